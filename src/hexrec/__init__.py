@@ -25,8 +25,11 @@
 
 __version__ = '0.5.1'
 
+from .base import aload
 from .base import convert
+from .base import convert_stream
 from .base import file_types
+from .base import guess_format_from_content
 from .base import guess_format_name
 from .base import guess_format_type
 from .base import load
@@ -26,11 +26,27 @@
 r""" Base types and classes."""
 
 import abc
+import asyncio
+import bisect
+import collections.abc
+import functools
+import hashlib
 import io
+import itertools
+import marshal
+import mmap as _mmap
 import os
+import re
 import sys
+import tempfile
+from array import array
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
 from typing import IO
 from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Literal
 from typing import Mapping
@@ -52,16 +68,29 @@ from bytesparse.base import EllipsisType
 from bytesparse.base import ImmutableMemory
 from bytesparse.base import MutableMemory
 
+from . import __version__
+
 try:
     from typing import Self
 except ImportError:  # pragma: no cover
     Self = Any  # Python < 3.11
 __TYPING_HAS_SELF = Self is not Any
 
+_LINE_END_REGEX = re.compile(b'\n')
+_SPACES_REGEX = re.compile(b'\\s*')
+
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):  # pragma: no cover
+    _IOV_MAX = 16  # POSIX minimum
+
 AnyPath = Union[bytes, bytearray, str, os.PathLike]
 
 ByteOrder = Literal['big', 'little']
 
+CONTENT_HEAD_SIZE: int = 4096
+r"""Size of the file head analyzed to guess the record format by content."""
+
 file_types: MutableMapping[str, Type['BaseFile']] = {}
 r"""Registered record file types.
 
@@ -86,6 +115,298 @@ TOKEN_COLOR_CODES: Mapping[str, bytes] = {
 r"""ANSI color codes for each possible token type."""
 
 
+def _is_memory_readonly(memory: MutableMemory) -> bool:
+    r"""Tells whether a memory object holds read-only blocks.
+
+    Read-only blocks are views over external buffers, like those referring
+    to a memory mapped file loaded by :meth:`hexrec.formats.raw.RawFile.load`,
+    or those shared by :meth:`BaseFile.copy` and :meth:`BaseFile.convert`.
+
+    Args:
+        memory (:class:`bytesparse.Memory`):
+            Memory object to check.
+
+    Returns:
+        bool: Any blocks are read-only.
+    """
+
+    for _, block_view in memory.blocks():
+        if block_view.readonly:
+            return True
+    return False
+
+
+def _share_memory(
+    memory: MutableMemory,
+    start: Union[int, None] = None,
+    endex: Union[int, None] = None,
+) -> MutableMemory:
+    r"""Shares memory data within a range.
+
+    It creates a new memory object, whose blocks are read-only views over the
+    data of `memory` within the specified range, without copying them.
+
+    Args:
+        memory (:class:`bytesparse.Memory`):
+            Memory object to share.
+
+        start (int):
+            Inclusive start address of the specified range.
+            If ``None``, start from the beginning of `memory`.
+
+        endex (int):
+            Exclusive end address of the specified range.
+            If ``None``, extend after the end of `memory`.
+
+    Returns:
+        :class:`bytesparse.Memory`: Memory object sharing data with `memory`.
+    """
+
+    blocks = [(block_start, memory.view(block_start, block_endex).toreadonly())
+              for block_start, block_endex in memory.intervals(start=start, endex=endex)]
+    shared = type(memory).from_blocks(blocks, copy=False, validate=False)
+    return shared
+
+
+def _peek_stream(stream: IO, size: int = CONTENT_HEAD_SIZE) -> Tuple[bytes, IO]:
+    r"""Peeks the beginning of a stream.
+
+    It reads up to `size` bytes from `stream`, without consuming them.
+    A buffered stream is peeked directly, while a seekable stream is
+    rewound after reading.
+    Any other stream is read as a whole into a :class:`io.BytesIO`, which
+    replaces the original one.
+
+    Args:
+        stream (bytes IO):
+            Stream to peek.
+
+        size (int):
+            Maximum number of bytes to peek.
+
+    Returns:
+        (bytes, bytes IO): Peeked bytes, and the stream to read from.
+    """
+
+    peek = getattr(stream, 'peek', None)
+    if peek is not None:
+        return bytes(peek(size)[:size]), stream
+
+    if stream.seekable():
+        offset = stream.tell()
+        head = stream.read(size)
+        stream.seek(offset)
+        return head, stream
+
+    stream = io.BytesIO(stream.read())
+    return stream.getvalue()[:size], stream
+
+
+def _sort_by_content(head: ByteString) -> List[Type['BaseFile']]:
+    r"""Sorts the registered record formats by content.
+
+    Args:
+        head (bytes):
+            Beginning of the record file to analyze.
+
+    Returns:
+        list of type: Record formats registered within :data:`file_types`,
+        the one guessed by :func:`guess_format_from_content` first.
+    """
+
+    in_types = list(file_types.values())
+    try:
+        in_type = file_types[guess_format_from_content(head)]
+    except ValueError:
+        pass
+    else:
+        in_types.remove(in_type)
+        in_types.insert(0, in_type)
+    return in_types
+
+
+def _iter_stream_windows(
+    parser: 'BaseParser',
+    stream: IO,
+    out_file: 'BaseFile',
+    maxdatalen: Union[int, None] = None,
+) -> Iterator[MutableMemory]:
+    r"""Iterates over memory windows parsed from a stream.
+
+    It feeds `parser` with the chunks read from `stream`, cutting the data
+    parsed so far into memory windows, as required by
+    :meth:`BaseFile._iter_stream_lines` of `out_file`.
+
+    Each window ends at a chunk boundary, as per
+    :meth:`bytesparse.base.ImmutableMemory.chop` with the
+    :attr:`BaseFile.maxdatalen` of `out_file` as width, so that only the
+    trailing incomplete chunk is kept within :attr:`BaseParser.memory`.
+
+    The *meta* of `out_file` is converted from that of `parser` as per
+    :meth:`BaseFile.convert`, right before the first window.
+    It is converted again from the final *meta* after the whole stream is
+    parsed, which must be the same but for the *start address*.
+
+    Args:
+        parser (:class:`BaseParser`):
+            Push parser of the input stream.
+
+        stream (bytes IO):
+            Input stream.
+
+        out_file (:class:`BaseFile`):
+            Output file object, in *memory role*.
+
+        maxdatalen (int):
+            If not ``None``, it overrides the converted maximum data length.
+
+    Returns:
+        iterator of :class:`bytesparse.Memory`: Memory windows, in address
+        order.
+
+    Raises:
+        ValueError: Data not in address order.
+        ValueError: *Meta* changed after the first window.
+    """
+
+    def convert_meta(in_meta: Mapping[str, Any]) -> MutableMapping[str, Any]:
+        converted = {key: in_meta[key] for key in out_file.META_KEYS if key in in_meta}
+        if converted.get('maxdatalen') == sys.maxsize:
+            converted['maxdatalen'] = out_file.DEFAULT_DATALEN  # unbounded
+        if maxdatalen is not None:
+            converted['maxdatalen'] = maxdatalen
+        return converted
+
+    chunk_size = parser.file_type.STREAM_CHUNK_SIZE
+    memory = parser.memory
+    committed = None
+    out_meta = None
+
+    while not parser.terminated:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        parser.feed(chunk)
+
+        if memory:
+            if committed is not None and memory.start < committed:
+                raise ValueError('unordered data')
+
+            if out_meta is None:
+                out_meta = convert_meta(parser.get_meta())
+                out_meta.pop('startaddr', None)  # usually parsed last
+                out_file.set_meta(out_meta)
+
+            width = out_file.maxdatalen
+            block_start = block_endex = 0
+            for block_start, block_endex in memory.intervals():
+                pass
+            endex = block_endex - (block_endex - block_start) % width
+
+            if endex > memory.start:
+                committed = endex
+                yield memory.cut(endex=endex, bound=False)
+
+    in_file = parser.close()
+    if memory and committed is not None and memory.start < committed:
+        raise ValueError('unordered data')
+
+    final_meta = convert_meta(in_file.get_meta())
+    if out_meta is not None:
+        if any(final_meta.get(key) != value for key, value in out_meta.items()):
+            raise ValueError('meta changed')
+    out_file.set_meta(final_meta)
+
+    if memory:
+        yield memory
+
+
+async def aload(
+    in_path_or_stream: Union[str, asyncio.StreamReader],
+    *load_args: Any,
+    in_format: Union[str, None] = None,
+    **load_kwargs: Any,
+) -> 'BaseFile':
+    r"""Loads a file asynchronously.
+
+    Coroutine version of :func:`load`.
+
+    All the custom `load_args` and `load_kwargs` are forwarded to the actual
+    underlying call to :meth:`BaseFile.aload`.
+
+    Args:
+        in_path_or_stream (str or :class:`asyncio.StreamReader`):
+            Input file path or asynchronous stream.
+
+        in_format (str):
+            Name of the input format, within :data:`file_types`.
+            If ``None``, a file path is guessed by extension, then by content
+            via :func:`guess_format_from_content`, then via brute-force
+            :meth:`BaseFile.aload`.
+            A stream is guessed by content only, as it cannot be rewound.
+
+    Returns:
+        :class:`BaseFile`: The loaded record file object, in *memory role*.
+
+    Raises:
+        ValueError: Stream content not recognized.
+
+    See Also:
+        :data:`file_types`
+        :func:`load`
+        :meth:`BaseFile.aload`
+
+    Examples:
+        >>> import asyncio
+        >>> from hexrec import aload
+        >>> async def main():
+        ...     stream = asyncio.StreamReader()
+        ...     stream.feed_data(b':03DA7A0061626383\r\n:00000001FF\r\n')
+        ...     stream.feed_eof()
+        ...     return await aload(stream)
+        >>> file = asyncio.run(main())
+        >>> file.memory.to_blocks()
+        [(55930, b'abc')]
+    """
+
+    if in_format is not None:
+        file_type = file_types[in_format]
+        return await file_type.aload(in_path_or_stream, *load_args, **load_kwargs)
+
+    if isinstance(in_path_or_stream, asyncio.StreamReader):
+        stream = in_path_or_stream
+        head = await stream.read(CONTENT_HEAD_SIZE)
+        file_type = file_types[guess_format_from_content(head)]
+        executor = load_kwargs.pop('executor', None)
+        chunk_size = load_kwargs.pop('chunk_size', None)
+        parser = file_type.create_parser(*load_args, **load_kwargs)
+        parser.feed(head)
+        return await file_type._afeed(parser, stream.read, executor=executor, chunk_size=chunk_size)
+
+    in_path = str(in_path_or_stream)
+    loop = asyncio.get_running_loop()
+    in_types = []
+    try:
+        in_types.append(guess_format_type(in_path))
+    except ValueError:
+        pass
+
+    def read_head() -> bytes:
+        with open(in_path, 'rb') as stream:
+            return stream.read(CONTENT_HEAD_SIZE)
+
+    head = await loop.run_in_executor(None, read_head)
+    in_types.extend(in_type for in_type in _sort_by_content(head) if in_type not in in_types)
+
+    last_exc = RuntimeError
+    for file_type in in_types:
+        try:
+            return await file_type.aload(in_path, *load_args, **load_kwargs)
+        except Exception as exc:
+            last_exc = exc
+    raise last_exc
+
+
 def colorize_tokens(
     tokens: Mapping[str, bytes],
     altdata: bool = True,
@@ -225,6 +546,151 @@ def convert(
     return in_file, out_file
 
 
+def convert_stream(
+    in_path: str,
+    out_path: str,
+    in_format: Union[str, None] = None,
+    out_format: Union[str, None] = None,
+    maxdatalen: Union[int, None] = None,
+    buffer_size: Union[int, None] = None,
+) -> bool:
+    r"""Converts a file into another format, streaming records.
+
+    Streaming version of :func:`convert`, without loading the whole input
+    file.
+    The input file is fed by chunks to the push parser of
+    :meth:`BaseFile.create_parser`, resolving record addresses into its
+    memory.
+    As soon as some data is final, it is re-chopped to the output
+    :attr:`BaseFile.maxdatalen`, then serialized straight onto the output
+    file via :meth:`BaseFile._iter_stream_lines`.
+
+    Memory usage is bounded by about an input chunk and an output record.
+    Only the output *formats* encoding memory windows on their own, by
+    overriding :meth:`BaseFile._iter_stream_lines` (i.e. Intel HEX and
+    SREC), are streamed; any other output *format* is converted in memory.
+
+    Streaming requires the input data records be in address order, as in most
+    record files.
+    If any out-of-order data is detected, or the converted *meta* changes
+    after some data records were already written, the function falls back
+    to the same in-memory conversion as :func:`convert`, loading the input
+    file again.
+    The same happens if the input file cannot be streamed at all, e.g. if
+    its format cannot be guessed, or if it is also the output file.
+
+    The streamed records are written to a temporary file within the same
+    folder, replacing any existing output file only once complete, so that
+    it is left untouched if the input file is invalid.
+
+    Args:
+        in_path (str):
+            Input file path.
+
+        out_path (str):
+            Output file path. It can be the same as `in_path`.
+
+        in_format (str):
+            Name of the input format, within :data:`file_types`.
+            If ``None``, it is guessed by file extension, then by content via
+            :func:`guess_format_from_content`.
+
+        out_format (str):
+            Name of the output format, within :data:`file_types`.
+            If ``None``, it is guessed via :func:`guess_format_name`.
+
+        maxdatalen (int):
+            Maximum *data* record length of the output file.
+            If ``None``, that of the input file.
+
+        buffer_size (int):
+            Size of the :class:`BatchWriter` buffer, in bytes.
+            If ``None``, :attr:`BaseFile.STREAM_CHUNK_SIZE` is used.
+
+    Returns:
+        bool: The conversion was streamed, instead of falling back to the
+        in-memory conversion.
+
+    Raises:
+        ValueError: Invalid input file.
+
+    See Also:
+        :func:`convert`
+        :meth:`BaseFile.create_parser`
+        :meth:`BaseFile._iter_stream_lines`
+
+    Examples:
+        >>> import os, tempfile
+        >>> from hexrec import IhexFile, convert_stream
+        >>> folder = tempfile.TemporaryDirectory()
+        >>> hex_path = os.path.join(folder.name, 'data.hex')
+        >>> srec_path = os.path.join(folder.name, 'data.srec')
+        >>> _ = IhexFile.from_blocks([(0xDA7A, b'abc')], startaddr=0xCAFE).save(hex_path)
+        >>> convert_stream(hex_path, srec_path)
+        True
+        >>> convert_stream(hex_path, srec_path, in_format='ihex', out_format='srec', maxdatalen=2)
+        True
+        >>> convert_stream(hex_path, hex_path, out_format='ihex')  # same file
+        False
+        >>> folder.cleanup()
+    """
+
+    if out_format is None:
+        out_format = guess_format_name(out_path)
+    out_type = file_types[out_format]
+
+    if in_format is None:
+        try:
+            in_type = guess_format_type(in_path)
+        except ValueError:
+            with open(in_path, 'rb') as stream:
+                head = stream.read(CONTENT_HEAD_SIZE)
+            try:
+                in_type = file_types[guess_format_from_content(head)]
+            except ValueError:
+                in_type = None
+    else:
+        in_type = file_types[in_format]
+
+    streamed = out_type._iter_stream_lines is not BaseFile._iter_stream_lines  # else collecting everything
+    out_exists = os.path.exists(out_path)
+
+    if in_type is not None and streamed and not (out_exists and os.path.samefile(in_path, out_path)):
+        if buffer_size is None:
+            buffer_size = out_type.STREAM_CHUNK_SIZE
+
+        if out_exists:  # replaced only once complete
+            fd, temp_path = tempfile.mkstemp(dir=(os.path.dirname(out_path) or None), suffix='.tmp')
+            out_stream = os.fdopen(fd, 'wb')
+        else:
+            temp_path = out_path
+            out_stream = open(out_path, 'xb')
+
+        try:
+            with out_stream, open(in_path, 'rb') as in_stream:
+                out_file = out_type()
+                windows = _iter_stream_windows(in_type.create_parser(), in_stream, out_file, maxdatalen=maxdatalen)
+                with BatchWriter(out_stream, buffer_size) as writer:
+                    writer.writelines(out_file._iter_stream_lines(windows))
+            if temp_path != out_path:
+                os.chmod(temp_path, os.stat(out_path).st_mode & 0o7777)
+                os.replace(temp_path, out_path)
+            temp_path = None
+            return True
+        except ValueError:
+            pass  # e.g. unordered data: fall back to in-memory conversion
+        finally:
+            if temp_path is not None:
+                os.remove(temp_path)
+
+    in_file = load(in_path, in_format=in_format)
+    out_file = out_type.convert(in_file)
+    if maxdatalen is not None:
+        out_file.maxdatalen = maxdatalen
+    out_file.save(out_path, buffer_size=buffer_size)
+    return False
+
+
 def guess_format_name(file_path: str) -> str:
     r"""Guesses the record format name.
 
@@ -312,6 +778,51 @@ def guess_format_type(file_path: str) -> Type['BaseFile']:
     return file_types[name]
 
 
+def guess_format_from_content(head: ByteString) -> str:
+    r"""Guesses the record format name from content.
+
+    It analyzes the beginning of a record file, namely its `head`, against
+    the signatures of all the record formats registered into
+    :data:`file_types`, as per :attr:`BaseFile.CONTENT_REGEX`.
+    The first record format to match its own signature is returned.
+
+    A few kilobytes of `head` are usually enough.
+
+    Args:
+        head (bytes):
+            Beginning of the record file to analyze.
+
+    Returns:
+        str: Record format registered within :data:`file_types`.
+
+    Raises:
+        ValueError: Cannot guess record file format.
+
+    See Also:
+        :data:`file_types`
+        :attr:`BaseFile.CONTENT_REGEX`
+
+    Examples:
+        >>> from hexrec import guess_format_from_content
+        >>> guess_format_from_content(b':0312340061626391\r\n')
+        'ihex'
+        >>> guess_format_from_content(b'S0030000FC\r\n')
+        'srec'
+        >>> guess_format_from_content(b'\x02$A1234,\r\n61 62 63\r\n\x03')
+        'asciihex'
+        >>> guess_format_from_content(b'@1234\r\n61 62 63\r\nq\r\n')
+        'titxt'
+    """
+
+    for name in file_types.keys():
+        content_regex = file_types[name].CONTENT_REGEX
+
+        if content_regex is not None and content_regex.match(head):
+            return name
+
+    raise ValueError('content not recognized')
+
+
 def load(
     in_path_or_stream: Union[str, IO, None],
     *load_args: Any,
@@ -332,7 +843,9 @@ def load(
 
         in_format (str):
             Name of the input format, within :data:`file_types`.
-            If ``None``, it is guessed via brute-force :meth:`BaseFile.load`.
+            If ``None``, it is guessed by file extension, then by content via
+            :func:`guess_format_from_content`, then via brute-force
+            :meth:`BaseFile.load`.
 
     Returns:
         :class:`BaseFile`: The loaded record file object.
@@ -340,6 +853,7 @@ def load(
     See Also:
         :data:`file_types`
         :func:`guess_format_name`
+        :func:`guess_format_from_content`
         :meth:`BaseFile.load`
 
     Examples:
@@ -350,6 +864,12 @@ def load(
         <hexrec.formats.ihex.IhexFile object at ...>
         >>> load('simple.hex', ignore_errors=True)  # doctest:+ELLIPSIS
         <hexrec.formats.ihex.IhexFile object at ...>
+        >>> import tempfile
+        >>> from hexrec.base import ParseCache
+        >>> folder = tempfile.TemporaryDirectory()
+        >>> load('simple.hex', cache=ParseCache(folder.name))  # doctest:+ELLIPSIS
+        <hexrec.formats.ihex.IhexFile object at ...>
+        >>> folder.cleanup()
     """
 
     if in_path_or_stream is None:
@@ -358,13 +878,16 @@ def load(
     if in_format is None:
         last_exc = RuntimeError
         if isinstance(in_path_or_stream, io.IOBase):
-            stream = in_path_or_stream
-            in_offset = stream.tell()
-            for file_type in file_types.values():
+            head, stream = _peek_stream(_cast(IO, in_path_or_stream))
+            seekable = stream.seekable()
+            in_offset = stream.tell() if seekable else 0
+            for file_type in _sort_by_content(head):
                 try:
                     return file_type.load(stream, *load_args, **load_kwargs)
                 except Exception as exc:
                     last_exc = exc
+                    if not seekable:
+                        break  # cannot retry
                     stream.seek(in_offset)
         else:
             in_path = str(in_path_or_stream)
@@ -374,7 +897,10 @@ def load(
             except Exception as exc:
                 last_exc = exc
 
-            for file_type in file_types.values():
+            with open(in_path, 'rb') as stream:
+                head = stream.read(CONTENT_HEAD_SIZE)
+
+            for file_type in _sort_by_content(head):
                 try:
                     return file_type.load(in_path, *load_args, **load_kwargs)
                 except Exception as exc:
@@ -656,8 +1182,31 @@ class BaseRecord(abc.ABC):
 
         validate (bool):
             If true, :meth:`validate` is called upon initialization.
+
+    Notes:
+        Record attributes are stored by :attr:`__slots__`, to reduce memory
+        usage when handling lots of records.
+        Child classes must declare their own :attr:`__slots__` for any
+        additional attributes; a child class not declaring :attr:`__slots__`
+        gets the usual instance :attr:`__dict__`, allowing arbitrary
+        attributes.
+
+        Records generated by record file *formats* are created by
+        :meth:`_create_trusted`, skipping validation, with :attr:`count`
+        and :attr:`checksum` computed lazily.
     """
 
+    __slots__ = [
+        'address',
+        'after',
+        'before',
+        'checksum',
+        'coords',
+        'count',
+        'data',
+        'tag',
+    ]
+
     EQUALITY_KEYS: Sequence[str] = [
         'address',
         'checksum',
@@ -759,6 +1308,45 @@ class BaseRecord(abc.ABC):
 
         return not self != other
 
+    def __getattr__(self, name: str) -> Any:
+        r"""Gets a missing attribute.
+
+        It is called only if the attribute is not set, which happens to
+        :attr:`count` and :attr:`checksum` of records created by
+        :meth:`_create_trusted`.
+        Those are computed via :meth:`compute_count` and
+        :meth:`compute_checksum` on first access, then stored as usual.
+
+        Args:
+            name (str):
+                Attribute name.
+
+        Returns:
+            any: Attribute value.
+
+        Raises:
+            AttributeError: Attribute not found.
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> Record = IhexFile.Record
+            >>> record = Record._create_trusted(Record.Tag.DATA, 0x1234, b'abc')
+            >>> record.checksum
+            145
+            >>> record.count
+            3
+        """
+
+        if name == 'count':
+            self.count = count = self.compute_count()
+            return count
+
+        if name == 'checksum':
+            self.checksum = checksum = self.compute_checksum()
+            return checksum
+
+        raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+
     def __init__(
         self,
         tag: BaseTag,
@@ -899,6 +1487,69 @@ class BaseRecord(abc.ABC):
 
         return self.to_bytestr().decode()
 
+    @classmethod
+    def _create_trusted(
+        cls,
+        tag: BaseTag,
+        address: int,
+        data: ByteString,
+        **kwargs: Any,
+    ) -> Self:  # type: ignore Self
+        r"""Creates a record from trusted fields.
+
+        Fast path for records generated by record file *formats*, e.g. by
+        :meth:`BaseFile.update_records`, whose fields are consistent by
+        construction.
+
+        Unlike :meth:`__init__`, no validation is performed, and the `tag`
+        is assigned as is.
+        :attr:`count` and :attr:`checksum` are left unset, so that they are
+        computed on first access, e.g. by :meth:`to_bytestr` or
+        :meth:`validate`; see :meth:`__getattr__`.
+        Any edits of the record fields before then are thus trusted as well.
+
+        Args:
+            tag (:class:`BaseTag`):
+                Record tag.
+
+            address (int):
+                Record address.
+
+            data (bytes):
+                Record data.
+
+            kwargs:
+                Further record attributes to assign, e.g. those specific of
+                the record file *format*.
+
+        Returns:
+            :class:`BaseRecord`: Record object.
+
+        See Also:
+            :meth:`__getattr__`
+            :meth:`create_data`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> Record = IhexFile.Record
+            >>> record = Record._create_trusted(Record.Tag.DATA, 0x1234, b'abc')
+            >>> record == Record.create_data(0x1234, b'abc')
+            True
+            >>> str(record)
+            ':0312340061626391\r\n'
+        """
+
+        record = cls.__new__(cls)
+        record.address = address
+        record.after = b''
+        record.before = b''
+        record.coords = (-1, -1)
+        record.data = data
+        record.tag = tag
+        for key, value in kwargs.items():
+            setattr(record, key, value)
+        return record
+
     def compute_checksum(self) -> Union[int, None]:
         r"""Computes the checksum field value.
 
@@ -927,6 +1578,42 @@ class BaseRecord(abc.ABC):
 
         return None
 
+    @classmethod
+    def compute_checksums(
+        cls,
+        records: Sequence['BaseRecord'],
+    ) -> List[Union[int, None]]:
+        r"""Computes the checksum field values of many records.
+
+        Batch counterpart of :meth:`compute_checksum`, for records of this
+        very *format*.
+
+        When not specialized, it calls :meth:`compute_checksum` for each
+        record.
+        Record *formats* with checksums compute them all at once, via
+        :func:`hexrec.utils.sum_chunks`.
+
+        Args:
+            records (list of :class:`BaseRecord`):
+                Records to process.
+
+        Returns:
+            list of int: Computed checksum values, one per record.
+
+        See Also:
+            :meth:`compute_checksum`
+            :meth:`verify_checksums`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> Record = IhexFile.Record
+            >>> records = [Record.create_data(0, b'abc'), Record.create_end_of_file()]
+            >>> Record.compute_checksums(records)
+            [215, 255]
+        """
+
+        return [record.compute_checksum() for record in records]
+
     def compute_count(self) -> Union[int, None]:
         r"""Compute the count field value.
 
@@ -1056,18 +1743,34 @@ class BaseRecord(abc.ABC):
         value = int.from_bytes(self.data, byteorder=byteorder, signed=signed)
         return value
 
-    def get_meta(self) -> MutableMapping[str, Any]:
-        r"""Gets meta information.
+    def diagnose(
+        self,
+        checksum: bool = True,
+        count: bool = True,
+    ) -> Union[str, None]:
+        r"""Diagnoses consistency of attribute values.
 
-        It returns all the object attributes whose keys are listed by
-        :attr:`META_KEYS`.
+        All the record attributes are checked for consistency, as per
+        :meth:`validate`, but without raising any exceptions.
+
+        Any lazy :attr:`count` and :attr:`checksum` of a record created by
+        :meth:`_create_trusted` are computed and stored first, so that any
+        later edits of the record fields are checked against them.
+
+        Please refer to the implementation for more details.
+
+        Args:
+            checksum (bool):
+                Check the consistency of the :attr:`checksum` attribute.
+
+            count (bool):
+                Check the consistency of the :attr:`count` attribute.
 
         Returns:
-             dict: Attribute values listed by :attr:`META_KEYS`.
+            str: Reason of the first inconsistency found, or ``None``.
 
         See Also:
-            :attr:`META_KEYS`
-            :meth:`set_meta`
+            :meth:`validate`
 
         Examples:
             **NOTE:** These examples are provided by :class:`BaseRecord`.
@@ -1075,7 +1778,62 @@ class BaseRecord(abc.ABC):
 
             >>> from hexrec import IhexFile
             >>> record = IhexFile.Record.create_end_of_file()
-            >>> record.get_meta()  # doctest:+NORMALIZE_WHITESPACE
+            >>> record.diagnose() is None
+            True
+            >>> record.checksum = 0
+            >>> record.diagnose()
+            'wrong checksum'
+        """
+
+        record_count = self.count  # computes any lazy values, see __getattr__
+        record_checksum = self.checksum
+
+        if self.address < 0:
+            return 'address overflow'
+
+        if record_checksum is not None:
+            if record_checksum < 0:
+                return 'checksum overflow'
+
+            if checksum:
+                if record_checksum != self.compute_checksum():
+                    return 'wrong checksum'
+
+        if record_count is not None:
+            if record_count < 0:
+                return 'count overflow'
+
+            if count:
+                if record_count != self.compute_count():
+                    return 'wrong count'
+
+        TagType = _cast(Any, self.Tag)
+        tag = self.tag
+        if not isinstance(tag, TagType) and tag not in TagType._value2member_map_:
+            return f'{tag!r} is not a valid {TagType.__qualname__}'
+
+        return None
+
+    def get_meta(self) -> MutableMapping[str, Any]:
+        r"""Gets meta information.
+
+        It returns all the object attributes whose keys are listed by
+        :attr:`META_KEYS`.
+
+        Returns:
+             dict: Attribute values listed by :attr:`META_KEYS`.
+
+        See Also:
+            :attr:`META_KEYS`
+            :meth:`set_meta`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseRecord`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import IhexFile
+            >>> record = IhexFile.Record.create_end_of_file()
+            >>> record.get_meta()  # doctest:+NORMALIZE_WHITESPACE
             {'address': 0, 'after': b'', 'before': b'', 'checksum': 255,
              'coords': (-1, -1), 'count': 0, 'data': b'',
              'tag': <IhexTag.END_OF_FILE: 1>}
@@ -1124,6 +1882,98 @@ class BaseRecord(abc.ABC):
         """
         ...
 
+    @classmethod
+    def parse_fields(
+        cls,
+        line: ByteString,
+    ) -> Union[Tuple[BaseTag, int, ByteString], None]:
+        r"""Parses the fields of a valid record line.
+
+        It decodes just the *tag*, *address*, and *data* fields of `line`,
+        without creating any record objects.
+
+        Only lines which would pass all the checks of :meth:`try_parse` are
+        decoded, possibly just for their most common layout.
+        Anything else is left to :meth:`try_parse`, which either parses
+        unusual valid lines, or tells the reason why `line` is invalid.
+
+        This generic implementation leaves every line to :meth:`try_parse`.
+
+        Args:
+            line (bytes):
+                String of bytes to parse.
+
+        Returns:
+            tuple: *tag*, *address*, and *data* of `line`, or ``None`` if
+            `line` must be parsed by :meth:`try_parse` instead.
+
+        See Also:
+            :meth:`try_parse`
+            :meth:`BaseFile._iter_parsed_fields`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseRecord`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import IhexFile
+            >>> IhexFile.Record.parse_fields(b':03007B006162635C\r\n')
+            (<IhexTag.DATA: 0>, 123, b'abc')
+            >>> IhexFile.Record.parse_fields(b':03007B0061626300\r\n') is None
+            True
+        """
+
+        return None
+
+    @classmethod
+    def parse_fields_batch(
+        cls,
+        lines: Sequence[ByteString],
+    ) -> Union[List[Tuple[BaseTag, int, ByteString]], None]:
+        r"""Parses the fields of a batch of valid record lines.
+
+        It decodes the *tag*, *address*, and *data* fields of all the `lines`
+        at once, as per :meth:`parse_fields`.
+        If any of the `lines` cannot be decoded this way, the whole batch is
+        rejected, so that the caller can fall back to :meth:`parse_fields`
+        and :meth:`try_parse` for each line.
+
+        This generic implementation calls :meth:`parse_fields` for each line.
+        Record *formats* may validate the whole batch in bulk instead.
+
+        Args:
+            lines (list of bytes):
+                Lines to parse.
+
+        Returns:
+            list: *tag*, *address*, and *data* of each line, or ``None`` if
+            the batch must be parsed line by line instead.
+
+        See Also:
+            :meth:`parse_fields`
+            :meth:`BaseFile._iter_parsed_fields`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseRecord`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import IhexFile
+            >>> IhexFile.Record.parse_fields_batch([b':03007B006162635C\r\n', b':00000001FF\r\n'])
+            [(<IhexTag.DATA: 0>, 123, b'abc'), (<IhexTag.END_OF_FILE: 1>, 0, b'')]
+            >>> IhexFile.Record.parse_fields_batch([b':03007B006162635C\r\n', b':0000000100\r\n']) is None
+            True
+        """
+
+        parse_fields = cls.parse_fields
+        parsed = []
+
+        for line in lines:
+            fields = parse_fields(line)
+            if fields is None:
+                return None
+            parsed.append(fields)
+
+        return parsed
+
     def print(
         self,
         *args,
@@ -1179,7 +2029,7 @@ class BaseRecord(abc.ABC):
         if color:
             tokens = colorize_tokens(tokens)
         assert stream is not None
-        stream.writelines(tokens.values())
+        stream.write(b''.join(tokens.values()))
         return self
 
     def serialize(self, stream: IO, *args, **kwargs) -> Self:  # type: ignore Self
@@ -1272,6 +2122,61 @@ class BaseRecord(abc.ABC):
         """
         ...
 
+    @classmethod
+    def try_parse(
+        cls,
+        line: ByteString,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Tuple[Union[Self, None], Union[str, None]]:  # type: ignore Self
+        r"""Tries to parse a record from bytes.
+
+        Like :meth:`parse`, but an invalid `line` is reported by its reason,
+        instead of raising an exception.
+        Each record *format* provides an implementation which does not rely
+        on exceptions, so that damaged files are parsed quickly.
+
+        This generic implementation just catches the exception raised by
+        :meth:`parse`.
+
+        Args:
+            line (bytes):
+                String of bytes to parse.
+
+            args:
+                Forwarded to :meth:`parse`.
+
+            kwargs:
+                Forwarded to :meth:`parse`.
+
+        Returns:
+            (record, reason): The parsed record and ``None``, or ``None`` and
+            the reason why `line` is invalid.
+
+        See Also:
+            :meth:`parse`
+            :meth:`diagnose`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseRecord`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import IhexFile
+            >>> record, reason = IhexFile.Record.try_parse(b':00000001FF\r\n')
+            >>> record.tag, reason
+            (<IhexTag.END_OF_FILE: 1>, None)
+            >>> IhexFile.Record.try_parse(b'::00000001FF\r\n')
+            (None, 'syntax error')
+            >>> IhexFile.Record.try_parse(b':00000001FE\r\n')
+            (None, 'wrong checksum')
+        """
+
+        try:
+            record = cls.parse(line, *args, **kwargs)
+        except ValueError as exc:
+            return None, str(exc)
+        return record, None
+
     def update_checksum(self) -> Self:  # type: ignore Self
         r"""Updates the checksum field.
 
@@ -1304,6 +2209,38 @@ class BaseRecord(abc.ABC):
         self.checksum = self.compute_checksum()
         return self
 
+    @classmethod
+    def update_checksums(
+        cls,
+        records: Sequence['BaseRecord'],
+    ) -> None:
+        r"""Updates the checksum fields of many records.
+
+        Batch counterpart of :meth:`update_checksum`: it assigns to the
+        :attr:`checksum` attribute of each record the value returned by
+        :meth:`compute_checksums`.
+
+        Args:
+            records (list of :class:`BaseRecord`):
+                Records to update.
+
+        See Also:
+            :meth:`compute_checksums`
+            :meth:`update_checksum`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> Record = IhexFile.Record
+            >>> records = [Record.create_data(0, b'abc'), Record.create_end_of_file()]
+            >>> records[1].checksum = 0
+            >>> Record.update_checksums(records)
+            >>> [record.checksum for record in records]
+            [215, 255]
+        """
+
+        for record, checksum in zip(records, cls.compute_checksums(records)):
+            record.checksum = checksum
+
     def update_count(self) -> Self:  # type: ignore Self
         r"""Updates the count field.
 
@@ -1361,6 +2298,9 @@ class BaseRecord(abc.ABC):
         Raises:
             ValueError: Some targeted attributes are inconsistent.
 
+        See Also:
+            :meth:`diagnose`
+
         Examples:
             **NOTE:** These examples are provided by :class:`BaseRecord`.
             Inherited classes for specific *formats* may require an adaptation.
@@ -1375,607 +2315,3255 @@ class BaseRecord(abc.ABC):
             ValueError: unexpcted data
         """
 
-        if self.address < 0:
-            raise ValueError('address overflow')
+        reason = self.diagnose(checksum=checksum, count=count)
+        if reason:
+            raise ValueError(reason)
+        return self
 
-        if self.checksum is not None:
-            if self.checksum < 0:
-                raise ValueError('checksum overflow')
+    @classmethod
+    def verify_checksums(
+        cls,
+        records: Sequence['BaseRecord'],
+    ) -> List[bool]:
+        r"""Verifies the checksum field values of many records.
 
-            if checksum:
-                if self.checksum != self.compute_checksum():
-                    raise ValueError('wrong checksum')
+        It tells whether the :attr:`checksum` of each record matches the
+        value computed by :meth:`compute_checksums`, all at once.
 
-        if self.count is not None:
-            if self.count < 0:
-                raise ValueError('count overflow')
+        If the checksums cannot be computed at once (e.g. because of a
+        missing :attr:`count`), all the records are reported as mismatching,
+        leaving to :meth:`validate` the report of the actual error of each
+        record.
 
-            if count:
-                if self.count != self.compute_count():
-                    raise ValueError('wrong count')
+        Args:
+            records (list of :class:`BaseRecord`):
+                Records to verify.
 
-        TagType = _cast(Any, self.Tag)
-        TagType(self.tag)
+        Returns:
+            list of bool: Checksum match, one per record.
 
-        return self
+        See Also:
+            :meth:`compute_checksums`
+            :meth:`validate`
 
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> Record = IhexFile.Record
+            >>> records = [Record.create_data(0, b'abc'), Record.create_end_of_file()]
+            >>> records[1].checksum = 0
+            >>> Record.verify_checksums(records)
+            [True, False]
+        """
 
-if not __TYPING_HAS_SELF:  # pragma: no cover
-    del Self
-    Self = TypeVar('Self', bound='BaseFile')
+        try:
+            checksums = cls.compute_checksums(records)
+        except Exception:
+            return [False] * len(records)
 
+        return [record.checksum == checksum for record, checksum in zip(records, checksums)]
 
-class BaseFile(abc.ABC):
-    r"""Record file.
 
-    A *record file* contains a sequence of *records* (:class:`BaseRecord`),
-    which can be serialized to transfer some *binary* data across systems,
-    usually an executable program of some configuration data for an
-    *embedded system*.
+class RecordTable(collections.abc.MutableSequence):
+    r"""Columnar record sequence.
 
-    The :class:`BaseFile` class provides a useful abstraction of a record file,
-    to create, edit, or convert across file *formats*.
+    A compact alternative to a :class:`list` of :class:`BaseRecord`.
 
-    A :class:`BaseFile` instance has a dual role:
+    Record attributes are stored by parallel columns: :class:`array.array`
+    for :attr:`BaseRecord.address`, :attr:`BaseRecord.count`,
+    :attr:`BaseRecord.checksum`, :attr:`BaseRecord.coords`, and the *tag*
+    index within :attr:`tag_types`.
+    The :attr:`BaseRecord.data` fields are stored into a single shared
+    :class:`bytearray`, via *offset* and *size* columns.
 
-    * *records role*: to host the sequence of *records* for parsing and
-      serialization;
+    It provides the same :class:`typing.MutableSequence` interface as a
+    :class:`list` of records, with a notable difference: records are created
+    on-the-fly upon item access, as detached copies.
+    Any changes to a record object are not seen by the table, unless stored
+    back by item assignment (e.g. ``table[i] = record``).
+    Methods like :meth:`iter_fields` access columns directly, without creating
+    any record objects.
 
-    * *memory role*: to host the equivalent *memory* image and *meta*
-      information.
+    Data of deleted or replaced records is reclaimed from :attr:`buffer` as
+    soon as it exceeds the data still in use.
 
-    Both roles can be active at the same time only when both representations
-    are coherent.
+    Any additional *meta* keys of :attr:`Record` (e.g. ``addrlen`` of
+    :class:`hexrec.formats.xtek.XtekRecord`) are stored as plain lists.
+    Non-*meta* attributes are not preserved.
 
-    The *records* role is useful to :meth:`load` or :meth:`save` the instance
-    against the filesystem.
-    The individual records can be edited via the :attr:`records` attribute.
-    This is considered an advanced feature, for debug or experimentation.
+    Args:
+        Record (type):
+            :class:`BaseRecord` class of the stored records.
 
-    The *memory* role is for editing the equivalent *memory image*.
-    The :class:`BaseFile` provides common methods to :meth:`read`,
-    :meth:`write`, :meth:`cut`, :meth:`crop`, :meth:`clear`, :meth:`delete`,
-    :meth:`fill`, :meth:`flood`, and more.
-    Furthermore, this role also abstracts *meta* information, like the maximum
-    *data* size (:attr:`maxdatalen`), or the *start address* (if available for
-    the specific file *format*).
-    Advanced editing can be performed via the underlying :attr:`memory`
-    attribute, thanks to  the powerful :class:`bytesparse.Memory` class (from
-    the `bytesparse Python package <https://pypi.org/project/bytesparse/>`_),
-    the :meth:`get_meta` and :meth:`set_meta` methods, or their equivalent
-    Python property wrappers.
-    The :attr:`memory` also provides additional methods and properties for
-    in-depth analysis (min/max address, gaps, spans, find, etc.).
+        records (list of :class:`BaseRecord`):
+            Records to store initially.
 
-    A :class:`BaseFile` instance can impersonate each role via:
+    Examples:
+        >>> from hexrec import IhexFile
+        >>> from hexrec.base import RecordTable
+        >>> IhexRecord = IhexFile.Record
+        >>> table = RecordTable(IhexRecord)
+        >>> table.append(IhexRecord.create_data(123, b'abc'))
+        >>> table.append(IhexRecord.create_end_of_file())
+        >>> len(table)
+        2
+        >>> str(table[0])
+        ':03007B006162635C\r\n'
+        >>> list(table.iter_fields())
+        [(<IhexTag.DATA: 0>, 123, b'abc'), (<IhexTag.END_OF_FILE: 1>, 0, b'')]
+        >>> table.buffer
+        bytearray(b'abc')
+        >>> record = table[0]
+        >>> record.data = b'xyz'
+        >>> table[0].data
+        b'abc'
+        >>> table[0] = record
+        >>> table[0].data
+        b'xyz'
+    """
 
-    * :meth:`apply_records` to mirror the :attr:`records` sequence into the
-      equivalent :attr:`memory` and *meta*.
+    def __eq__(self, other: Any) -> bool:
 
-    * :meth:`update_records` to mirror the :attr:`memory` and *meta* into
-      an actual :attr:`records` sequence.
+        if self is other:
+            return True
 
-    Please note that reading from the :attr:`records` or :attr:`memory`
-    properties automatically activates the corresponding role if inactive
-    (i.e. :meth:`update_records` if :attr:`_records` is ``None``,
-    :meth:`apply_records` if :attr:`_memory` is ``None``).
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
 
-    Beware that any editing done within a role may invalidate the other role,
-    if both :attr:`records` and :attr:`memory` + *meta* are instantiated.
-    For example, setting the :attr:`maxdatalen` property means that records
-    must be updated to mirror the new maximum *data* field length.
-    Records must also be invalidated whenever the :attr:`memory` is altered.
+        if len(self) != len(other):
+            return False
 
-    Usually, *meta* property setters automatically invalidate :attr:`records`
-    on change (via :meth:`discard_records`).
-    Instead, only the explicit *memory* methods of :meth:`BaseFile` do it
-    automatically; any operations on the :attr:`memory` itself require
-    :meth:`update_records` be called to mirror any changes.
+        return all(a == b for a, b in zip(self, other))
 
-    Instantiation of a new :class:`BaseFile` instance should be performed via:
+    def __delitem__(self, key: Union[slice, int]) -> None:
 
-    * :class:`BaseFile` for an empty file (only!);
-      *memory* role.
+        if isinstance(key, slice):
+            key = slice(*key.indices(len(self)))
+        else:
+            key = self._check_index(key)
 
-    * :meth:`from_bytes`, :meth:`from_blocks`, :meth:`from_memory` to create
-      from existing byte-like, blocks, or :class:`bytesparse.Memory`;
-      *memory* role.
+        sizes = self.sizes
+        if isinstance(key, slice):
+            self._used_size -= sum(sizes[key])
+        else:
+            self._used_size -= sizes[key]
 
-    * :meth:`copy`, :meth:`convert` to clone an existing :class:`BaseFile`;
-      *memory* role.
+        for column in self._iter_columns():
+            del column[key]
 
-    * :meth:`from_records` to create from existing records;
-      *records* role.
+        self._reclaim_buffer()
 
-    * :meth:`load` to load records from the filesystem (via :func:`open`);
-      *records* role.
+    def __getitem__(self, key: Union[slice, int]) -> Union[BaseRecord, List[BaseRecord]]:
 
-    * :meth:`parse` to load records from a byte stream;
-      *records* role.
+        if isinstance(key, slice):
+            return [self._get_record(index) for index in range(len(self))[key]]
+        else:
+            return self._get_record(self._check_index(key))
 
-    Validation of :attr:`records` is performed via :meth:`validate`.
+    def __init__(
+        self,
+        Record: Type[BaseRecord],
+        records: Union[Iterable[BaseRecord], None] = None,
+    ):
 
-    Most methods return *self*, and as such they can be *chained*, instead of
-    being forced to call each method in a separate statement.
-    This comes handy to write some one-liners or generally shorter scripts.
+        self.Record: Type[BaseRecord] = Record
+        r"""Record object type."""
 
-    Please note that within the examples of this documentation *chaining* is
-    rarely used, for easier reading.
-    Any places where interactive console commands would return *self*, the
-    returned value is suppressed by assigning ``_``, not to disrupt the output
-    (e.g.: ``_ = file.print()`` outputs only record content to *stdout*).
-    """
+        self.tag_types: Sequence[BaseTag] = list(_cast(Any, Record.Tag))
+        r"""Tag values, as indexed by :attr:`tags`."""
 
-    DEFAULT_DATALEN: int = 16
-    r"""Default data attribute length.
+        self._tag_indices = {tag: index for index, tag in enumerate(self.tag_types)}
+        self._extra_keys = [key for key in Record.META_KEYS if key not in BaseRecord.META_KEYS]
 
-    Default value for the :attr:`maxdatalen` *meta*, which sets the maximum
-    size of :attr:`BaseRecord.data` field values.
-    """
+        self.tags: array = array('B')
+        r"""Tag index column."""
 
-    FILE_EXT: Sequence[str] = []
-    r"""Supported filename extensions.
+        self.addresses: array = array('Q')
+        r"""Address column."""
 
-    Sequence of file name extension substrings (e.g. ``.hex``).
-    This list is used by functions like :func:`guess_format_name` to manage
-    mapping of file *formats*.
-    """
+        self.counts: array = array('q')
+        r"""Count column; ``-1`` stands for ``None``."""
 
-    META_KEYS: Sequence[str] = ['maxdatalen']
-    r"""Meta information key names.
+        self.checksums: array = array('q')
+        r"""Checksum column; ``-1`` stands for ``None``."""
 
-    Sequence of key strings listing the supported *meta* information of this
-    file *format*.
-    """
-
-    Record: Type[BaseRecord] = None  # override  # type: ignore override
-    r"""Record object type.
-
-    This class attribute indicates the :class:`BaseRecord` class used by this
-    :class:`BaseFile` class.
-    """
-
-    def __add__(
-        self,
-        other: Union['BaseFile', AnyBytes],
-    ) -> Self:  # type: ignore Self
-        r"""Concatenates with another file.
+        self.offsets: array = array('Q')
+        r"""Data offset column, within :attr:`buffer`."""
 
-        Equivalent to :meth:`copy` then :meth:`extend`.
-
-        Args:
-            other (:class:`BaseFile` or bytes):
-                Other file or bytes to concatenate.
+        self.sizes: array = array('Q')
+        r"""Data size column."""
 
-        Returns:
-            :class:`BaseFile`: Concatenation of *self* and *other*.
+        self.rows: array = array('q')
+        r"""Coordinates row column."""
 
-        See Also:
-            :meth:`copy`
-            :meth:`extend`
+        self.columns: array = array('q')
+        r"""Coordinates column column."""
 
-        Examples:
-            **NOTE:** These examples are provided by :class:`BaseFile`.
-            Inherited classes for specific *formats* may require an adaptation.
+        self.befores: List[bytes] = []
+        r"""Before column."""
 
-            >>> from hexrec import SrecFile
-            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
-            >>> file2 = SrecFile.from_bytes(b'xyz', offset=456)
-            >>> file3 = file1 + file2
-            >>> file3.memory.to_blocks()
-            [(123, b'abc'), (582, b'xyz')]
-            >>> file4 = file3 + b'789'
-            >>> file4.memory.to_blocks()
-            [(123, b'abc'), (582, b'xyz789')]
-        """
+        self.afters: List[bytes] = []
+        r"""After column."""
 
-        return self.copy().extend(other)
+        self.extras: Mapping[str, List[Any]] = {key: [] for key in self._extra_keys}
+        r"""Additional *meta* columns."""
 
-    def __bool__(self) -> bool:
-        r"""bool: Has data records or memory.
+        self.buffer: bytearray = bytearray()
+        r"""Shared data buffer."""
 
-        Examples:
-            **NOTE:** These examples are provided by :class:`BaseFile`.
-            Inherited classes for specific *formats* may require an adaptation.
+        self._used_size = 0
 
-             >>> from hexrec import IhexFile
-             >>> file = IhexFile()
-             >>> bool(file)
-             False
-             >>> _ = file.append(0)
-             >>> bool(file)
-             True
+        if records is not None:
+            self.extend(records)
 
-             >>> from hexrec import IhexFile
-             >>> IhexRecord = IhexFile.Record
-             >>> file = IhexFile.from_records([IhexRecord.create_end_of_file()])
-             >>> bool(file)
-             False
-             >>> file.records.insert(0, IhexRecord.create_data(0, b'\0'))
-             >>> bool(file)
-             True
-        """
+    def __len__(self) -> int:
 
-        if self._memory:
-            return True
+        return len(self.tags)
 
-        if self._records:
-            for record in self._records:
-                if record.tag.is_data() and record.data:
-                    return True
+    def __repr__(self) -> str:
 
-        return False
+        return f'<{type(self).__name__} of {self.Record.__name__} at 0x{id(self):016X}>'
 
-    def __delitem__(self, key: Union[slice, int]) -> None:
-        r"""Deletes a range.
+    def __setitem__(
+        self,
+        key: Union[slice, int],
+        value: Union[BaseRecord, Iterable[BaseRecord]],
+    ) -> None:
 
-        Args:
-            key (slice or int):
-                Range to delete.
+        if isinstance(key, slice):
+            records = list(self)
+            records[key] = value
+            self.clear()
+            self.extend(records)
+        else:
+            index = self._check_index(key)
+            self._used_size -= self.sizes[index]
+            fields = self._get_fields(_cast(BaseRecord, value))
+            for column, field in zip(self._iter_columns(), fields):
+                column[index] = field
+            self._reclaim_buffer()
+
+    def _check_index(self, index: int) -> int:
+
+        size = len(self.tags)
+        index = index.__index__()
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError('record table index out of range')
+        return index
+
+    def _get_fields(self, record: BaseRecord) -> List[Any]:
+
+        try:
+            tag_index = self._tag_indices[record.tag]
+        except KeyError:
+            raise ValueError('invalid tag') from None
+
+        address = record.address
+        if address < 0:
+            raise ValueError('address overflow')
 
-        See Also:
-            :meth:`bytesparse.base.MutableMemory.__delitem__`
+        count = record.count
+        if count is None:
+            count = -1
+        elif count < 0:
+            raise ValueError('count overflow')
+
+        checksum = record.checksum
+        if checksum is None:
+            checksum = -1
+        elif checksum < 0:
+            raise ValueError('checksum overflow')
+
+        buffer = self.buffer
+        offset = len(buffer)
+        data = record.data
+        buffer += data
+        self._used_size += len(data)
+        row, column = record.coords
+
+        fields = [tag_index, address, count, checksum, offset, len(data), row, column,
+                  record.before, record.after]
+        fields.extend(getattr(record, key) for key in self._extra_keys)
+        return fields
+
+    def _get_record(self, index: int) -> BaseRecord:
+
+        offset = self.offsets[index]
+        count = self.counts[index]
+        checksum = self.checksums[index]
+        extras = {key: column[index] for key, column in self.extras.items()}
+
+        record = self.Record(self.tag_types[self.tags[index]],
+                             address=self.addresses[index],
+                             data=bytes(self.buffer[offset:(offset + self.sizes[index])]),
+                             count=(None if count < 0 else count),
+                             checksum=(None if checksum < 0 else checksum),
+                             before=self.befores[index],
+                             after=self.afters[index],
+                             coords=(self.rows[index], self.columns[index]),
+                             validate=False,
+                             **extras)
+        return record
+
+    def _iter_columns(self) -> Iterator[MutableSequence[Any]]:
+
+        yield self.tags
+        yield self.addresses
+        yield self.counts
+        yield self.checksums
+        yield self.offsets
+        yield self.sizes
+        yield self.rows
+        yield self.columns
+        yield self.befores
+        yield self.afters
+        yield from self.extras.values()
+
+    def _reclaim_buffer(self) -> None:
+
+        buffer = self.buffer
+        used_size = self._used_size
+        if len(buffer) - used_size <= used_size:
+            return
+
+        compacted = bytearray()
+        offsets = self.offsets
+        for index, (offset, size) in enumerate(zip(offsets, self.sizes)):
+            offsets[index] = len(compacted)
+            compacted += buffer[offset:(offset + size)]
+        self.buffer = compacted
+
+    def append(self, record: BaseRecord) -> None:
+
+        fields = self._get_fields(record)
+        for column, field in zip(self._iter_columns(), fields):
+            column.append(field)
+
+    def clear(self) -> None:
+
+        for column in self._iter_columns():
+            del column[:]
+        self.buffer.clear()
+        self._used_size = 0
+
+    def insert(self, index: int, record: BaseRecord) -> None:
+
+        fields = self._get_fields(record)
+        for column, field in zip(self._iter_columns(), fields):
+            column.insert(index, field)
+
+    def iter_fields(self) -> Iterator[Tuple[BaseTag, int, bytes]]:
+        r"""Iterates over record fields.
+
+        It yields the *tag*, *address*, and *data* of each record, directly
+        from the columns, without creating any record objects.
+
+        Yields:
+            tuple: *tag*, *address*, and *data* of each record.
 
         Examples:
-            **NOTE:** These examples are provided by :class:`BaseFile`.
-            Inherited classes for specific *formats* may require an adaptation.
-
             >>> from hexrec import SrecFile
-            >>> file = SrecFile.from_blocks([(123, b'abc'), (456, b'xyz')])
-            >>> del file[457]
-            >>> file.memory.to_blocks()
-            [(123, b'abc'), (456, b'xz')]
-            >>> del file[125:457]
-            >>> file.memory.to_blocks()
-            [(123, b'abz')]
+            >>> from hexrec.base import RecordTable
+            >>> SrecRecord = SrecFile.Record
+            >>> records = [SrecRecord.create_header(b'H'),
+            ...            SrecRecord.create_data(0x1234, b'abc')]
+            >>> table = RecordTable(SrecRecord, records)
+            >>> list(table.iter_fields())
+            [(<SrecTag.HEADER: 0>, 0, b'H'), (<SrecTag.DATA_16: 1>, 4660, b'abc')]
         """
 
-        del self.memory[key]
+        tag_types = self.tag_types
+        buffer = self.buffer
 
-    def __getitem__(self, key: Union[slice, int]) -> Union[AnyBytes, int, None]:
-        r"""Extracts a range.
+        for tag_index, address, offset, size in zip(self.tags, self.addresses, self.offsets, self.sizes):
+            yield tag_types[tag_index], address, bytes(buffer[offset:(offset + size)])
 
-        Args:
-            key (slice or int):
-                Range to extract.
 
-        Raises:
-            ValueError: invalid range.
+class BatchWriter:
+    r"""Batched byte stream writer.
 
-        See Also:
-            :meth:`bytesparse.base.ImmutableMemory.__getitem__`
+    It accumulates the written byte strings (e.g. serialized lines) into a
+    buffer, which is flushed onto the underlying stream as a whole as soon
+    as its size reaches :attr:`buffer_size`.
+    This way, many lines cost a single system call, even on unbuffered
+    sinks like pipes and sockets.
 
-        Examples:
-            **NOTE:** These examples are provided by :class:`BaseFile`.
-            Inherited classes for specific *formats* may require an adaptation.
+    Raw file streams (:class:`io.FileIO`) are flushed via :func:`os.writev`
+    where available, without joining the buffered byte strings.
+    Any other streams are written once with the joined byte strings.
 
-            >>> from hexrec import SrecFile
-            >>> file = SrecFile.from_blocks([(123, b'abc'), (456, b'xyz')])
-            >>> chr(file[457])
-            'y'
-            >>> repr(file[333])
-            'None'
-            >>> file[123:125]
-            b'ab'
-            >>> file[125:457]
-            Traceback (most recent call last):
-                ...
-            ValueError: non-contiguous data within range
-        """
+    Written byte strings are referenced, not copied, until flushed.
 
-        item = self.memory[key]
-        if isinstance(key, slice):
-            item = bytes(item)
-        return item
+    Args:
+        stream (bytes IO):
+            Stream to write onto.
 
-    def __eq__(self, other: Any) -> bool:
-        r"""Equality test.
+        buffer_size (int):
+            Buffer size, in bytes.
+            If zero, each byte string is written straight onto `stream`.
 
-        The file objects `self` and `other` are considered *equal* if the
-        inequality tests of :meth:`__ne__` result false.
+    Raises:
+        ValueError: Invalid buffer size.
 
-        Returns:
-            bool: `self` and `other` are *equal*.
+    Examples:
+        >>> from hexrec.base import BatchWriter
+        >>> import io
+        >>> stream = io.BytesIO()
+        >>> with BatchWriter(stream) as writer:
+        ...     _ = writer.write(b'abc\n')
+        ...     writer.writelines([b'xyz\n', b'123\n'])
+        ...     stream.getvalue()
+        b''
+        >>> stream.getvalue()
+        b'abc\nxyz\n123\n'
+    """
 
-        See Also
-            :meth:`__ne__`
+    DEFAULT_BUFFER_SIZE: int = 0x10000
+    r"""Default buffer size, in bytes."""
 
-        Examples:
-            **NOTE:** These examples are provided by :class:`BaseFile`.
-            Inherited classes for specific *formats* may require an adaptation.
+    def __enter__(self) -> 'BatchWriter':
 
-            >>> from hexrec import SrecFile
-            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
-            >>> file2 = SrecFile.from_bytes(b'abc', offset=123)
-            >>> file1 is file2
-            False
-            >>> file1 == file2
-            True
-            >>> file3 = SrecFile.from_bytes(b'xyz', offset=123)
-            >>> file1 == file3
-            False
-            >>> file4 = SrecFile.from_bytes(b'abc', offset=456)
-            >>> file1 == file4
-            False
+        return self
 
-            >>> from hexrec import SrecFile, IhexFile
-            >>> srec_file = SrecFile.from_bytes(b'abc', offset=123)
-            >>> ihex_file = IhexFile.from_bytes(b'abc', offset=123)
-            >>> srec_file == ihex_file
-            False
-            >>> srec_file.memory == ihex_file.memory
-            True
-            >>> set(srec_file.META_KEYS) - set(ihex_file.META_KEYS)
-            {'header'}
-        """
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
 
-        return not self != other
+        self.flush()
 
-    def __iadd__(
+    def __init__(
         self,
-        other: Union['BaseFile', AnyBytes],
-    ) -> Self:  # type: ignore Self
-        r"""Concatenates data.
+        stream: IO,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
 
-        Equivalent to :meth:`extend`.
+        buffer_size = buffer_size.__index__()
+        if buffer_size < 0:
+            raise ValueError('invalid buffer size')
 
-        It concatenates `other` to the underlyng :attr:`memory`.
+        self.stream: IO = stream
+        r"""Underlying stream to write onto."""
 
-        Any stored :attr:`records` are discarded upon return.
+        self.buffer_size: int = buffer_size
+        r"""Buffer size, in bytes."""
 
-        Args:
-            other (:class:`BaseFile` or bytes):
-                Other file or bytes to concatenate.
+        self._chunks: List[AnyBytes] = []
+        self._size: int = 0
+        self._fileno: Union[int, None] = None
 
-        Returns:
-            :class:`BaseFile`: *self*.
+        if hasattr(os, 'writev') and isinstance(stream, io.FileIO):
+            self._fileno = stream.fileno()
 
-        See Also:
-            :attr:`memory`
-            :meth:`extend`
-            :meth:`discard_records`
-            :meth:`bytesparse.base.MutableMemory.extend`
+    def _writev(self, chunks: List[AnyBytes]) -> None:
+        r"""Writes byte strings via :func:`os.writev`.
 
-        Examples:
-            **NOTE:** These examples are provided by :class:`BaseFile`.
-            Inherited classes for specific *formats* may require an adaptation.
+        It writes all the `chunks` onto the raw file descriptor, in batches
+        of up to ``IOV_MAX`` byte strings, resuming after partial writes.
 
-            >>> from hexrec import SrecFile
-            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
-            >>> file2 = SrecFile.from_bytes(b'xyz', offset=456)
-            >>> file1 += file2
-            >>> file1.memory.to_blocks()
-            [(123, b'abc'), (582, b'xyz')]
-            >>> file1 += b'789'
-            >>> file1.memory.to_blocks()
-            [(123, b'abc'), (582, b'xyz789')]
+        Args:
+            chunks (list of bytes):
+                Byte strings to write; altered upon return.
         """
 
-        return self.extend(other)
+        fileno = self._fileno
+        index = 0
 
-    def __init__(self):
+        while index < len(chunks):
+            batch = chunks[index:(index + _IOV_MAX)]
+            written = os.writev(fileno, batch)
 
-        self._records: Union[MutableSequence[BaseRecord], None] = None
-        self._memory: Union[MutableMemory, None] = Memory()
-        self._maxdatalen: int = self.DEFAULT_DATALEN
+            for chunk in batch:
+                size = len(chunk)
+                if written < size:
+                    chunks[index] = memoryview(chunk)[written:]
+                    break
+                written -= size
+                index += 1
 
-    def __ior__(self, other: 'BaseFile') -> Self:  # type: ignore Self
-        r"""Merges with another file.
+    def flush(self) -> None:
+        r"""Flushes the buffer.
 
-        Equivalent to :meth:`merge`.
+        It writes all the buffered byte strings onto :attr:`stream`.
+        """
 
-        Any stored :attr:`records` are discarded upon return.
+        chunks = self._chunks
+        if chunks:
+            if len(chunks) == 1:
+                self.stream.write(chunks[0])
+            elif self._fileno is not None:
+                self._writev(chunks)
+            else:
+                self.stream.write(b''.join(chunks))
+            chunks.clear()
+            self._size = 0
+
+    def write(self, data: AnyBytes) -> int:
+        r"""Writes a byte string.
+
+        The byte string is appended to the buffer, which is flushed if its
+        size reaches :attr:`buffer_size`.
 
         Args:
-            other (:class:`BaseFile` or bytes):
-                Other file or bytes to merge.
+            data (bytes):
+                Byte string to write.
 
         Returns:
-            :class:`BaseFile`: *self*.
+            int: Size of `data`, in bytes.
+        """
 
-        See Also:
-            :meth:`merge`
-            :meth:`discard_records`
+        size = len(data)
+        self._chunks.append(data)
+        self._size += size
+        if self._size >= self.buffer_size:
+            self.flush()
+        return size
 
-        Examples:
-            **NOTE:** These examples are provided by :class:`BaseFile`.
-            Inherited classes for specific *formats* may require an adaptation.
+    def writelines(self, lines: Iterable[AnyBytes]) -> None:
+        r"""Writes byte strings.
 
-            >>> from hexrec import SrecFile
-            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
-            >>> file2 = SrecFile.from_bytes(b'xyz', offset=456)
-            >>> file1 |= file2
-            >>> file1.memory.to_blocks()
-            [(123, b'abc'), (456, b'xyz')]
-            >>> file1 |= b'789'
-            >>> file1.memory.to_blocks()
-            [(0, b'789'), (123, b'abc'), (456, b'xyz')]
+        It calls :meth:`write` for each of the `lines`.
+
+        Args:
+            lines (iterable of bytes):
+                Byte strings to write.
         """
 
-        self.merge(other)
-        return self
+        write = self.write
+        for line in lines:
+            write(line)
 
-    def __ne__(self, other: Any) -> bool:
-        r"""Inequality test.
 
-        The file objects `self` and `other` are considered *unequal* if any of
-        the following tests result true:
+class ChunkWriter:
+    r"""Memory chunk writer.
 
-        * Both have *memory role* (i.e. :attr:`memory`), resulting unequal;
-        * Both have *records role* (i.e. :attr:`records`), resulting unequal;
-        * `other` does not have a *meta* listed by :attr:`META_KEYS`;
-        * A *meta* value (among those of :attr:`META_KEYS`) is different.
+    It joins contiguous *data* written at increasing addresses into a
+    single chunk, which is written into the underlying memory as a whole
+    as soon as some non-contiguous *data* are written, or when flushed.
+    This way, many small *data* records cost a single memory write.
 
-        Returns:
-            bool: `self` and `other` are *unequal*.
+    Args:
+        memory (:class:`bytesparse.Memory`):
+            Memory to write onto.
 
-        See Also:
-            :meth:`__eq__`
-            :attr:`memory`
-            :attr:`records`
-            :attr:`META_KEYS`
+    Examples:
+        >>> from hexrec.base import ChunkWriter
+        >>> from bytesparse import Memory
+        >>> memory = Memory()
+        >>> with ChunkWriter(memory) as writer:
+        ...     writer.write(123, b'abc')
+        ...     writer.write(126, b'xyz')
+        ...     writer.write(456, b'.')
+        >>> memory.to_blocks()
+        [(123, b'abcxyz'), (456, b'.')]
+        >>> writer.maxdatalen
+        3
+    """
 
-        Examples:
-            **NOTE:** These examples are provided by :class:`BaseFile`.
-            Inherited classes for specific *formats* may require an adaptation.
+    def __enter__(self) -> 'ChunkWriter':
 
-            >>> from hexrec import SrecFile
-            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
-            >>> file2 = SrecFile.from_bytes(b'abc', offset=123)
-            >>> file1 is file2
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+
+        self.flush()
+
+    def __init__(self, memory: MutableMemory):
+
+        self.memory: MutableMemory = memory
+        r"""Underlying memory to write onto."""
+
+        self.maxdatalen: int = 0
+        r"""Maximum size of the written *data*, in bytes."""
+
+        self._chunk: bytearray = bytearray()
+        self._start: int = 0
+        self._endex: int = 0
+
+    def flush(self) -> None:
+        r"""Flushes the chunk.
+
+        It writes the pending chunk into :attr:`memory`.
+        """
+
+        chunk = self._chunk
+        if chunk:
+            self.memory.write(self._start, chunk)
+            self._chunk = bytearray()
+        self._start = self._endex
+
+    def write(self, address: int, data: AnyBytes) -> None:
+        r"""Writes data.
+
+        The *data* are appended to the pending chunk if contiguous, otherwise
+        the chunk is flushed and restarted at `address`.
+
+        Args:
+            address (int):
+                Address of the *data*.
+
+            data (bytes):
+                *Data* to write.
+        """
+
+        if address != self._endex:
+            self.flush()
+            self._start = address
+        self._chunk += data
+        size = len(data)
+        self._endex = address + size
+        if self.maxdatalen < size:
+            self.maxdatalen = size
+
+
+class BaseParser:
+    r"""Push parser.
+
+    It parses a byte stream incrementally, being fed with its chunks as soon
+    as they are available (e.g. received from a socket or a serial port),
+    instead of pulling the whole stream at once like :meth:`BaseFile.parse`.
+
+    Each :meth:`feed` parses the lines completed by the incoming chunk,
+    applying each record straight into :attr:`memory` and *meta* via
+    :meth:`apply_record`.
+    Any trailing incomplete line is kept until completed by the next chunks,
+    so that records split across chunk boundaries are supported.
+    No parsed records are collected, so memory usage is bounded by the
+    longest line, besides :attr:`memory` itself.
+
+    Finally, :meth:`close` creates the file object in *memory role*.
+
+    This generic implementation handles *data* records only; each record
+    file *format* provides its own :attr:`BaseFile.Parser` to handle its
+    own *meta* and addressing.
+
+    Args:
+        file_type (type):
+            :class:`BaseFile` class of the parsed file.
+
+        ignore_errors (bool):
+            Ignore invalid lines, collecting them into :attr:`diagnostics`.
+
+        ignore_after_termination (bool):
+            Ignore anything after the termination record was parsed, if
+            supported.
+
+    See Also:
+        :meth:`BaseFile.create_parser`
+        :meth:`BaseFile.parse_memory`
+
+    Examples:
+        >>> from hexrec import IhexFile
+        >>> parser = IhexFile.create_parser()
+        >>> parser.feed(b':03DA7A00616263')
+        []
+        >>> records = parser.feed(b'83\r\n:040000050000CAFE2F\r\n:000000')
+        >>> [record.coords for record in records]
+        [(1, 0), (2, 0)]
+        >>> records = parser.feed(b'01FF\r\n')
+        >>> file = parser.close()
+        >>> file.memory.to_blocks()
+        [(55930, b'abc')]
+        >>> file.get_meta()
+        {'linear': True, 'maxdatalen': 3, 'startaddr': 51966}
+    """
+
+    def __init__(
+        self,
+        file_type: Type['BaseFile'],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+    ):
+
+        self.file_type: Type['BaseFile'] = file_type
+        r"""Parsed file object type."""
+
+        self.ignore_errors: bool = ignore_errors
+        r"""Ignore :class:`Exception` raised by :meth:`BaseRecord.parse`."""
+
+        self.ignore_after_termination: bool = ignore_after_termination
+        r"""Ignore anything after the termination record."""
+
+        self.maxdatalen: int = 0
+        r"""Maximum *data* size parsed so far."""
+
+        self.memory: MutableMemory = Memory()
+        r"""Memory image parsed so far."""
+
+        self.parsed: int = 0
+        r"""Number of records parsed so far."""
+
+        self.row: int = 0
+        r"""Number of lines parsed so far."""
+
+        self.terminated: bool = False
+        r"""The termination record was parsed."""
+
+        self.diagnostics: List[Tuple[int, int, str]] = []
+        r"""Ignored errors, as ``(row, column, reason)`` tuples."""
+
+        self._pending = bytearray()
+
+    def _parse_lines(self, lines: Iterable[ByteString]) -> List[BaseRecord]:
+        r"""Parses complete lines.
+
+        It executes :meth:`BaseRecord.parse` for each line, applying each
+        record via :meth:`apply_record`.
+        Lines resulting empty by :meth:`BaseFile._is_line_empty` are just
+        discarded.
+
+        Args:
+            lines (list of bytes):
+                Lines to parse.
+
+        Returns:
+            list of :class:`BaseRecord`: Parsed records.
+        """
+
+        file_type = self.file_type
+        Record = file_type.Record
+        records = []
+
+        for line in lines:
+            self.row += 1
+
+            if file_type._is_line_empty(line):
+                continue
+
+            if self.ignore_errors:
+                record, reason = Record.try_parse(line)
+                if reason:
+                    self.diagnostics.append((self.row, 0, reason))
+                    continue
+            else:
+                record = Record.parse(line)
+
+            record.coords = (self.row, 0)
+            self.apply_record(record)
+            records.append(record)
+            self.parsed += 1
+
+            if self.ignore_after_termination:
+                if record.tag.is_file_termination():
+                    self.terminated = True
+                    self._pending.clear()
+                    break
+
+        return records
+
+    def _parse_pending(self) -> List[BaseRecord]:
+        r"""Parses the pending line.
+
+        It parses the trailing incomplete line, if any, as the last one.
+
+        Returns:
+            list of :class:`BaseRecord`: Parsed records.
+        """
+
+        pending = self._pending
+        if not pending or self.terminated:
+            return []
+
+        line = bytes(pending)
+        pending.clear()
+        return self._parse_lines([line])
+
+    def apply_record(self, record: BaseRecord) -> None:
+        r"""Applies a record.
+
+        It writes the *data* of a record into :attr:`memory`, or updates the
+        *meta* state accordingly.
+
+        Args:
+            record (:class:`BaseRecord`):
+                Record to apply.
+        """
+
+        if record.tag.is_data():
+            data = record.data
+            self.memory.write(record.address, data)
+            if self.maxdatalen < len(data):
+                self.maxdatalen = len(data)
+
+    def close(self) -> 'BaseFile':
+        r"""Closes the parser.
+
+        It parses any trailing incomplete line, then creates a file object in
+        *memory role* from :attr:`memory` and :meth:`get_meta`.
+
+        If no records were parsed at all, the empty record sequence is
+        validated by :meth:`BaseFile.apply_records`, so that the same
+        exceptions as per :meth:`BaseFile.parse_memory` are raised.
+
+        Returns:
+            :class:`BaseFile`: The created file object.
+
+        Raises:
+            ValueError: Invalid record, or records required.
+        """
+
+        self._parse_pending()
+        if not self.parsed:
+            self.file_type.from_records([]).apply_records()
+        file = self.file_type.from_memory(self.memory, **self.get_meta())
+        return file
+
+    def feed(self, chunk: AnyBytes) -> List[BaseRecord]:
+        r"""Feeds a stream chunk.
+
+        It parses the lines completed by `chunk`, keeping any trailing
+        incomplete line for the next chunks.
+        Anything after the termination record is ignored, if required.
+
+        Args:
+            chunk (bytes):
+                Chunk of the byte stream, of any size.
+
+        Returns:
+            list of :class:`BaseRecord`: Records parsed from the completed
+            lines, already applied.
+
+        Raises:
+            ValueError: Invalid record.
+        """
+
+        if self.terminated:
+            return []
+
+        pending = self._pending
+        scanned = len(pending)  # no line ends before
+        pending += chunk
+        endex = pending.rfind(b'\n', scanned) + 1
+        if not endex:
+            return []
+
+        buffer = bytes(pending[:endex])
+        del pending[:endex]
+        return self._parse_lines(self.file_type._iter_buffer_lines(buffer))
+
+    def get_meta(self) -> MutableMapping[str, Any]:
+        r"""Parsed meta.
+
+        Returns:
+            dict: *Meta* parsed so far, as per :meth:`BaseFile.get_meta`.
+        """
+
+        return {'maxdatalen': (self.maxdatalen or self.file_type.DEFAULT_DATALEN)}
+
+
+class ParseCache:
+    r"""Persistent parse cache.
+
+    It stores the :attr:`BaseFile.memory` and *meta* of loaded record files
+    into a cache directory, so that loading an unchanged file again skips
+    parsing altogether, creating the file object in *memory role* straight
+    from the cached entry.
+
+    Each entry is keyed by the :mod:`hexrec` version, the file type, the
+    parsing arguments, and the fingerprint of the input file, as per
+    :meth:`fingerprint`.
+    Entries are compact :mod:`marshal` dumps of memory blocks and *meta*.
+
+    The least recently used entries are evicted as soon as the cache
+    directory exceeds :attr:`max_size`.
+
+    Args:
+        path (str):
+            Path of the cache directory; created if missing.
+
+        max_size (int):
+            Maximum total size of the cached entries, in bytes.
+
+        hash_content (bool):
+            Fingerprints files by hashing their whole content.
+            If false, just by their path, size, and modification time.
+
+    See Also:
+        :meth:`BaseFile.load`
+
+    Examples:
+        >>> import os, tempfile
+        >>> from hexrec import IhexFile
+        >>> from hexrec.base import ParseCache
+        >>> folder = tempfile.TemporaryDirectory()
+        >>> path = os.path.join(folder.name, 'data.hex')
+        >>> _ = IhexFile.from_blocks([(0xDA7A, b'abc')], startaddr=0xCAFE).save(path)
+        >>> cache = ParseCache(os.path.join(folder.name, '.hexrec-cache'))
+        >>> file = IhexFile.load(path, cache=cache)  # miss, parsed
+        >>> file = IhexFile.load(path, cache=cache)  # hit, not parsed
+        >>> file.memory.to_blocks()
+        [(55930, b'abc')]
+        >>> file.get_meta()
+        {'linear': True, 'maxdatalen': 3, 'startaddr': 51966}
+        >>> folder.cleanup()
+    """
+
+    DEFAULT_MAX_SIZE: int = 64 << 20
+    r"""Default maximum total size of the cached entries, in bytes."""
+
+    ENTRY_EXT: str = '.hexrec'
+    r"""Cache entry file extension."""
+
+    VERSION: int = 1
+    r"""Cache entry format version."""
+
+    def __init__(
+        self,
+        path: AnyPath,
+        max_size: int = DEFAULT_MAX_SIZE,
+        hash_content: bool = True,
+    ):
+
+        max_size = max_size.__index__()
+        if max_size < 0:
+            raise ValueError('invalid maximum size')
+
+        self.path: str = os.fsdecode(path)
+        r"""Path of the cache directory."""
+
+        self.max_size: int = max_size
+        r"""Maximum total size of the cached entries, in bytes."""
+
+        self.hash_content: bool = hash_content
+        r"""Fingerprint files by hashing their whole content."""
+
+        self._fingerprints: MutableMapping[Tuple[str, int, int], bytes] = {}
+
+        os.makedirs(self.path, exist_ok=True)
+
+    def _entry_path(self, key: str) -> str:
+        r"""Path of a cache entry.
+
+        Args:
+            key (str):
+                Cache entry key.
+
+        Returns:
+            str: Path of the cache entry file.
+        """
+
+        return os.path.join(self.path, key + self.ENTRY_EXT)
+
+    def clear(self) -> None:
+        r"""Removes all the cached entries."""
+
+        ext = self.ENTRY_EXT
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if entry.name.endswith(ext):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:  # pragma: no cover
+                        pass
+
+    def evict(self) -> None:
+        r"""Evicts the least recently used entries.
+
+        It removes the least recently used entries, until the total size of
+        the cached entries does not exceed :attr:`max_size`.
+        """
+
+        ext = self.ENTRY_EXT
+        stats = []
+        total = 0
+
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if entry.name.endswith(ext):
+                    try:
+                        stat = entry.stat()
+                    except OSError:  # pragma: no cover
+                        continue
+                    stats.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        stats.sort()
+        for _, size, path in stats:
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:  # pragma: no cover
+                continue
+            total -= size
+
+    def fingerprint(self, path: AnyPath) -> bytes:
+        r"""Fingerprints a file.
+
+        If :attr:`hash_content`, it hashes the whole file content, which is
+        robust against any modification.
+        Otherwise, it just combines the absolute path, size, and modification
+        time of the file.
+
+        Content hashes are memoized by path, size, and modification time, so
+        that trying multiple formats on the same file hashes it only once.
+
+        Args:
+            path (str):
+                Path of the file.
+
+        Returns:
+            bytes: File fingerprint.
+        """
+
+        path = os.path.abspath(os.fsdecode(path))
+        stat = os.stat(path)
+        memo_key = (path, stat.st_size, stat.st_mtime_ns)
+
+        if not self.hash_content:
+            return repr(memo_key).encode()
+
+        digest = self._fingerprints.get(memo_key)
+        if digest is None:
+            hasher = hashlib.blake2b(digest_size=20)
+            with open(path, 'rb') as stream:
+                for chunk in iter(functools.partial(stream.read, 1 << 20), b''):
+                    hasher.update(chunk)
+            digest = hasher.digest()
+            self._fingerprints[memo_key] = digest
+        return digest
+
+    def get(self, key: str) -> Union[Tuple[BlockSequence, Mapping[str, Any]], None]:
+        r"""Gets a cached entry.
+
+        A hit marks the entry as the most recently used one.
+        Any unreadable entry is removed, resulting in a miss.
+
+        Args:
+            key (str):
+                Cache entry key, as per :meth:`make_key`.
+
+        Returns:
+            (blocks, meta): Memory blocks and *meta* of the cached entry, or
+            ``None`` if missing.
+        """
+
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as stream:
+                version, blocks, meta = marshal.load(stream)
+            if version != self.VERSION:
+                raise ValueError('version mismatch')
+        except FileNotFoundError:
+            return None
+        except Exception:
+            try:
+                os.remove(path)
+            except OSError:  # pragma: no cover
+                pass
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:  # pragma: no cover
+            pass
+        return blocks, meta
+
+    def make_key(
+        self,
+        file_type: Type['BaseFile'],
+        path: AnyPath,
+        args: Sequence[Any] = (),
+        kwargs: Union[Mapping[str, Any], None] = None,
+    ) -> str:
+        r"""Makes a cache entry key.
+
+        Args:
+            file_type (type):
+                :class:`BaseFile` class of the loaded file.
+
+            path (str):
+                Path of the loaded file.
+
+            args (list):
+                Positional arguments forwarded to :meth:`BaseFile.parse`.
+
+            kwargs (dict):
+                Keyword arguments forwarded to :meth:`BaseFile.parse`.
+
+        Returns:
+            str: Cache entry key, as hexadecimal string.
+        """
+
+        items = sorted((kwargs or {}).items())
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(repr((self.VERSION, marshal.version, __version__,
+                            file_type.__module__, file_type.__qualname__,
+                            tuple(args), items)).encode())
+        hasher.update(self.fingerprint(path))
+        return hasher.hexdigest()
+
+    def put(
+        self,
+        key: str,
+        blocks: BlockSequence,
+        meta: Mapping[str, Any],
+    ) -> None:
+        r"""Puts an entry into the cache.
+
+        The entry is written atomically, then the least recently used entries
+        are evicted via :meth:`evict`.
+        Any I/O errors are ignored, as caching is just an optimization.
+
+        Args:
+            key (str):
+                Cache entry key, as per :meth:`make_key`.
+
+            blocks (list of blocks):
+                Memory blocks to cache.
+
+            meta (dict):
+                *Meta* to cache.
+        """
+
+        blocks = [(address, bytes(data)) for address, data in blocks]
+        payload = marshal.dumps((self.VERSION, blocks, dict(meta)))
+        if len(payload) > self.max_size:
+            return
+
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as stream:
+                stream.write(payload)
+            os.replace(temp_path, self._entry_path(key))
+            temp_path = None
+        except OSError:  # pragma: no cover
+            return
+        finally:
+            if temp_path is not None:  # pragma: no cover
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+        self.evict()
+
+
+class EditBatch:
+    r"""Batch of memory edits.
+
+    It collects overwriting edits of a file object, like :meth:`write`,
+    :meth:`fill`, and :meth:`clear`, into a staging memory, along with any
+    *meta* changes, until :meth:`commit`.
+    This way, overlapping edits are coalesced into a minimal set of memory
+    operations, and the file :attr:`BaseFile.records` are invalidated once.
+
+    Upon :meth:`commit`, the cleared ranges are cleared first, then each
+    staged chunk is written.
+    A chunk falling within existing contiguous data is patched in place,
+    without resizing the underlying memory block.
+
+    The edits are not visible through the file object until committed.
+    When used as a context manager, the batch is committed upon exit, or
+    discarded if an exception was raised.
+
+    Args:
+        file (:class:`BaseFile`):
+            File object to edit.
+
+    See Also:
+        :meth:`BaseFile.batch`
+
+    Examples:
+        >>> from hexrec import IhexFile
+        >>> file = IhexFile.from_blocks([(0x1000, bytes(8))])
+        >>> with file.batch() as batch:
+        ...     _ = batch.write(0x1000, b'abc')
+        ...     _ = batch.fill(0x1002, 0x1006, b'xy')
+        ...     _ = batch.clear(0x1007, 0x1008)
+        ...     _ = batch.set_meta({'startaddr': 0x1000})
+        ...     file.memory.to_blocks()
+        [(4096, b'\x00\x00\x00\x00\x00\x00\x00\x00')]
+        >>> file.memory.to_blocks()
+        [(4096, b'abxyxy\x00')]
+        >>> file.startaddr
+        4096
+    """
+
+    def __enter__(self) -> 'EditBatch':
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+    def __init__(self, file: 'BaseFile'):
+
+        self.file: 'BaseFile' = file
+        r"""File object to edit."""
+
+        self._staging: MutableMemory = Memory()
+        self._clears: List[Tuple[int, int]] = []
+        self._meta: MutableMapping[str, Any] = {}
+
+    def clear(self, start: int, endex: int) -> 'EditBatch':
+        r"""Clears an address range.
+
+        Args:
+            start (int):
+                Inclusive start address of the range.
+
+            endex (int):
+                Exclusive end address of the range.
+
+        Returns:
+            :class:`EditBatch`: *self*.
+
+        See Also:
+            :meth:`BaseFile.clear`
+        """
+
+        start = start.__index__()
+        endex = endex.__index__()
+        if start < endex:
+            self._staging.clear(start=start, endex=endex)
+            self._clears.append((start, endex))
+        return self
+
+    def commit(self) -> None:
+        r"""Commits the collected edits.
+
+        It applies the collected edits to :attr:`file`, then resets the
+        batch, which can be reused.
+
+        The cleared ranges are merged and cleared first, then each staged
+        chunk is written, patching existing contiguous data in place.
+        Any memory blocks shared with other files are copied before being
+        patched.
+        Finally, any collected *meta* are set via :meth:`BaseFile.set_meta`.
+        """
+
+        file = self.file
+        staging = self._staging
+        clears = self._clears
+        meta = self._meta
+
+        if clears or staging:
+            memory = file._get_memory()
+            clears.sort()
+            merged = []
+
+            for start, endex in clears:
+                if merged and start <= merged[-1][1]:
+                    if merged[-1][1] < endex:
+                        merged[-1] = (merged[-1][0], endex)
+                else:
+                    merged.append((start, endex))
+
+            for start, endex in merged:
+                file._unshare_memory(start, start)
+                file._unshare_memory(endex, endex)
+                memory.clear(start=start, endex=endex)
+                file._mark_dirty(start, endex)
+
+            for start, chunk in staging.blocks():
+                endex = start + len(chunk)
+                file._unshare_memory(start, endex)
+                try:
+                    target = memory.view(start, endex)
+                except ValueError:  # not within contiguous data
+                    target = None
+
+                if target is not None and not target.readonly and isinstance(target.obj, bytearray):
+                    with target:
+                        target[:] = chunk
+                else:
+                    if target is not None:
+                        target.release()
+                    memory.write(start, chunk)
+                file._mark_dirty(start, endex)
+
+        if meta:
+            file.set_meta(meta, strict=False)
+
+        self.discard()
+
+    def discard(self) -> None:
+        r"""Discards the collected edits.
+
+        It forgets all the edits collected so far, leaving :attr:`file`
+        untouched.
+        """
+
+        self._staging = Memory()
+        self._clears = []
+        self._meta = {}
+
+    def fill(
+        self,
+        start: int,
+        endex: int,
+        pattern: Union[int, AnyBytes] = 0,
+    ) -> 'EditBatch':
+        r"""Fills an address range.
+
+        Args:
+            start (int):
+                Inclusive start address of the range.
+
+            endex (int):
+                Exclusive end address of the range.
+
+            pattern (int or bytes):
+                Pattern to fill with.
+
+        Returns:
+            :class:`EditBatch`: *self*.
+
+        See Also:
+            :meth:`BaseFile.fill`
+        """
+
+        self._staging.fill(start=start.__index__(), endex=endex.__index__(), pattern=pattern)
+        return self
+
+    def set_meta(
+        self,
+        meta: Mapping[str, Any],
+        strict: bool = True,
+    ) -> 'EditBatch':
+        r"""Sets meta information.
+
+        Args:
+            meta (dict):
+                *Meta* to set upon :meth:`commit`, as per
+                :meth:`BaseFile.set_meta`.
+
+            strict (bool):
+                Raises :class:`KeyError` if a key is not listed by
+                :attr:`BaseFile.META_KEYS`.
+
+        Returns:
+            :class:`EditBatch`: *self*.
+
+        Raises:
+            KeyError: Unknown *meta* key.
+
+        See Also:
+            :meth:`BaseFile.set_meta`
+        """
+
+        if strict:
+            meta_keys = self.file.META_KEYS
+            for key in meta:
+                if key not in meta_keys:
+                    raise KeyError(f'unknown meta: {key!r}')
+        self._meta.update(meta)
+        return self
+
+    def write(
+        self,
+        address: int,
+        data: Union['BaseFile', AnyBytes, int, ImmutableMemory],
+        clear: bool = False,
+    ) -> 'EditBatch':
+        r"""Writes data.
+
+        Args:
+            address (int):
+                Address of the first byte to write.
+
+            data (bytes):
+                Byte data to write.
+
+            clear (bool):
+                Clears the range spanned by `data` before writing, if it is
+                a memory object.
+
+        Returns:
+            :class:`EditBatch`: *self*.
+
+        See Also:
+            :meth:`BaseFile.write`
+        """
+
+        address = address.__index__()
+        if isinstance(data, BaseFile):
+            data = data._get_memory()
+        if clear and isinstance(data, ImmutableMemory):
+            self.clear(address + data.start, address + data.endex)
+        self._staging.write(address, data)
+        return self
+
+
+if not __TYPING_HAS_SELF:  # pragma: no cover
+    del Self
+    Self = TypeVar('Self', bound='BaseFile')
+
+
+class BaseFile(abc.ABC):
+    r"""Record file.
+
+    A *record file* contains a sequence of *records* (:class:`BaseRecord`),
+    which can be serialized to transfer some *binary* data across systems,
+    usually an executable program of some configuration data for an
+    *embedded system*.
+
+    The :class:`BaseFile` class provides a useful abstraction of a record file,
+    to create, edit, or convert across file *formats*.
+
+    A :class:`BaseFile` instance has a dual role:
+
+    * *records role*: to host the sequence of *records* for parsing and
+      serialization;
+
+    * *memory role*: to host the equivalent *memory* image and *meta*
+      information.
+
+    Both roles can be active at the same time only when both representations
+    are coherent.
+
+    The *records* role is useful to :meth:`load` or :meth:`save` the instance
+    against the filesystem.
+    The individual records can be edited via the :attr:`records` attribute.
+    This is considered an advanced feature, for debug or experimentation.
+
+    The *memory* role is for editing the equivalent *memory image*.
+    The :class:`BaseFile` provides common methods to :meth:`read`,
+    :meth:`write`, :meth:`cut`, :meth:`crop`, :meth:`clear`, :meth:`delete`,
+    :meth:`fill`, :meth:`flood`, and more.
+    Furthermore, this role also abstracts *meta* information, like the maximum
+    *data* size (:attr:`maxdatalen`), or the *start address* (if available for
+    the specific file *format*).
+    Advanced editing can be performed via the underlying :attr:`memory`
+    attribute, thanks to  the powerful :class:`bytesparse.Memory` class (from
+    the `bytesparse Python package <https://pypi.org/project/bytesparse/>`_),
+    the :meth:`get_meta` and :meth:`set_meta` methods, or their equivalent
+    Python property wrappers.
+    The :attr:`memory` also provides additional methods and properties for
+    in-depth analysis (min/max address, gaps, spans, find, etc.).
+
+    A :class:`BaseFile` instance can impersonate each role via:
+
+    * :meth:`apply_records` to mirror the :attr:`records` sequence into the
+      equivalent :attr:`memory` and *meta*.
+
+    * :meth:`update_records` to mirror the :attr:`memory` and *meta* into
+      an actual :attr:`records` sequence.
+
+    Please note that reading from the :attr:`records` or :attr:`memory`
+    properties automatically activates the corresponding role if inactive
+    (i.e. :meth:`update_records` if :attr:`_records` is ``None``,
+    :meth:`apply_records` if :attr:`_memory` is ``None``).
+
+    Beware that any editing done within a role may invalidate the other role,
+    if both :attr:`records` and :attr:`memory` + *meta* are instantiated.
+    For example, setting the :attr:`maxdatalen` property means that records
+    must be updated to mirror the new maximum *data* field length.
+    Records must also be invalidated whenever the :attr:`memory` is altered.
+
+    Usually, *meta* property setters automatically invalidate :attr:`records`
+    on change (via :meth:`discard_records`).
+    Instead, only the explicit *memory* methods of :meth:`BaseFile` do it
+    automatically; any operations on the :attr:`memory` itself require
+    :meth:`update_records` be called to mirror any changes.
+
+    The explicit *memory* methods also keep track of the edited address
+    ranges, so that the next :meth:`update_records` regenerates only the
+    *data* records overlapping them, reusing the others (along with their
+    serialized lines), while :meth:`discard_records` forgets everything.
+
+    Many edits can be collected via :meth:`batch`, then applied at once,
+    coalescing overlapping edits and invalidating :attr:`records` once.
+
+    Instantiation of a new :class:`BaseFile` instance should be performed via:
+
+    * :class:`BaseFile` for an empty file (only!);
+      *memory* role.
+
+    * :meth:`from_bytes`, :meth:`from_blocks`, :meth:`from_memory` to create
+      from existing byte-like, blocks, or :class:`bytesparse.Memory`;
+      *memory* role.
+
+    * :meth:`copy`, :meth:`convert` to clone an existing :class:`BaseFile`;
+      *memory* role.
+
+    * :meth:`from_records` to create from existing records;
+      *records* role.
+
+    * :meth:`load` to load records from the filesystem (via :func:`open`);
+      *records* role.
+
+    * :meth:`parse` to load records from a byte stream;
+      *records* role.
+
+    Validation of :attr:`records` is performed via :meth:`validate`.
+
+    Most methods return *self*, and as such they can be *chained*, instead of
+    being forced to call each method in a separate statement.
+    This comes handy to write some one-liners or generally shorter scripts.
+
+    Please note that within the examples of this documentation *chaining* is
+    rarely used, for easier reading.
+    Any places where interactive console commands would return *self*, the
+    returned value is suppressed by assigning ``_``, not to disrupt the output
+    (e.g.: ``_ = file.print()`` outputs only record content to *stdout*).
+    """
+
+    ASYNC_CHUNK_SIZE: int = 0x10000
+    r"""Chunk size for asynchronous I/O.
+
+    Size of each chunk read or written by the asynchronous methods, like
+    :meth:`aparse` and :meth:`aserialize`.
+    The event loop is given back control after processing each chunk.
+    """
+
+    CHECKSUM_BATCH_SIZE: int = 0x1000
+    r"""Checksum batch size.
+
+    Number of records whose checksums are verified at once, via
+    :meth:`BaseRecord.verify_checksums`, by :meth:`parse` and
+    :meth:`validate_records`, or via :meth:`BaseRecord.parse_fields_batch`
+    by :meth:`parse_memory`.
+    """
+
+    CONTENT_REGEX: Union[re.Pattern, None] = None  # override
+    r"""Content signature regex.
+
+    Regular expression matching the beginning of a record file of this
+    *format*, as used by :func:`guess_format_from_content`.
+    It should be strict enough not to match other *formats*.
+    If ``None``, the *format* cannot be guessed by content.
+    """
+
+    DEFAULT_DATALEN: int = 16
+    r"""Default data attribute length.
+
+    Default value for the :attr:`maxdatalen` *meta*, which sets the maximum
+    size of :attr:`BaseRecord.data` field values.
+    """
+
+    FILE_EXT: Sequence[str] = []
+    r"""Supported filename extensions.
+
+    Sequence of file name extension substrings (e.g. ``.hex``).
+    This list is used by functions like :func:`guess_format_name` to manage
+    mapping of file *formats*.
+    """
+
+    META_KEYS: Sequence[str] = ['maxdatalen']
+    r"""Meta information key names.
+
+    Sequence of key strings listing the supported *meta* information of this
+    file *format*.
+    """
+
+    Parser: Type[BaseParser] = BaseParser  # override
+    r"""Push parser object type.
+
+    This class attribute indicates the :class:`BaseParser` class created by
+    :meth:`create_parser`.
+    """
+
+    Record: Type[BaseRecord] = None  # override  # type: ignore override
+    r"""Record object type.
+
+    This class attribute indicates the :class:`BaseRecord` class used by this
+    :class:`BaseFile` class.
+    """
+
+    SHARD_SIZE_MIN: int = 0x10000
+    r"""Minimum shard size for parallel parsing and serialization.
+
+    Minimum size of each shard of the byte buffer split by
+    :meth:`parse_parallel`, or of the memory data split by
+    :meth:`serialize_parallel`.
+    Smaller buffers are split into fewer shards, down to a single shard
+    processed by the calling process, as spawning processes is costly.
+    """
+
+    STREAM_CHUNK_SIZE: int = 0x10000
+    r"""Chunk size for bounded-memory streaming.
+
+    Size of each chunk read by parsers which scan the input for sentinel
+    characters, instead of iterating over its lines (e.g. the *ASCII-HEX*
+    ``STX`` and ``ETX`` characters).
+    Memory usage is bounded by this size plus the longest line.
+
+    It is also the default size of the :class:`BatchWriter` buffer used by
+    :meth:`serialize`, :meth:`serialize_memory`, and :meth:`print`.
+    """
+
+    def __add__(
+        self,
+        other: Union['BaseFile', AnyBytes],
+    ) -> Self:  # type: ignore Self
+        r"""Concatenates with another file.
+
+        Equivalent to :meth:`copy` then :meth:`extend`.
+
+        Args:
+            other (:class:`BaseFile` or bytes):
+                Other file or bytes to concatenate.
+
+        Returns:
+            :class:`BaseFile`: Concatenation of *self* and *other*.
+
+        See Also:
+            :meth:`copy`
+            :meth:`extend`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import SrecFile
+            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
+            >>> file2 = SrecFile.from_bytes(b'xyz', offset=456)
+            >>> file3 = file1 + file2
+            >>> file3.memory.to_blocks()
+            [(123, b'abc'), (582, b'xyz')]
+            >>> file4 = file3 + b'789'
+            >>> file4.memory.to_blocks()
+            [(123, b'abc'), (582, b'xyz789')]
+        """
+
+        return self.copy().extend(other)
+
+    def __bool__(self) -> bool:
+        r"""bool: Has data records or memory.
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+             >>> from hexrec import IhexFile
+             >>> file = IhexFile()
+             >>> bool(file)
+             False
+             >>> _ = file.append(0)
+             >>> bool(file)
+             True
+
+             >>> from hexrec import IhexFile
+             >>> IhexRecord = IhexFile.Record
+             >>> file = IhexFile.from_records([IhexRecord.create_end_of_file()])
+             >>> bool(file)
+             False
+             >>> file.records.insert(0, IhexRecord.create_data(0, b'\0'))
+             >>> bool(file)
+             True
+        """
+
+        if self._memory:
+            return True
+
+        if self._records:
+            for record in self._records:
+                if record.tag.is_data() and record.data:
+                    return True
+
+        return False
+
+    def __delitem__(self, key: Union[slice, int]) -> None:
+        r"""Deletes a range.
+
+        Args:
+            key (slice or int):
+                Range to delete.
+
+        See Also:
+            :meth:`bytesparse.base.MutableMemory.__delitem__`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import SrecFile
+            >>> file = SrecFile.from_blocks([(123, b'abc'), (456, b'xyz')])
+            >>> del file[457]
+            >>> file.memory.to_blocks()
+            [(123, b'abc'), (456, b'xz')]
+            >>> del file[125:457]
+            >>> file.memory.to_blocks()
+            [(123, b'abz')]
+        """
+
+        if isinstance(key, slice):
+            self._unshare_memory(key.start, key.stop)
+        else:
+            self._unshare_memory(key, key + 1)
+        del self._get_memory()[key]
+
+    def __getitem__(self, key: Union[slice, int]) -> Union[AnyBytes, int, None]:
+        r"""Extracts a range.
+
+        Args:
+            key (slice or int):
+                Range to extract.
+
+        Raises:
+            ValueError: invalid range.
+
+        See Also:
+            :meth:`bytesparse.base.ImmutableMemory.__getitem__`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import SrecFile
+            >>> file = SrecFile.from_blocks([(123, b'abc'), (456, b'xyz')])
+            >>> chr(file[457])
+            'y'
+            >>> repr(file[333])
+            'None'
+            >>> file[123:125]
+            b'ab'
+            >>> file[125:457]
+            Traceback (most recent call last):
+                ...
+            ValueError: non-contiguous data within range
+        """
+
+        item = self._get_memory()[key]
+        if isinstance(key, slice):
+            item = bytes(item)
+        return item
+
+    def __eq__(self, other: Any) -> bool:
+        r"""Equality test.
+
+        The file objects `self` and `other` are considered *equal* if the
+        inequality tests of :meth:`__ne__` result false.
+
+        Returns:
+            bool: `self` and `other` are *equal*.
+
+        See Also
+            :meth:`__ne__`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import SrecFile
+            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
+            >>> file2 = SrecFile.from_bytes(b'abc', offset=123)
+            >>> file1 is file2
+            False
+            >>> file1 == file2
+            True
+            >>> file3 = SrecFile.from_bytes(b'xyz', offset=123)
+            >>> file1 == file3
+            False
+            >>> file4 = SrecFile.from_bytes(b'abc', offset=456)
+            >>> file1 == file4
+            False
+
+            >>> from hexrec import SrecFile, IhexFile
+            >>> srec_file = SrecFile.from_bytes(b'abc', offset=123)
+            >>> ihex_file = IhexFile.from_bytes(b'abc', offset=123)
+            >>> srec_file == ihex_file
+            False
+            >>> srec_file.memory == ihex_file.memory
+            True
+            >>> set(srec_file.META_KEYS) - set(ihex_file.META_KEYS)
+            {'header'}
+        """
+
+        return not self != other
+
+    def __iadd__(
+        self,
+        other: Union['BaseFile', AnyBytes],
+    ) -> Self:  # type: ignore Self
+        r"""Concatenates data.
+
+        Equivalent to :meth:`extend`.
+
+        It concatenates `other` to the underlyng :attr:`memory`.
+
+        Any stored :attr:`records` are discarded upon return.
+
+        Args:
+            other (:class:`BaseFile` or bytes):
+                Other file or bytes to concatenate.
+
+        Returns:
+            :class:`BaseFile`: *self*.
+
+        See Also:
+            :attr:`memory`
+            :meth:`extend`
+            :meth:`discard_records`
+            :meth:`bytesparse.base.MutableMemory.extend`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import SrecFile
+            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
+            >>> file2 = SrecFile.from_bytes(b'xyz', offset=456)
+            >>> file1 += file2
+            >>> file1.memory.to_blocks()
+            [(123, b'abc'), (582, b'xyz')]
+            >>> file1 += b'789'
+            >>> file1.memory.to_blocks()
+            [(123, b'abc'), (582, b'xyz789')]
+        """
+
+        return self.extend(other)
+
+    def __init__(self):
+
+        self._records: Union[MutableSequence[BaseRecord], None] = None
+        self._memory: Union[MutableMemory, None] = Memory()
+        self._maxdatalen: int = self.DEFAULT_DATALEN
+        self._update_key: Any = None
+        self._update_cache: MutableMapping[int, BaseRecord] = {}
+        self._dirty_spans: List[Tuple[int, int]] = []
+        self._record_lines: Union[Tuple[Any, MutableMapping[int, Tuple[BaseRecord, tuple, bytes]]], None] = None
+        self._shared_buffers: MutableMapping[int, Any] = {}
+        self._private_memory: Union[MutableMemory, None] = None
+        self._exposed_memory: Union[MutableMemory, None] = None
+        self._mapping: Union[_mmap.mmap, None] = None
+        self._mapped_file: Union[Tuple[int, int], None] = None
+
+    def __ior__(self, other: 'BaseFile') -> Self:  # type: ignore Self
+        r"""Merges with another file.
+
+        Equivalent to :meth:`merge`.
+
+        Any stored :attr:`records` are discarded upon return.
+
+        Args:
+            other (:class:`BaseFile` or bytes):
+                Other file or bytes to merge.
+
+        Returns:
+            :class:`BaseFile`: *self*.
+
+        See Also:
+            :meth:`merge`
+            :meth:`discard_records`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import SrecFile
+            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
+            >>> file2 = SrecFile.from_bytes(b'xyz', offset=456)
+            >>> file1 |= file2
+            >>> file1.memory.to_blocks()
+            [(123, b'abc'), (456, b'xyz')]
+            >>> file1 |= b'789'
+            >>> file1.memory.to_blocks()
+            [(0, b'789'), (123, b'abc'), (456, b'xyz')]
+        """
+
+        self.merge(other)
+        return self
+
+    def __ne__(self, other: Any) -> bool:
+        r"""Inequality test.
+
+        The file objects `self` and `other` are considered *unequal* if any of
+        the following tests result true:
+
+        * Both have *memory role* (i.e. :attr:`memory`), resulting unequal;
+        * Both have *records role* (i.e. :attr:`records`), resulting unequal;
+        * `other` does not have a *meta* listed by :attr:`META_KEYS`;
+        * A *meta* value (among those of :attr:`META_KEYS`) is different.
+
+        Returns:
+            bool: `self` and `other` are *unequal*.
+
+        See Also:
+            :meth:`__eq__`
+            :attr:`memory`
+            :attr:`records`
+            :attr:`META_KEYS`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import SrecFile
+            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
+            >>> file2 = SrecFile.from_bytes(b'abc', offset=123)
+            >>> file1 is file2
             False
             >>> file1 != file2
             False
             >>> file3 = SrecFile.from_bytes(b'xyz', offset=123)
             >>> file1 != file3
             True
-            >>> file4 = SrecFile.from_bytes(b'abc', offset=456)
-            >>> file1 != file4
+            >>> file4 = SrecFile.from_bytes(b'abc', offset=456)
+            >>> file1 != file4
+            True
+
+            >>> from hexrec import SrecFile, IhexFile
+            >>> srec_file = SrecFile.from_bytes(b'abc', offset=123)
+            >>> ihex_file = IhexFile.from_bytes(b'abc', offset=123)
+            >>> srec_file != ihex_file
+            True
+            >>> srec_file.memory != ihex_file.memory
+            False
+            >>> set(srec_file.META_KEYS) - set(ihex_file.META_KEYS)
+            {'header'}
+        """
+
+        self_records = self._records
+        other_records = other._records
+        self_memory = self._memory
+        other_memory = other._memory
+
+        if self_memory is not None and other_memory is not None:
+            if self_memory != other_memory:
+                return True
+        elif self_records is not None and other_records is not None:
+            if self_records != other_records:
+                return True
+        else:
+            raise ValueError('both memory or both records required')
+
+        for key in self.META_KEYS:
+            if not hasattr(other, key):  # ensure
+                return True
+
+            self_value = getattr(self, key)
+            other_value = getattr(other, key)
+
+            if self_value != other_value:
+                return True
+
+        return False
+
+    def __or__(
+        self,
+        other: Union['BaseFile', AnyBytes],
+    ) -> Self:  # type: ignore Self
+        r"""Merges with another file.
+
+        Equivalent to :meth:`copy` then :meth:`merge`.
+
+        Args:
+            other (:class:`BaseFile` or bytes):
+                Other file or bytes to merge.
+
+        Returns:
+            :class:`BaseFile`: *self* merged with *other*.
+
+        See Also:
+            :meth:`copy`
+            :meth:`merge`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import SrecFile
+            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
+            >>> file2 = SrecFile.from_bytes(b'xyz', offset=456)
+            >>> file3 = file1 | file2
+            >>> file3.memory.to_blocks()
+            [(123, b'abc'), (456, b'xyz')]
+            >>> file4 = file3 | b'789'
+            >>> file4.memory.to_blocks()
+            [(0, b'789'), (123, b'abc'), (456, b'xyz')]
+        """
+
+        return self.copy().merge(other)
+
+    def __setitem__(
+        self,
+        key: Union[slice, int],
+        value: Union[AnyBytes, ImmutableMemory, int, None],
+    ) -> None:
+        r"""Sets a range.
+
+        Args:
+            key (slice or int):
+                Range to set.
+
+            value (bytes, :class:`bytesparse.base.ImmutableMemory`, ``None``):
+                Value(s) to set.
+                ``None`` acts like :meth:`clear`.
+
+        Raises:
+            ValueError: invalid range.
+
+        See Also:
+            :meth:`bytesparse.base.MutableMemory.__setitem__`
+            :meth:`clear`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import SrecFile
+            >>> file = SrecFile.from_blocks([(123, b'abc'), (456, b'xyz')])
+            >>> file[124] = b'?'
+            >>> file.memory.to_blocks()
+            [(123, b'a?c'), (456, b'xyz')]
+            >>> file[:125] = None
+            >>> file.memory.to_blocks()
+            [(125, b'c'), (456, b'xyz')]
+            >>> file[457:458] = b'789'
+            >>> file.memory.to_blocks()
+            [(125, b'c'), (456, b'x789z')]
+        """
+
+        if isinstance(key, slice):
+            self._unshare_memory(key.start, key.stop)
+        else:
+            self._unshare_memory(key, key + 1)
+        self._get_memory()[key] = value
+
+    @classmethod
+    async def _afeed(
+        cls,
+        parser: BaseParser,
+        read: Callable[[int], Any],
+        executor: Union[Executor, None] = None,
+        chunk_size: Union[int, None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Feeds a push parser asynchronously.
+
+        It awaits chunks from the `read` coroutine function, feeding each one
+        to the `parser`, until the end of the input, then closes the `parser`.
+
+        If `executor` is ``None``, parsing is performed within the event loop,
+        which is given back control after each chunk.
+        Otherwise, parsing is offloaded to the `executor`.
+
+        Args:
+            parser (:class:`BaseParser`):
+                Push parser to feed.
+
+            read (coroutine function):
+                Reads a chunk, given its maximum size.
+                An empty chunk marks the end of the input.
+
+            executor (:class:`concurrent.futures.Executor`):
+                Executor running the parser, or ``None``.
+                It must share the `parser` object, e.g. a
+                :class:`concurrent.futures.ThreadPoolExecutor`.
+
+            chunk_size (int):
+                Maximum size of each chunk.
+                If ``None``, :attr:`ASYNC_CHUNK_SIZE` is used.
+
+        Returns:
+            :class:`BaseFile`: The created file object.
+        """
+
+        if chunk_size is None:
+            chunk_size = cls.ASYNC_CHUNK_SIZE
+        loop = asyncio.get_running_loop()
+
+        while True:
+            chunk = await read(chunk_size)
+            if not chunk:
+                break
+
+            if executor is None:
+                parser.feed(chunk)
+                await asyncio.sleep(0)  # yield to the event loop
+            else:
+                await loop.run_in_executor(executor, parser.feed, chunk)
+
+        if executor is None:
+            file = parser.close()
+        else:
+            file = await loop.run_in_executor(executor, parser.close)
+        return _cast(cls, file)
+
+    async def _arender(
+        self,
+        args: Sequence[Any],
+        kwargs: Mapping[str, Any],
+        executor: Union[Executor, None] = None,
+    ) -> bytes:
+        r"""Serializes into a byte string asynchronously.
+
+        It executes :meth:`serialize` onto a memory stream.
+
+        If `executor` is ``None``, serialization is performed within the event
+        loop.
+        Otherwise, it is offloaded to the `executor`.
+
+        Args:
+            args:
+                Forwarded to :meth:`serialize`.
+
+            kwargs:
+                Forwarded to :meth:`serialize`.
+
+            executor (:class:`concurrent.futures.Executor`):
+                Executor running the serialization, or ``None``.
+
+        Returns:
+            bytes: Serialized byte string.
+        """
+
+        stream = io.BytesIO()
+        serialize = functools.partial(self.serialize, stream, *args, **kwargs)
+
+        if executor is None:
+            serialize()
+        else:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(executor, serialize)
+
+        return stream.getvalue()
+
+    def _export_memory(
+        self,
+        start: Union[int, None] = None,
+        endex: Union[int, None] = None,
+    ) -> MutableMemory:
+        r"""Exports memory data within a range, copy-on-write.
+
+        It creates a new memory object, whose blocks are read-only views over
+        the data of :attr:`memory` within the specified range, without copying
+        them.
+        The exported buffers are tracked, so that they are copied by
+        :meth:`_unshare_memory` before being edited in place.
+        Tracked buffers are kept alive, so that their identities are never
+        reused by other objects.
+
+        If the memory object was exposed via :attr:`memory` or :meth:`view`,
+        it might be edited directly without any tracking, so the exported
+        memory object gets private copies of its blocks instead.
+
+        Args:
+            start (int):
+                Inclusive start address of the specified range.
+                If ``None``, start from the beginning of :attr:`memory`.
+
+            endex (int):
+                Exclusive end address of the specified range.
+                If ``None``, extend after the end of :attr:`memory`.
+
+        Returns:
+            :class:`bytesparse.Memory`: Memory object sharing data.
+
+        See Also:
+            :meth:`_unshare_memory`
+        """
+
+        memory = self._get_memory()
+        if memory is self._exposed_memory:
+            return memory.extract(start=start, endex=endex, bound=False)
+
+        shared_buffers = self._shared_buffers
+        blocks = []
+
+        for block_start, block_endex in memory.intervals(start=start, endex=endex):
+            with memory.view(block_start, block_endex) as block_view:
+                if not block_view.readonly:
+                    buffer = block_view.obj
+                    shared_buffers[id(buffer)] = buffer
+                blocks.append((block_start, block_view.toreadonly()))
+
+        exported = type(memory).from_blocks(blocks, copy=False, validate=False)
+        return exported
+
+    def _get_memory(self) -> MutableMemory:
+        r"""Gets the memory object, as is.
+
+        Unlike :attr:`memory`, it does not unshare any memory data, so that
+        methods can share it via :meth:`_export_memory`, or unshare just the
+        range they edit via :meth:`_unshare_memory`.
+
+        Returns:
+            :class:`bytesparse.Memory`: The stored memory object.
+
+        See Also:
+            :attr:`memory`
+        """
+
+        if self._memory is None:
+            self.apply_records()
+        assert self._memory is not None
+        return self._memory
+
+    def _get_reusable_records(self, key: Any) -> MutableMapping[int, BaseRecord]:
+        r"""Gets the data records reusable by :meth:`update_records`.
+
+        The *data* records generated by the last :meth:`update_records` are
+        kept by chunk start address, along with the `key` summarizing the
+        arguments they were generated with.
+        Records overlapping any memory ranges edited since then are dropped.
+        None are kept once exposed via :attr:`records`, as they might have
+        been edited.
+
+        The caller must still check that the *data* field of a reusable record
+        matches the actual memory content, because direct editing of the
+        :attr:`memory` is not tracked.
+
+        Args:
+            key:
+                Summary of the :meth:`update_records` arguments, including
+                any *meta* shaping the *data* records (e.g.
+                :attr:`maxdatalen`).
+
+        Returns:
+            dict: Reusable *data* records, by chunk start address.
+        """
+
+        if key != self._update_key:
+            return {}
+
+        reusable = self._update_cache
+        dirty_spans = self._dirty_spans
+        if dirty_spans:
+            addresses = list(reusable)
+            size = len(addresses)
+
+            for dirty_start, dirty_endex in dirty_spans:
+                index = max(bisect.bisect_right(addresses, dirty_start) - 1, 0)
+
+                while index < size:
+                    address = addresses[index]
+                    if address >= dirty_endex:
+                        break
+                    record = reusable.get(address)
+                    if record is not None and dirty_start < address + len(record.data):
+                        del reusable[address]
+                    index += 1
+
+            self._dirty_spans = []
+        return reusable
+
+    @classmethod
+    def _is_line_empty(cls, line: Union[bytes, bytearray, memoryview]) -> bool:
+        r"""Empty line check.
+
+        Tells whether a `line` has no meaningful content (e.g. all whitespace).
+        The check itself depends on the implementing file *format*.
+        It may be used internally to skip empty lines, e.g. by :meth:`parse`.
+
+        Args:
+            line (bytes):
+                A line, byte string.
+
+        Returns:
+            :bool: The `line` is empty.
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import IhexFile
+            >>> IhexFile._is_line_empty(b'')
+            True
+            >>> IhexFile._is_line_empty(b' \t\v\r\n')
+            True
+            >>> IhexFile._is_line_empty(b':00000001FF\r\n')
+            False
+            >>> IhexFile._is_line_empty(memoryview(b' \t\v\r\n'))
             True
+        """
+
+        if isinstance(line, memoryview):
+            return _SPACES_REGEX.fullmatch(line) is not None
+        return not line or line.isspace()
+
+    @classmethod
+    def _iter_buffer_lines(cls, buffer: AnyBytes) -> Iterator[memoryview]:
+        r"""Iterates over buffer lines.
+
+        It splits a byte `buffer` into lines, each one including its
+        trailing line feed, like iterating over a binary stream.
+        Each line is a :class:`memoryview` slice of `buffer`, so that no line
+        content is copied.
+
+        Args:
+            buffer (bytes):
+                Byte buffer to split into lines.
+
+        Returns:
+            iterator of memoryview: Line views.
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> [bytes(line) for line in IhexFile._iter_buffer_lines(b'abc\n\nxyz')]
+            [b'abc\n', b'\n', b'xyz']
+        """
+
+        view = memoryview(buffer)
+        start = 0
+
+        for match in _LINE_END_REGEX.finditer(view):
+            endex = match.end()
+            yield view[start:endex]
+            start = endex
+
+        if start < len(view):
+            yield view[start:]
+
+    @classmethod
+    def _iter_checked_records(
+        cls,
+        parsed: List[Tuple[int, Union[BaseRecord, None], Union[str, None]]],
+        tolerant: bool = False,
+        ignore_after_termination: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Iterator[BaseRecord]:
+        r"""Iterates over a batch of checked parsed records.
+
+        It validates a batch of records parsed by :meth:`BaseRecord.try_parse`
+        without validation, as done by :meth:`_iter_parsed_records`.
+        Their checksums are verified at once via
+        :meth:`BaseRecord.verify_checksums`; any other checks are performed
+        by :meth:`BaseRecord.diagnose` for each record.
+
+        Args:
+            parsed (list):
+                Parsed ``(row, record, reason)`` tuples, as returned by
+                :meth:`BaseRecord.try_parse` for each row.
+
+            tolerant (bool):
+                Ignore invalid records.
+
+            ignore_after_termination (bool):
+                Ignore anything after the termination record.
+
+            diagnostics (list):
+                If not ``None``, a ``(row, column, reason)`` tuple is appended
+                for each invalid record.
+
+        Returns:
+            iterator: Valid records; the generator returns whether the
+            termination record was yielded.
+
+        Raises:
+            ValueError: Invalid record, if not `tolerant`.
+
+        See Also:
+            :meth:`_iter_parsed_records`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> Record = IhexFile.Record
+            >>> lines = [b':03007B006162635C', b':03007B0061626300', b':00000001FF']
+            >>> parsed = [(row, *Record.try_parse(line, validate=False))
+            ...           for row, line in enumerate(lines, 1)]
+            >>> diagnostics = []
+            >>> records = IhexFile._iter_checked_records(parsed, True, diagnostics=diagnostics)
+            >>> [record.coords for record in records]
+            [(1, 0), (3, 0)]
+            >>> diagnostics
+            [(2, 0, 'wrong checksum')]
+        """
+
+        records = [record for _, record, _ in parsed if record is not None]
+        verified = iter(cls.Record.verify_checksums(records))
+
+        for row, record, reason in parsed:
+            if record is not None:
+                reason = record.diagnose(checksum=(not next(verified)))
+
+            if reason:
+                if not tolerant:
+                    raise ValueError(reason)
+                if diagnostics is not None:
+                    diagnostics.append((row, 0, reason))
+                continue
+
+            record = _cast(BaseRecord, record)
+            record.coords = (row, 0)
+            yield record
+
+            if ignore_after_termination:
+                if record.tag.is_file_termination():
+                    return True
+
+        return False
+
+    def _iter_chunk_windows(
+        self,
+        align: bool = False,
+        boundary: Union[int, None] = None,
+    ) -> Iterator[Tuple[int, memoryview]]:
+        r"""Iterates over windows of memory chunks.
+
+        It chops :attr:`memory` into the same chunks as
+        :meth:`bytesparse.base.ImmutableMemory.chop` with :attr:`maxdatalen`
+        as width, grouping consecutive chunks into windows of up to about
+        :attr:`STREAM_CHUNK_SIZE` bytes.
+
+        All the chunks within a window have the same size, which is that of
+        the window itself if smaller than :attr:`maxdatalen`.
+        This allows record file *formats* to encode whole windows in batch,
+        e.g. via :func:`hexrec.utils.hexlify_lines`.
+
+        Args:
+            align (bool):
+                Aligns chunk address bounds to :attr:`maxdatalen`.
+
+            boundary (int):
+                If not ``None``, the start addresses of the chunks within a
+                window lie within the same `boundary` aligned page.
+
+        Returns:
+            iterator of tuple: ``(address, window)`` tuples, with `window` as
+            :class:`memoryview` of :attr:`memory`.
+
+        Raises:
+            ValueError: :attr:`memory` attribute not populated.
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> file = IhexFile.from_blocks([(0x1234, b'abcdefg')], maxdatalen=2)
+            >>> [(hex(a), bytes(w)) for a, w in file._iter_chunk_windows()]
+            [('0x1234', b'abcdef'), ('0x123a', b'g')]
+            >>> file.maxdatalen = 3
+            >>> [(hex(a), bytes(w)) for a, w in file._iter_chunk_windows(align=True)]
+            [('0x1234', b'ab'), ('0x1236', b'cde'), ('0x1239', b'fg')]
+            >>> file = IhexFile.from_blocks([(0xFFFC, b'abcdefg')], maxdatalen=2)
+            >>> [(hex(a), bytes(w)) for a, w in file._iter_chunk_windows(boundary=0x10000)]
+            [('0xfffc', b'abcd'), ('0x10000', b'ef'), ('0x10002', b'g')]
+        """
+
+        memory = self._memory
+        if memory is None:
+            raise ValueError('memory instance required')
+
+        width = self.maxdatalen
+        if width < 1:
+            raise ValueError('invalid width')
+
+        window_size = max(width, self.STREAM_CHUNK_SIZE - (self.STREAM_CHUNK_SIZE % width))
+
+        for block_start, block_view in memory.blocks():
+            block_size = len(block_view)
+            offset = 0
+
+            if align:
+                offset = block_start % width
+                if offset:
+                    offset = width - offset
+                    yield block_start, block_view[:offset]
+
+            while offset < block_size:
+                endex = min(offset + window_size, block_size)
+
+                if boundary:
+                    address = block_start + offset
+                    page_size = boundary - (address % boundary)
+                    endex = min(endex, offset + (page_size + width - 1) // width * width)
+
+                if endex - offset > width:
+                    endex -= (endex - offset) % width
+
+                yield block_start + offset, block_view[offset:endex]
+                offset = endex
+
+    def _iter_memory_lines(self, *args, **kwargs) -> Iterator[AnyBytes]:
+        r"""Iterates over serialized lines, straight from memory.
+
+        It generates the same byte strings as :meth:`BaseRecord.to_bytestr`
+        for each record generated by :meth:`update_records`.
+
+        This generic implementation just walks :attr:`records`.
+        Record file *formats* encode lines straight from :attr:`memory` and
+        *meta*, without creating any records.
+
+        Args:
+            args:
+                Forwarded to :meth:`BaseRecord.to_bytestr`.
+
+            kwargs:
+                Forwarded to :meth:`BaseRecord.to_bytestr`.
+
+        Returns:
+            iterator of bytes: Serialized lines.
+        """
+
+        if self._records is None:
+            self.update_records()
+        for record in self._records:
+            yield record.to_bytestr(*args, **kwargs)
 
-            >>> from hexrec import SrecFile, IhexFile
-            >>> srec_file = SrecFile.from_bytes(b'abc', offset=123)
-            >>> ihex_file = IhexFile.from_bytes(b'abc', offset=123)
-            >>> srec_file != ihex_file
-            True
-            >>> srec_file.memory != ihex_file.memory
-            False
-            >>> set(srec_file.META_KEYS) - set(ihex_file.META_KEYS)
-            {'header'}
+    @classmethod
+    def _iter_parsed_fields(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Iterator[Tuple[BaseTag, int, ByteString]]:
+        r"""Iterates over parsed record fields.
+
+        Like :meth:`_iter_parsed_records`, but yielding just the *tag*,
+        *address*, and *data* of each valid line, without creating any record
+        objects.
+
+        Lines are decoded by batches of :attr:`CHECKSUM_BATCH_SIZE` via
+        :meth:`BaseRecord.parse_fields_batch`.
+        Only a rejected batch is decoded line by line, via
+        :meth:`BaseRecord.parse_fields`; only the lines it leaves undecoded
+        are parsed by :meth:`BaseRecord.try_parse`, which also tells the
+        reason why a line is invalid.
+        So, the accepted syntax is the same as :meth:`_iter_parsed_records`,
+        as well as the reported errors.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore invalid lines.
+
+            ignore_after_termination (bool):
+                Ignore anything after the termination record was parsed, if
+                supported.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            iterator: *tag*, *address*, and *data* of each valid line.
+
+        Raises:
+            ValueError: Invalid line, if not ignoring errors.
+
+        See Also:
+            :meth:`_iter_parsed_records`
+            :meth:`BaseRecord.parse_fields_batch`
+            :meth:`BaseRecord.parse_fields`
+            :meth:`parse_memory`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> buffer = b':03007B006162635C\n:03007B0061626300\n:00000001FF\n'
+            >>> diagnostics = []
+            >>> list(IhexFile._iter_parsed_fields(buffer, diagnostics=diagnostics))
+            [(<IhexTag.DATA: 0>, 123, b'abc'), (<IhexTag.END_OF_FILE: 1>, 0, b'')]
+            >>> diagnostics
+            [(2, 0, 'wrong checksum')]
         """
 
-        self_records = self._records
-        other_records = other._records
-        self_memory = self._memory
-        other_memory = other._memory
+        Record = cls.Record
+        parse_fields = Record.parse_fields
+        parse_fields_batch = Record.parse_fields_batch
+        batch_size = cls.CHECKSUM_BATCH_SIZE
+        tolerant = ignore_errors or diagnostics is not None
+        row = 0
 
-        if self_memory is not None and other_memory is not None:
-            if self_memory != other_memory:
-                return True
-        elif self_records is not None and other_records is not None:
-            if self_records != other_records:
-                return True
+        if ignore_after_termination:
+            terminators = {tag for tag in _cast(Any, Record.Tag) if tag.is_file_termination()}
         else:
-            raise ValueError('both memory or both records required')
+            terminators = set()
 
-        for key in self.META_KEYS:
-            if not hasattr(other, key):  # ensure
-                return True
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            lines = cls._iter_buffer_lines(stream)
+        else:
+            lines = iter(stream)
 
-            self_value = getattr(self, key)
-            other_value = getattr(other, key)
+        while True:
+            batch = list(itertools.islice(lines, batch_size))
+            if not batch:
+                break
 
-            if self_value != other_value:
-                return True
+            parsed = parse_fields_batch(batch)
+            if parsed is not None:
+                row += len(batch)
+                for fields in parsed:
+                    yield fields
 
-        return False
+                    if fields[0] in terminators:
+                        return
+                continue
+
+            for line in batch:  # fall back line by line
+                row += 1
+                fields = parse_fields(line)
+
+                if fields is None:
+                    if cls._is_line_empty(line):
+                        continue
+
+                    record, reason = Record.try_parse(line)
+                    if reason:
+                        if not tolerant:
+                            raise ValueError(reason)
+                        if diagnostics is not None:
+                            diagnostics.append((row, 0, reason))
+                        continue
+
+                    record = _cast(BaseRecord, record)
+                    fields = (record.tag, record.address, record.data)
+
+                yield fields
+
+                if fields[0] in terminators:
+                    return
+
+    @classmethod
+    def _iter_parsed_records(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Iterator[BaseRecord]:
+        r"""Iterates over parsed records.
+
+        It executes :meth:`BaseRecord.parse` for each line of the incoming
+        `stream`, yielding each record as soon as it is parsed.
+        Lines resulting empty by :meth:`_is_line_empty` are just discarded.
+
+        A byte buffer (e.g. a :class:`memoryview` of a memory mapped file) is
+        split into lines by :meth:`_iter_buffer_lines`, without copying.
+
+        Lines are parsed by :meth:`BaseRecord.try_parse` without validation,
+        which does not raise exceptions for invalid lines.
+        Records are then validated by batches via :meth:`_iter_checked_records`,
+        with their checksums verified at once.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore :class:`Exception` raised by :meth:`BaseRecord.parse`.
+
+            ignore_after_termination (bool):
+                Ignore anything after the termination record was parsed, if
+                supported.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            iterator: Parsed records.
+
+        See Also:
+            :meth:`parse`
+            :meth:`parse_memory`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> import io
+            >>> stream = io.BytesIO(b':03007B006162635C\n:00000001FF\n')
+            >>> [record.coords for record in IhexFile._iter_parsed_records(stream)]
+            [(1, 0), (2, 0)]
+        """
+
+        Record = cls.Record
+        batch_size = cls.CHECKSUM_BATCH_SIZE
+        row = 0
+        tolerant = ignore_errors or diagnostics is not None
+        parsed = []
+
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            lines = cls._iter_buffer_lines(stream)
+        else:
+            lines = stream
+
+        for line in lines:
+            line = _cast(bytes, line)
+            row += 1
+
+            if cls._is_line_empty(line):
+                continue
+
+            record, reason = Record.try_parse(line, validate=False)
+            parsed.append((row, record, reason))
+
+            if len(parsed) >= batch_size or (ignore_after_termination and record is not None
+                                             and record.tag.is_file_termination()):
+                terminated = yield from cls._iter_checked_records(parsed, tolerant, ignore_after_termination,
+                                                                  diagnostics)
+                if terminated:
+                    return
+                parsed = []
+
+        yield from cls._iter_checked_records(parsed, tolerant, ignore_after_termination, diagnostics)
+
+    @classmethod
+    def _iter_record_fields(
+        cls,
+        records: Iterable[BaseRecord],
+    ) -> Iterator[Tuple[BaseTag, int, ByteString]]:
+        r"""Iterates over record fields.
+
+        It yields the *tag*, *address*, and *data* of each record.
+        A :class:`RecordTable` is accessed directly by columns, without
+        creating any record objects.
+
+        Args:
+            records (list of :class:`BaseRecord`):
+                Records to iterate over.
+
+        Returns:
+            iterator: *tag*, *address*, and *data* of each record.
+
+        See Also:
+            :meth:`RecordTable.iter_fields`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> records = [IhexFile.Record.create_data(123, b'abc')]
+            >>> list(IhexFile._iter_record_fields(records))
+            [(<IhexTag.DATA: 0>, 123, b'abc')]
+        """
+
+        if isinstance(records, RecordTable):
+            return records.iter_fields()
+        else:
+            return ((record.tag, record.address, record.data) for record in records)
+
+    def _iter_stream_lines(
+        self,
+        windows: Iterable[MutableMemory],
+        *args,
+        **kwargs,
+    ) -> Iterator[AnyBytes]:
+        r"""Iterates over serialized lines of streamed memory windows.
+
+        It generates the same lines as :meth:`_iter_memory_lines`, as if
+        :attr:`memory` held just the data of all the `windows`, with the
+        *meta* in force after the `windows` are exhausted.
+
+        The `windows` are in address order, each one starting either at a
+        block start or at a chunk boundary, as per
+        :meth:`bytesparse.base.ImmutableMemory.chop` with :attr:`maxdatalen`
+        as width.
+        Their generator may update the *meta* right before the first window,
+        and after the last one.
+
+        This generic implementation just collects all the `windows`, then
+        calls :meth:`_iter_memory_lines`, so :func:`convert_stream` does not
+        stream the *formats* relying on it.
+        Record file *formats* overriding it encode each window as soon as it
+        is available, keeping memory usage bounded.
+
+        Args:
+            windows (iterable of :class:`bytesparse.Memory`):
+                Memory windows, in address order.
+
+            args:
+                Forwarded to :meth:`_iter_memory_lines`.
+
+            kwargs:
+                Forwarded to :meth:`_iter_memory_lines`.
+
+        Returns:
+            iterator of bytes: Serialized lines.
+
+        See Also:
+            :func:`convert_stream`
+            :meth:`_iter_memory_lines`
+
+        Examples:
+            >>> from hexrec import TiTxtFile
+            >>> from bytesparse import Memory
+            >>> windows = [Memory.from_bytes(b'abc', offset=0x1234),
+            ...            Memory.from_bytes(b'xyz', offset=0x1237)]
+            >>> file = TiTxtFile()
+            >>> list(file._iter_stream_lines(windows))
+            [b'@1234\r\n', b'61 62 63 78 79 7A\r\n', b'q\r\n']
+        """
+
+        memory = Memory()
+        for window in windows:
+            for block_start, block_view in window.blocks():
+                memory.write(block_start, block_view)
+
+        backup = self._memory
+        try:
+            self._memory = memory
+            yield from self._iter_memory_lines(*args, **kwargs)
+        finally:
+            self._memory = backup
+
+    @classmethod
+    def _iter_verified_records(
+        cls,
+        records: Sequence[BaseRecord],
+    ) -> Iterator[Tuple[BaseRecord, bool]]:
+        r"""Iterates over records along with their checksum verification.
+
+        It yields each record along with whether its checksum matches, as
+        per :meth:`BaseRecord.verify_checksums`, run by batches of
+        :attr:`CHECKSUM_BATCH_SIZE` records.
+        Only the records of the current batch are held at once, e.g. when
+        created on-the-fly by a :class:`RecordTable`.
+
+        Args:
+            records (list of :class:`BaseRecord`):
+                Records to verify.
+
+        Returns:
+            iterator: Each record and its checksum match.
+
+        See Also:
+            :meth:`validate_records`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> Record = IhexFile.Record
+            >>> records = [Record.create_data(0, b'abc'), Record.create_end_of_file()]
+            >>> records[0].checksum = 0
+            >>> [verified for _, verified in IhexFile._iter_verified_records(records)]
+            [False, True]
+        """
+
+        verify_checksums = cls.Record.verify_checksums
+        batch_size = cls.CHECKSUM_BATCH_SIZE
+
+        for start in range(0, len(records), batch_size):
+            batch = records[start:(start + batch_size)]
+            yield from zip(batch, verify_checksums(batch))
+
+    @classmethod
+    def _map_buffer_shards(
+        cls,
+        function: Callable[..., Any],
+        buffer: AnyBytes,
+        workers: Union[int, None],
+        *args,
+    ) -> Iterator[Any]:
+        r"""Maps a function onto buffer shards.
+
+        The byte `buffer` is split into shards by :meth:`_split_buffer_shards`,
+        one per worker process at most.
+        Each shard is processed by a :class:`ProcessPoolExecutor` worker as
+        ``function(shard, index, *args)``, where `index` is the shard index.
+
+        A single shard is processed directly by the calling process.
+
+        Args:
+            function (callable):
+                Picklable function to process each shard.
+
+            buffer (bytes):
+                Byte buffer to split into shards.
+
+            workers (int):
+                Maximum number of worker processes.
+                If ``None``, as many as :func:`os.cpu_count`.
+
+            args:
+                Forwarded to `function`.
+
+        Returns:
+            iterator: Shard results, in buffer order.
+
+        See Also:
+            :meth:`_split_buffer_shards`
+            :attr:`SHARD_SIZE_MIN`
+        """
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        bounds = cls._split_buffer_shards(buffer, workers, cls.SHARD_SIZE_MIN)
+
+        if len(bounds) == 1:
+            yield function(buffer, 0, *args)
+            return
+
+        view = memoryview(buffer)
+        with ProcessPoolExecutor(max_workers=len(bounds)) as executor:
+            futures = [executor.submit(function, bytes(view[start:endex]), index, *args)
+                       for index, (start, endex) in enumerate(bounds)]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _map_memory_shards(
+        self,
+        function: Callable[..., Any],
+        workers: Union[int, None],
+        align: bool,
+        *args,
+    ) -> Iterator[Any]:
+        r"""Maps a function onto memory shards.
+
+        The :attr:`memory` is split into shards by
+        :meth:`_split_memory_shards`, one per worker process at most.
+        Each shard is processed by a :class:`ProcessPoolExecutor` worker as
+        ``function(memory, index, previous, *args)``, where `memory` holds the
+        shard data, `index` is the shard index, and `previous` is the start
+        address of the last chunk preceding the shard.
+
+        A single shard is processed directly by the calling process, with the
+        actual :attr:`memory`.
+
+        Args:
+            function (callable):
+                Picklable function to process each shard.
+
+            workers (int):
+                Maximum number of worker processes.
+                If ``None``, as many as :func:`os.cpu_count`.
+
+            align (bool):
+                Aligns chunk address bounds to :attr:`maxdatalen`.
+
+            args:
+                Forwarded to `function`.
+
+        Returns:
+            iterator: Shard results, in address order.
+
+        See Also:
+            :meth:`_split_memory_shards`
+            :attr:`SHARD_SIZE_MIN`
+        """
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        shards = self._split_memory_shards(workers, size_min=self.SHARD_SIZE_MIN, align=align)
+        memory = self._get_memory()
+
+        if len(shards) == 1:
+            yield function(memory, 0, None, *args)
+            return
+
+        with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            futures = [executor.submit(function, memory.extract(start=start, endex=endex), index, previous, *args)
+                       for index, (start, endex, previous) in enumerate(shards)]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _mark_dirty(self, start: int, endex: int) -> None:
+        r"""Marks an edited memory range.
+
+        It discards the stored :attr:`records` like :meth:`discard_records`,
+        but keeps the *data* records generated by the last
+        :meth:`update_records`, so that those not overlapping any edited
+        range can be reused by the next one.
+
+        Args:
+            start (int):
+                Inclusive start address of the edited range.
+
+            endex (int):
+                Exclusive end address of the edited range.
+        """
+
+        self._records = None
+        if self._memory is None:
+            self._memory = Memory()
+
+        if self._update_key is not None and start < endex:
+            dirty_spans = self._dirty_spans
+
+            if dirty_spans and dirty_spans[-1][0] <= endex and start <= dirty_spans[-1][1]:
+                last_start, last_endex = dirty_spans[-1]
+                dirty_spans[-1] = (min(start, last_start), max(endex, last_endex))
+            else:
+                dirty_spans.append((start, endex))
+
+            if len(dirty_spans) > len(self._update_cache):
+                self._update_key = None
+                self._update_cache = {}
+                self._dirty_spans = []
+
+    def _serialize_records(self, stream: IO, *args, **kwargs) -> None:
+        r"""Serializes records onto a byte stream.
+
+        It writes the serialized line of each of the stored :attr:`records`.
+
+        Lines of records generated by :meth:`update_records` are cached, so
+        that records reused after some memory editing are not serialized
+        again, as long as their fields and the serialization arguments match.
+
+        Args:
+            stream (bytes IO):
+                Stream to serialize records onto.
+
+            args:
+                Forwarded to :meth:`BaseRecord.to_bytestr` of each record.
+
+            kwargs:
+                Forwarded to :meth:`BaseRecord.to_bytestr` of each record.
+        """
+
+        if self._records is None:
+            self.update_records()
+        records = self._records
+
+        if self._update_key is None:
+            self._record_lines = None
+            for record in records:
+                record.serialize(stream, *args, **kwargs)
+            return
+
+        key = (args, kwargs)
+        record_lines = self._record_lines
+        if record_lines is None or record_lines[0] != key:
+            cached = {}
+        else:
+            cached = record_lines[1]
+        entries = {}
+        lines = []
+
+        for record in records:
+            fields = (record.tag, record.address, record.data, record.count,
+                      record.checksum, record.before, record.after)
+            record_id = id(record)
+            entry = cached.get(record_id)
+
+            if entry is None or entry[0] is not record or entry[1] != fields:
+                entry = (record, fields, record.to_bytestr(*args, **kwargs))
+
+            entries[record_id] = entry
+            lines.append(entry[2])
+
+        self._record_lines = (key, entries)
+        stream.writelines(lines)
+
+    def _set_updated_records(
+        self,
+        records: MutableSequence[BaseRecord],
+        data_records: MutableMapping[int, BaseRecord],
+        key: Any,
+    ) -> None:
+        r"""Assigns the records generated by :meth:`update_records`.
+
+        Args:
+            records (list of :class:`BaseRecord`):
+                Generated records.
+
+            data_records (dict):
+                Generated *data* records, by chunk start address.
+
+            key:
+                Summary of the :meth:`update_records` arguments.
+        """
+
+        self._records = records
+        self._update_key = key
+        self._update_cache = data_records
+        self._dirty_spans = []
 
-    def __or__(
-        self,
-        other: Union['BaseFile', AnyBytes],
-    ) -> Self:  # type: ignore Self
-        r"""Merges with another file.
+    @classmethod
+    def _split_buffer_shards(
+        cls,
+        buffer: AnyBytes,
+        count: int,
+        size_min: int = 0,
+    ) -> List[Tuple[int, int]]:
+        r"""Splits a buffer into shards.
 
-        Equivalent to :meth:`copy` then :meth:`merge`.
+        It splits a byte `buffer` into (up to) `count` shards of similar size,
+        each one ending at a line boundary, so that no line is split.
 
         Args:
-            other (:class:`BaseFile` or bytes):
-                Other file or bytes to merge.
+            buffer (bytes):
+                Byte buffer to split into shards.
 
-        Returns:
-            :class:`BaseFile`: *self* merged with *other*.
+            count (int):
+                Maximum number of shards.
 
-        See Also:
-            :meth:`copy`
-            :meth:`merge`
+            size_min (int):
+                Minimum shard size, reducing the number of shards.
 
-        Examples:
-            **NOTE:** These examples are provided by :class:`BaseFile`.
-            Inherited classes for specific *formats* may require an adaptation.
+        Returns:
+            list of (int, int): Shard ranges, as ``(start, endex)`` offsets.
 
-            >>> from hexrec import SrecFile
-            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
-            >>> file2 = SrecFile.from_bytes(b'xyz', offset=456)
-            >>> file3 = file1 | file2
-            >>> file3.memory.to_blocks()
-            [(123, b'abc'), (456, b'xyz')]
-            >>> file4 = file3 | b'789'
-            >>> file4.memory.to_blocks()
-            [(0, b'789'), (123, b'abc'), (456, b'xyz')]
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> IhexFile._split_buffer_shards(b'abc\ndef\nghi\n', 2)
+            [(0, 8), (8, 12)]
+            >>> IhexFile._split_buffer_shards(b'abc\ndef\nghi\n', 2, size_min=100)
+            [(0, 12)]
         """
 
-        return self.copy().merge(other)
-
-    def __setitem__(
+        view = memoryview(buffer)
+        size = len(view)
+        if size_min > 0:
+            count = min(count, size // size_min)
+        count = max(count, 1)
+        step = size // count
+        bounds = []
+        start = 0
+
+        for index in range(1, count):
+            match = _LINE_END_REGEX.search(view, max(index * step - 1, start))
+            if match is None:
+                break
+            endex = match.end()
+            bounds.append((start, endex))
+            start = endex
+
+        if start < size or not bounds:
+            bounds.append((start, size))
+        return bounds
+
+    def _split_memory_shards(
         self,
-        key: Union[slice, int],
-        value: Union[AnyBytes, ImmutableMemory, int, None],
-    ) -> None:
-        r"""Sets a range.
+        count: int,
+        size_min: int = 0,
+        align: bool = False,
+    ) -> List[Tuple[int, int, Union[int, None]]]:
+        r"""Splits memory into shards.
+
+        It splits the :attr:`memory` into (up to) `count` shards holding
+        similar amounts of data, each one starting at a chunk boundary, as per
+        :meth:`bytesparse.base.ImmutableMemory.chop` with :attr:`maxdatalen`,
+        so that no chunk is split.
 
         Args:
-            key (slice or int):
-                Range to set.
+            count (int):
+                Maximum number of shards.
 
-            value (bytes, :class:`bytesparse.base.ImmutableMemory`, ``None``):
-                Value(s) to set.
-                ``None`` acts like :meth:`clear`.
+            size_min (int):
+                Minimum shard data size, reducing the number of shards.
 
-        Raises:
-            ValueError: invalid range.
+            align (bool):
+                Aligns chunk address bounds to :attr:`maxdatalen`.
 
-        See Also:
-            :meth:`bytesparse.base.MutableMemory.__setitem__`
-            :meth:`clear`
+        Returns:
+            list of (int, int, int): Shard ranges, as ``(start, endex,
+            previous)``, where `previous` is the start address of the last
+            chunk preceding the shard (``None`` for the first shard).
 
-        Examples:
-            **NOTE:** These examples are provided by :class:`BaseFile`.
-            Inherited classes for specific *formats* may require an adaptation.
+        Raises:
+            ValueError: :attr:`memory` attribute not populated.
 
+        Examples:
             >>> from hexrec import SrecFile
-            >>> file = SrecFile.from_blocks([(123, b'abc'), (456, b'xyz')])
-            >>> file[124] = b'?'
-            >>> file.memory.to_blocks()
-            [(123, b'a?c'), (456, b'xyz')]
-            >>> file[:125] = None
-            >>> file.memory.to_blocks()
-            [(125, b'c'), (456, b'xyz')]
-            >>> file[457:458] = b'789'
-            >>> file.memory.to_blocks()
-            [(125, b'c'), (456, b'x789z')]
+            >>> file = SrecFile.from_blocks([(0, bytes(10)), (20, bytes(10))], maxdatalen=4)
+            >>> file._split_memory_shards(1)
+            [(0, 30, None)]
+            >>> file._split_memory_shards(2)
+            [(0, 20, None), (20, 30, 8)]
+            >>> file._split_memory_shards(4)
+            [(0, 4, None), (4, 20, 0), (20, 24, 8), (24, 30, 20)]
         """
 
-        self.memory[key] = value
+        memory = self._memory
+        if memory is None:
+            raise ValueError('memory instance required')
+
+        width = self.maxdatalen
+        if width < 1:
+            width = sys.maxsize  # unbounded
+        spans = list(memory.intervals())
+        size = sum(endex - start for start, endex in spans)
+        if size_min > 0:
+            count = min(count, size // size_min)
+        count = min(count, size)
+        if count <= 1:
+            return [(memory.start, memory.endex, None)]
+        step = size // count
+
+        cuts = []
+        target = step
+        offset = 0
+        last_chunk = None
+
+        for block_start, block_endex in spans:
+            block_size = block_endex - block_start
+
+            while target < offset + block_size and target < step * count:
+                cut = block_start + target - offset
+                if align:
+                    cut -= cut % width
+                else:
+                    cut -= (cut - block_start) % width
+
+                if cut > block_start:
+                    cuts.append((cut, max(block_start, cut - width)))
+                elif last_chunk is not None:
+                    cuts.append((block_start, last_chunk))
+                target += step
+
+            if align:
+                last_chunk = max(block_start, (block_endex - 1) - (block_endex - 1) % width)
+            else:
+                last_chunk = block_endex - 1 - (block_size - 1) % width
+            offset += block_size
 
-    @classmethod
-    def _is_line_empty(cls, line: Union[bytes, bytearray]) -> bool:
-        r"""Empty line check.
+        shards = []
+        start = spans[0][0]
+        previous = None
+        for cut, cut_previous in cuts:
+            if start < cut:
+                shards.append((start, cut, previous))
+                start, previous = cut, cut_previous
+        shards.append((start, spans[-1][1], previous))
+        return shards
+
+    def _unshare_memory(
+        self,
+        start: Union[int, None] = None,
+        endex: Union[int, None] = None,
+        mapped: bool = True,
+    ) -> None:
+        r"""Unshares memory data before editing a range.
 
-        Tells whether a `line` has no meaningful content (e.g. all whitespace).
-        The check itself depends on the implementing file *format*.
-        It may be used internally to skip empty lines, e.g. by :meth:`parse`.
+        Any memory blocks touching the specified range, which are either
+        read-only views or buffers exported by :meth:`_export_memory`, are
+        replaced with private copies, so that they can be edited in place
+        without affecting other memory objects sharing the same data.
+        Whole blocks are replaced, so that the shared buffers themselves are
+        never resized while exported.
+
+        A memory object found to share no data is remembered, so that
+        editing it does not require any further lookups.
 
         Args:
-            line (bytes):
-                A line, byte string.
+            start (int):
+                Inclusive start address of the range to edit.
+                If ``None``, start from the beginning of :attr:`memory`.
 
-        Returns:
-            :bool: The `line` is empty.
+            endex (int):
+                Exclusive end address of the range to edit.
+                If ``None``, extend after the end of :attr:`memory`.
 
-        Examples:
-            **NOTE:** These examples are provided by :class:`BaseFile`.
-            Inherited classes for specific *formats* may require an adaptation.
+            mapped (bool):
+                Unshares the read-only views over the file memory mapped by
+                :meth:`load` too.
 
-            >>> from hexrec import IhexFile
-            >>> IhexFile._is_line_empty(b'')
-            True
-            >>> IhexFile._is_line_empty(b' \t\v\r\n')
-            True
-            >>> IhexFile._is_line_empty(b':00000001FF\r\n')
-            False
+        See Also:
+            :meth:`_export_memory`
         """
 
-        return not line or line.isspace()
+        memory = self._get_memory()
+        shared_buffers = self._shared_buffers
+        mapping = None if mapped else self._mapping
+
+        if not shared_buffers:
+            if memory is self._private_memory:
+                return
+            if not _is_memory_readonly(memory):
+                self._private_memory = memory
+                return
+
+        if start is not None:
+            start -= 1  # touching block before
+        if endex is not None:
+            endex += 1  # touching block after
+
+        for span_start, _ in list(memory.intervals(start=start, endex=endex)):
+            block_start, block_endex, _ = memory.block_span(span_start)
+            block_view = memory.view(block_start, block_endex)
+            buffer = block_view.obj
+            buffer_id = id(buffer)
+
+            kept = mapping is not None and buffer is mapping  # read-only anyway
+            if not kept and (block_view.readonly or buffer_id in shared_buffers):
+                private = bytearray(block_view)
+                block_view.release()
+                memory.clear(start=block_start, endex=block_endex)  # drops the whole block
+                memory.write(block_start, private)
+                shared_buffers.pop(buffer_id, None)
+            else:
+                block_view.release()
 
     def align(
         self,
@@ -2026,10 +5614,171 @@ class BaseFile(abc.ABC):
             [(120, b'...abc..'), (132, b'..xyz...')]
         """
 
-        self.memory.align(modulo, start=start, endex=endex, pattern=pattern)
-        self.discard_records()
+        memory = self._get_memory()
+        dirty_start, dirty_endex = memory.bound(start, endex)
+        self._unshare_memory(dirty_start - modulo, dirty_endex + modulo)
+        memory.align(modulo, start=start, endex=endex, pattern=pattern)
+        self._mark_dirty(dirty_start - modulo, dirty_endex + modulo)
         return self
 
+    @classmethod
+    async def aload(
+        cls,
+        in_path_or_stream: Union[AnyPath, asyncio.StreamReader],
+        *args: Any,
+        executor: Union[Executor, None] = None,
+        chunk_size: Union[int, None] = None,
+        **kwargs: Any,
+    ) -> Self:  # type: ignore Self
+        r"""Loads a file object asynchronously.
+
+        Coroutine version of :meth:`load`.
+
+        A filesystem path is read by chunks via the default executor of the
+        running event loop, so that file I/O never blocks the event loop.
+        Any other object is parsed via :meth:`aparse`.
+
+        The file object is created in *memory role*.
+
+        Args:
+            in_path_or_stream (str or :class:`asyncio.StreamReader`):
+                Path of the file within the filesystem, or asynchronous byte
+                input stream.
+
+            args:
+                Forwarded to :meth:`create_parser`.
+
+            executor (:class:`concurrent.futures.Executor`):
+                Executor running the parser, as per :meth:`aparse`.
+
+            chunk_size (int):
+                Maximum size of each chunk.
+                If ``None``, :attr:`ASYNC_CHUNK_SIZE` is used.
+
+            kwargs:
+                Forwarded to :meth:`create_parser`.
+
+        Returns:
+            :class:`BaseFile`: Loaded file object.
+
+        Raises:
+            ValueError: Invalid record, or records required, as per
+            :meth:`aparse`.
+
+        See Also:
+            :meth:`aparse`
+            :meth:`asave`
+            :meth:`load`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> import asyncio, os, tempfile
+            >>> from hexrec import IhexFile
+            >>> folder = tempfile.TemporaryDirectory()
+            >>> path = os.path.join(folder.name, 'data.hex')
+            >>> _ = IhexFile.from_blocks([(0xDA7A, b'abc')], startaddr=0xCAFE).save(path)
+            >>> file = asyncio.run(IhexFile.aload(path))
+            >>> file.memory.to_blocks()
+            [(55930, b'abc')]
+            >>> file.get_meta()
+            {'linear': True, 'maxdatalen': 3, 'startaddr': 51966}
+            >>> folder.cleanup()
+        """
+
+        if not isinstance(in_path_or_stream, (bytes, bytearray, str, os.PathLike)):
+            return await cls.aparse(in_path_or_stream, *args,
+                                    executor=executor, chunk_size=chunk_size, **kwargs)
+
+        path = in_path_or_stream
+        loop = asyncio.get_running_loop()
+        parser = cls.create_parser(*args, **kwargs)
+        stream = await loop.run_in_executor(None, open, path, 'rb')
+        try:
+            async def read(size: int) -> bytes:
+                return await loop.run_in_executor(None, stream.read, size)
+
+            return await cls._afeed(parser, read, executor=executor, chunk_size=chunk_size)
+        finally:
+            await loop.run_in_executor(None, stream.close)
+
+    @classmethod
+    async def aparse(
+        cls,
+        stream: asyncio.StreamReader,
+        *args: Any,
+        executor: Union[Executor, None] = None,
+        chunk_size: Union[int, None] = None,
+        **kwargs: Any,
+    ) -> Self:  # type: ignore Self
+        r"""Parses an asynchronous byte stream.
+
+        Coroutine version of :meth:`parse`.
+
+        It reads the `stream` by chunks, feeding them to a push parser created
+        by :meth:`create_parser`, until the end of the `stream`.
+
+        If `executor` is ``None``, parsing is performed within the event loop,
+        which is given back control after each chunk, as big as `chunk_size`
+        at most.
+        Otherwise, parsing is offloaded to the `executor`, so that the event
+        loop is not stalled by big files.
+
+        The file object is created in *memory role*.
+
+        Args:
+            stream (:class:`asyncio.StreamReader`):
+                Asynchronous byte stream to parse, providing the
+                :meth:`asyncio.StreamReader.read` coroutine.
+
+            args:
+                Forwarded to :meth:`create_parser`.
+
+            executor (:class:`concurrent.futures.Executor`):
+                Executor running the parser, or ``None``.
+                It must share the parser object, e.g. a
+                :class:`concurrent.futures.ThreadPoolExecutor`.
+
+            chunk_size (int):
+                Maximum size of each chunk.
+                If ``None``, :attr:`ASYNC_CHUNK_SIZE` is used.
+
+            kwargs:
+                Forwarded to :meth:`create_parser`.
+
+        Returns:
+            :class:`BaseFile`: The created file object.
+
+        Raises:
+            ValueError: Invalid record, or records required, as per
+            :meth:`BaseParser.close`.
+
+        See Also:
+            :meth:`aload`
+            :meth:`aserialize`
+            :meth:`create_parser`
+            :meth:`parse`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> import asyncio
+            >>> from hexrec import IhexFile
+            >>> async def main():
+            ...     stream = asyncio.StreamReader()
+            ...     stream.feed_data(b':03DA7A0061626383\r\n:00000001FF\r\n')
+            ...     stream.feed_eof()
+            ...     return await IhexFile.aparse(stream)
+            >>> file = asyncio.run(main())
+            >>> file.memory.to_blocks()
+            [(55930, b'abc')]
+        """
+
+        parser = cls.create_parser(*args, **kwargs)
+        return await cls._afeed(parser, stream.read, executor=executor, chunk_size=chunk_size)
+
     def append(self, item: Union[AnyBytes, int]) -> Self:  # type: ignore Self
         r"""Appends a byte.
 
@@ -2061,63 +5810,233 @@ class BaseFile(abc.ABC):
             [(123, b'abc.\x00')]
         """
 
-        self.memory.append(item)
-        self.discard_records()
+        memory = self._get_memory()
+        endex = memory.endex
+        self._unshare_memory(endex, endex)
+        memory.append(item)
+        self._mark_dirty(endex, memory.endex)
         return self
 
     def apply_records(self) -> Self:  # type: ignore Self
         r"""Applies records to memory and meta.
 
-        This method processes the stored :attr:`records`, converting *data* as
-        :attr:`memory`, and special records into their *meta* counterparts.
+        This method processes the stored :attr:`records`, converting *data* as
+        :attr:`memory`, and special records into their *meta* counterparts.
+
+        This effectively converts the *records role* into the *memory role*
+        (keeping both).
+
+        The :attr:`memory` and *meta* are assigned upon return.
+        Any exceptions being raised should not alter the file object.
+
+        Returns:
+            :class:`BaseFile`: *self*.
+
+        Raises:
+            ValueError: :attr:`records` attribute not populated.
+
+        See Also:
+            :attr:`records`
+            :attr:`memory`
+            :meth:`get_meta`
+            :meth:`update_records`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import IhexFile
+            >>> IhexRecord = IhexFile.Record
+            >>> records = [IhexRecord.create_data(123, b'abc'),
+            ...            IhexRecord.create_start_linear_address(456),
+            ...            IhexRecord.create_end_of_file()]
+            >>> file = IhexFile.from_records(records, maxdatalen=16)
+            >>> _ = file.apply_records()
+            >>> file.memory.to_blocks()
+            [(123, b'abc')]
+            >>> file.get_meta()
+            {'linear': True, 'maxdatalen': 16, 'startaddr': 456}
+        """
+
+        if self._records is None:
+            raise ValueError('records required')
+
+        memory = Memory()
+
+        for tag, address, data in self._iter_record_fields(self._records):
+            if tag.is_data():
+                memory.write(address, data)
+
+        self.discard_memory()
+        self._memory = memory
+        return self
+
+    async def asave(
+        self,
+        out_path_or_stream: Union[AnyPath, asyncio.StreamWriter],
+        *args: Any,
+        executor: Union[Executor, None] = None,
+        chunk_size: Union[int, None] = None,
+        **kwargs: Any,
+    ) -> Self:  # type: ignore Self
+        r"""Saves a file object asynchronously.
+
+        Coroutine version of :meth:`save`.
+
+        A filesystem path is written via the default executor of the running
+        event loop, so that file I/O never blocks the event loop.
+        Any other object is written via :meth:`aserialize`.
+
+        Args:
+            out_path_or_stream (str or :class:`asyncio.StreamWriter`):
+                Path of the file within the filesystem, or asynchronous output
+                byte stream.
+
+            args:
+                Forwarded to :meth:`serialize`.
+
+            executor (:class:`concurrent.futures.Executor`):
+                Executor running the serialization, as per :meth:`aserialize`.
+
+            chunk_size (int):
+                Maximum size of each chunk.
+                If ``None``, :attr:`ASYNC_CHUNK_SIZE` is used.
+
+            kwargs:
+                Forwarded to :meth:`serialize`.
+
+        Returns:
+            :class:`BaseFile`: *self*.
+
+        See Also:
+            :meth:`aload`
+            :meth:`aserialize`
+            :meth:`save`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> import asyncio, os, tempfile
+            >>> from hexrec import IhexFile
+            >>> folder = tempfile.TemporaryDirectory()
+            >>> path = os.path.join(folder.name, 'data.hex')
+            >>> file = IhexFile.from_blocks([(0xDA7A, b'abc')], startaddr=0xCAFE)
+            >>> _ = asyncio.run(file.asave(path))
+            >>> folder.cleanup()
+        """
+
+        if not isinstance(out_path_or_stream, (bytes, bytearray, str, os.PathLike)):
+            return await self.aserialize(out_path_or_stream, *args,
+                                         executor=executor, chunk_size=chunk_size, **kwargs)
+
+        path = out_path_or_stream
+        if chunk_size is None:
+            chunk_size = self.ASYNC_CHUNK_SIZE
+        loop = asyncio.get_running_loop()
+        data = await self._arender(args, kwargs, executor=executor)
+
+        stream = await loop.run_in_executor(None, open, path, 'wb')
+        try:
+            for offset in range(0, len(data), chunk_size):
+                chunk = data[offset:(offset + chunk_size)]
+                await loop.run_in_executor(None, stream.write, chunk)
+        finally:
+            await loop.run_in_executor(None, stream.close)
+        return self
+
+    async def aserialize(
+        self,
+        stream: asyncio.StreamWriter,
+        *args: Any,
+        executor: Union[Executor, None] = None,
+        chunk_size: Union[int, None] = None,
+        **kwargs: Any,
+    ) -> Self:  # type: ignore Self
+        r"""Serializes onto an asynchronous byte stream.
+
+        Coroutine version of :meth:`serialize`.
+
+        It renders the serialized byte string via :meth:`serialize`, then
+        writes it onto the `stream` by chunks, awaiting
+        :meth:`asyncio.StreamWriter.drain` after each chunk.
+
+        If `executor` is ``None``, serialization is performed within the event
+        loop.
+        Otherwise, it is offloaded to the `executor`, so that the event loop
+        is not stalled by big files.
+
+        Args:
+            stream (:class:`asyncio.StreamWriter`):
+                Asynchronous byte stream to serialize onto, providing the
+                :meth:`asyncio.StreamWriter.write` method and the
+                :meth:`asyncio.StreamWriter.drain` coroutine.
+
+            args:
+                Forwarded to :meth:`serialize`.
 
-        This effectively converts the *records role* into the *memory role*
-        (keeping both).
+            executor (:class:`concurrent.futures.Executor`):
+                Executor running the serialization, or ``None``.
 
-        The :attr:`memory` and *meta* are assigned upon return.
-        Any exceptions being raised should not alter the file object.
+            chunk_size (int):
+                Maximum size of each chunk.
+                If ``None``, :attr:`ASYNC_CHUNK_SIZE` is used.
+
+            kwargs:
+                Forwarded to :meth:`serialize`.
 
         Returns:
             :class:`BaseFile`: *self*.
 
-        Raises:
-            ValueError: :attr:`records` attribute not populated.
+        See Also:
+            :meth:`aparse`
+            :meth:`asave`
+            :meth:`serialize`
+        """
+
+        if chunk_size is None:
+            chunk_size = self.ASYNC_CHUNK_SIZE
+        data = await self._arender(args, kwargs, executor=executor)
+
+        for offset in range(0, len(data), chunk_size):
+            stream.write(data[offset:(offset + chunk_size)])
+            await stream.drain()
+        return self
+
+    def batch(self) -> EditBatch:
+        r"""Starts a batch of memory edits.
+
+        It creates an :class:`EditBatch` collecting overwriting edits and
+        *meta* changes, applied at once upon :meth:`EditBatch.commit`.
+        Overlapping edits are coalesced into a minimal set of :attr:`memory`
+        operations, and :attr:`records` are invalidated once, instead of
+        upon each edit.
+
+        Returns:
+            :class:`EditBatch`: Batch of edits of *self*.
 
         See Also:
-            :attr:`records`
-            :attr:`memory`
-            :meth:`get_meta`
-            :meth:`update_records`
+            :class:`EditBatch`
+            :meth:`write`
+            :meth:`fill`
+            :meth:`clear`
+            :meth:`set_meta`
 
         Examples:
             **NOTE:** These examples are provided by :class:`BaseFile`.
             Inherited classes for specific *formats* may require an adaptation.
 
-            >>> from hexrec import IhexFile
-            >>> IhexRecord = IhexFile.Record
-            >>> records = [IhexRecord.create_data(123, b'abc'),
-            ...            IhexRecord.create_start_linear_address(456),
-            ...            IhexRecord.create_end_of_file()]
-            >>> file = IhexFile.from_records(records, maxdatalen=16)
-            >>> _ = file.apply_records()
+            >>> from hexrec import SrecFile
+            >>> file = SrecFile.from_blocks([(123, b'abc'), (130, b'xyz')])
+            >>> with file.batch() as batch:
+            ...     for offset in range(8):
+            ...         _ = batch.write(123 + offset, b'ABCDEFGH'[offset])
+            ...     _ = batch.clear(127, 129)
             >>> file.memory.to_blocks()
-            [(123, b'abc')]
-            >>> file.get_meta()
-            {'linear': True, 'maxdatalen': 16, 'startaddr': 456}
+            [(123, b'ABCD'), (129, b'GHyz')]
         """
 
-        if self._records is None:
-            raise ValueError('records required')
-
-        memory = Memory()
-
-        for record in self._records:
-            if record.tag.is_data():
-                memory.write(record.address, record.data)
-
-        self.discard_memory()
-        self._memory = memory
-        return self
+        return EditBatch(self)
 
     def clear(
         self,
@@ -2159,8 +6078,12 @@ class BaseFile(abc.ABC):
             [(123, b'a'), (132, b'z')]
         """
 
-        self.memory.clear(start=start, endex=endex)
-        self.discard_records()
+        memory = self._get_memory()
+        dirty_start, dirty_endex = memory.bound(start, endex)
+        self._unshare_memory(dirty_start, dirty_start)
+        self._unshare_memory(dirty_endex, dirty_endex)
+        memory.clear(start=start, endex=endex)
+        self._mark_dirty(dirty_start, dirty_endex)
         return self
 
     @classmethod
@@ -2174,6 +6097,15 @@ class BaseFile(abc.ABC):
         It copies the :attr:`memory` and *meta* of the `source` file object,
         creating a new one of the target :class:`BaseFile` format type.
 
+        Memory blocks are shared copy-on-write instead of being copied: a
+        block is actually copied only when edited by the methods of either
+        file object.
+        Accessing :attr:`memory` or :meth:`view` unshares the exposed blocks
+        beforehand, so that editing them directly affects only one file
+        object.
+        Memory already exposed that way might be edited directly at any time,
+        so its blocks are copied instead.
+
         Args:
             source (:class:`BaseFile`):
                 Source file object to convert.
@@ -2181,6 +6113,9 @@ class BaseFile(abc.ABC):
             meta (bool):
                 Copy *meta* information to the target file object.
                 Only the keys of the target :attr:`META_KEYS` are processed.
+                An unbounded ``maxdatalen`` (e.g. that of
+                :class:`hexrec.formats.raw.RawFile`) is replaced by the target
+                :attr:`DEFAULT_DATALEN`.
 
         Returns:
             :class:`BaseFile`: Converted copy of `source` to the target format.
@@ -2206,12 +6141,15 @@ class BaseFile(abc.ABC):
             target_meta = {key: source_meta[key]
                            for key in cls.META_KEYS
                            if key in source_meta}
+            if target_meta.get('maxdatalen') == sys.maxsize:
+                target_meta['maxdatalen'] = cls.DEFAULT_DATALEN  # unbounded
         else:
             target_meta = {}
 
-        target_memory = source.memory.copy()
-        target_memory = _cast(MutableMemory, target_memory)
+        target_memory = source._export_memory()
         target = cls.from_memory(memory=target_memory, **target_meta)
+        target._mapping = source._mapping  # shared ownership
+        target._mapped_file = source._mapped_file
         return target
 
     def copy(
@@ -2225,6 +6163,15 @@ class BaseFile(abc.ABC):
         It copied data within the specified range of the file object, creating
         a new one carrying the inner slice.
 
+        Memory blocks are shared copy-on-write instead of being copied: a
+        block is actually copied only when edited by the methods of either
+        file object.
+        Accessing :attr:`memory` or :meth:`view` unshares the exposed blocks
+        beforehand, so that editing them directly affects only one file
+        object.
+        Memory already exposed that way might be edited directly at any time,
+        so its blocks are copied instead.
+
         Args:
             start (int):
                 Inclusive start address of the specified range.
@@ -2259,12 +6206,48 @@ class BaseFile(abc.ABC):
             [(123, b'abc'), (130, b'xyz')]
         """
 
-        copied_memory = self.memory.extract(start=start, endex=endex, bound=False)
+        copied_memory = self._export_memory(start=start, endex=endex)
         copied_meta = self.get_meta() if meta else {}
-        copied_memory = _cast(MutableMemory, copied_memory)
         copied = self.from_memory(memory=copied_memory, **copied_meta)
+        copied._mapping = self._mapping  # shared ownership
+        copied._mapped_file = self._mapped_file
         return copied
 
+    @classmethod
+    def create_parser(cls, *args: Any, **kwargs: Any) -> BaseParser:
+        r"""Creates a push parser.
+
+        It creates a :attr:`Parser` object, which parses a byte stream fed
+        incrementally by chunks, and finally creates a file object of this
+        class.
+
+        Args:
+            args:
+                Forwarded to the :attr:`Parser` constructor.
+
+            kwargs:
+                Forwarded to the :attr:`Parser` constructor.
+
+        Returns:
+            :class:`BaseParser`: The created push parser.
+
+        See Also:
+            :class:`BaseParser`
+            :meth:`parse`
+
+        Examples:
+            >>> from hexrec import SrecFile
+            >>> parser = SrecFile.create_parser()
+            >>> _ = parser.feed(b'S0030000FC\r\nS1060')
+            >>> _ = parser.feed(b'07B61626358\r\nS9030000FC\r\n')
+            >>> file = parser.close()
+            >>> file.memory.to_blocks()
+            [(123, b'abc')]
+        """
+
+        parser = cls.Parser(cls, *args, **kwargs)
+        return parser
+
     def crop(
         self,
         start: Union[int, None] = None,
@@ -2275,6 +6258,10 @@ class BaseFile(abc.ABC):
         It clears outside the specified range of underlying :attr:`memory`
         object, timming it.
 
+        Read-only memory blocks, like those of a memory mapped
+        :class:`hexrec.formats.raw.RawFile`, are not altered: :attr:`memory`
+        is replaced by views over them, trimmed to the specified range.
+
         Any stored :attr:`records` are discarded upon return.
 
         Args:
@@ -2305,8 +6292,17 @@ class BaseFile(abc.ABC):
             [(124, b'bc'), (130, b'xy')]
         """
 
-        self.memory.crop(start=start, endex=endex)
-        self.discard_records()
+        memory = self._get_memory()
+        content_start, content_endex = memory.start, memory.endex
+        crop_start, crop_endex = memory.bound(start, endex)
+        if _is_memory_readonly(memory):
+            self._memory = _share_memory(memory, start=start, endex=endex)
+        else:
+            self._unshare_memory(crop_start, crop_start)
+            self._unshare_memory(crop_endex, crop_endex)
+            memory.crop(start=start, endex=endex)
+        self._mark_dirty(content_start, crop_start)
+        self._mark_dirty(crop_endex, content_endex)
         return self
 
     def cut(
@@ -2358,11 +6354,15 @@ class BaseFile(abc.ABC):
             [(123, b'a'), (132, b'z')]
         """
 
-        inner_memory = self.memory.cut(start=start, endex=endex, bound=False)
+        memory = self._get_memory()
+        dirty_start, dirty_endex = memory.bound(start, endex)
+        self._unshare_memory(dirty_start, dirty_start)
+        self._unshare_memory(dirty_endex, dirty_endex)
+        inner_memory = memory.cut(start=start, endex=endex, bound=False)
         inner_memory = _cast(MutableMemory, inner_memory)
         inner_meta = self.get_meta() if meta else {}
         inner = self.from_memory(memory=inner_memory, **inner_meta)
-        self.discard_records()
+        self._mark_dirty(dirty_start, dirty_endex)
         return inner
 
     def delete(
@@ -2405,14 +6405,20 @@ class BaseFile(abc.ABC):
             [(123, b'az')]
         """
 
-        self.memory.delete(start=start, endex=endex)
-        self.discard_records()
+        memory = self._get_memory()
+        dirty_start, dirty_endex = memory.bound(start, memory.endex)
+        self._unshare_memory(dirty_start, dirty_start)
+        if endex is not None:
+            self._unshare_memory(endex, endex)
+        memory.delete(start=start, endex=endex)
+        self._mark_dirty(dirty_start, dirty_endex)
         return self
 
     def discard_records(self) -> Self:  # type: ignore Self
         r"""Discards underlying records.
 
         The underlying :attr:`records` object is assigned ``None``.
+        Any records kept for reuse by :meth:`update_records` are dropped too.
 
         If the underlying :attr:`memory` object is ``None``, it is assigned
         a new empty memory object.
@@ -2440,6 +6446,10 @@ class BaseFile(abc.ABC):
         self._records = None
         if self._memory is None:
             self._memory = Memory()
+        self._update_key = None
+        self._update_cache = {}
+        self._dirty_spans = []
+        self._record_lines = None
         return self
 
     def discard_memory(self) -> Self:  # type: ignore Self
@@ -2450,6 +6460,11 @@ class BaseFile(abc.ABC):
         If the underlying :attr:`records` object is ``None``, it is assigned
         a new empty memory object.
 
+        If the file object was loaded via memory mapping, the mapping is
+        closed, unless still referred by other objects sharing its data
+        (e.g. a :meth:`copy` of the file object, which owns the mapping as
+        well).
+
         Returns:
             :class:`BaseFile`: *self*.
 
@@ -2468,8 +6483,20 @@ class BaseFile(abc.ABC):
         """
 
         self._memory = None
+        self._shared_buffers = {}
+        self._private_memory = None
+        self._exposed_memory = None
         if self._records is None:
             self._memory = Memory()
+
+        mapping = self._mapping
+        self._mapping = None
+        self._mapped_file = None
+        if mapping is not None:
+            try:
+                mapping.close()
+            except BufferError:
+                pass  # closed by the last owner sharing data
         return self
 
     def extend(
@@ -2510,9 +6537,12 @@ class BaseFile(abc.ABC):
         """
 
         if isinstance(other, BaseFile):
-            other = other.memory
-        self.memory.extend(other)
-        self.discard_records()
+            other = other._get_memory()
+        memory = self._get_memory()
+        endex = memory.endex
+        self._unshare_memory(endex, endex)
+        memory.extend(other)
+        self._mark_dirty(endex, memory.endex)
         return self
 
     def fill(
@@ -2559,8 +6589,11 @@ class BaseFile(abc.ABC):
             [(123, b'a........z')]
         """
 
-        self.memory.fill(start=start, endex=endex, pattern=pattern)
-        self.discard_records()
+        memory = self._get_memory()
+        dirty_start, dirty_endex = memory.bound(start, endex)
+        self._unshare_memory(dirty_start, dirty_endex)
+        memory.fill(start=start, endex=endex, pattern=pattern)
+        self._mark_dirty(dirty_start, dirty_endex)
         return self
 
     def find(
@@ -2615,7 +6648,7 @@ class BaseFile(abc.ABC):
             -1
         """
 
-        offset = self.memory.find(item, start=start, endex=endex)
+        offset = self._get_memory().find(item, start=start, endex=endex)
         return offset
 
     def flood(
@@ -2664,8 +6697,11 @@ class BaseFile(abc.ABC):
             [(123, b'abc....xyz')]
         """
 
-        self.memory.flood(start=start, endex=endex, pattern=pattern)
-        self.discard_records()
+        memory = self._get_memory()
+        dirty_start, dirty_endex = memory.bound(start, endex)
+        self._unshare_memory(dirty_start, dirty_endex)
+        memory.flood(start=start, endex=endex, pattern=pattern)
+        self._mark_dirty(dirty_start, dirty_endex)
         return self
 
     @classmethod
@@ -2876,7 +6912,7 @@ class BaseFile(abc.ABC):
         """
 
         if maxdatalen is None:
-            dataiter = (len(r.data) for r in records if r.tag.is_data())
+            dataiter = (len(data) for tag, _, data in cls._iter_record_fields(records) if tag.is_data())
             maxdatalen = max(dataiter, default=0)
             if maxdatalen < 1:
                 maxdatalen = cls.DEFAULT_DATALEN
@@ -2912,7 +6948,7 @@ class BaseFile(abc.ABC):
             458
         """
 
-        return self.memory.endin
+        return self._get_memory().endin
 
     def get_address_min(self) -> int:
         r"""Minimum address within memory.
@@ -2935,7 +6971,7 @@ class BaseFile(abc.ABC):
             123
         """
 
-        return self.memory.start
+        return self._get_memory().start
 
     def get_holes(self) -> List[Tuple[int, int]]:
         r"""List of memory holes.
@@ -2963,7 +6999,7 @@ class BaseFile(abc.ABC):
             [(126, 456), (459, 789)]
         """
 
-        memory = self.memory
+        memory = self._get_memory()
         holes = list(memory.gaps(memory.start, memory.endex))
         holes = _cast(List[Tuple[int, int]], holes)
         return holes
@@ -2994,7 +7030,7 @@ class BaseFile(abc.ABC):
             [(123, 126), (456, 459), (789, 791)]
         """
 
-        spans = list(self.memory.intervals())
+        spans = list(self._get_memory().intervals())
         return spans
 
     def get_meta(self) -> Mapping[str, Any]:
@@ -3071,7 +7107,7 @@ class BaseFile(abc.ABC):
             ValueError: subsection not found
         """
 
-        offset = self.memory.index(item, start=start, endex=endex)
+        offset = self._get_memory().index(item, start=start, endex=endex)
         return offset
 
     @classmethod
@@ -3079,6 +7115,11 @@ class BaseFile(abc.ABC):
         cls,
         in_path_or_stream: Union[AnyPath, IO, None],
         *args,
+        records: bool = True,
+        mmap: bool = False,
+        workers: Union[int, None] = 1,
+        cache: Union[ParseCache, None] = None,
+        validate: bool = False,
         **kwargs,
     ) -> Self:  # type: ignore Self
         r"""Loads a file object from the filesystem.
@@ -3094,6 +7135,46 @@ class BaseFile(abc.ABC):
             args:
                 Forwarded to :meth:`parse`.
 
+            records (bool):
+                Loads the file object in *records role* via :meth:`parse`.
+                If false, the file object is loaded in *memory role* via
+                :meth:`parse_memory`, without creating any :attr:`records`.
+
+            mmap (bool):
+                Maps the file into memory via :mod:`mmap`, parsing straight
+                from a :class:`memoryview` of it, instead of reading it through
+                a buffered stream.
+                If the loaded :attr:`memory` still refers to the mapping, the
+                latter is owned by the file object, until closed by
+                :meth:`discard_memory`.
+                Meanwhile, :meth:`save` replaces the mapped file with a new
+                one, instead of overwriting the mapped data.
+                Ignored if `path_or_stream` is a stream.
+
+            workers (int):
+                If not 1, the file object is loaded in *memory role* via
+                :meth:`parse_parallel`, splitting the parsing among this
+                number of worker processes.
+                If ``None``, as many as :func:`os.cpu_count`.
+                Overrides `records`.
+
+            cache (:class:`ParseCache`):
+                If not ``None``, the memory and *meta* parsed from
+                `path_or_stream` are stored into this cache.
+                A cache hit creates the file object in *memory role* straight
+                from the cached entry, without parsing.
+                If `records` is true (and `workers` is 1), the
+                :attr:`records` are then generated by :meth:`update_records`,
+                so they may differ from the ones stored within the file.
+                Ignored if `path_or_stream` is a stream, if collecting
+                parsing `diagnostics`, or if validating.
+
+            validate (bool):
+                If true, the file object is loaded in *memory role* via
+                :meth:`parse_validated`, checking the consistency of the
+                record sequence while parsing.
+                Overrides `records` and `workers`.
+
             kwargs:
                 Forwarded to :meth:`parse`.
 
@@ -3103,6 +7184,10 @@ class BaseFile(abc.ABC):
         See Also:
             :meth:`save`
             :meth:`parse`
+            :meth:`parse_memory`
+            :meth:`parse_parallel`
+            :meth:`parse_validated`
+            :class:`ParseCache`
             :func:`open`
             :attr:`sys.stdin.buffer`
 
@@ -3110,24 +7195,77 @@ class BaseFile(abc.ABC):
             **NOTE:** These examples are provided by :class:`BaseFile`.
             Inherited classes for specific *formats* may require an adaptation.
 
+            >>> import os, tempfile
             >>> from hexrec import IhexFile
-            >>> file = IhexFile.load('data.hex')
+            >>> folder = tempfile.TemporaryDirectory()
+            >>> path = os.path.join(folder.name, 'data.hex')
+            >>> _ = IhexFile.from_blocks([(0xDA7A, b'abc')], startaddr=0xCAFE).save(path)
+            >>> file = IhexFile.load(path)
             >>> file.memory.to_blocks()
             [(55930, b'abc')]
             >>> file.get_meta()
             {'linear': True, 'maxdatalen': 3, 'startaddr': 51966}
+            >>> file = IhexFile.load(path, records=False)
+            >>> file.memory.to_blocks()
+            [(55930, b'abc')]
+            >>> file = IhexFile.load(path, mmap=True)
+            >>> file.memory.to_blocks()
+            [(55930, b'abc')]
+            >>> _ = file.discard_memory()  # closes any mapping
+            >>> file = IhexFile.load(path, workers=4)
+            >>> file.memory.to_blocks()
+            [(55930, b'abc')]
+            >>> file = IhexFile.load(path, validate=True)
+            >>> file.memory.to_blocks()
+            [(55930, b'abc')]
+            >>> folder.cleanup()
         """
 
         if in_path_or_stream is None:
             in_path_or_stream = sys.stdin.buffer
 
+        if validate:
+            parse = cls.parse_validated
+        elif workers != 1:
+            kwargs['workers'] = workers
+            parse = cls.parse_parallel
+        else:
+            parse = cls.parse if records else cls.parse_memory
+
         if isinstance(in_path_or_stream, io.IOBase):
             stream = _cast(IO, in_path_or_stream)
-            return cls.parse(stream, *args, **kwargs)
+            return parse(stream, *args, **kwargs)
+
+        elif cache is not None and not validate and kwargs.get('diagnostics') is None:
+            path = os.fsdecode(in_path_or_stream)
+            key = cache.make_key(cls, path, args, {k: v for k, v in kwargs.items() if k != 'workers'})
+            entry = cache.get(key)
+            if entry is not None:
+                blocks, meta = entry
+                file = cls.from_memory(Memory.from_blocks(blocks), **meta)
+                if records and workers == 1:
+                    file.update_records()
+                return file
+
+            file = cls.load(path, *args, records=records, mmap=mmap, **kwargs)
+            cache.put(key, file._get_memory().to_blocks(), file.get_meta())
+            return file
+
         else:
             path = str(in_path_or_stream)
             with open(path, 'rb') as stream:
-                return cls.parse(stream, *args, **kwargs)
+                status = os.fstat(stream.fileno())
+                if not mmap or not status.st_size:
+                    return parse(stream, *args, **kwargs)
+
+                mapped = _mmap.mmap(stream.fileno(), 0, access=_mmap.ACCESS_READ)
+                file = parse(memoryview(mapped), *args, **kwargs)
+                try:
+                    mapped.close()
+                except BufferError:  # memory blocks refer to the mapping
+                    file._mapping = mapped  # closed by discard_memory()
+                    file._mapped_file = (status.st_dev, status.st_ino)
+                return file
 
     @property
     def maxdatalen(self) -> int:
@@ -3211,113 +7349,349 @@ class BaseFile(abc.ABC):
         For more control activating the *memory role*, please call
         :meth:`apply_records` manually, providing the desired arguments.
 
-        Notes:
-            Most methods acting on the *records role* (i.e. altering content of
-            :attr:`records`) would implicitly discard :attr:`memory` via
-            :meth:`discard_memory`.
+        As the exposed memory object might be edited directly, any memory data
+        shared with other file objects (e.g. by :meth:`copy` and
+        :meth:`convert`) is unshared beforehand, by copying it.
+        Read-only blocks, like the views over a file memory mapped by
+        :meth:`load`, are copied as well, so that the exposed memory object
+        can always be edited.
+        Prefer :meth:`read` and :meth:`view` to access huge mapped files
+        without copying them.
+
+        Notes:
+            Most methods acting on the *records role* (i.e. altering content of
+            :attr:`records`) would implicitly discard :attr:`memory` via
+            :meth:`discard_memory`.
+
+        See Also:
+            :meth:`apply_records`
+            :meth:`discard_memory`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import SrecFile
+            >>> blocks = [(123, b'abc'), (456, b'xyz')]
+            >>> file = SrecFile.from_blocks(blocks)
+            >>> file.memory.to_blocks()
+            [(123, b'abc'), (456, b'xyz')]
+            >>> _ = file.write(789, b'?!')
+            >>> file.memory.to_blocks()
+            [(123, b'abc'), (456, b'xyz'), (789, b'?!')]
+        """
+
+        memory = self._get_memory()
+        self._unshare_memory()  # exposed to direct editing
+        self._exposed_memory = memory
+        return memory
+
+    def merge(self, *files: 'BaseFile', clear: bool = False) -> Self:  # type: ignore Self
+        r"""Merges data onto the file.
+
+        It writes the provided `files` onto *self*, in the provided order.
+        Any common address ranges are overwritten.
+
+        Any stored :attr:`records` are discarded upon return.
+
+        Args:
+            files (:class:`BaseFile`):
+                Files to merge.
+
+            clear (bool):
+                :meth:`clear` the target address range before writing.
+
+        Returns:
+            :class:`BaseFile`: *self*.
+
+        See Also:
+            :meth:`clear`
+            :meth:`discard_records`
+            :meth:`write`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import SrecFile
+            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
+            >>> file2 = SrecFile.from_bytes(b'xyz', offset=456)
+            >>> file3 = SrecFile.from_bytes(b'<<<?????>>>', offset=450)
+            >>> _ = file3.merge(file1, file2)
+            >>> file3.memory.to_blocks()
+            [(123, b'abc'), (450, b'<<<???xyz>>')]
+        """
+
+        for file in files:
+            self.write(0, file, clear=clear)
+        return self
+
+    @classmethod
+    def parse(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        table: bool = False,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Parses records from a byte stream.
+
+        It executes :meth:`BaseRecord.parse` for each line of the incoming
+        `stream`, creating a new file object with the collected records calling
+        :meth:`from_records`.
+
+        Lines resulting empty by :meth:`_is_empty_line` are just discarded.
+
+        Notes:
+            Please refer to the actual implementation of each record file
+            *format*, because it may be more specialized.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore :class:`Exception` raised by :meth:`BaseRecord.parse`.
+
+            ignore_after_termination (bool):
+                Ignore anything after the termination record was parsed, if
+                supported (e.g. *End Of File* or *start address* record,
+                depending on the specific file *format*).
+
+            table (bool):
+                Stores :attr:`records` into a compact :class:`RecordTable`,
+                instead of a :class:`list`.
+                Its records are detached copies: edits must be stored back by
+                item assignment.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them, without
+                raising any exceptions.
+
+        Returns:
+            :class:`BaseFile`: *self*.
+
+        See Also:
+            :meth:`parse`
+            :meth:`BaseRecord.parse`
+            :meth:`from_records`
+            :meth:`_is_empty_line`
+            :class:`RecordTable`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import IhexFile
+            >>> buffer = b'''
+            ...     :03DA7A0061626383
+            ...     :040000050000CAFE2F
+            ...     :00000001FF
+            ... '''
+            >>> import io
+            >>> stream = io.BytesIO(buffer)
+            >>> file = IhexFile.parse(stream)
+            >>> file.memory.to_blocks()
+            [(55930, b'abc')]
+            >>> file.get_meta()
+            {'linear': True, 'maxdatalen': 3, 'startaddr': 51966}
+            >>> file = IhexFile.parse(buffer)
+            >>> file.memory.to_blocks()
+            [(55930, b'abc')]
+            >>> file.get_meta()
+            {'linear': True, 'maxdatalen': 3, 'startaddr': 51966}
+            >>> diagnostics = []
+            >>> file = IhexFile.parse(b':03DA7A0061626383\njunk\n:00000001FE\n',
+            ...                       diagnostics=diagnostics)
+            >>> diagnostics
+            [(2, 0, 'syntax error'), (3, 0, 'wrong checksum')]
+        """
+
+        records = RecordTable(cls.Record) if table else []
+        records.extend(cls._iter_parsed_records(stream, ignore_errors=ignore_errors,
+                                                ignore_after_termination=ignore_after_termination,
+                                                diagnostics=diagnostics))
+        file = cls.from_records(records)
+        return file
+
+    @classmethod
+    def parse_memory(
+        cls,
+        stream: Union[AnyBytes, IO],
+        *args,
+        **kwargs,
+    ) -> Self:  # type: ignore Self
+        r"""Parses a byte stream directly into memory.
+
+        It parses the incoming `stream` into a file object in *memory role*,
+        holding only :attr:`memory` and *meta*.
+        The :attr:`records` are generated from scratch by
+        :meth:`update_records` upon request.
+
+        The resulting :attr:`memory` and *meta* are the same as per
+        :meth:`parse` followed by :meth:`apply_records`.
+
+        Notes:
+            This generic implementation just parses the whole :attr:`records`
+            sequence, then applies and discards it.
+            Each record file *format* should implement a faster algorithm,
+            writing each record into :attr:`memory` as soon as it is parsed,
+            without collecting any :attr:`records`.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            args:
+                Forwarded to :meth:`parse`.
+
+            kwargs:
+                Forwarded to :meth:`parse`.
+
+        Returns:
+            :class:`BaseFile`: The created file object.
 
         See Also:
+            :meth:`parse`
             :meth:`apply_records`
-            :meth:`discard_memory`
+            :meth:`discard_records`
 
         Examples:
             **NOTE:** These examples are provided by :class:`BaseFile`.
             Inherited classes for specific *formats* may require an adaptation.
 
-            >>> from hexrec import SrecFile
-            >>> blocks = [(123, b'abc'), (456, b'xyz')]
-            >>> file = SrecFile.from_blocks(blocks)
-            >>> file.memory.to_blocks()
-            [(123, b'abc'), (456, b'xyz')]
-            >>> _ = file.write(789, b'?!')
+            >>> from hexrec import IhexFile
+            >>> buffer = b'''
+            ...     :03DA7A0061626383
+            ...     :040000050000CAFE2F
+            ...     :00000001FF
+            ... '''
+            >>> file = IhexFile.parse_memory(buffer)
             >>> file.memory.to_blocks()
-            [(123, b'abc'), (456, b'xyz'), (789, b'?!')]
+            [(55930, b'abc')]
+            >>> file.get_meta()
+            {'linear': True, 'maxdatalen': 3, 'startaddr': 51966}
         """
 
-        if self._memory is None:
-            self.apply_records()
-        assert self._memory is not None
-        return self._memory
+        file = cls.parse(stream, *args, **kwargs)
+        file.apply_records()
+        file.discard_records()
+        return file
 
-    def merge(self, *files: 'BaseFile', clear: bool = False) -> Self:  # type: ignore Self
-        r"""Merges data onto the file.
+    @classmethod
+    def parse_parallel(
+        cls,
+        stream: Union[AnyBytes, IO],
+        *args,
+        workers: Union[int, None] = None,
+        **kwargs,
+    ) -> Self:  # type: ignore Self
+        r"""Parses a byte stream into memory, in parallel.
 
-        It writes the provided `files` onto *self*, in the provided order.
-        Any common address ranges are overwritten.
+        It splits the incoming `stream` into shards at line boundaries, each
+        one parsed directly into memory by a separate worker process.
+        The partial memories are then merged in order, into a file object in
+        *memory role*.
 
-        Any stored :attr:`records` are discarded upon return.
+        The resulting :attr:`memory` and *meta* are the same as per
+        :meth:`parse_memory`.
+
+        Notes:
+            This generic implementation just falls back to the serial
+            :meth:`parse_memory`, as not all the record file *formats* can
+            parse a shard independently from the previous ones.
 
         Args:
-            files (:class:`BaseFile`):
-                Files to merge.
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
 
-            clear (bool):
-                :meth:`clear` the target address range before writing.
+            args:
+                Forwarded to :meth:`parse_memory`.
+
+            workers (int):
+                Maximum number of worker processes.
+                If ``None``, as many as :func:`os.cpu_count`.
+
+            kwargs:
+                Forwarded to :meth:`parse_memory`.
 
         Returns:
-            :class:`BaseFile`: *self*.
+            :class:`BaseFile`: The created file object.
 
         See Also:
-            :meth:`clear`
-            :meth:`discard_records`
-            :meth:`write`
+            :meth:`parse_memory`
+            :attr:`SHARD_SIZE_MIN`
 
         Examples:
             **NOTE:** These examples are provided by :class:`BaseFile`.
             Inherited classes for specific *formats* may require an adaptation.
 
-            >>> from hexrec import SrecFile
-            >>> file1 = SrecFile.from_bytes(b'abc', offset=123)
-            >>> file2 = SrecFile.from_bytes(b'xyz', offset=456)
-            >>> file3 = SrecFile.from_bytes(b'<<<?????>>>', offset=450)
-            >>> _ = file3.merge(file1, file2)
-            >>> file3.memory.to_blocks()
-            [(123, b'abc'), (450, b'<<<???xyz>>')]
+            >>> from hexrec import IhexFile
+            >>> buffer = b'''
+            ...     :03DA7A0061626383
+            ...     :040000050000CAFE2F
+            ...     :00000001FF
+            ... '''
+            >>> file = IhexFile.parse_parallel(buffer, workers=4)
+            >>> file.memory.to_blocks()
+            [(55930, b'abc')]
+            >>> file.get_meta()
+            {'linear': True, 'maxdatalen': 3, 'startaddr': 51966}
         """
 
-        for file in files:
-            self.write(0, file, clear=clear)
-        return self
+        return cls.parse_memory(stream, *args, **kwargs)
 
     @classmethod
-    def parse(
+    def parse_validated(
         cls,
         stream: Union[AnyBytes, IO],
-        ignore_errors: bool = False,
-        ignore_after_termination: bool = True,
+        *args,
+        **kwargs,
     ) -> Self:  # type: ignore Self
-        r"""Parses records from a byte stream.
+        r"""Parses and validates a byte stream directly into memory.
 
-        It executes :meth:`BaseRecord.parse` for each line of the incoming
-        `stream`, creating a new file object with the collected records calling
-        :meth:`from_records`.
+        It parses the incoming `stream` into a file object in *memory role*,
+        checking the consistency of the record sequence along the way.
 
-        Lines resulting empty by :meth:`_is_empty_line` are just discarded.
+        The resulting :attr:`memory` and *meta* are the same as per
+        :meth:`parse` followed by :meth:`validate_records` and
+        :meth:`apply_records`.
 
         Notes:
-            Please refer to the actual implementation of each record file
-            *format*, because it may be more specialized.
+            This generic implementation just executes those steps in turn,
+            walking the records three times, with the default checks of
+            :meth:`validate_records`.
+            Each record file *format* should implement a faster algorithm,
+            validating each record and writing it into :attr:`memory` within
+            the same single pass, also accepting the optional checks of
+            :meth:`validate_records`.
+            In that case, the first invalid record or sequence found along
+            the `stream` raises the exception, so that the reported reason
+            may differ from the multi-pass approach for a `stream` with
+            multiple errors.
 
         Args:
             stream (bytes IO or buffer):
                 Stream or byte buffer to parse records from.
 
-            ignore_errors (bool):
-                Ignore :class:`Exception` raised by :meth:`BaseRecord.parse`.
+            args:
+                Forwarded to :meth:`parse`.
 
-            ignore_after_termination (bool):
-                Ignore anything after the termination record was parsed, if
-                supported (e.g. *End Of File* or *start address* record,
-                depending on the specific file *format*).
+            kwargs:
+                Forwarded to :meth:`parse`.
 
         Returns:
-            :class:`BaseFile`: *self*.
+            :class:`BaseFile`: The created file object.
+
+        Raises:
+            ValueError: Invalid record or record sequence.
 
         See Also:
             :meth:`parse`
-            :meth:`BaseRecord.parse`
-            :meth:`from_records`
-            :meth:`_is_empty_line`
+            :meth:`validate_records`
+            :meth:`apply_records`
 
         Examples:
             **NOTE:** These examples are provided by :class:`BaseFile`.
@@ -3329,49 +7703,21 @@ class BaseFile(abc.ABC):
             ...     :040000050000CAFE2F
             ...     :00000001FF
             ... '''
-            >>> import io
-            >>> stream = io.BytesIO(buffer)
-            >>> file = IhexFile.parse(stream)
-            >>> file.memory.to_blocks()
-            [(55930, b'abc')]
-            >>> file.get_meta()
-            {'linear': True, 'maxdatalen': 3, 'startaddr': 51966}
-            >>> file = IhexFile.parse(buffer)
+            >>> file = IhexFile.parse_validated(buffer)
             >>> file.memory.to_blocks()
             [(55930, b'abc')]
             >>> file.get_meta()
             {'linear': True, 'maxdatalen': 3, 'startaddr': 51966}
+            >>> IhexFile.parse_validated(b':03DA7A0061626383\n')
+            Traceback (most recent call last):
+                ...
+            ValueError: missing end of file record
         """
 
-        if isinstance(stream, (bytes, bytearray, memoryview)):
-            stream = io.BytesIO(stream)
-
-        Record = cls.Record
-        records = []
-        row = 0
-
-        for line in stream:
-            line = _cast(bytes, line)
-            row += 1
-
-            if cls._is_line_empty(line):
-                continue
-
-            try:
-                record = Record.parse(line)
-            except Exception:
-                if ignore_errors:
-                    continue
-                raise
-
-            record.coords = (row, 0)
-            records.append(record)
-
-            if ignore_after_termination:
-                if record.tag.is_file_termination():
-                    break
-
-        file = cls.from_records(records)
+        file = cls.parse(stream, *args, **kwargs)
+        file.validate_records()
+        file.apply_records()
+        file.discard_records()
         return file
 
     def print(
@@ -3381,6 +7727,7 @@ class BaseFile(abc.ABC):
         color: bool = False,
         start: Union[int, None] = None,
         stop: Union[int, None] = None,
+        buffer_size: Union[int, None] = None,
         **kwargs,
     ) -> Self:  # type: ignore Self
         r"""Prints record content to stdout.
@@ -3419,6 +7766,11 @@ class BaseFile(abc.ABC):
                 If negative, look back from the last index.
                 If ``None``, print up to the last record.
 
+            buffer_size (int):
+                Size of the :class:`BatchWriter` buffer, in bytes.
+                If zero, each record is written straight onto `stream`.
+                If ``None``, :attr:`STREAM_CHUNK_SIZE` is used.
+
             kwargs:
                 Forwarded to the underlying call to :meth:`to_tokens`.
 
@@ -3427,6 +7779,7 @@ class BaseFile(abc.ABC):
 
         See Also:
             :meth:`BaseRecord.print`
+            :class:`BatchWriter`
 
         Examples:
             **NOTE:** These examples are provided by :class:`BaseFile`.
@@ -3450,8 +7803,17 @@ class BaseFile(abc.ABC):
             S1130030303132333435363738393A3B3C3D3E3F44
         """
 
-        for record in self.records[start:stop]:
-            record.print(*args, stream=stream, color=color, **kwargs)
+        if stream is None:
+            stream = sys.stdout.buffer
+        if buffer_size is None:
+            buffer_size = self.STREAM_CHUNK_SIZE
+
+        if self._records is None:
+            self.update_records()
+
+        with BatchWriter(stream, buffer_size) as writer:
+            for record in self._records[start:stop]:
+                record.print(*args, stream=writer, color=color, **kwargs)
         return self
 
     def read(
@@ -3499,7 +7861,7 @@ class BaseFile(abc.ABC):
             [(123, b'abc'), (130, b'xyz')]
         """
 
-        memory = self.memory.extract(start=start, endex=endex, pattern=fill)
+        memory = self._get_memory().extract(start=start, endex=endex, pattern=fill)
         chunk = memory.to_bytes()
         return chunk
 
@@ -3517,6 +7879,13 @@ class BaseFile(abc.ABC):
         For more control activating the *records role*, please call
         :meth:`update_records` manually, providing the desired arguments.
 
+        As the exposed records might be edited, they are no longer reused by
+        the next call to :meth:`update_records`.
+
+        If parsed into a :class:`RecordTable` (e.g. by :meth:`parse` with
+        `table`), the exposed records are detached copies: any edits must be
+        stored back by item assignment (e.g. ``file.records[i] = record``).
+
         Notes:
             Most methods acting on the *memory role* (i.e. altering content of
             :attr:`memory`) would implicitly discard :attr:`records` via
@@ -3553,12 +7922,17 @@ class BaseFile(abc.ABC):
         if self._records is None:
             self.update_records()
         assert self._records is not None
+        self._update_key = None  # may be edited by the caller
+        self._update_cache = {}
+        self._dirty_spans = []
         return self._records
 
     def save(
         self,
         out_path_or_stream: Union[AnyPath, IO, None],
         *args,
+        buffer_size: Union[int, None] = None,
+        workers: Union[int, None] = 1,
         **kwargs,
     ) -> Self:  # type: ignore Self
         r"""Saves a file object into the filesystem.
@@ -3566,6 +7940,11 @@ class BaseFile(abc.ABC):
         The :func:`open` function creates a *stream* from the filesystem,
         allowing :meth:`serialize` to save a file object.
 
+        If the :attr:`memory` refers to the file memory mapped by
+        :meth:`load`, and `out_path_or_stream` is that very file, a temporary
+        file is written first, replacing the mapped one via :func:`os.replace`
+        only once complete.
+
         Args:
             out_path_or_stream (str or bytes IO):
                 Path of the file within the filesystem, or output byte stream.
@@ -3574,6 +7953,18 @@ class BaseFile(abc.ABC):
             args:
                 Forwarded to :meth:`serialize`.
 
+            buffer_size (int):
+                Size of the :class:`BatchWriter` buffer batching the written
+                lines, in bytes.
+                If zero, each line is written straight onto the stream.
+                If ``None``, the default of :meth:`serialize` is used.
+
+            workers (int):
+                If not 1, the file object is saved via
+                :meth:`serialize_parallel`, splitting the encoding among this
+                number of worker processes.
+                If ``None``, as many as :func:`os.cpu_count`.
+
             kwargs:
                 Forwarded to :meth:`serialize`.
 
@@ -3583,6 +7974,7 @@ class BaseFile(abc.ABC):
         See Also:
             :meth:`load`
             :meth:`serialize`
+            :meth:`serialize_parallel`
             :func:`open`
             :attr:`sys.stdout.buffer`
 
@@ -3590,21 +7982,56 @@ class BaseFile(abc.ABC):
             **NOTE:** These examples are provided by :class:`BaseFile`.
             Inherited classes for specific *formats* may require an adaptation.
 
+            >>> import os, tempfile
             >>> from hexrec import IhexFile
+            >>> folder = tempfile.TemporaryDirectory()
+            >>> path = os.path.join(folder.name, 'data.hex')
             >>> file = IhexFile.from_blocks([(0xDA7A, b'abc')], startaddr=0xCAFE)
-            >>> _ = file.save('data.hex')
+            >>> _ = file.save(path)
+            >>> _ = file.save(path, buffer_size=0x100000)
+            >>> _ = file.save(path, workers=4)
+            >>> folder.cleanup()
         """
 
         if out_path_or_stream is None:
             out_path_or_stream = sys.stdout.buffer
 
+        if buffer_size is not None:
+            kwargs['buffer_size'] = buffer_size
+
+        if workers != 1:
+            kwargs['workers'] = workers
+            serialize = self.serialize_parallel
+        else:
+            serialize = self.serialize
+
         if isinstance(out_path_or_stream, io.IOBase):
             stream = _cast(IO, out_path_or_stream)
-            return self.serialize(stream, *args, **kwargs)
-        else:
-            path = str(out_path_or_stream)
-            with open(path, 'wb') as stream:
-                return self.serialize(stream, *args, **kwargs)
+            return serialize(stream, *args, **kwargs)
+
+        path = str(out_path_or_stream)
+        if self._mapped_file is not None:
+            try:
+                status = os.stat(path)
+            except OSError:
+                status = None
+
+            if status is not None and (status.st_dev, status.st_ino) == self._mapped_file:
+                # Truncating the mapped file would destroy the data being saved
+                fd, temp_path = tempfile.mkstemp(dir=(os.path.dirname(path) or None), suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'wb') as stream:
+                        serialize(stream, *args, **kwargs)
+                    os.chmod(temp_path, status.st_mode & 0o7777)
+                    os.replace(temp_path, path)
+                    temp_path = None
+                finally:
+                    if temp_path is not None:
+                        os.remove(temp_path)
+                return self
+
+        with open(path, 'wb') as stream:
+            return serialize(stream, *args, **kwargs)
 
     def set_meta(
         self,
@@ -3655,11 +8082,20 @@ class BaseFile(abc.ABC):
         self.discard_records()
         return self
 
-    def serialize(self, stream: IO, *args, **kwargs) -> Self:  # type: ignore Self
+    def serialize(
+        self,
+        stream: IO,
+        *args,
+        buffer_size: Union[int, None] = None,
+        **kwargs,
+    ) -> Self:  # type: ignore Self
         r"""Serializes records onto a byte stream.
 
         It executes :meth:`BaseRecord.serialize` for each of the stored
-        :attr:`records`.
+        :attr:`records`, batching their lines via :class:`BatchWriter`.
+
+        While not in *records role*, it calls :meth:`serialize_memory`
+        instead, without creating any :attr:`records`.
 
         Args:
             stream (bytes IO):
@@ -3668,6 +8104,11 @@ class BaseFile(abc.ABC):
             args:
                 Forwarded to :meth:`BaseRecord.serialize` of each record.
 
+            buffer_size (int):
+                Size of the :class:`BatchWriter` buffer, in bytes.
+                If zero, each record is written straight onto `stream`.
+                If ``None``, :attr:`STREAM_CHUNK_SIZE` is used.
+
             kwargs:
                 Forwarded to :meth:`BaseRecord.serialize` of each record.
 
@@ -3676,6 +8117,7 @@ class BaseFile(abc.ABC):
 
         See Also:
             :meth:`parse`
+            :meth:`serialize_memory`
             :meth:`BaseRecord.serialize`
 
         Examples:
@@ -3691,10 +8133,152 @@ class BaseFile(abc.ABC):
             :00000001FF
         """
 
-        for record in self.records:
-            record.serialize(stream, *args, **kwargs)
+        if self._records is None:
+            return self.serialize_memory(stream, *args, buffer_size=buffer_size, **kwargs)
+
+        if buffer_size is None:
+            buffer_size = self.STREAM_CHUNK_SIZE
+
+        with BatchWriter(stream, buffer_size) as writer:
+            self._serialize_records(writer, *args, **kwargs)
+        return self
+
+    def serialize_memory(
+        self,
+        stream: IO,
+        *args,
+        buffer_size: Union[int, None] = None,
+        **kwargs,
+    ) -> Self:  # type: ignore Self
+        r"""Serializes memory straight onto a byte stream.
+
+        It writes the same bytes as :meth:`update_records` followed by
+        :meth:`serialize`, encoding lines straight from :attr:`memory` and
+        *meta*, without creating any :attr:`records`.
+        Lines are batched via :class:`BatchWriter`.
+
+        This is automatically called by :meth:`serialize` while not in
+        *records role*, which is kept inactive.
+
+        Notes:
+            As lines are written while being encoded, an exception may be
+            raised after some lines were already written onto `stream`.
+
+        Args:
+            stream (bytes IO):
+                Stream to serialize onto.
+
+            args:
+                Forwarded to the line encoder of the record file *format*.
+                Positional arguments are the same as :meth:`serialize`,
+                optionally followed by keyword arguments of
+                :meth:`update_records`.
+
+            buffer_size (int):
+                Size of the :class:`BatchWriter` buffer, in bytes.
+                If zero, each line is written straight onto `stream`.
+                If ``None``, :attr:`STREAM_CHUNK_SIZE` is used.
+
+            kwargs:
+                Forwarded to the line encoder of the record file *format*.
+
+        Returns:
+            :class:`BaseFile`: *self*.
+
+        See Also:
+            :meth:`serialize`
+            :meth:`update_records`
+            :attr:`STREAM_CHUNK_SIZE`
+            :class:`BatchWriter`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import IhexFile
+            >>> file = IhexFile.from_blocks([(0xDA7A, b'abc')], startaddr=0xCAFE)
+            >>> import io
+            >>> stream = io.BytesIO()
+            >>> _ = file.serialize_memory(stream, end=b'\n')
+            >>> stream.getvalue()
+            b':03DA7A0061626383\n:040000050000CAFE2F\n:00000001FF\n'
+            >>> file._records is None
+            True
+        """
+
+        if buffer_size is None:
+            buffer_size = self.STREAM_CHUNK_SIZE
+
+        with BatchWriter(stream, buffer_size) as writer:
+            writer.writelines(self._iter_memory_lines(*args, **kwargs))
         return self
 
+    def serialize_parallel(
+        self,
+        stream: IO,
+        *args,
+        workers: Union[int, None] = None,
+        buffer_size: Union[int, None] = None,
+        **kwargs,
+    ) -> Self:  # type: ignore Self
+        r"""Serializes memory onto a byte stream, in parallel.
+
+        It splits the :attr:`memory` into shards at chunk boundaries, each one
+        encoded by a separate worker process.
+        The encoded shards are then written in order, between the *header*
+        and *trailer* records of the file, which are generated once.
+
+        The written bytes are the same as per :meth:`serialize`.
+
+        While in *records role*, it calls :meth:`serialize` instead.
+
+        Notes:
+            This generic implementation just falls back to the serial
+            :meth:`serialize`, as not all the record file *formats* can
+            encode a shard independently from the previous ones.
+
+        Args:
+            stream (bytes IO):
+                Stream to serialize onto.
+
+            args:
+                Forwarded to :meth:`serialize`.
+
+            workers (int):
+                Maximum number of worker processes.
+                If ``None``, as many as :func:`os.cpu_count`.
+
+            buffer_size (int):
+                Size of the :class:`BatchWriter` buffer, in bytes.
+                If zero, each shard is written straight onto `stream`.
+                If ``None``, :attr:`STREAM_CHUNK_SIZE` is used.
+
+            kwargs:
+                Forwarded to :meth:`serialize`.
+
+        Returns:
+            :class:`BaseFile`: *self*.
+
+        See Also:
+            :meth:`serialize`
+            :meth:`serialize_memory`
+            :attr:`SHARD_SIZE_MIN`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import IhexFile
+            >>> file = IhexFile.from_blocks([(0xDA7A, b'abc')], startaddr=0xCAFE)
+            >>> import io
+            >>> stream = io.BytesIO()
+            >>> _ = file.serialize_parallel(stream, end=b'\n', workers=4)
+            >>> stream.getvalue()
+            b':03DA7A0061626383\n:040000050000CAFE2F\n:00000001FF\n'
+        """
+
+        return self.serialize(stream, *args, buffer_size=buffer_size, **kwargs)
+
     def shift(self, offset: int) -> Self:  # type: ignore Self
         r"""Shifts data addresses by an offset.
 
@@ -3726,7 +8310,7 @@ class BaseFile(abc.ABC):
             [(1123, b'abc'), (1456, b'xyz')]
         """
 
-        self.memory.shift(offset)
+        self._get_memory().shift(offset)
         self.discard_records()
         return self
 
@@ -3862,6 +8446,11 @@ class BaseFile(abc.ABC):
         It returns a :class:`memoryview` over the specified range, which must
         cover a *contiguous* data region (i.e. no memory holes within).
 
+        As the view might be written, any memory data within the range shared
+        with other file objects is unshared beforehand, as per :attr:`memory`.
+        Only the views over a file memory mapped by :meth:`load` are returned
+        as they are, being read-only, without copying them.
+
         Args:
             start (int):
                 Inclusive start address of the specified range.
@@ -3891,7 +8480,10 @@ class BaseFile(abc.ABC):
             ValueError: non-contiguous data within range
         """
 
-        view = self.memory.view(start=start, endex=endex)
+        memory = self._get_memory()
+        self._unshare_memory(start, endex, mapped=False)  # exposed to direct editing
+        self._exposed_memory = memory
+        view = memory.view(start=start, endex=endex)
         return view
 
     def write(
@@ -3939,9 +8531,16 @@ class BaseFile(abc.ABC):
         """
 
         if isinstance(data, BaseFile):
-            data = data.memory
-        self.memory.write(address, data, clear=clear)
-        self.discard_records()
+            data = data._get_memory()
+        if isinstance(data, ImmutableMemory):
+            dirty_start, dirty_endex = address + data.start, address + data.endex
+        elif isinstance(data, int):
+            dirty_start, dirty_endex = address, address + 1
+        else:
+            dirty_start, dirty_endex = address, address + len(data)
+        self._unshare_memory(dirty_start, dirty_endex)
+        self._get_memory().write(address, data, clear=clear)
+        self._mark_dirty(dirty_start, dirty_endex)
         return self
 
 
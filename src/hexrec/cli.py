@@ -40,6 +40,7 @@ Why does this file exist, and why not put this in __main__?
   Also see (1) from https://click.palletsprojects.com/en/stable/setuptools/#setuptools-integration
 """
 
+import sys
 from typing import Callable
 from typing import List
 from typing import Mapping
@@ -52,7 +53,12 @@ import click
 
 from .__init__ import __version__
 from .__init__ import file_types
+from .base import CONTENT_HEAD_SIZE
 from .base import BaseFile
+from .base import ParseCache
+from .base import _peek_stream
+from .base import convert_stream
+from .base import guess_format_from_content
 from .base import guess_format_name
 from .formats.srec import SrecFile
 from .formats.srec import SrecRecord
@@ -150,9 +156,25 @@ def guess_input_type(
     if input_format:
         input_type = file_types[input_format]
     elif input_path is None or input_path == '-':
-        raise ValueError('standard input requires input format')
+        stream = sys.stdin.buffer
+        try:
+            if not hasattr(stream, 'peek') and not stream.seekable():
+                raise ValueError('cannot peek')  # would consume the stream
+            head, _ = _peek_stream(stream)
+            name = guess_format_from_content(head)
+        except ValueError:
+            raise ValueError('standard input requires input format') from None
+        input_type = file_types[name]
     else:
-        name = guess_format_name(input_path)
+        try:
+            name = guess_format_name(input_path)
+        except ValueError as exc:
+            with open(input_path, 'rb') as stream:
+                head = stream.read(CONTENT_HEAD_SIZE)
+            try:
+                name = guess_format_from_content(head)
+            except ValueError:
+                raise exc
         input_type = file_types[name]
     return input_type
 
@@ -202,6 +224,10 @@ class SingleFileInOutCtxMgr:
         output_path: str,
         output_format: Union[str, None],
         output_width: Union[int, None],
+        input_workers: Union[int, None] = 1,
+        input_cache: Union[ParseCache, None] = None,
+        output_buffer_size: Union[int, None] = None,
+        output_workers: Union[int, None] = 1,
     ):
 
         if input_path == '-':
@@ -216,25 +242,31 @@ class SingleFileInOutCtxMgr:
         self.input_format: Union[str, None] = input_format
         self.input_type: Union[Type[BaseFile], None] = None
         self.input_file: Union[BaseFile, None] = None
+        self.input_workers: Union[int, None] = input_workers
+        self.input_cache: Union[ParseCache, None] = input_cache
 
         self.output_path: Union[str, None] = output_path
         self.output_format: Union[str, None] = output_format
         self.output_type: Union[Type[BaseFile], None] = None
         self.output_file: Union[BaseFile, None] = None
         self.output_width: Union[int, None] = output_width
+        self.output_buffer_size: Union[int, None] = output_buffer_size
+        self.output_workers: Union[int, None] = output_workers
 
     def __enter__(self) -> 'SingleFileInOutCtxMgr':
 
         self.input_type = guess_input_type(self.input_path, self.input_format)
-        self.input_file = self.input_type.load(self.input_path)
-
         self.output_type = guess_output_type(self.output_path, self.output_format, self.input_type)
 
         if self.output_type is self.input_type:
+            # Keep the input records, whatever the workers and cache
+            self.input_file = self.input_type.load(self.input_path)
             self.output_file = self.input_file
             assert self.output_file is not None
             self.output_file.apply_records()
         else:
+            self.input_file = self.input_type.load(self.input_path, workers=self.input_workers,
+                                                   cache=self.input_cache)
             assert self.input_file is not None
             self.output_file = self.output_type.convert(self.input_file)
 
@@ -247,7 +279,8 @@ class SingleFileInOutCtxMgr:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
 
         assert self.output_file is not None
-        self.output_file.save(self.output_path)
+        self.output_file.save(self.output_path, buffer_size=self.output_buffer_size,
+                              workers=self.output_workers)
 
 
 class MultiFileInOutCtxMgr:
@@ -259,6 +292,10 @@ class MultiFileInOutCtxMgr:
         output_path: str,
         output_format: Union[str, None],
         output_width: Union[int, None],
+        input_workers: Union[int, None] = 1,
+        input_cache: Union[ParseCache, None] = None,
+        output_buffer_size: Union[int, None] = None,
+        output_workers: Union[int, None] = 1,
     ):
 
         input_paths = list(input_paths)
@@ -275,12 +312,16 @@ class MultiFileInOutCtxMgr:
         self.input_formats: Sequence[Union[str, None]] = input_formats
         self.input_types: List[Union[Type[BaseFile], None]] = [None] * len(self.input_paths)
         self.input_files: List[Union[BaseFile, None]] = [None] * len(self.input_paths)
+        self.input_workers: Union[int, None] = input_workers
+        self.input_cache: Union[ParseCache, None] = input_cache
 
         self.output_path: Union[str, None] = output_path
         self.output_format: Union[str, None] = output_format
         self.output_type: Union[Type[BaseFile], None] = None
         self.output_file: Union[BaseFile, None] = None
         self.output_width: Union[int, None] = output_width
+        self.output_buffer_size: Union[int, None] = output_buffer_size
+        self.output_workers: Union[int, None] = output_workers
 
     def __enter__(self) -> 'MultiFileInOutCtxMgr':
 
@@ -288,7 +329,8 @@ class MultiFileInOutCtxMgr:
             input_type = guess_input_type(self.input_paths[i], self.input_formats[i])
             assert input_type is not None
             self.input_types[i] = input_type
-            self.input_files[i] = input_type.load(self.input_paths[i])
+            self.input_files[i] = input_type.load(self.input_paths[i], workers=self.input_workers,
+                                                  cache=self.input_cache)
 
         self.output_type = guess_output_type(self.output_path, self.output_format, self.input_types[0])
         self.output_file = self.output_type()
@@ -301,7 +343,8 @@ class MultiFileInOutCtxMgr:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
 
         assert self.output_file is not None
-        self.output_file.save(self.output_path)
+        self.output_file.save(self.output_path, buffer_size=self.output_buffer_size,
+                              workers=self.output_workers)
 
 
 # ============================================================================
@@ -322,7 +365,7 @@ def main() -> None:
 @main.command()
 @click.option('-i', '--input-format', type=FORMAT_CHOICE, help="""
     Forces the input file format.
-    Required for the standard input.
+    Guessed by content for the standard input.
 """)
 @click.option('-o', '--output-format', type=FORMAT_CHOICE, help="""
     Forces the output file format.
@@ -362,7 +405,7 @@ def align(
     r"""Pads blocks to align their boundaries.
 
     ``INFILE`` is the path of the input file.
-    Set to ``-`` to read from standard input; input format required.
+    Set to ``-`` to read from standard input; input format guessed by content if missing.
 
     ``OUTFILE`` is the path of the output file.
     Set to ``-`` to write to standard output.
@@ -379,7 +422,7 @@ def align(
 @main.command()
 @click.option('-i', '--input-format', type=FORMAT_CHOICE, help="""
     Forces the input file format.
-    Required for the standard input.
+    Guessed by content for the standard input.
 """)
 @click.option('-o', '--output-format', type=FORMAT_CHOICE, help="""
     Forces the output file format.
@@ -411,7 +454,7 @@ def clear(
     r"""Clears an address range.
 
     ``INFILE`` is the path of the input file.
-    Set to ``-`` to read from standard input; input format required.
+    Set to ``-`` to read from standard input; input format guessed by content if missing.
 
     ``OUTFILE`` is the path of the output file.
     Set to ``-`` to write to standard output.
@@ -428,7 +471,7 @@ def clear(
 @main.command()
 @click.option('-i', '--input-format', type=FORMAT_CHOICE, help="""
     Forces the input file format.
-    Required for the standard input.
+    Guessed by content for the standard input.
 """)
 @click.option('-o', '--output-format', type=FORMAT_CHOICE, help="""
     Forces the output file format.
@@ -438,12 +481,42 @@ def clear(
     Sets the length of the record data field, in bytes.
     By default it is that of the input file.
 """)
+@click.option('-j', '--workers', type=BASED_INT, default=1, show_default=True, help="""
+    Number of worker processes parsing the input file and serializing the
+    output file, if supported.
+    The input file is parsed by a single process if its format matches that
+    of the output file, so that its records are kept.
+    Set to 0 for as many as the CPUs.
+""")
+@click.option('--cache-dir', type=click.Path(file_okay=False), envvar='HEXREC_CACHE_DIR', help="""
+    Directory caching parsed input files, for faster reloading.
+    Not used if the input format matches that of the output file, so that
+    the input records are kept.
+    Disabled by default.
+""")
+@click.option('--buffer-size', type=BASED_INT, help="""
+    Size of the output write buffer, in bytes.
+    Set to 0 to write each record on its own.
+""")
+@click.option('--stream', is_flag=True, help="""
+    Streams records from the input file to the output file, with bounded
+    memory, re-chopping data records.
+    Only Intel HEX and SREC outputs are streamed.
+    Falls back to loading the whole input file if its data are not in
+    address order.
+    Workers and cache are ignored while streaming.
+    Ignored for the standard input and output.
+""")
 @click.argument('infile', type=FILE_PATH_IN, required=False)
 @click.argument('outfile', type=FILE_PATH_OUT, required=False)
 def convert(
     input_format: Union[str, None],
     output_format: Union[str, None],
     width: Union[int, None],
+    workers: int,
+    cache_dir: Union[str, None],
+    buffer_size: Union[int, None],
+    stream: bool,
     infile: str,
     outfile: str,
 ) -> None:
@@ -451,14 +524,22 @@ def convert(
     r"""Converts a file to another format.
 
     ``INFILE`` is the list of paths of the input files.
-    Set to ``-`` to read from standard input; input format required.
+    Set to ``-`` to read from standard input; input format guessed by content if missing.
 
     ``OUTFILE`` is the path of the output file.
     Set to ``-`` to write to standard output.
     Leave empty to overwrite ``INFILE``.
     """
 
-    with SingleFileInOutCtxMgr(infile, input_format, outfile, output_format, width):
+    if stream and infile not in (None, '-') and outfile != '-':
+        convert_stream(infile, (outfile or infile), in_format=input_format, out_format=output_format,
+                       maxdatalen=width, buffer_size=buffer_size)
+        return
+
+    cache = ParseCache(cache_dir) if cache_dir else None
+
+    with SingleFileInOutCtxMgr(infile, input_format, outfile, output_format, width, (workers or None), cache,
+                               buffer_size, (workers or None)):
         pass
 
 
@@ -467,7 +548,7 @@ def convert(
 @main.command()
 @click.option('-i', '--input-format', type=FORMAT_CHOICE, help="""
     Forces the input file format.
-    Required for the standard input.
+    Guessed by content for the standard input.
 """)
 @click.option('-o', '--output-format', type=FORMAT_CHOICE, help="""
     Forces the output file format.
@@ -504,7 +585,7 @@ def crop(
     r"""Selects data from an address range.
 
     ``INFILE`` is the path of the input file.
-    Set to ``-`` to read from standard input; input format required.
+    Set to ``-`` to read from standard input; input format guessed by content if missing.
 
     ``OUTFILE`` is the path of the output file.
     Set to ``-`` to write to standard output.
@@ -524,7 +605,7 @@ def crop(
 @main.command()
 @click.option('-i', '--input-format', type=FORMAT_CHOICE, help="""
     Forces the input file format.
-    Required for the standard input.
+    Guessed by content for the standard input.
 """)
 @click.option('-o', '--output-format', type=FORMAT_CHOICE, help="""
     Forces the output file format.
@@ -556,7 +637,7 @@ def delete(
     r"""Deletes an address range.
 
     ``INFILE`` is the path of the input file.
-    Set to ``-`` to read from standard input; input format required.
+    Set to ``-`` to read from standard input; input format guessed by content if missing.
 
     ``OUTFILE`` is the path of the output file.
     Set to ``-`` to write to standard output.
@@ -573,7 +654,7 @@ def delete(
 @main.command()
 @click.option('-i', '--input-format', type=FORMAT_CHOICE, help="""
     Forces the input file format.
-    Required for the standard input.
+    Guessed by content for the standard input.
 """)
 @click.option('-o', '--output-format', type=FORMAT_CHOICE, help="""
     Forces the output file format.
@@ -609,7 +690,7 @@ def fill(
     r"""Fills an address range with a byte value.
 
     ``INFILE`` is the path of the input file.
-    Set to ``-`` to read from standard input; input format required.
+    Set to ``-`` to read from standard input; input format guessed by content if missing.
 
     ``OUTFILE`` is the path of the output file.
     Set to ``-`` to write to standard output.
@@ -626,7 +707,7 @@ def fill(
 @main.command()
 @click.option('-i', '--input-format', type=FORMAT_CHOICE, help="""
     Forces the input file format.
-    Required for the standard input.
+    Guessed by content for the standard input.
 """)
 @click.option('-o', '--output-format', type=FORMAT_CHOICE, help="""
     Forces the output file format.
@@ -662,7 +743,7 @@ def flood(
     r"""Fills emptiness of an address range with a byte value.
 
     ``INFILE`` is the path of the input file.
-    Set to ``-`` to read from standard input; input format required.
+    Set to ``-`` to read from standard input; input format guessed by content if missing.
 
     ``OUTFILE`` is the path of the output file.
     Set to ``-`` to write to standard output.
@@ -949,7 +1030,7 @@ def hd(
 @main.command()
 @click.option('-i', '--input-format', type=FORMAT_CHOICE, help="""
     Forces the input file format for all input files.
-    Required for the standard input.
+    Guessed by content for the standard input.
 """)
 @click.option('-o', '--output-format', type=FORMAT_CHOICE, help="""
     Forces the output file format.
@@ -962,6 +1043,19 @@ def hd(
 @click.option('--clear-holes', is_flag=True, help="""
     Merges memory holes, clearing data at their place.
 """)
+@click.option('-j', '--workers', type=BASED_INT, default=1, show_default=True, help="""
+    Number of worker processes parsing each input file and serializing the
+    output file, if supported.
+    Set to 0 for as many as the CPUs.
+""")
+@click.option('--cache-dir', type=click.Path(file_okay=False), envvar='HEXREC_CACHE_DIR', help="""
+    Directory caching parsed input files, for faster reloading.
+    Disabled by default.
+""")
+@click.option('--buffer-size', type=BASED_INT, help="""
+    Size of the output write buffer, in bytes.
+    Set to 0 to write each record on its own.
+""")
 @click.argument('infiles', type=FILE_PATH_IN, nargs=-1)
 @click.argument('outfile', type=FILE_PATH_OUT)
 def merge(
@@ -969,13 +1063,16 @@ def merge(
     output_format: Union[str, None],
     width: Union[int, None],
     clear_holes: bool,
+    workers: int,
+    cache_dir: Union[str, None],
+    buffer_size: Union[int, None],
     infiles: Sequence[str],
     outfile: str,
 ) -> None:
     r"""Merges multiple files.
 
     ``INFILES`` is the list of paths of the input files.
-    Set any to ``-`` or none to read from standard input; input format required.
+    Set any to ``-`` or none to read from standard input; input format guessed by content if missing.
 
     ``OUTFILE`` is the path of the output file.
     Set to ``-`` to write to standard output.
@@ -987,8 +1084,10 @@ def merge(
     if not infiles:
         infiles = [None]  # type: ignore None
     input_formats = [input_format] * len(infiles)
+    cache = ParseCache(cache_dir) if cache_dir else None
 
-    with MultiFileInOutCtxMgr(infiles, input_formats, outfile, output_format, width) as ctx:
+    with MultiFileInOutCtxMgr(infiles, input_formats, outfile, output_format, width,
+                              (workers or None), cache, buffer_size, (workers or None)) as ctx:
         assert ctx.output_file is not None
         ctx_input_files = _cast(List[BaseFile], ctx.input_files)
         ctx.output_file.merge(*ctx_input_files, clear=clear_holes)
@@ -999,7 +1098,7 @@ def merge(
 @main.command()
 @click.option('-i', '--input-format', type=FORMAT_CHOICE, help="""
     Forces the input file format.
-    Required for the standard input.
+    Guessed by content for the standard input.
 """)
 @click.option('-o', '--output-format', type=FORMAT_CHOICE, help="""
     Forces the output file format.
@@ -1025,7 +1124,7 @@ def shift(
     r"""Shifts data addresses.
 
     ``INFILE`` is the path of the input file.
-    Set to ``-`` to read from standard input; input format required.
+    Set to ``-`` to read from standard input; input format guessed by content if missing.
 
     ``OUTFILE`` is the path of the output file.
     Set to ``-`` to write to standard output.
@@ -1042,7 +1141,7 @@ def shift(
 @main.command()
 @click.option('-i', '--input-format', type=FORMAT_CHOICE, help="""
     Forces the input file format.
-    Required for the standard input.
+    Guessed by content for the standard input.
 """)
 @click.argument('infile', type=FILE_PATH_IN, required=False)
 def validate(
@@ -1052,12 +1151,11 @@ def validate(
     r"""Validates a record file.
 
     ``INFILE`` is the path of the input file.
-    Set to ``-`` to read from standard input; input format required.
+    Set to ``-`` to read from standard input; input format guessed by content if missing.
     """
 
     input_type = guess_input_type(infile, input_format)
-    input_file = input_type.load(infile)
-    input_file.validate_records()
+    input_type.load(infile, validate=True)
 
 
 # ----------------------------------------------------------------------------
@@ -30,20 +30,29 @@ See Also:
 """
 
 import enum
+import functools
 import re
 from typing import IO
 from typing import Any
+from typing import Iterator
+from typing import List
 from typing import Mapping
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union  # NOTE: type | operator unsupported for Python < 3.10
 from typing import cast as _cast
 
+from bytesparse import Memory
+
 from ..base import AnyBytes
 from ..base import BaseFile
+from ..base import BaseParser
 from ..base import BaseRecord
 from ..base import BaseTag
+from ..base import BatchWriter
 from ..base import ByteString
+from ..base import RecordTable
 from ..utils import hexlify
 from ..utils import unhexlify
 
@@ -53,6 +62,11 @@ except ImportError:  # pragma: no cover
     Self = Any  # Python < 3.11
 __TYPING_HAS_SELF = Self is not Any
 
+_ETX_REGEX = re.compile(b'\\x03')
+_RESYNC_REGEX = re.compile(b'[$0-9A-Fa-f]')
+_STX_REGEX = re.compile(b'\\x02')
+_TOKEN_REGEX = re.compile(b'\\S')
+
 
 class AsciiHexTag(BaseTag, enum.IntEnum):
     r"""ASCII-HEX tag."""
@@ -125,6 +139,8 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class AsciiHexRecord(BaseRecord):
     r"""ASCII-HEX record object."""
 
+    __slots__ = ()
+
     Tag: Type[AsciiHexTag] = AsciiHexTag  # type: ignore override
 
     LINE_REGEX = re.compile(
@@ -248,6 +264,48 @@ class AsciiHexRecord(BaseRecord):
         record = cls(cls.Tag.DATA, data=data, address=address)
         return record
 
+    def diagnose(
+        self,
+        checksum: bool = True,
+        count: bool = True,
+    ) -> Union[str, None]:
+
+        reason = super().diagnose(checksum=checksum, count=count)
+        if reason:
+            return reason
+
+        Tag = self.Tag
+        tag = self.tag
+
+        if self.after and not self.after.isspace():
+            return 'junk after'
+
+        if self.before and not self.before.isspace():
+            return 'junk before'
+
+        if checksum:
+            if self.checksum is None:
+                if tag == Tag.CHECKSUM:
+                    return 'checksum required'
+            else:
+                if not 0 <= self.checksum <= 0xFFFF:
+                    return 'checksum overflow'
+
+        if count:
+            if self.count is None:
+                if tag == Tag.ADDRESS:
+                    return 'count required'
+            else:
+                addrstr = b'%X' % self.address
+                if self.count < len(addrstr):
+                    return 'count overflow'
+
+        if self.data:
+            if tag != Tag.DATA:
+                return 'unexpected data'
+
+        return None
+
     @classmethod
     def parse(  # type: ignore kwargs order
         cls,
@@ -287,42 +345,9 @@ class AsciiHexRecord(BaseRecord):
             ValueError: syntax error
         """
 
-        match = cls.LINE_REGEX.match(line)
-        if not match:
-            raise ValueError('syntax error')
-
-        coords = match.span()
-        groups = match.groupdict()
-        groups_address = groups['address']
-        groups_checksum = groups['checksum']
-        groups_data = groups['data'] or b''
-
-        Tag = cls.Tag
-        checksum = None
-        count = None
-        data = b''
-
-        if groups_address:
-            tag = Tag.ADDRESS
-            address = int(groups_address, 16)
-            count = len(groups_address)
-
-        elif groups_checksum:
-            tag = Tag.CHECKSUM
-            checksum = int(groups_checksum, 16)
-
-        else:
-            tag = Tag.DATA
-            data = groups_data.translate(None, delete=cls.DATA_EXECHARS)
-            data = unhexlify(data)
-
-        record = cls(tag,
-                     address=address,
-                     data=data,
-                     checksum=checksum,
-                     count=count,
-                     coords=coords,
-                     validate=validate)
+        record, reason = cls.try_parse(line, address=address, validate=validate)
+        if reason:
+            raise ValueError(reason)
         return record
 
     def to_bytestr(
@@ -450,44 +475,295 @@ class AsciiHexRecord(BaseRecord):
             'end': end,
         }
 
-    def validate(
+    @classmethod
+    def try_parse(  # type: ignore kwargs order
+        cls,
+        line: ByteString,
+        address: int = 0,
+        validate: bool = True,
+    ) -> Tuple[Union[Self, None], Union[str, None]]:  # type: ignore Self
+
+        match = cls.LINE_REGEX.match(line)
+        if not match:
+            return None, 'syntax error'
+
+        coords = match.span()
+        groups = match.groupdict()
+        groups_address = groups['address']
+        groups_checksum = groups['checksum']
+        groups_data = groups['data'] or b''
+
+        Tag = cls.Tag
+        checksum = None
+        count = None
+        data = b''
+
+        if groups_address:
+            tag = Tag.ADDRESS
+            address = int(groups_address, 16)
+            count = len(groups_address)
+
+        elif groups_checksum:
+            tag = Tag.CHECKSUM
+            checksum = int(groups_checksum, 16)
+
+        else:
+            tag = Tag.DATA
+            data = groups_data.translate(None, delete=cls.DATA_EXECHARS)
+            data = unhexlify(data)
+
+        record = cls(tag,
+                     address=address,
+                     data=data,
+                     checksum=checksum,
+                     count=count,
+                     coords=coords,
+                     validate=False)
+
+        if validate:
+            reason = record.diagnose(checksum=(checksum is not None and count is not None),
+                                     count=(count is not None))
+            if reason:
+                return None, reason
+
+        return record, None
+
+
+class AsciiHexParser(BaseParser):
+    r"""ASCII-HEX push parser.
+
+    It discards anything before the ``STX`` character and after the ``ETX``
+    character, if required, as per :meth:`AsciiHexFile.parse`.
+
+    Records are parsed as tokens, tracking the current address, within the
+    lines completed by each chunk.
+    """
+
+    def __init__(
         self,
-        checksum: bool = True,
-        count: bool = True,
-    ) -> Self:  # type: ignore Self
+        file_type: Type[BaseFile],
+        ignore_errors: bool = False,
+        stxetx: bool = True,
+    ):
 
-        super().validate(checksum=checksum, count=count)
-        Tag = self.Tag
-        tag = self.tag
+        super().__init__(file_type,
+                         ignore_errors=ignore_errors,
+                         ignore_after_termination=False)
 
-        if self.after and not self.after.isspace():
-            raise ValueError('junk after')
+        self.stxetx: bool = stxetx
+        r"""Require record data be enclosed within ``STX`` and ``ETX``."""
 
-        if self.before and not self.before.isspace():
-            raise ValueError('junk before')
+        self.address: int = 0
+        r"""Current address."""
 
-        if checksum:
-            if self.checksum is None:
-                if tag == Tag.CHECKSUM:
-                    raise ValueError('checksum required')
-            else:
-                if not 0 <= self.checksum <= 0xFFFF:
-                    raise ValueError('checksum overflow')
+        self.begun: bool = not stxetx
+        r"""The ``STX`` character was fed."""
+
+        self.stopped: bool = False
+        r"""The ``ETX`` character was fed."""
+
+        self.offset: int = 0
+        r"""Stream offset of the pending bytes, for record coordinates."""
+
+        self.row = 1
+        self.row_offset: int = 0
+        r"""Stream offset of the current row, for diagnostics."""
+
+    def _advance_rows(self, buffer: ByteString, start: int, endex: int) -> None:
+        r"""Advances the row counter.
 
+        Args:
+            buffer (bytes):
+                Buffer starting at :attr:`offset`.
+
+            start (int):
+                Start of the scanned buffer range.
+
+            endex (int):
+                Exclusive end of the scanned buffer range.
+        """
+
+        count = buffer.count(b'\n', start, endex)
         if count:
-            if self.count is None:
-                if tag == Tag.ADDRESS:
-                    raise ValueError('count required')
+            self.row += count
+            self.row_offset = self.offset + buffer.rindex(b'\n', start, endex) + 1
+
+    def _parse_buffer(self, buffer: ByteString, fields: bool = False) -> List[Any]:
+        r"""Parses a buffer of complete tokens.
+
+        It executes :meth:`AsciiHexRecord.try_parse` for each token within
+        `buffer`, without applying the parsed records.
+        An invalid token raises :class:`ValueError`, unless ignoring errors:
+        it is appended to :attr:`diagnostics` instead, resuming from the next
+        candidate token.
+        Trailing whitespace (e.g. a blank line) is skipped.
+
+        With `fields`, *data* and *address* tokens are decoded straight from
+        their :attr:`AsciiHexRecord.LINE_REGEX` match, as any of them is
+        valid, without creating any record objects.
+
+        Args:
+            buffer (bytes):
+                Buffer to parse.
+
+            fields (bool):
+                Return the ``(tag, address, data)`` fields of the parsed
+                records, instead of the records themselves.
+
+        Returns:
+            list: Parsed records, or their fields.
+        """
+
+        size = len(buffer)
+        if not buffer.strip():  # e.g. blank lines only
+            self._advance_rows(buffer, 0, size)
+            self.offset += size
+            return []
+
+        Record = self.file_type.Record
+        Tag = Record.Tag
+        regex = Record.LINE_REGEX
+        exechars = Record.DATA_EXECHARS
+        view = memoryview(buffer)
+        parsed = []
+        offset = 0
+        scanned = 0
+
+        while offset < size:
+            if fields:
+                match = regex.match(view, offset)
+                if match:
+                    groups_data = match.group('data')
+                    if groups_data:
+                        data = unhexlify(groups_data.translate(None, delete=exechars))
+                        parsed.append((Tag.DATA, self.address, data))
+                        self.address += len(data)
+                        offset = match.end()
+                        continue
+
+                    groups_address = match.group('address')
+                    if groups_address:
+                        self.address = int(groups_address, 16)
+                        parsed.append((Tag.ADDRESS, self.address, b''))
+                        offset = match.end()
+                        continue
+
+            record, reason = Record.try_parse(view[offset:], address=self.address)
+            if reason:
+                match = _TOKEN_REGEX.search(view, offset)
+                if not match:
+                    break  # whitespace only
+                if not self.ignore_errors:
+                    raise ValueError(reason)
+                pos = match.start()
+                self._advance_rows(buffer, scanned, pos)
+                scanned = pos
+                self.diagnostics.append((self.row, self.offset + pos - self.row_offset, reason))
+                match = _RESYNC_REGEX.search(view, pos + 1)
+                offset = match.start() if match else size
+                continue
+
+            record = _cast(AsciiHexRecord, record)
+            pos, endpos = record.coords
+            self.address = record.address + len(record.data)
+            if fields:
+                parsed.append((record.tag, record.address, record.data))
             else:
-                addrstr = b'%X' % self.address
-                if self.count < len(addrstr):
-                    raise ValueError('count overflow')
+                record.coords = (pos + offset + self.offset, endpos + offset + self.offset)
+                parsed.append(record)
+            offset += endpos
 
-        if self.data:
-            if tag != Tag.DATA:
-                raise ValueError('unexpected data')
+        self._advance_rows(buffer, scanned, size)
+        self.offset += size
+        return parsed
 
-        return self
+    def _parse_chunk(self, chunk: AnyBytes, fields: bool = False) -> List[Any]:
+        r"""Parses the lines completed by a chunk.
+
+        It discards anything before ``STX`` and after ``ETX``, then parses the
+        tokens of the lines completed by `chunk` via :meth:`_parse_buffer`,
+        keeping any trailing incomplete line pending.
+
+        Args:
+            chunk (bytes):
+                Incoming chunk.
+
+            fields (bool):
+                Forwarded to :meth:`_parse_buffer`.
+
+        Returns:
+            list: Parsed records (or their fields), not applied.
+        """
+
+        if self.stopped:
+            return []
+
+        if not self.begun:
+            match = _STX_REGEX.search(chunk)
+            skipped = bytes(chunk[:match.end()] if match else chunk)
+            self._advance_rows(skipped, 0, len(skipped))
+            self.offset += len(skipped)
+            if not match:
+                return []
+            chunk = chunk[match.end():]
+            self.begun = True
+
+        if self.stxetx:
+            match = _ETX_REGEX.search(chunk)
+            if match:
+                chunk = chunk[:match.start()]
+                self.stopped = True
+
+        pending = self._pending
+        scanned = len(pending)  # no line ends before
+        pending += chunk
+        if self.stopped:
+            endex = len(pending)
+        else:
+            endex = pending.rfind(b'\n', scanned) + 1
+            if not endex:
+                return []
+
+        buffer = bytes(pending[:endex])
+        del pending[:endex]
+        return self._parse_buffer(buffer, fields=fields)
+
+    def _parse_remainder(self, fields: bool = False) -> List[Any]:
+        r"""Parses the pending bytes, as the last ones.
+
+        Args:
+            fields (bool):
+                Forwarded to :meth:`_parse_buffer`.
+
+        Returns:
+            list: Parsed records (or their fields), not applied.
+        """
+
+        pending = self._pending
+        buffer = bytes(pending)
+        pending.clear()
+        return self._parse_buffer(buffer, fields=fields)
+
+    def close(self) -> BaseFile:
+
+        if self.stxetx:
+            if not self.begun:
+                raise ValueError('missing STX character')
+            if not self.stopped:
+                raise ValueError('missing ETX character')
+
+        for record in self._parse_remainder():
+            self.apply_record(record)
+
+        file = self.file_type.from_memory(self.memory, **self.get_meta())
+        return file
+
+    def feed(self, chunk: AnyBytes) -> List[BaseRecord]:
+
+        records = self._parse_chunk(chunk)
+        for record in records:
+            self.apply_record(record)
+        return records
 
 
 if not __TYPING_HAS_SELF:  # pragma: no cover
@@ -498,14 +774,287 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class AsciiHexFile(BaseFile):
     r"""ASCII-HEX file object."""
 
+    CONTENT_REGEX = re.compile(b'\\s*\\x02')
+    r"""Content signature regex, matching a leading *STX*."""
+
+    Parser: Type[AsciiHexParser] = AsciiHexParser  # type: ignore override
+
     Record: Type[AsciiHexRecord] = AsciiHexRecord  # type: ignore override
 
+    def _iter_memory_lines(
+        self,
+        exechar: bytes = b' ',
+        exelast: bool = True,
+        dollarend: AnyBytes = b',',
+        end: AnyBytes = b'\r\n',
+        stxetx: bool = True,
+        align: bool = False,
+        checksum: bool = False,
+        addrlen: int = 8,
+    ) -> Iterator[bytes]:
+        r"""Iterates over serialized lines, straight from memory.
+
+        It generates the same lines as :meth:`update_records` followed by
+        :meth:`serialize`.
+        *Data* lines are encoded straight from :attr:`memory`, without
+        creating any records.
+
+        Args:
+            exechar (byte):
+                *Execution character* value.
+
+            exelast (bool):
+                Append *execution character* also to the last byte of the
+                serialized record.
+
+            dollarend (byte):
+                End character of *dollar* records (i.e. *address* and
+                *checksum* records).
+
+            end (bytes):
+                End of record termination bytes.
+
+            stxetx (bool):
+                Enclose the whole serialized file within ASCII ``STX`` and
+                ``ETX`` bytes.
+
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+            checksum (bool):
+                Generates the *checksum* record.
+
+            addrlen (int):
+                Address length, in *nibbles* (4-bit units).
+
+        Returns:
+            iterator of bytes: Serialized lines.
+
+        Raises:
+            ValueError: :attr:`memory` attribute not populated.
+
+        Examples:
+            >>> from hexrec import AsciiHexFile
+            >>> file = AsciiHexFile.from_blocks([(0x1234, b'abc')])
+            >>> list(file._iter_memory_lines(end=b'\n', addrlen=4))
+            [b'\x02', b'$A1234,\n', b'61 62 63 \n', b'\x03']
+        """
+
+        memory = self._memory
+        if memory is None:
+            raise ValueError('memory instance required')
+
+        addrlen = addrlen.__index__()
+        if addrlen < 1:
+            raise ValueError('invalid address length')
+
+        if stxetx:
+            yield b'\x02'
+
+        Record = self.Record
+        last_data_endex = 0
+        file_checksum = 0
+        exestr = exechar if exelast else b''
+
+        for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
+            if checksum:
+                file_checksum = (file_checksum + sum(chunk_view)) & 0xFFFF
+
+            if chunk_start != last_data_endex:
+                record = Record.create_address(chunk_start, addrlen=addrlen)
+                yield record.to_bytestr(exechar=exechar, exelast=exelast, dollarend=dollarend, end=end)
+
+            last_data_endex = chunk_start + len(chunk_view)
+            line = b'%s%s%s' % (hexlify(chunk_view, exechar), exestr, end)
+            chunk_view.release()
+            yield line
+
+        if checksum:
+            record = Record.create_checksum(file_checksum)
+            yield record.to_bytestr(exechar=exechar, exelast=exelast, dollarend=dollarend, end=end)
+
+        if stxetx:
+            yield b'\x03'
+
+    @classmethod
+    def _iter_parsed_fields(  # type: ignore kwargs order
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        stxetx: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Iterator[Tuple[BaseTag, int, ByteString]]:
+        r"""Iterates over parsed record fields.
+
+        Like :meth:`_iter_parsed_records`, but yielding just the *tag*,
+        *address*, and *data* of each valid token, without creating any record
+        objects, as per :meth:`AsciiHexParser._parse_buffer`.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore invalid tokens.
+
+            stxetx (bool):
+                Require record data be enclosed within ASCII ``STX`` and
+                ``ETX`` bytes.
+
+            diagnostics (list):
+                If not ``None``, invalid tokens are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            iterator: *tag*, *address*, and *data* of each valid token.
+
+        Raises:
+            ValueError: Missing ``STX`` or ``ETX`` character, unless
+                collecting `diagnostics`.
+
+        See Also:
+            :meth:`_iter_parsed_records`
+            :meth:`parse_memory`
+        """
+
+        yield from cls._iter_parsed_tokens(stream, ignore_errors=ignore_errors, stxetx=stxetx,
+                                           diagnostics=diagnostics, fields=True)
+
+    @classmethod
+    def _iter_parsed_records(  # type: ignore kwargs order
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        stxetx: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Iterator[AsciiHexRecord]:
+        r"""Iterates over parsed records.
+
+        It executes :meth:`AsciiHexRecord.parse` for each token of the
+        incoming `stream`, yielding each record as soon as it is parsed.
+
+        The input is scanned in chunks of :attr:`STREAM_CHUNK_SIZE` bytes by
+        an :class:`AsciiHexParser`, so that only the current chunk and the
+        trailing incomplete line are held in memory, besides the records.
+
+        When ignoring errors, tokens are parsed by
+        :meth:`AsciiHexRecord.try_parse` instead, resuming from the next
+        candidate token after an invalid one, without raising exceptions.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore :class:`Exception` raised by
+                :meth:`AsciiHexRecord.parse`.
+
+            stxetx (bool):
+                Require record data be enclosed within ASCII ``STX`` and
+                ``ETX`` bytes.
+
+            diagnostics (list):
+                If not ``None``, invalid tokens are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            iterator: Parsed records.
+
+        Raises:
+            ValueError: Missing ``STX`` or ``ETX`` character, unless
+                collecting `diagnostics`.
+
+        See Also:
+            :meth:`parse`
+            :meth:`parse_memory`
+        """
+
+        yield from cls._iter_parsed_tokens(stream, ignore_errors=ignore_errors, stxetx=stxetx,
+                                           diagnostics=diagnostics)
+
+    @classmethod
+    def _iter_parsed_tokens(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        stxetx: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+        fields: bool = False,
+    ) -> Iterator[Any]:
+        r"""Iterates over parsed tokens.
+
+        It feeds the incoming `stream` to an :class:`AsciiHexParser` in
+        chunks of :attr:`STREAM_CHUNK_SIZE` bytes, yielding the parsed tokens.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore invalid tokens.
+
+            stxetx (bool):
+                Require record data be enclosed within ASCII ``STX`` and
+                ``ETX`` bytes.
+
+            diagnostics (list):
+                If not ``None``, invalid tokens are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+            fields (bool):
+                Yield the ``(tag, address, data)`` fields of the parsed
+                records, instead of the records themselves.
+
+        Returns:
+            iterator: Parsed records, or their fields.
+
+        Raises:
+            ValueError: Missing ``STX`` or ``ETX`` character, unless
+                collecting `diagnostics`.
+
+        See Also:
+            :meth:`_iter_parsed_fields`
+            :meth:`_iter_parsed_records`
+        """
+
+        parser = cls.Parser(cls, ignore_errors=(ignore_errors or diagnostics is not None), stxetx=stxetx)
+        if diagnostics is not None:
+            parser.diagnostics = diagnostics
+        chunk_size = cls.STREAM_CHUNK_SIZE
+
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            view = memoryview(stream)
+            chunks = (view[offset:(offset + chunk_size)] for offset in range(0, len(view), chunk_size))
+        else:
+            chunks = iter(functools.partial(stream.read, chunk_size), b'')
+
+        for chunk in chunks:
+            yield from parser._parse_chunk(chunk, fields=fields)
+            if parser.stopped:
+                break
+
+        if stxetx:
+            if not parser.begun:
+                if diagnostics is None:
+                    raise ValueError('missing STX character')
+                diagnostics.append((0, 0, 'missing STX character'))
+                return
+
+            if not parser.stopped:
+                if diagnostics is None:
+                    raise ValueError('missing ETX character')
+                diagnostics.append((0, 0, 'missing ETX character'))
+
+        yield from parser._parse_remainder(fields=fields)
+
     @classmethod
     def parse(  # type: ignore kwargs order
         cls,
-        stream: IO,
+        stream: Union[AnyBytes, IO],
         ignore_errors: bool = False,
         stxetx: bool = True,
+        table: bool = False,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
     ) -> Self:  # type: ignore Self
         r"""Parses records from a byte stream.
 
@@ -520,8 +1069,8 @@ class AsciiHexFile(BaseFile):
             *format*, because it may be more specialized.
 
         Args:
-            stream (bytes IO):
-                Stream to serialize records onto.
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
 
             ignore_errors (bool):
                 Ignore :class:`Exception` raised by
@@ -531,6 +1080,16 @@ class AsciiHexFile(BaseFile):
                 Require record data be enclosed within ASCII ``STX`` and
                 ``ETX`` bytes.
 
+            table (bool):
+                Stores :attr:`records` into a compact
+                :class:`hexrec.base.RecordTable`, instead of a :class:`list`.
+                Its records are detached copies: edits must be stored back by
+                item assignment.
+
+            diagnostics (list):
+                If not ``None``, invalid tokens are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
         Returns:
             :class:`AsciiHexFile`: *self*.
 
@@ -557,46 +1116,78 @@ class AsciiHexFile(BaseFile):
             {'maxdatalen': 3}
         """
 
-        buffer: bytes = stream.read()
+        records = RecordTable(cls.Record) if table else []
+        records.extend(cls._iter_parsed_records(stream, ignore_errors=ignore_errors, stxetx=stxetx,
+                                                diagnostics=diagnostics))
+        file = cls.from_records(records)
+        return file
 
-        records = []
-        Record = cls.Record
+    @classmethod
+    def parse_memory(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        stxetx: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Parses a byte stream directly into memory.
 
-        if stxetx:
-            stx_offset = buffer.find(0x02)
-            if stx_offset < 0:
-                raise ValueError('missing STX character')
-            stx_offset += 1
+        Each token is decoded by :meth:`_iter_parsed_fields`, then written
+        straight into :attr:`memory`, without creating any record objects.
 
-            etx_offset = buffer.find(0x03, stx_offset)
-            if etx_offset < 0:
-                raise ValueError('missing ETX character')
-        else:
-            stx_offset = 0
-            etx_offset = len(buffer)
+        The accepted syntax is the same as :meth:`parse`, as well as the
+        resulting :attr:`memory` and *meta*, and the reported errors.
 
-        view = memoryview(buffer)
-        offset = stx_offset
-        address = 0
-
-        while offset < etx_offset:
-            chunk = view[offset:etx_offset]
-            try:
-                record = Record.parse(chunk, address=address)
-            except Exception:
-                if ignore_errors:
-                    offset += 1
-                    continue
-                raise
-            pos, endpos = record.coords
-            pos += offset
-            endpos += offset
-            record.coords = pos, endpos
-            offset = endpos
-            address = record.address + len(record.data)
-            records.append(record)
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
 
-        file = cls.from_records(records)
+            ignore_errors (bool):
+                Ignore :class:`Exception` raised by
+                :meth:`AsciiHexRecord.parse`.
+
+            stxetx (bool):
+                Require record data be enclosed within ASCII ``STX`` and
+                ``ETX`` bytes.
+
+            diagnostics (list):
+                If not ``None``, invalid tokens are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            :class:`AsciiHexFile`: The created file object.
+
+        See Also:
+            :meth:`parse`
+            :meth:`_iter_parsed_fields`
+
+        Examples:
+            >>> from hexrec import AsciiHexFile
+            >>> buffer = b'''
+            ...     \x02
+            ...     $A1234,
+            ...     61 62 63
+            ...     78 79 7A
+            ...     \x03
+            ... '''
+            >>> file = AsciiHexFile.parse_memory(buffer)
+            >>> file.memory.to_blocks()
+            [(4660, b'abcxyz')]
+            >>> file.get_meta()
+            {'maxdatalen': 3}
+        """
+
+        memory = Memory()
+        maxdatalen = 0
+
+        for tag, address, data in cls._iter_parsed_fields(stream, ignore_errors=ignore_errors, stxetx=stxetx,
+                                                          diagnostics=diagnostics):
+            if tag.is_data():
+                memory.write(address, data)
+                if maxdatalen < len(data):
+                    maxdatalen = len(data)
+
+        file = cls.from_memory(memory, maxdatalen=(maxdatalen or cls.DEFAULT_DATALEN))
         return file
 
     def serialize(
@@ -607,12 +1198,16 @@ class AsciiHexFile(BaseFile):
         dollarend: AnyBytes = b',',
         end: AnyBytes = b'\r\n',
         stxetx: bool = True,
+        buffer_size: Union[int, None] = None,
     ) -> 'BaseFile':
         r"""Serializes records onto a byte stream.
 
         It executes :meth:`MosRecord.serialize` for each of the stored
         :attr:`records`.
 
+        While not in *records role*, it calls :meth:`serialize_memory`
+        instead, without creating any :attr:`records`.
+
         Args:
             stream (bytes IO):
                 Stream to serialize records onto.
@@ -635,6 +1230,11 @@ class AsciiHexFile(BaseFile):
                 Enclose the whole serialized file within ASCII ``STX`` and
                 ``ETX`` bytes.
 
+            buffer_size (int):
+                Size of the :class:`BatchWriter` buffer, in bytes.
+                If zero, each record is written straight onto `stream`.
+                If ``None``, :attr:`STREAM_CHUNK_SIZE` is used.
+
         Returns:
             :class:`MosFile`: *self*.
 
@@ -651,15 +1251,23 @@ class AsciiHexFile(BaseFile):
             ;0000010001
         """
 
-        if stxetx:
-            stream.write(b'\x02')
+        if self._records is None:
+            return self.serialize_memory(stream, exechar=exechar, exelast=exelast,
+                                         dollarend=dollarend, end=end, stxetx=stxetx,
+                                         buffer_size=buffer_size)
 
-        for record in self.records:
-            record.serialize(stream, exechar=exechar, exelast=exelast,
-                             dollarend=dollarend, end=end)
+        if buffer_size is None:
+            buffer_size = self.STREAM_CHUNK_SIZE
 
-        if stxetx:
-            stream.write(b'\x03')
+        with BatchWriter(stream, buffer_size) as writer:
+            if stxetx:
+                writer.write(b'\x02')
+
+            self._serialize_records(writer, exechar=exechar, exelast=exelast,
+                                    dollarend=dollarend, end=end)
+
+            if stxetx:
+                writer.write(b'\x03')
 
         return self
 
@@ -728,22 +1336,29 @@ class AsciiHexFile(BaseFile):
 
         records = []
         Record = self.Record
+        data_tag = Record.Tag.DATA
         last_data_endex = 0
         file_checksum = 0
+        key = (align, checksum, addrlen, self.maxdatalen)
+        reusable = self._get_reusable_records(key)
+        data_records = {}
         chunk_views = []
         try:
             for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
                 chunk_views.append(chunk_view)
-                data = bytes(chunk_view)
                 if checksum:
-                    sum_data = sum(data) & 0xFFFF
+                    sum_data = sum(chunk_view) & 0xFFFF
                     file_checksum = (file_checksum + sum_data) & 0xFFFF
 
                 if chunk_start != last_data_endex:
                     record = Record.create_address(chunk_start, addrlen=addrlen)
                     records.append(record)
 
-                record = Record.create_data(chunk_start, data)
+                record = reusable.get(chunk_start)
+                if record is None or record.data != chunk_view:
+                    data = bytes(chunk_view)
+                    record = Record._create_trusted(data_tag, chunk_start, data)
+                data_records[chunk_start] = record
                 records.append(record)
                 last_data_endex = chunk_start + len(chunk_view)
 
@@ -755,8 +1370,7 @@ class AsciiHexFile(BaseFile):
             record = Record.create_checksum(file_checksum)
             records.append(record)
 
-        self.discard_records()
-        self._records = records
+        self._set_updated_records(records, data_records, key)
         return self
 
     def validate_records(
@@ -801,9 +1415,9 @@ class AsciiHexFile(BaseFile):
         last_data_endex = 0
         file_checksum = 0
 
-        for record in records:
+        for record, verified in self._iter_verified_records(records):
             record = _cast(AsciiHexRecord, record)
-            record.validate()
+            record.validate(checksum=(not verified))
             tag = record.tag
 
             if tag == Tag.ADDRESS:
@@ -31,16 +31,22 @@ See Also:
 
 import enum
 import re
+from typing import IO
 from typing import Any
+from typing import Iterator
+from typing import List
 from typing import Mapping
 from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
+from typing import Union  # NOTE: type | operator unsupported for Python < 3.10
 
 from bytesparse import Memory
 
 from ..base import AnyBytes
 from ..base import BaseFile
+from ..base import BaseParser
 from ..base import BaseRecord
 from ..base import BaseTag
 from ..base import ByteString
@@ -75,6 +81,8 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class AvrRecord(BaseRecord):
     r"""Atmel Generic record object."""
 
+    __slots__ = ()
+
     Tag: Type[AvrTag] = AvrTag  # type: ignore override
 
     LINE_REGEX = re.compile(
@@ -104,6 +112,31 @@ class AvrRecord(BaseRecord):
         record = cls(cls.Tag.DATA, address=address, data=data)
         return record
 
+    def diagnose(
+        self,
+        checksum: bool = True,
+        count: bool = True,
+    ) -> Union[str, None]:
+
+        reason = super().diagnose(checksum=checksum, count=count)
+        if reason:
+            return reason
+
+        if self.after and not self.after.isspace():
+            return 'junk after is not whitespace'
+
+        if self.before and not self.before.isspace():
+            return 'junk before is not whitespace'
+
+        data_size = len(self.data)
+        if data_size != 2:
+            return 'data size overflow'
+
+        if not 0 <= self.address <= 0xFFFFFF:
+            return 'address overflow'
+
+        return None
+
     @classmethod
     def parse(
         cls,
@@ -136,23 +169,22 @@ class AvrRecord(BaseRecord):
             ValueError: syntax error
         """
 
-        match = cls.LINE_REGEX.match(line)
-        if not match:
-            raise ValueError('syntax error')
+        record, reason = cls.try_parse(line, validate=validate)
+        if reason:
+            raise ValueError(reason)
+        return record
 
-        groups = match.groupdict()
-        before = groups['before']
-        address = int(groups['address'], 16)
-        data = unhexlify(groups['data'])
-        after = groups['after']
+    @classmethod
+    def parse_fields(
+        cls,
+        line: ByteString,
+    ) -> Union[Tuple[AvrTag, int, ByteString], None]:
 
-        record = cls(cls.Tag.DATA,
-                     address=address,
-                     data=data,
-                     before=before,
-                     after=after,
-                     validate=validate)
-        return record
+        match = cls.LINE_REGEX.match(line)
+        if match is None:
+            return None
+
+        return cls.Tag.DATA, int(match.group('address'), 16), unhexlify(match.group('data'))
 
     def to_bytestr(
         self,
@@ -186,28 +218,61 @@ class AvrRecord(BaseRecord):
             'end': end,
         }
 
-    def validate(
-        self,
-        checksum: bool = True,
-        count: bool = True,
-    ) -> Self:  # type: ignore Self
+    @classmethod
+    def try_parse(
+        cls,
+        line: ByteString,
+        validate: bool = True,
+    ) -> Tuple[Union[Self, None], Union[str, None]]:  # type: ignore Self
 
-        super().validate(checksum=checksum, count=count)
+        match = cls.LINE_REGEX.match(line)
+        if not match:
+            return None, 'syntax error'
 
-        if self.after and not self.after.isspace():
-            raise ValueError('junk after is not whitespace')
+        groups = match.groupdict()
+        before = groups['before']
+        address = int(groups['address'], 16)
+        data = unhexlify(groups['data'])
+        after = groups['after']
 
-        if self.before and not self.before.isspace():
-            raise ValueError('junk before is not whitespace')
+        record = cls(cls.Tag.DATA,
+                     address=address,
+                     data=data,
+                     before=before,
+                     after=after,
+                     validate=False)
 
-        data_size = len(self.data)
-        if data_size != 2:
-            raise ValueError('data size overflow')
+        if validate:
+            reason = record.diagnose()
+            if reason:
+                return None, reason
 
-        if not 0 <= self.address <= 0xFFFFFF:
-            raise ValueError('address overflow')
+        return record, None
 
-        return self
+
+class AvrParser(BaseParser):
+    r"""Atmel Generic push parser.
+
+    It maps word addresses to byte addresses while parsing, as per
+    :meth:`AvrFile.apply_records`.
+    """
+
+    def __init__(
+        self,
+        file_type: Type[BaseFile],
+        ignore_errors: bool = False,
+    ):
+
+        super().__init__(file_type,
+                         ignore_errors=ignore_errors,
+                         ignore_after_termination=False)
+
+    def apply_record(self, record: BaseRecord) -> None:
+
+        data = record.data
+        self.memory.write(record.address * 2, data)
+        if self.maxdatalen < len(data):
+            self.maxdatalen = len(data)
 
 
 if not __TYPING_HAS_SELF:  # pragma: no cover
@@ -218,12 +283,73 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class AvrFile(BaseFile):
     r"""Atmel Generic file object."""
 
+    CONTENT_REGEX = re.compile(b'\\s*[0-9A-Fa-f]{6}[ \\t]*:[ \\t]*[0-9A-Fa-f]{4}')
+    r"""Content signature regex, matching a leading record."""
+
     DEFAULT_DATALEN: int = 2
 
     FILE_EXT: Sequence[str] = ['.rom']
 
+    Parser: Type[AvrParser] = AvrParser  # type: ignore override
+
     Record: Type[AvrRecord] = AvrRecord  # type: ignore override
 
+    def _iter_memory_lines(
+        self,
+        end: AnyBytes = b'\r\n',
+    ) -> Iterator[bytes]:
+        r"""Iterates over serialized lines, straight from memory.
+
+        It generates the same lines as :meth:`update_records` followed by
+        :meth:`AvrRecord.to_bytestr` for each record.
+        Lines are encoded straight from :attr:`memory`, a whole slice of
+        words at once, without creating any records.
+
+        Args:
+            end (bytes):
+                End of record termination bytes.
+
+        Returns:
+            iterator of bytes: Serialized lines.
+
+        Raises:
+            ValueError: :attr:`memory` attribute not populated.
+
+        Examples:
+            >>> from hexrec import AvrFile
+            >>> file = AvrFile.from_blocks([(0x1234, b'abcd')])
+            >>> list(file._iter_memory_lines(end=b'\n'))
+            [b'00091A:6162\n', b'00091B:6364\n']
+        """
+
+        memory = self._memory
+        if memory is None:
+            raise ValueError('memory instance required')
+        if self.maxdatalen != 2:
+            raise ValueError('invalid maximum data length')
+
+        slice_size = max(2, self.STREAM_CHUNK_SIZE & ~1)
+
+        for block_start, block_view in memory.blocks():
+            if block_start & 1:
+                raise ValueError('invalid word alignment')
+
+            block_size = len(block_view)
+            word_address = block_start >> 1
+
+            for offset in range(0, block_size, slice_size):
+                data_str = hexlify(block_view[offset:(offset + slice_size)])
+
+                for index in range(0, len(data_str) - 3, 4):
+                    if word_address > 0xFFFFFF:
+                        raise ValueError('address overflow')
+
+                    yield b'%06X:%s%s' % (word_address, data_str[index:(index + 4)], end)
+                    word_address += 1
+
+            if block_size & 1:
+                raise ValueError('invalid word size')
+
     def apply_records(self) -> Self:  # type: ignore Self
 
         if self._records is None:
@@ -239,6 +365,64 @@ class AvrFile(BaseFile):
         self._memory = memory
         return self
 
+    @classmethod
+    def parse_memory(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Parses a byte stream directly into memory.
+
+        Each line is decoded by :meth:`AvrRecord.parse_fields`, then written
+        straight into :attr:`memory`, without creating any record objects.
+
+        The accepted syntax is the same as :meth:`parse`, as well as the
+        resulting :attr:`memory` and *meta*, and the reported errors.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore :class:`Exception` raised by :meth:`AvrRecord.parse`.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            :class:`AvrFile`: The created file object.
+
+        See Also:
+            :meth:`parse`
+            :meth:`AvrRecord.parse_fields`
+
+        Examples:
+            >>> from hexrec import AvrFile
+            >>> buffer = b'''
+            ... 00091A:6162
+            ... 00091B:6364
+            ... '''
+            >>> file = AvrFile.parse_memory(buffer)
+            >>> file.memory.to_blocks()
+            [(4660, b'abcd')]
+            >>> file.get_meta()
+            {'maxdatalen': 2}
+        """
+
+        memory = Memory()
+        maxdatalen = 0
+
+        for _, address, data in cls._iter_parsed_fields(stream, ignore_errors=ignore_errors,
+                                                        diagnostics=diagnostics):
+            memory.write(address * 2, data)
+            if maxdatalen < len(data):
+                maxdatalen = len(data)
+
+        file = cls.from_memory(memory, maxdatalen=(maxdatalen or cls.DEFAULT_DATALEN))
+        return file
+
     def update_records(self) -> Self:  # type: ignore Self
         r"""Applies memory and meta to records.
 
@@ -287,6 +471,10 @@ class AvrFile(BaseFile):
 
         records = []
         Record = self.Record
+        data_tag = Record.Tag.DATA
+        key = ()  # fixed maxdatalen
+        reusable = self._get_reusable_records(key)
+        data_records = {}
         chunk_views = []
         try:
             for chunk_start, chunk_view in memory.chop(2):
@@ -294,18 +482,22 @@ class AvrFile(BaseFile):
                     raise ValueError('invalid word alignment')
                 if len(chunk_view) != 2:
                     raise ValueError('invalid word size')
-                word_address = chunk_start // 2
                 chunk_views.append(chunk_view)
-                word_data = bytes(chunk_view)
-                record = Record.create_data(word_address, word_data)
+                record = reusable.get(chunk_start)
+                if record is None or record.data != chunk_view:
+                    word_address = chunk_start // 2
+                    if not 0 <= word_address <= 0xFFFFFF:
+                        raise ValueError('address overflow')
+                    word_data = bytes(chunk_view)
+                    record = Record._create_trusted(data_tag, word_address, word_data)
+                data_records[chunk_start] = record
                 records.append(record)
 
         finally:
             for chunk_view in chunk_views:
                 chunk_view.release()
 
-        self.discard_records()
-        self._records = records
+        self._set_updated_records(records, data_records, key)
         return self
 
     def validate_records(
@@ -344,8 +536,8 @@ class AvrFile(BaseFile):
 
         last_data_endex = 0
 
-        for record in records:
-            record.validate()
+        for record, verified in self._iter_verified_records(records):
+            record.validate(checksum=(not verified))
 
             if data_ordering:
                 byte_address = record.address * 2
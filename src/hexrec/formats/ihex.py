@@ -29,11 +29,18 @@ See Also:
     `<https://en.wikipedia.org/wiki/Intel_HEX>`_
 """
 
+import binascii
 import enum
 import re
+from typing import IO
 from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Mapping
+from typing import MutableMapping
 from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union  # NOTE: type | operator unsupported for Python < 3.10
@@ -43,10 +50,15 @@ from bytesparse import Memory
 
 from ..base import AnyBytes
 from ..base import BaseFile
+from ..base import BaseParser
 from ..base import BaseRecord
 from ..base import BaseTag
+from ..base import BatchWriter
 from ..base import ByteString
+from ..base import ChunkWriter
 from ..utils import hexlify
+from ..utils import hexlify_lines
+from ..utils import sum_chunks
 from ..utils import unhexlify
 
 try:
@@ -55,6 +67,9 @@ except ImportError:  # pragma: no cover
     Self = Any  # Python < 3.11
 __TYPING_HAS_SELF = Self is not Any
 
+_CHECKSUM_TABLE = bytes((-value) & 0xFF for value in range(0x100))
+r"""Translation table from byte sums to *Intel HEX* checksums."""
+
 
 class IhexTag(BaseTag, enum.IntEnum):
     r"""Intel HEX tag."""
@@ -162,6 +177,10 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class IhexRecord(BaseRecord):
     r"""Intel HEX record object."""
 
+    __slots__ = [
+        '_extended_address',  # for debug
+    ]
+
     Tag: Type[IhexTag] = IhexTag  # type: ignore override
 
     LINE_REGEX = re.compile(
@@ -175,6 +194,18 @@ class IhexRecord(BaseRecord):
     )
     r"""Line parser regex."""
 
+    BATCH_REGEX = re.compile(
+        b'(?::[0-9A-Fa-f]+\\r?\\n)*'
+    )
+    r"""Batch parser regex, matching whole lines without any junk."""
+
+    FIELDS_REGEX = re.compile(
+        b'^[^:]*:'
+        b'(?P<fields>[0-9A-Fa-f]+)'
+        b'\\r?\\n?$'
+    )
+    r"""Field parser regex, matching a line without junk after the checksum."""
+
     def compute_checksum(self) -> int:
 
         if self.count is None:
@@ -189,6 +220,23 @@ class IhexRecord(BaseRecord):
         checksum = (0x100 - (checksum & 0xFF)) & 0xFF
         return checksum
 
+    @classmethod
+    def compute_checksums(
+        cls,
+        records: Sequence[BaseRecord],
+    ) -> List[Union[int, None]]:
+
+        try:
+            sums = sum_chunks([record.data for record in records], [
+                ([record.count for record in records], 1),
+                ([record.address for record in records], 2),
+                ([record.tag for record in records], 1),
+            ])
+        except (OverflowError, TypeError):  # unsupported by the batch layout
+            return super().compute_checksums(records)
+
+        return [(0x100 - (total & 0xFF)) & 0xFF for total in sums]
+
     def compute_count(self) -> int:
 
         return len(self.data)
@@ -332,6 +380,56 @@ class IhexRecord(BaseRecord):
         record = cls(cls.Tag.START_SEGMENT_ADDRESS, data=data)
         return record
 
+    def diagnose(
+        self,
+        checksum: bool = True,
+        count: bool = True,
+    ) -> Union[str, None]:
+
+        reason = super().diagnose(checksum=checksum, count=count)
+        if reason:
+            return reason
+
+        # if self.after and not self.after.isspace():
+        #     raise ValueError('junk after is not whitespace')
+
+        if b':' in self.before:
+            return 'junk before contains ":"'
+
+        if self.checksum is not None:
+            if not 0 <= self.checksum <= 0xFF:
+                return 'checksum overflow'
+
+        if self.count is not None:
+            if not 0 <= self.count <= 0xFF:
+                return 'count overflow'
+
+        data_size = len(self.data)
+        if data_size > 0xFF:
+            return 'data size overflow'
+
+        if not 0 <= self.address <= 0xFFFF:
+            return 'address overflow'
+
+        tag = _cast(IhexTag, self.tag)
+
+        if tag.is_data():
+            pass
+
+        elif tag.is_start():
+            if data_size != 4:
+                return 'start address data size overflow'
+
+        elif tag.is_extension():
+            if data_size != 2:
+                return 'extension data size overflow'
+
+        else:  # elif tag.is_eof():
+            if data_size:
+                return 'unexpected data'
+
+        return None
+
     @classmethod
     def parse(
         cls,
@@ -339,28 +437,110 @@ class IhexRecord(BaseRecord):
         validate: bool = True,
     ) -> Self:  # type: ignore Self
 
-        match = cls.LINE_REGEX.match(line)
-        if not match:
-            raise ValueError('syntax error')
+        record, reason = cls.try_parse(line, validate=validate)
+        if reason:
+            raise ValueError(reason)
+        return record
 
-        groups = match.groupdict()
-        before = groups['before']
-        count = int(groups['count'], 16)
-        address = int(groups['address'], 16)
-        tag = cls.Tag(int(groups['tag'], 16))
-        data = unhexlify(groups['data'])
-        checksum = int(groups['checksum'], 16)
-        after = groups['after']
+    @classmethod
+    def parse_fields(
+        cls,
+        line: ByteString,
+    ) -> Union[Tuple[IhexTag, int, ByteString], None]:
 
-        record = cls(tag,
-                     address=address,
-                     data=data,
-                     count=count,
-                     checksum=checksum,
-                     before=before,
-                     after=after,
-                     validate=validate)
-        return record
+        match = cls.FIELDS_REGEX.match(line)
+        if match is None:
+            return None
+
+        fields = match.group(1)
+        count = int(fields[:2], 16)
+        if len(fields) != (count << 1) + 10:
+            return None
+
+        raw = binascii.unhexlify(fields)
+        if sum(raw) & 0xFF:
+            return None
+
+        tag = cls.Tag._value2member_map_.get(raw[3])
+        if tag is None:
+            return None
+
+        if tag:  # not DATA
+            if tag.is_start():
+                if count != 4:
+                    return None
+            elif tag.is_extension():
+                if count != 2:
+                    return None
+            elif count:
+                return None
+
+        return _cast(IhexTag, tag), ((raw[1] << 8) | raw[2]), raw[4:-1]
+
+    @classmethod
+    def parse_fields_batch(
+        cls,
+        lines: Sequence[ByteString],
+    ) -> Union[List[Tuple[IhexTag, int, ByteString]], None]:
+        r"""Parses the fields of a batch of valid record lines.
+
+        Please refer to :meth:`BaseRecord.parse_fields_batch` for more details.
+
+        The syntax of the whole batch is checked at once by
+        :attr:`BATCH_REGEX`, then all the hexadecimal digits are decoded at
+        once.
+        Each line is then just checked against the *count* it states.
+
+        Args:
+            lines (list of bytes):
+                Lines to parse.
+
+        Returns:
+            list: *tag*, *address*, and *data* of each line, or ``None`` if
+            the batch must be parsed line by line instead.
+        """
+
+        buffer = b''.join(lines)
+        if not all(lines) or not cls.BATCH_REGEX.fullmatch(buffer):
+            return None
+        try:
+            raw = binascii.unhexlify(buffer.translate(None, b':\r\n'))
+        except binascii.Error:  # odd digits
+            return None
+
+        tags = cls.Tag._value2member_map_
+        parsed = []
+        append = parsed.append
+        offset = 0
+
+        for line in lines:
+            count = raw[offset]
+            eol_size = len(line) - ((count << 1) + 11)
+            if eol_size != 1 and (eol_size != 2 or line[-2] != 0x0D):
+                return None
+
+            endex = offset + count + 5
+            if sum(raw[offset:endex]) & 0xFF:
+                return None
+
+            tag = tags.get(raw[offset + 3])
+            if tag is None:
+                return None
+
+            if tag:  # not DATA
+                if tag.is_start():
+                    if count != 4:
+                        return None
+                elif tag.is_extension():
+                    if count != 2:
+                        return None
+                elif count:
+                    return None
+
+            append((tag, ((raw[offset + 1] << 8) | raw[offset + 2]), raw[(offset + 4):(endex - 1)]))
+            offset = endex
+
+        return parsed
 
     def to_bytestr(self, end: AnyBytes = b'\r\n') -> bytes:
 
@@ -396,53 +576,103 @@ class IhexRecord(BaseRecord):
             'end': end,
         }
 
-    def validate(
+    @classmethod
+    def try_parse(
+        cls,
+        line: ByteString,
+        validate: bool = True,
+    ) -> Tuple[Union[Self, None], Union[str, None]]:  # type: ignore Self
+
+        match = cls.LINE_REGEX.match(line)
+        if not match:
+            return None, 'syntax error'
+
+        groups = match.groupdict()
+        before = groups['before']
+        count = int(groups['count'], 16)
+        address = int(groups['address'], 16)
+        tag = int(groups['tag'], 16)
+        tag = cls.Tag._value2member_map_.get(tag, tag)
+        if not isinstance(tag, cls.Tag):
+            return None, f'{tag!r} is not a valid {cls.Tag.__qualname__}'
+        data = unhexlify(groups['data'])
+        checksum = int(groups['checksum'], 16)
+        after = groups['after']
+
+        record = cls(tag,
+                     address=address,
+                     data=data,
+                     count=count,
+                     checksum=checksum,
+                     before=before,
+                     after=after,
+                     validate=False)
+
+        if validate:
+            reason = record.diagnose()
+            if reason:
+                return None, reason
+
+        return record, None
+
+
+class IhexParser(BaseParser):
+    r"""Intel HEX push parser.
+
+    It tracks the *extended address* records while parsing, as per
+    :meth:`IhexFile.apply_records`.
+    """
+
+    def __init__(
         self,
-        checksum: bool = True,
-        count: bool = True,
-    ) -> Self:  # type: ignore Self
+        file_type: Type[BaseFile],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+    ):
 
-        super().validate(checksum=checksum, count=count)
+        super().__init__(file_type,
+                         ignore_errors=ignore_errors,
+                         ignore_after_termination=ignore_after_termination)
 
-        # if self.after and not self.after.isspace():
-        #     raise ValueError('junk after is not whitespace')
+        self.extension: int = 0
+        r"""Current address extension."""
 
-        if b':' in self.before:
-            raise ValueError('junk before contains ":"')
+        self.has_ela: bool = False
+        r"""An *Extended Linear Address* record was parsed."""
 
-        if self.checksum is not None:
-            if not 0 <= self.checksum <= 0xFF:
-                raise ValueError('checksum overflow')
+        self.has_esa: bool = False
+        r"""An *Extended Segment Address* record was parsed."""
 
-        if self.count is not None:
-            if not 0 <= self.count <= 0xFF:
-                raise ValueError('count overflow')
+        self.startaddr: Union[int, None] = None
+        r"""Parsed start address."""
 
-        data_size = len(self.data)
-        if data_size > 0xFF:
-            raise ValueError('data size overflow')
+    def apply_record(self, record: BaseRecord) -> None:
 
-        if not 0 <= self.address <= 0xFFFF:
-            raise ValueError('address overflow')
+        tag = _cast(IhexTag, record.tag)
+        data = record.data
 
-        tag = _cast(IhexTag, self.tag)
+        if tag == IhexTag.DATA:
+            self.memory.write(record.address + self.extension, data)
+            if self.maxdatalen < len(data):
+                self.maxdatalen = len(data)
 
-        if tag.is_data():
-            pass
+        elif tag == IhexTag.EXTENDED_LINEAR_ADDRESS:
+            self.has_ela = True
+            self.extension = int.from_bytes(data, byteorder='big') << 16
 
-        elif tag.is_start():
-            if data_size != 4:
-                raise ValueError('start address data size overflow')
+        elif tag == IhexTag.EXTENDED_SEGMENT_ADDRESS:
+            self.has_esa = True
+            self.extension = int.from_bytes(data, byteorder='big') << 4
 
-        elif tag.is_extension():
-            if data_size != 2:
-                raise ValueError('extension data size overflow')
+        elif tag.is_start():
+            self.startaddr = int.from_bytes(data, byteorder='big')
 
-        else:  # elif tag.is_eof():
-            if data_size:
-                raise ValueError('unexpected data')
+    def get_meta(self) -> MutableMapping[str, Any]:
 
-        return self
+        meta = super().get_meta()
+        meta['linear'] = self.has_ela or not self.has_esa
+        meta['startaddr'] = self.startaddr
+        return meta
 
 
 if not __TYPING_HAS_SELF:  # pragma: no cover
@@ -453,6 +683,9 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class IhexFile(BaseFile):
     r"""Intel HEX file object."""
 
+    CONTENT_REGEX = re.compile(b'\\s*:[0-9A-Fa-f]{10}')
+    r"""Content signature regex, matching a leading record."""
+
     FILE_EXT: Sequence[str] = [
         # https://en.wikipedia.org/wiki/Intel_HEX
         # General purpose:
@@ -473,6 +706,8 @@ class IhexFile(BaseFile):
         'startaddr',
     ]
 
+    Parser: Type[IhexParser] = IhexParser  # type: ignore override
+
     Record: Type[IhexRecord] = IhexRecord  # type: ignore override
 
     def __init__(self):
@@ -482,6 +717,443 @@ class IhexFile(BaseFile):
         self._linear: bool = True
         self._startaddr: Union[int, None] = None
 
+    def _iter_data_lines(
+        self,
+        end: AnyBytes = b'\r\n',
+        align: bool = False,
+        last_start: int = 0,
+    ) -> Iterator[bytes]:
+        r"""Iterates over serialized data lines, straight from memory.
+
+        It generates the same *data* and *extended address* lines as
+        :meth:`update_records` followed by :meth:`IhexRecord.to_bytestr`
+        for each record.
+        *Data* lines are encoded straight from :attr:`memory`, without
+        creating any records, in batch via
+        :func:`hexrec.utils.hexlify_lines`: each generated item holds all
+        the lines of a window of :meth:`_iter_chunk_windows`.
+
+        Args:
+            end (bytes):
+                End of record termination bytes.
+
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+            last_start (int):
+                Start address of the chunk preceding :attr:`memory`, telling
+                the address extension already in force.
+
+        Returns:
+            iterator of bytes: Serialized lines.
+            The generator returns the start address of the last window, for
+            the `last_start` of the following memory.
+
+        Raises:
+            ValueError: :attr:`memory` attribute not populated.
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> file = IhexFile.from_blocks([(0x12345, b'abc')])
+            >>> list(file._iter_data_lines(end=b'\n'))
+            [b':020000040001F9\n', b':032345006162636F\n']
+            >>> list(file._iter_data_lines(end=b'\n', last_start=0x10000))
+            [b':032345006162636F\n']
+        """
+
+        memory = self._memory
+        if memory is None:
+            raise ValueError('memory instance required')
+
+        Record = self.Record
+        linear = self.linear
+
+        for window_start, window_view in self._iter_chunk_windows(align=align, boundary=0x10000):
+            if linear:
+                if (window_start ^ last_start) & 0xFFFF0000:
+                    extension = window_start >> 16
+                    record = Record.create_extended_linear_address(extension)
+                    yield record.to_bytestr(end=end)
+            else:
+                if window_start > 0x000FFFFF:
+                    raise ValueError('segment overflow')
+
+                if (window_start ^ last_start) & 0x000F0000:
+                    extension = (window_start & 0x000F0000) >> 4
+                    record = Record.create_extended_segment_address(extension)
+                    yield record.to_bytestr(end=end)
+
+            size = min(len(window_view), self.maxdatalen)
+            if size > 0xFF:
+                raise ValueError('data size overflow')
+
+            lines = hexlify_lines(window_view, size, address=(window_start & 0xFFFF), address_size=2,
+                                  head=bytes((size,)), tag=b'\x00', checksum_size=1,
+                                  checksum_table=_CHECKSUM_TABLE, prefix=b':', suffix=end)
+            window_view.release()
+            yield lines
+            last_start = window_start
+
+        return last_start
+
+    def _iter_memory_lines(
+        self,
+        end: AnyBytes = b'\r\n',
+        align: bool = False,
+        start: bool = True,
+    ) -> Iterator[bytes]:
+        r"""Iterates over serialized lines, straight from memory.
+
+        It generates the same lines as :meth:`update_records` followed by
+        :meth:`IhexRecord.to_bytestr` for each record, without creating any
+        records.
+
+        Args:
+            end (bytes):
+                End of record termination bytes.
+
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+            start (bool):
+                Generates the *start address* record, if :attr:`startaddr` is
+                not ``None``.
+
+        Returns:
+            iterator of bytes: Serialized lines.
+
+        Raises:
+            ValueError: :attr:`memory` attribute not populated.
+
+        See Also:
+            :meth:`_iter_data_lines`
+            :meth:`_iter_trailer_lines`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> file = IhexFile.from_blocks([(0x12345, b'abc')])
+            >>> list(file._iter_memory_lines(end=b'\n'))
+            [b':020000040001F9\n', b':032345006162636F\n', b':00000001FF\n']
+        """
+
+        yield from self._iter_data_lines(end=end, align=align)
+        yield from self._iter_trailer_lines(end=end, start=start)
+
+    def _iter_stream_lines(
+        self,
+        windows: Iterable[Memory],
+        end: AnyBytes = b'\r\n',
+        align: bool = False,
+        start: bool = True,
+    ) -> Iterator[bytes]:
+        r"""Iterates over serialized lines of streamed memory windows.
+
+        It generates the same lines as :meth:`_iter_memory_lines`, as if
+        :attr:`memory` held just the data of all the `windows`.
+        Each window is encoded via :meth:`_iter_data_lines` as soon as it is
+        available, carrying the address extension in force over to the next
+        window.
+        The *start address* and *end of file* lines follow the last window,
+        with the final *meta*.
+
+        Args:
+            windows (iterable of :class:`bytesparse.Memory`):
+                Memory windows, in address order.
+
+            end (bytes):
+                End of record termination bytes.
+
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+            start (bool):
+                Generates the *start address* record, if :attr:`startaddr` is
+                not ``None``.
+
+        Returns:
+            iterator of bytes: Serialized lines.
+
+        See Also:
+            :func:`hexrec.base.convert_stream`
+            :meth:`_iter_data_lines`
+            :meth:`_iter_trailer_lines`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> from bytesparse import Memory
+            >>> windows = [Memory.from_bytes(b'abc', offset=0x12345),
+            ...            Memory.from_bytes(b'xyz', offset=0x12348)]
+            >>> file = IhexFile.from_memory(maxdatalen=3)
+            >>> list(file._iter_stream_lines(windows, end=b'\n'))  # doctest:+NORMALIZE_WHITESPACE
+            [b':020000040001F9\n', b':032345006162636F\n', b':0323480078797A27\n',
+             b':00000001FF\n']
+        """
+
+        backup = self._memory
+        last_start = 0
+        try:
+            for window in windows:
+                self._memory = window
+                last_start = yield from self._iter_data_lines(end=end, align=align, last_start=last_start)
+        finally:
+            self._memory = backup
+
+        yield from self._iter_trailer_lines(end=end, start=start)
+
+    def _iter_trailer_lines(
+        self,
+        end: AnyBytes = b'\r\n',
+        start: bool = True,
+    ) -> Iterator[bytes]:
+        r"""Iterates over serialized trailer lines.
+
+        It generates the same *start address* and *end of file* lines as
+        :meth:`update_records` followed by :meth:`IhexRecord.to_bytestr`
+        for each record.
+
+        Args:
+            end (bytes):
+                End of record termination bytes.
+
+            start (bool):
+                Generates the *start address* record, if :attr:`startaddr` is
+                not ``None``.
+
+        Returns:
+            iterator of bytes: Serialized lines.
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> file = IhexFile.from_blocks([(0x12345, b'abc')], startaddr=0xCAFE)
+            >>> list(file._iter_trailer_lines(end=b'\n'))
+            [b':040000050000CAFE2F\n', b':00000001FF\n']
+        """
+
+        Record = self.Record
+        startaddr = self._startaddr
+        if start and startaddr is not None:
+            if self.linear:
+                record = Record.create_start_linear_address(startaddr)
+            else:
+                record = Record.create_start_segment_address(startaddr)
+            yield record.to_bytestr(end=end)
+
+        yield Record.create_end_of_file().to_bytestr(end=end)
+
+    @classmethod
+    def _merge_memory_shards(cls, shards: Iterable[tuple]) -> Self:  # type: ignore Self
+        r"""Merges parsed memory shards.
+
+        It merges the outcomes of :meth:`_parse_memory_shard`, in buffer
+        order, into a file object in *memory role*.
+        The *head* of each shard is relocated by the address extension
+        carried over from the previous shards.
+        Merging stops at the shard holding the *End Of File* record.
+
+        Args:
+            shards (list of tuple):
+                Outcomes of :meth:`_parse_memory_shard`.
+
+        Returns:
+            :class:`IhexFile`: The created file object.
+
+        Raises:
+            ValueError: No valid records, as per :meth:`apply_records`.
+
+        See Also:
+            :meth:`_parse_memory_shard`
+        """
+
+        memory = None
+        extension = 0
+        startaddr = None
+        has_ela = False
+        has_esa = False
+        maxdatalen = 0
+        parsed = 0
+
+        for (shard_memory, head, shard_extension, shard_startaddr,
+             shard_has_ela, shard_has_esa, shard_maxdatalen, shard_parsed, terminated) in shards:
+
+            if memory is None:
+                memory = shard_memory
+            else:
+                if head:
+                    memory.write(extension, head)
+                memory.write(0, shard_memory)
+
+            if shard_extension is not None:
+                extension = shard_extension
+            if shard_startaddr is not None:
+                startaddr = shard_startaddr
+            has_ela = has_ela or shard_has_ela
+            has_esa = has_esa or shard_has_esa
+            if maxdatalen < shard_maxdatalen:
+                maxdatalen = shard_maxdatalen
+            parsed += shard_parsed
+            if terminated:
+                break
+
+        if not parsed:
+            raise ValueError('records required')
+
+        file = cls.from_memory(memory,
+                               linear=(has_ela or not has_esa),
+                               maxdatalen=(maxdatalen or cls.DEFAULT_DATALEN),
+                               startaddr=startaddr)
+        return file
+
+    @classmethod
+    def _parse_memory_shard(
+        cls,
+        buffer: AnyBytes,
+        index: int = 0,
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> tuple:
+        r"""Parses a buffer shard into memory.
+
+        It decodes each line of the shard `buffer` via
+        :meth:`_iter_parsed_fields`, writing *data* straight into memory,
+        without creating any records.
+        Contiguous *data* records are joined into a single memory write, via
+        :class:`ChunkWriter`.
+
+        The address extension in force at the beginning of a shard is known
+        only after parsing the previous shards.
+        So, any *data* preceding the first extension record of a shard
+        following the first one (i.e. `index` is positive) are written into a
+        separate *head* memory, relative to the unknown extension.
+
+        Args:
+            buffer (bytes):
+                Byte buffer shard, starting at a line boundary.
+
+            index (int):
+                Shard index; zero for the first shard.
+
+            ignore_errors (bool):
+                Ignore invalid lines.
+
+            ignore_after_termination (bool):
+                Ignore anything after the *End Of File* record.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            tuple: Shard *memory*, *head* memory (``None`` for the first
+            shard), last address extension (``None`` if not stated), start
+            address (``None`` if not stated), *Extended Linear Address*
+            presence, *Extended Segment Address* presence, maximum data size,
+            number of valid records, and *End Of File* termination.
+
+        Raises:
+            ValueError: Invalid record.
+
+        See Also:
+            :meth:`_merge_memory_shards`
+            :meth:`_iter_parsed_fields`
+            :class:`ChunkWriter`
+        """
+
+        memory = Memory()
+        head = Memory() if index else None
+        writer = ChunkWriter(head if head is not None else memory)
+        Tag = cls.Record.Tag
+        data_tag = Tag.DATA
+        ela_tag = Tag.EXTENDED_LINEAR_ADDRESS
+        esa_tag = Tag.EXTENDED_SEGMENT_ADDRESS
+        extension = 0
+        extended = not index
+        startaddr = None
+        has_ela = False
+        has_esa = False
+        parsed = 0
+        terminated = False
+
+        for tag, address, data in cls._iter_parsed_fields(buffer, ignore_errors, ignore_after_termination,
+                                                          diagnostics):
+            parsed += 1
+
+            if tag == data_tag:
+                writer.write(address + extension, data)
+
+            elif tag == ela_tag or tag == esa_tag:
+                if not extended:
+                    extended = True
+                    writer.flush()
+                    writer.memory = memory
+                if tag == ela_tag:
+                    has_ela = True
+                    extension = int.from_bytes(data, byteorder='big') << 16
+                else:
+                    has_esa = True
+                    extension = int.from_bytes(data, byteorder='big') << 4
+
+            elif tag.is_start():
+                startaddr = int.from_bytes(data, byteorder='big')
+
+            elif ignore_after_termination:  # END_OF_FILE
+                terminated = True
+
+        writer.flush()
+
+        return (memory, head, (extension if extended else None), startaddr,
+                has_ela, has_esa, writer.maxdatalen, parsed, terminated)
+
+    @classmethod
+    def _serialize_memory_shard(
+        cls,
+        memory: Memory,
+        index: int,
+        previous: Union[int, None],
+        meta: Mapping[str, Any],
+        end: AnyBytes = b'\r\n',
+        align: bool = False,
+    ) -> bytes:
+        r"""Serializes a memory shard.
+
+        It encodes the *data* lines of a memory shard, along with any needed
+        *extended address* lines, via :meth:`_iter_data_lines`.
+
+        Each shard states its own address extension, unless already in force
+        for the `previous` chunk, so that the concatenation of all the shards
+        matches the serial encoding.
+
+        Args:
+            memory (:class:`bytesparse.Memory`):
+                Memory shard.
+
+            index (int):
+                Shard index; zero for the first shard.
+
+            previous (int):
+                Start address of the last chunk preceding the shard, or
+                ``None`` for the first shard.
+
+            meta (dict):
+                File *meta*.
+
+            end (bytes):
+                End of record termination bytes.
+
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+        Returns:
+            bytes: Serialized lines.
+
+        See Also:
+            :meth:`serialize_parallel`
+        """
+
+        file = cls.from_memory(memory, **meta)
+        last_start = 0 if previous is None else previous
+        return b''.join(file._iter_data_lines(end=end, align=align, last_start=last_start))
+
     def apply_records(self) -> Self:  # type: ignore Self
 
         if not self._records:
@@ -497,22 +1169,22 @@ class IhexFile(BaseFile):
         has_ela = False
         has_esa = False
 
-        for record in self._records:
-            tag = _cast(IhexTag, record.tag)
+        for tag, address, data in self._iter_record_fields(self._records):
+            tag = _cast(IhexTag, tag)
 
             if tag == data_tag:
-                memory.write(record.address + extension, record.data)
+                memory.write(address + extension, data)
 
             elif tag == ela_tag:
                 has_ela = True
-                extension = record.data_to_int() << 16
+                extension = int.from_bytes(data, byteorder='big') << 16
 
             elif tag == esa_tag:
                 has_esa = True
-                extension = record.data_to_int() << 4
+                extension = int.from_bytes(data, byteorder='big') << 4
 
             elif tag.is_start():
-                startaddr = record.data_to_int()
+                startaddr = int.from_bytes(data, byteorder='big')
 
         self.discard_memory()
         self._memory = memory
@@ -574,6 +1246,393 @@ class IhexFile(BaseFile):
             self.discard_records()
         self._linear = linear
 
+    @classmethod
+    def parse_memory(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Parses a byte stream directly into memory.
+
+        It decodes each line via :meth:`IhexRecord.parse_fields`, writing
+        each record straight into :attr:`memory` and *meta*, without creating
+        any :attr:`records`.
+        Contiguous *data* records are joined into a single memory write.
+
+        The accepted syntax is the same as :meth:`parse`, as well as the
+        resulting :attr:`memory` and *meta*, and the reported errors.
+        The created file object is in *memory role*, so :attr:`records` are
+        generated from scratch by :meth:`update_records` upon request.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore invalid lines.
+
+            ignore_after_termination (bool):
+                Ignore anything after the *End Of File* record.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            :class:`IhexFile`: The created file object.
+
+        Raises:
+            ValueError: Invalid record.
+
+        See Also:
+            :meth:`parse`
+            :meth:`parse_parallel`
+            :meth:`IhexRecord.parse_fields`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> buffer = b'''
+            ...     :03DA7A0061626383
+            ...     :03DA7D0078797A3B
+            ...     :040000050000CAFE2F
+            ...     :00000001FF
+            ... '''
+            >>> file = IhexFile.parse_memory(buffer)
+            >>> file.memory.to_blocks()
+            [(55930, b'abcxyz')]
+            >>> file.get_meta()
+            {'linear': True, 'maxdatalen': 3, 'startaddr': 51966}
+        """
+
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            buffer = stream
+        else:
+            buffer = stream.read()
+
+        shard = cls._parse_memory_shard(buffer, 0, ignore_errors, ignore_after_termination, diagnostics)
+        file = cls._merge_memory_shards([shard])
+        return file
+
+    @classmethod
+    def parse_parallel(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        workers: Union[int, None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Parses a byte stream into memory, in parallel.
+
+        It splits the incoming `stream` into shards at line boundaries, each
+        one parsed by :meth:`_parse_memory_shard` within a separate worker
+        process.
+        The partial memories are then merged in order by
+        :meth:`_merge_memory_shards`, relocating any *data* preceding the
+        first address extension record of each shard by the extension carried
+        over from the previous shards.
+
+        The accepted syntax is the same as :meth:`parse_memory`, as well as
+        the resulting :attr:`memory` and *meta*.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore invalid lines.
+
+            ignore_after_termination (bool):
+                Ignore anything after the *End Of File* record.
+
+            workers (int):
+                Maximum number of worker processes.
+                If ``None``, as many as :func:`os.cpu_count`.
+
+        Returns:
+            :class:`IhexFile`: The created file object.
+
+        Raises:
+            ValueError: Invalid record.
+
+        See Also:
+            :meth:`parse_memory`
+            :attr:`SHARD_SIZE_MIN`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> buffer = b'''
+            ...     :03DA7A0061626383
+            ...     :03DA7D0078797A3B
+            ...     :040000050000CAFE2F
+            ...     :00000001FF
+            ... '''
+            >>> file = IhexFile.parse_parallel(buffer, workers=4)
+            >>> file.memory.to_blocks()
+            [(55930, b'abcxyz')]
+            >>> file.get_meta()
+            {'linear': True, 'maxdatalen': 3, 'startaddr': 51966}
+        """
+
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            buffer = stream
+        else:
+            buffer = stream.read()
+
+        shards = cls._map_buffer_shards(cls._parse_memory_shard, buffer, workers,
+                                        ignore_errors, ignore_after_termination)
+        file = cls._merge_memory_shards(shards)
+        return file
+
+    @classmethod
+    def parse_validated(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_after_termination: bool = True,
+        data_ordering: bool = False,
+        start_required: bool = False,
+        start_penultimate: bool = True,
+        start_within_data: bool = False,
+    ) -> Self:  # type: ignore Self
+        r"""Parses and validates a byte stream directly into memory.
+
+        It validates each record parsed from the `stream`, checks the record
+        sequence as per :meth:`validate_records`, and writes each record into
+        :attr:`memory` and *meta*, all within the same single pass.
+        The address extension is tracked once for both the checks and the
+        memory writes.
+        Contiguous *data* records are joined into a single memory write.
+
+        The resulting :attr:`memory` and *meta* are the same as per
+        :meth:`parse` followed by :meth:`validate_records` and
+        :meth:`apply_records`.
+        The first invalid record or sequence found along the `stream` raises
+        the exception.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_after_termination (bool):
+                Ignore anything after the *End Of File* record.
+
+            data_ordering (bool):
+                Checks that the *data* record sequence has monotonically
+                increasing addresses, without any overlapping.
+
+            start_required (bool):
+                Requires the *start address* record be present.
+
+            start_penultimate (bool):
+                Requires the *start address* record be the penultimate one.
+
+            start_within_data (bool):
+                Requires *start address* fall within data carried by some
+                *data* record.
+
+        Returns:
+            :class:`IhexFile`: The created file object.
+
+        Raises:
+            ValueError: Invalid record or record sequence.
+
+        See Also:
+            :meth:`parse`
+            :meth:`validate_records`
+            :meth:`apply_records`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> buffer = b'''
+            ...     :03DA7A0061626383
+            ...     :03DA7D0078797A3B
+            ...     :040000050000CAFE2F
+            ...     :00000001FF
+            ... '''
+            >>> file = IhexFile.parse_validated(buffer, start_required=True)
+            >>> file.memory.to_blocks()
+            [(55930, b'abcxyz')]
+            >>> file.get_meta()
+            {'linear': True, 'maxdatalen': 3, 'startaddr': 51966}
+            >>> IhexFile.parse_validated(buffer, start_within_data=True)
+            Traceback (most recent call last):
+                ...
+            ValueError: no data at start address
+        """
+
+        Tag = cls.Record.Tag
+        data_tag = Tag.DATA
+        eof_tag = Tag.END_OF_FILE
+        ela_tag = Tag.EXTENDED_LINEAR_ADDRESS
+        esa_tag = Tag.EXTENDED_SEGMENT_ADDRESS
+        memory = Memory()
+        extension = 0
+        startaddr = None
+        has_ela = False
+        has_esa = False
+        maxdatalen = 0
+        last_data_endex = 0
+        start_index = None
+        eof_index = None
+        chunk_start = 0
+        chunk_endex = 0
+        chunk = bytearray()
+        index = -1
+
+        records = cls._iter_parsed_records(stream, ignore_after_termination=ignore_after_termination)
+
+        for index, record in enumerate(records):
+            if eof_index is not None:
+                raise ValueError('end of file record not last')
+
+            if start_penultimate and start_index is not None and start_index < index - 1:
+                raise ValueError('start record not penultimate')
+
+            tag = _cast(IhexTag, record.tag)
+            data = record.data
+
+            if tag == data_tag:
+                address = record.address + extension
+                size = len(data)
+                if data_ordering:
+                    if address < last_data_endex:
+                        raise ValueError('unordered data record')
+                    last_data_endex = address + size
+
+                if address != chunk_endex:
+                    if chunk:
+                        memory.write(chunk_start, chunk)
+                    chunk_start = address
+                    chunk = bytearray()
+                chunk += data
+                chunk_endex = address + size
+                if maxdatalen < size:
+                    maxdatalen = size
+
+            elif tag == eof_tag:
+                eof_index = index
+
+            elif tag == ela_tag:
+                has_ela = True
+                extension = int.from_bytes(data, byteorder='big') << 16
+
+            elif tag == esa_tag:
+                has_esa = True
+                extension = int.from_bytes(data, byteorder='big') << 4
+
+            elif tag.is_start():
+                if start_penultimate and start_index is not None:
+                    raise ValueError('start record not penultimate')
+                start_index = index
+                startaddr = int.from_bytes(data, byteorder='big')
+
+        if start_penultimate and start_index is not None and start_index != index - 1:
+            raise ValueError('start record not penultimate')
+
+        if eof_index is None:
+            raise ValueError('missing end of file record')
+
+        if start_required:
+            if start_index is None:
+                raise ValueError('missing start record')
+
+        if chunk:
+            memory.write(chunk_start, chunk)
+
+        if start_within_data:
+            if startaddr is not None:
+                start_datum = memory.peek(startaddr)
+                if start_datum is None:
+                    raise ValueError('no data at start address')
+
+        file = cls.from_memory(memory,
+                               linear=(has_ela or not has_esa),
+                               maxdatalen=(maxdatalen or cls.DEFAULT_DATALEN),
+                               startaddr=startaddr)
+        return file
+
+    def serialize_parallel(
+        self,
+        stream: IO,
+        end: AnyBytes = b'\r\n',
+        align: bool = False,
+        start: bool = True,
+        workers: Union[int, None] = None,
+        buffer_size: Union[int, None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Serializes memory onto a byte stream, in parallel.
+
+        It splits the :attr:`memory` into shards at chunk boundaries, each one
+        encoded by :meth:`_serialize_memory_shard` within a separate worker
+        process, with its own leading *extended address* record when needed.
+        The encoded shards are then written in order, followed by the
+        *start address* and *end of file* records, generated once.
+
+        The written bytes are the same as per :meth:`serialize`.
+
+        While in *records role*, it calls :meth:`serialize` instead.
+
+        Args:
+            stream (bytes IO):
+                Stream to serialize onto.
+
+            end (bytes):
+                End of record termination bytes.
+
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+                Ignored in *records role*.
+
+            start (bool):
+                Generates the *start address* record, if :attr:`startaddr` is
+                not ``None``.
+                Ignored in *records role*.
+
+            workers (int):
+                Maximum number of worker processes.
+                If ``None``, as many as :func:`os.cpu_count`.
+
+            buffer_size (int):
+                Size of the :class:`BatchWriter` buffer, in bytes.
+                If zero, each shard is written straight onto `stream`.
+                If ``None``, :attr:`STREAM_CHUNK_SIZE` is used.
+
+        Returns:
+            :class:`IhexFile`: *self*.
+
+        Raises:
+            ValueError: Invalid address or data size.
+
+        See Also:
+            :meth:`serialize`
+            :meth:`_serialize_memory_shard`
+            :attr:`SHARD_SIZE_MIN`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> file = IhexFile.from_blocks([(0x12345, b'abc')], startaddr=0xCAFE)
+            >>> import io
+            >>> stream = io.BytesIO()
+            >>> _ = file.serialize_parallel(stream, end=b'\n', workers=4)
+            >>> stream.getvalue()
+            b':020000040001F9\n:032345006162636F\n:040000050000CAFE2F\n:00000001FF\n'
+        """
+
+        if self._records is not None:
+            return self.serialize(stream, end=end, buffer_size=buffer_size)
+
+        if buffer_size is None:
+            buffer_size = self.STREAM_CHUNK_SIZE
+
+        shards = self._map_memory_shards(self._serialize_memory_shard, workers, align,
+                                         self.get_meta(), end, align)
+
+        with BatchWriter(stream, buffer_size) as writer:
+            writer.writelines(shards)
+            writer.writelines(self._iter_trailer_lines(end=end, start=start))
+        return self
+
     @property
     def startaddr(self) -> Union[int, None]:
         r"""Start address.
@@ -683,8 +1742,13 @@ class IhexFile(BaseFile):
 
         records = []
         Record = self.Record
+        data_tag = Record.Tag.DATA
+        created = []
         last_start = 0
         linear = self.linear
+        key = (align, start, linear, self.maxdatalen)
+        reusable = self._get_reusable_records(key)
+        data_records = {}
         chunk_views = []
         try:
             for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
@@ -704,13 +1768,20 @@ class IhexFile(BaseFile):
                         record = Record.create_extended_segment_address(extension)
                         records.append(record)
 
-                address = chunk_start & 0xFFFF
-                data = bytes(chunk_view)
-                record = Record.create_data(address, data)
-                setattr(record, '_extended_address', chunk_start)  # for debug
+                record = reusable.get(chunk_start)
+                if record is None or record.data != chunk_view:
+                    if len(chunk_view) > 0xFF:
+                        raise ValueError('data size overflow')
+                    address = chunk_start & 0xFFFF
+                    data = bytes(chunk_view)
+                    record = Record._create_trusted(data_tag, address, data, _extended_address=chunk_start)
+                    created.append(record.update_count())
+                data_records[chunk_start] = record
                 records.append(record)
                 last_start = chunk_start
 
+            Record.update_checksums(created)
+
             startaddr = self._startaddr
             if start and startaddr is not None:
                 if linear:
@@ -726,8 +1797,7 @@ class IhexFile(BaseFile):
             for chunk_view in chunk_views:
                 chunk_view.release()
 
-        self.discard_records()
-        self._records = records
+        self._set_updated_records(records, data_records, key)
         return self
 
     def validate_records(
@@ -781,8 +1851,8 @@ class IhexFile(BaseFile):
         last_data_endex = 0
         extension = 0
 
-        for index, record in enumerate(records):
-            record.validate()
+        for index, (record, verified) in enumerate(self._iter_verified_records(records)):
+            record.validate(checksum=(not verified))
             tag = _cast(IhexTag, record.tag)
 
             if data_ordering:
@@ -819,7 +1889,7 @@ class IhexFile(BaseFile):
         if start_within_data:
             if start_record is not None:
                 startaddr = start_record.data_to_int()
-                start_datum = self.memory.peek(startaddr)
+                start_datum = self._get_memory().peek(startaddr)
                 if start_datum is None:
                     raise ValueError('no data at start address')
 
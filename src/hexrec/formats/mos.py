@@ -30,22 +30,31 @@ See Also:
 """
 
 import enum
-import io
 import re
 from typing import IO
 from typing import Any
+from typing import Iterator
+from typing import List
 from typing import Mapping
+from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union  # NOTE: type | operator unsupported for Python < 3.10
 from typing import cast as _cast
 
+from bytesparse import Memory
+
 from ..base import AnyBytes
 from ..base import BaseFile
+from ..base import BaseParser
 from ..base import BaseRecord
 from ..base import BaseTag
+from ..base import BatchWriter
 from ..base import ByteString
 from ..utils import hexlify
+from ..utils import hexlify_lines
+from ..utils import sum_chunks
 from ..utils import unhexlify
 
 try:
@@ -54,6 +63,10 @@ except ImportError:  # pragma: no cover
     Self = Any  # Python < 3.11
 __TYPING_HAS_SELF = Self is not Any
 
+_BEGIN_REGEX = re.compile(b';')
+_EMPTY_LINE_REGEX = re.compile(b'[\\0\\s]*')
+_XOFF_REGEX = re.compile(b'\\x13')
+
 
 class MosTag(BaseTag, enum.IntEnum):
     r"""MOS Technology tag."""
@@ -103,6 +116,8 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class MosRecord(BaseRecord):
     r"""MOS Technology record object."""
 
+    __slots__ = ()
+
     Tag: Type[MosTag] = MosTag  # type: ignore override
 
     LINE_REGEX = re.compile(
@@ -115,6 +130,13 @@ class MosRecord(BaseRecord):
     )
     r"""Line parser regex."""
 
+    FIELDS_REGEX = re.compile(
+        b'^\0*[^;]*;'
+        b'(?P<fields>[0-9A-Fa-f]+)'
+        b'(?:(?:\\r\\n?|\\n)\0*)?$'
+    )
+    r"""Field parser regex, matching a line without junk after the checksum."""
+
     def compute_checksum(self) -> int:
 
         if self.count is None:
@@ -127,6 +149,22 @@ class MosRecord(BaseRecord):
         checksum = (count + sum_address + sum_data) & 0xFFFF
         return checksum
 
+    @classmethod
+    def compute_checksums(
+        cls,
+        records: Sequence[BaseRecord],
+    ) -> List[Union[int, None]]:
+
+        try:
+            sums = sum_chunks([record.data for record in records], [
+                ([record.count for record in records], 1),
+                ([record.address for record in records], 2),
+            ])
+        except (OverflowError, TypeError):  # unsupported by the batch layout
+            return super().compute_checksums(records)
+
+        return [total & 0xFFFF for total in sums]
+
     def compute_count(self) -> int:
 
         return len(self.data)
@@ -179,6 +217,39 @@ class MosRecord(BaseRecord):
         record = cls(cls.Tag.EOF, address=record_count)
         return record
 
+    def diagnose(
+        self,
+        checksum: bool = True,
+        count: bool = True,
+    ) -> Union[str, None]:
+
+        reason = super().diagnose(checksum=checksum, count=count)
+        if reason:
+            return reason
+
+        if self.after and not self.after.isspace():
+            return 'junk after is not whitespace'
+
+        if b';' in self.before:
+            return 'junk before contains ";"'
+
+        if self.checksum is not None:
+            if not 0 <= self.checksum <= 0xFFFF:
+                return 'checksum overflow'
+
+        if self.count is not None:
+            if not 0 <= self.count <= 0xFF:
+                return 'count overflow'
+
+        data_size = len(self.data)
+        if data_size > 0xFF:
+            return 'data size overflow'
+
+        if not 0 <= self.address <= 0xFFFF:
+            return 'address overflow'
+
+        return None
+
     @classmethod
     def parse(  # type: ignore kwargs order
         cls,
@@ -218,27 +289,31 @@ class MosRecord(BaseRecord):
             ValueError: syntax error
         """
 
-        match = cls.LINE_REGEX.match(line)
-        if not match:
-            raise ValueError('syntax error')
+        record, reason = cls.try_parse(line, eof=eof, validate=validate)
+        if reason:
+            raise ValueError(reason)
+        return record
 
-        groups = match.groupdict()
-        before = groups['before']
-        count = int(groups['count'], 16)
-        address = int(groups['address'], 16)
-        data = unhexlify(groups['data'])
-        checksum = int(groups['checksum'], 16)
-        after = groups['after']
+    @classmethod
+    def parse_fields(
+        cls,
+        line: ByteString,
+    ) -> Union[Tuple[MosTag, int, ByteString], None]:
 
-        record = cls(cls.Tag.EOF if eof else cls.Tag.DATA,
-                     address=address,
-                     data=data,
-                     count=count,
-                     checksum=checksum,
-                     before=before,
-                     after=after,
-                     validate=validate)
-        return record
+        match = cls.FIELDS_REGEX.match(line)
+        if match is None:
+            return None
+
+        fields = match.group(1)
+        count = int(fields[:2], 16)
+        if len(fields) != (count << 1) + 10:
+            return None
+
+        raw = unhexlify(fields)
+        if sum(raw[:-2]) & 0xFFFF != (raw[-2] << 8) | raw[-1]:
+            return None
+
+        return cls.Tag.DATA, ((raw[1] << 8) | raw[2]), raw[3:-2]
 
     def to_bytestr(
         self,
@@ -282,36 +357,116 @@ class MosRecord(BaseRecord):
             'nuls': nulstr,
         }
 
-    def validate(
+    @classmethod
+    def try_parse(  # type: ignore kwargs order
+        cls,
+        line: ByteString,
+        eof: bool = False,
+        validate: bool = True,
+    ) -> Tuple[Union[Self, None], Union[str, None]]:  # type: ignore Self
+
+        match = cls.LINE_REGEX.match(line)
+        if not match:
+            return None, 'syntax error'
+
+        groups = match.groupdict()
+        before = groups['before']
+        count = int(groups['count'], 16)
+        address = int(groups['address'], 16)
+        data = unhexlify(groups['data'])
+        checksum = int(groups['checksum'], 16)
+        after = groups['after']
+
+        record = cls(cls.Tag.EOF if eof else cls.Tag.DATA,
+                     address=address,
+                     data=data,
+                     count=count,
+                     checksum=checksum,
+                     before=before,
+                     after=after,
+                     validate=False)
+
+        if validate:
+            reason = record.diagnose()
+            if reason:
+                return None, reason
+
+        return record, None
+
+
+class MosParser(BaseParser):
+    r"""MOS Technology push parser.
+
+    It discards anything before the first record start character (``;``) and
+    after the ``XOFF`` character, as per :meth:`MosFile._trim_buffer`.
+
+    As the last record may be the *End Of File* record, only the *data* of
+    the previous records is applied, until :meth:`close`.
+    """
+
+    def __init__(
         self,
-        checksum: bool = True,
-        count: bool = True,
-    ) -> Self:  # type: ignore Self
+        file_type: Type[BaseFile],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        eof_record: bool = True,
+    ):
 
-        super().validate(checksum=checksum, count=count)
+        super().__init__(file_type,
+                         ignore_errors=ignore_errors,
+                         ignore_after_termination=ignore_after_termination)
 
-        if self.after and not self.after.isspace():
-            raise ValueError('junk after is not whitespace')
+        self.eof_record: bool = eof_record
+        r"""Interpret the last record as the *End Of File* record."""
 
-        if b';' in self.before:
-            raise ValueError('junk before contains ";"')
+        self.begun: bool = False
+        r"""The first record start character was fed."""
 
-        if self.checksum is not None:
-            if not 0 <= self.checksum <= 0xFFFF:
-                raise ValueError('checksum overflow')
+        self.stopped: bool = False
+        r"""The ``XOFF`` character was fed."""
 
-        if self.count is not None:
-            if not 0 <= self.count <= 0xFF:
-                raise ValueError('count overflow')
+        self._last_record: Union[BaseRecord, None] = None
 
-        data_size = len(self.data)
-        if data_size > 0xFF:
-            raise ValueError('data size overflow')
+    def apply_record(self, record: BaseRecord) -> None:
 
-        if not 0 <= self.address <= 0xFFFF:
-            raise ValueError('address overflow')
+        last_record = self._last_record
+        if last_record is not None:
+            super().apply_record(last_record)
+        self._last_record = record
 
-        return self
+    def close(self) -> BaseFile:
+
+        self._parse_pending()
+        last_record = self._last_record
+
+        if last_record is None:
+            if self.eof_record and not self.ignore_errors:
+                raise ValueError('missing end of file record')
+
+        elif not self.eof_record:
+            super().apply_record(last_record)
+
+        file = self.file_type.from_memory(self.memory, **self.get_meta())
+        return file
+
+    def feed(self, chunk: AnyBytes) -> List[BaseRecord]:
+
+        if self.stopped:
+            return []
+
+        match = _XOFF_REGEX.search(chunk)
+        if match:
+            chunk = chunk[:match.start()]
+            self.stopped = True
+
+        if not self.begun:
+            match = _BEGIN_REGEX.search(chunk)
+            if not match:
+                return []
+            chunk = chunk[match.start():]
+            self.begun = True
+
+        return super().feed(chunk)
 
 
 if not __TYPING_HAS_SELF:  # pragma: no cover
@@ -322,17 +477,180 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class MosFile(BaseFile):
     r"""MOS Technology file object."""
 
+    CONTENT_REGEX = re.compile(b'[\\0\\s]*;[0-9A-Fa-f]{10}')
+    r"""Content signature regex, matching a leading record."""
+
     DEFAULT_DATALEN: int = 24
 
+    Parser: Type[MosParser] = MosParser  # type: ignore override
+
     Record: Type[MosRecord] = MosRecord  # type: ignore override
 
     @classmethod
-    def _is_line_empty(cls, line: Union[bytes, bytearray]) -> bool:
+    def _is_line_empty(cls, line: Union[bytes, bytearray, memoryview]) -> bool:
 
+        if isinstance(line, memoryview):
+            return _EMPTY_LINE_REGEX.fullmatch(line) is not None
         if b'\0' in line:
             line = line.replace(b'\0', b'')
         return not line or line.isspace()
 
+    def _iter_memory_lines(
+        self,
+        end: AnyBytes = b'\r\n',
+        nuls: bool = True,
+        xoff: bool = True,
+        align: bool = False,
+    ) -> Iterator[bytes]:
+        r"""Iterates over serialized lines, straight from memory.
+
+        It generates the same lines as :meth:`update_records` followed by
+        :meth:`serialize`.
+        *Data* lines are encoded straight from :attr:`memory`, without
+        creating any records: :func:`hexrec.utils.hexlify_lines` encodes
+        all the lines of a window of :meth:`_iter_chunk_windows` into a
+        single generated item.
+
+        Args:
+            end (bytes):
+                Line ending suffix bytes.
+
+            nuls (bool):
+                Append six ASCII ``NUL`` (zero) bytes after each line.
+
+            xoff (bool):
+                Generate the ASCII ``XOFF`` byte at the end of the whole
+                serialization.
+
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+        Returns:
+            iterator of bytes: Serialized lines.
+
+        Raises:
+            ValueError: :attr:`memory` attribute not populated.
+
+        Examples:
+            >>> from hexrec import MosFile
+            >>> file = MosFile.from_blocks([(0x1234, b'abc')])
+            >>> list(file._iter_memory_lines(end=b'\n', nuls=False))
+            [b';031234616263016F\n', b';0000010001\n', b'\x13']
+        """
+
+        memory = self._memory
+        if memory is None:
+            raise ValueError('memory instance required')
+
+        nulstr = b'\0\0\0\0\0\0' if nuls else b''
+        record_count = 0
+
+        for window_start, window_view in self._iter_chunk_windows(align=align):
+            window_size = len(window_view)
+            size = min(window_size, self.maxdatalen)
+            if window_start + window_size - size > 0xFFFF:
+                raise ValueError('address overflow')
+
+            if size > 0xFF:
+                raise ValueError('size overflow')
+
+            lines = hexlify_lines(window_view, size, address=window_start, address_size=2,
+                                  head=bytes((size,)), checksum_size=2, prefix=b';', suffix=(end + nulstr))
+            window_view.release()
+            yield lines
+            record_count += window_size // size
+
+        record = self.Record.create_eof(record_count)
+        yield record.to_bytestr(end=end, nuls=nuls)
+
+        if xoff:
+            yield b'\x13'
+
+    @classmethod
+    def _iter_trimmed_lines(cls, stream: IO) -> Iterator[bytes]:
+        r"""Iterates over the record lines of a stream.
+
+        It yields only the lines from the first record start character (``;``)
+        up to the ``XOFF`` character (excluded), as per :meth:`_trim_buffer`.
+        The stream is read line by line, so that it is never held in memory
+        as a whole.
+
+        Args:
+            stream (bytes IO):
+                Stream to read lines from.
+
+        Returns:
+            iterator: Trimmed lines.
+
+        Examples:
+            >>> from hexrec import MosFile
+            >>> import io
+            >>> stream = io.BytesIO(b'\0\0;0000000000\r\n\x13\0')
+            >>> list(MosFile._iter_trimmed_lines(stream))
+            [b';0000000000\r\n']
+        """
+
+        lines = iter(stream)
+
+        for line in lines:
+            match = _BEGIN_REGEX.search(line)
+            xoff = _XOFF_REGEX.search(line, 0, match.start() if match else len(line))
+            if xoff:
+                return
+            if match:
+                line = line[match.start():]
+                break
+        else:
+            return
+
+        while True:
+            match = _XOFF_REGEX.search(line)
+            if match:
+                line = line[:match.start()]
+                if line:
+                    yield line
+                return
+            yield line
+
+            line = next(lines, None)
+            if line is None:
+                return
+
+    @classmethod
+    def _trim_buffer(cls, stream: Union[AnyBytes, IO]) -> memoryview:
+        r"""Trims the input to the record lines.
+
+        It keeps only the bytes from the first record start character (``;``)
+        up to the ``XOFF`` character (excluded).
+        A byte buffer is trimmed without copying its content, while a stream
+        is read as a whole.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to trim.
+
+        Returns:
+            memoryview: Trimmed view.
+
+        Examples:
+            >>> from hexrec import MosFile
+            >>> bytes(MosFile._trim_buffer(b'\0\0;0000000000\r\n\x13\0'))
+            b';0000000000\r\n'
+        """
+
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            view = memoryview(stream)
+        else:
+            view = memoryview(stream.read())
+
+        match = _XOFF_REGEX.search(view)
+        endex = match.start() if match else len(view)
+
+        match = _BEGIN_REGEX.search(view, 0, endex)
+        start = match.start() if match else endex
+
+        return view[start:endex]
+
     @classmethod
     def parse(  # type: ignore kwargs order
         cls,
@@ -340,6 +658,8 @@ class MosFile(BaseFile):
         ignore_errors: bool = False,
         ignore_after_termination: bool = True,
         eof_record: bool = True,
+        table: bool = False,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
     ) -> Self:  # type: ignore Self
         r"""Parses records from a byte stream.
 
@@ -366,6 +686,16 @@ class MosFile(BaseFile):
             eof_record (bool):
                 Interpret the last record as the *End Of File* record.
 
+            table (bool):
+                Stores :attr:`records` into a compact
+                :class:`hexrec.base.RecordTable`, instead of a :class:`list`.
+                Its records are detached copies: edits must be stored back by
+                item assignment.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
         Returns:
             :class:`MosFile`: *self*.
 
@@ -390,47 +720,137 @@ class MosFile(BaseFile):
             {'maxdatalen': 3}
         """
 
-        data = stream.read()
-        data = _cast(bytes, data)
-
-        start = data.find(b';')
-        if start < 0:
-            start = len(data)
-
-        endex = data.find(b'\x13')
-        if endex < 0:
-            endex = len(data)
-
-        if start > endex:
-            start = endex
-
-        data = data[start:endex]
-        stream = io.BytesIO(data)
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            stream = cls._trim_buffer(stream)
+        else:
+            stream = cls._iter_trimmed_lines(stream)  # type: ignore lines
 
         file = super().parse(stream, ignore_errors=ignore_errors,
-                             ignore_after_termination=ignore_after_termination)
+                             ignore_after_termination=ignore_after_termination,
+                             table=table, diagnostics=diagnostics)
         file = _cast(MosFile, file)
 
         if eof_record:
-            if file._records:
-                file._records[-1].tag = cls.Record.Tag.EOF  # patch
+            records = file._records
+            if records:
+                record = records[-1]
+                record.tag = cls.Record.Tag.EOF  # patch
+                records[-1] = record
+            elif diagnostics is not None:
+                diagnostics.append((0, 0, 'missing end of file record'))
             elif not ignore_errors:
                 raise ValueError('missing end of file record')
 
         return file
 
+    @classmethod
+    def parse_memory(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        eof_record: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Parses a byte stream directly into memory.
+
+        Each line is decoded by :meth:`MosRecord.parse_fields`, then written
+        straight into :attr:`memory`, without creating any record objects.
+        Only the last parsed line is kept, as it may be the *End Of File*
+        record.
+
+        The accepted syntax is the same as :meth:`parse`, as well as the
+        resulting :attr:`memory` and *meta*, and the reported errors.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore :class:`Exception` raised by :meth:`MosRecord.parse`.
+
+            ignore_after_termination (bool):
+                Ignore anything after the *End Of File* record was parsed.
+
+            eof_record (bool):
+                Interpret the last record as the *End Of File* record.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            :class:`MosFile`: The created file object.
+
+        Raises:
+            ValueError: Invalid record, or missing *End Of File* record.
+
+        See Also:
+            :meth:`parse`
+            :meth:`MosRecord.parse_fields`
+
+        Examples:
+            >>> from hexrec import MosFile
+            >>> buffer = b'''
+            ...     ;03DA7A616263027D
+            ...     ;03DA7D78797A02C5
+            ...     ;0000020002
+            ... '''
+            >>> file = MosFile.parse_memory(buffer)
+            >>> file.memory.to_blocks()
+            [(55930, b'abcxyz')]
+            >>> file.get_meta()
+            {'maxdatalen': 3}
+        """
+
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            stream = cls._trim_buffer(stream)
+        else:
+            stream = cls._iter_trimmed_lines(stream)  # type: ignore lines
+        memory = Memory()
+        maxdatalen = 0
+        last_data = None
+        last_address = 0
+
+        for _, address, data in cls._iter_parsed_fields(stream, ignore_errors=ignore_errors,
+                                                        ignore_after_termination=ignore_after_termination,
+                                                        diagnostics=diagnostics):
+            if last_data is not None:
+                memory.write(last_address, last_data)
+            if maxdatalen < len(data):
+                maxdatalen = len(data)
+            last_data = data
+            last_address = address
+
+        if last_data is None:
+            if eof_record:
+                if diagnostics is not None:
+                    diagnostics.append((0, 0, 'missing end of file record'))
+                elif not ignore_errors:
+                    raise ValueError('missing end of file record')
+
+        elif not eof_record:
+            memory.write(last_address, last_data)
+
+        file = cls.from_memory(memory, maxdatalen=(maxdatalen or cls.DEFAULT_DATALEN))
+        return file
+
     def serialize(
         self,
         stream: IO,
         end: AnyBytes = b'\r\n',
         nuls: bool = True,
         xoff: bool = True,
+        buffer_size: Union[int, None] = None,
     ) -> 'BaseFile':
         r"""Serializes records onto a byte stream.
 
         It executes :meth:`MosRecord.serialize` for each of the stored
         :attr:`records`.
 
+        While not in *records role*, it calls :meth:`serialize_memory`
+        instead, without creating any :attr:`records`.
+
         Args:
             stream (bytes IO):
                 Stream to serialize records onto.
@@ -446,6 +866,11 @@ class MosFile(BaseFile):
                 Append the ASCII ``XOFF`` byte at the end of the whole
                 serialization.
 
+            buffer_size (int):
+                Size of the :class:`BatchWriter` buffer, in bytes.
+                If zero, each record is written straight onto `stream`.
+                If ``None``, :attr:`STREAM_CHUNK_SIZE` is used.
+
         Returns:
             :class:`MosFile`: *self*.
 
@@ -462,11 +887,18 @@ class MosFile(BaseFile):
             ;0000010001
         """
 
-        for record in self.records:
-            record.serialize(stream, end=end, nuls=nuls)
+        if self._records is None:
+            return self.serialize_memory(stream, end=end, nuls=nuls, xoff=xoff,
+                                         buffer_size=buffer_size)
 
-        if xoff:
-            stream.write(b'\x13')
+        if buffer_size is None:
+            buffer_size = self.STREAM_CHUNK_SIZE
+
+        with BatchWriter(stream, buffer_size) as writer:
+            self._serialize_records(writer, end=end, nuls=nuls)
+
+            if xoff:
+                writer.write(b'\x13')
 
         return self
 
@@ -523,14 +955,29 @@ class MosFile(BaseFile):
 
         records = []
         Record = self.Record
+        data_tag = Record.Tag.DATA
+        key = (align, self.maxdatalen)
+        reusable = self._get_reusable_records(key)
+        data_records = {}
         chunk_views = []
+        created = []
         try:
             for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
                 chunk_views.append(chunk_view)
-                data = bytes(chunk_view)
-                record = Record.create_data(chunk_start, data)
+                record = reusable.get(chunk_start)
+                if record is None or record.data != chunk_view:
+                    if not 0 <= chunk_start <= 0xFFFF:
+                        raise ValueError('address overflow')
+                    if len(chunk_view) > 0xFF:
+                        raise ValueError('size overflow')
+                    data = bytes(chunk_view)
+                    record = Record._create_trusted(data_tag, chunk_start, data)
+                    created.append(record.update_count())
+                data_records[chunk_start] = record
                 records.append(record)
 
+            Record.update_checksums(created)
+
             record = Record.create_eof(len(records))
             records.append(record)
 
@@ -538,8 +985,7 @@ class MosFile(BaseFile):
             for chunk_view in chunk_views:
                 chunk_view.release()
 
-        self.discard_records()
-        self._records = records
+        self._set_updated_records(records, data_records, key)
         return self
 
     def validate_records(
@@ -582,8 +1028,8 @@ class MosFile(BaseFile):
         eof_record = None
         last_data_endex = 0
 
-        for index, record in enumerate(records):
-            record.validate()
+        for index, (record, verified) in enumerate(self._iter_verified_records(records)):
+            record.validate(checksum=(not verified))
             tag = _cast(MosTag, record.tag)
 
             if data_ordering:
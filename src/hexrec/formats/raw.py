@@ -29,19 +29,29 @@ This format is actually used to hold binary chunks of raw data (`bytes`).
 """
 
 import enum
+import io
 import sys
 from typing import IO
 from typing import Any
+from typing import Iterator
+from typing import List
 from typing import Mapping
 from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
+from typing import Union  # NOTE: type | operator unsupported for Python < 3.10
+
+from bytesparse import Memory
 
 from ..base import AnyBytes
+from ..base import AnyPath
 from ..base import BaseFile
+from ..base import BaseParser
 from ..base import BaseRecord
 from ..base import BaseTag
 from ..base import ByteString
+from ..base import RecordTable
 
 try:
     from typing import Self
@@ -75,6 +85,8 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class RawRecord(BaseRecord):
     r"""Raw binary record object."""
 
+    __slots__ = ()
+
     Tag: Type[RawTag] = RawTag  # type: ignore override
 
     @classmethod
@@ -144,6 +156,85 @@ class RawRecord(BaseRecord):
         }
 
 
+class RawParser(BaseParser):
+    r"""Raw binary push parser.
+
+    The incoming chunks are written into :attr:`memory` one after the other,
+    as per :meth:`RawFile.parse_memory`.
+
+    If :attr:`maxdatalen` is bounded, the stream is chopped into records of
+    that size, as per :meth:`RawFile.parse`, keeping any trailing incomplete
+    record pending for the next chunks.
+    Otherwise, each chunk makes a record as a whole.
+    """
+
+    def __init__(
+        self,
+        file_type: Type[BaseFile],
+        ignore_errors: bool = False,
+        maxdatalen: int = sys.maxsize,
+        address: int = 0,
+    ):
+
+        maxdatalen = maxdatalen.__index__()
+        if maxdatalen < 1:
+            raise ValueError('invalid maximum data length')
+
+        super().__init__(file_type,
+                         ignore_errors=ignore_errors,
+                         ignore_after_termination=False)
+
+        self.address: int = address.__index__()
+        r"""Current address."""
+
+        self.maxdatalen = maxdatalen
+
+    def _parse_data(self, data: AnyBytes) -> BaseRecord:
+        r"""Parses a record.
+
+        Args:
+            data (bytes):
+                Record *data*, following the previous ones.
+
+        Returns:
+            :class:`RawRecord`: Parsed record, already applied.
+        """
+
+        record = self.file_type.Record.create_data(self.address, bytes(data))
+        record.coords = (0, self.address)
+        self.memory.write(self.address, data)
+        self.address += len(data)
+        return record
+
+    def close(self) -> BaseFile:
+
+        pending = self._pending
+        if pending:
+            self._parse_data(pending)
+            pending.clear()
+
+        file = self.file_type.from_memory(self.memory)
+        file._maxdatalen = self.maxdatalen
+        return file
+
+    def feed(self, chunk: AnyBytes) -> List[BaseRecord]:
+
+        if not chunk:
+            return []
+
+        maxdatalen = self.maxdatalen
+        if maxdatalen == sys.maxsize:  # unbounded
+            return [self._parse_data(chunk)]
+
+        pending = self._pending
+        pending += chunk
+        endex = len(pending) - (len(pending) % maxdatalen)
+        records = [self._parse_data(pending[offset:(offset + maxdatalen)])
+                   for offset in range(0, endex, maxdatalen)]
+        del pending[:endex]
+        return records
+
+
 if not __TYPING_HAS_SELF:  # pragma: no cover
     del Self
     Self = TypeVar('Self', bound='RawFile')
@@ -159,6 +250,8 @@ class RawFile(BaseFile):
         '.bin', '.dat', '.eep', '.raw',
     ]
 
+    Parser: Type[RawParser] = RawParser  # type: ignore override
+
     Record: Type[RawRecord] = RawRecord  # type: ignore override
 
     @classmethod
@@ -166,13 +259,134 @@ class RawFile(BaseFile):
 
         return not line
 
+    def _iter_memory_lines(
+        self,
+        align: bool = False,
+    ) -> Iterator[memoryview]:
+        r"""Iterates over serialized chunks, straight from memory.
+
+        It generates the same chunks as :meth:`update_records` followed by
+        :meth:`RawRecord.to_bytestr` for each record.
+        Each chunk is a :class:`memoryview` of :attr:`memory`, so that no
+        data is copied (e.g. from a memory mapped file).
+
+        Args:
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+        Returns:
+            iterator of memoryview: Serialized chunks.
+
+        Raises:
+            ValueError: :attr:`memory` attribute not populated.
+
+        Examples:
+            >>> from hexrec import RawFile
+            >>> file = RawFile.from_bytes(b'Hello, World!', maxdatalen=5)
+            >>> [bytes(chunk) for chunk in file._iter_memory_lines()]
+            [b'Hello', b', Wor', b'ld!']
+        """
+
+        memory = self._memory
+        if memory is None:
+            raise ValueError('memory instance required')
+        with memory.view():  # contiguity check
+            pass
+
+        for _, chunk_view in memory.chop(self.maxdatalen, align=align):
+            yield chunk_view
+
+    @classmethod
+    def load(
+        cls,
+        in_path_or_stream: Union[AnyPath, IO, None],
+        *args,
+        records: bool = True,
+        mmap: bool = False,
+        **kwargs,
+    ) -> Self:  # type: ignore Self
+        r"""Loads a file object from the filesystem.
+
+        Please refer to :meth:`BaseFile.load` for more details.
+
+        If `mmap` is true and `in_path_or_stream` is a path, the file object
+        is loaded in *memory role*, and its :attr:`memory` refers directly
+        to a read-only memory mapping of the file, without copying it.
+        This allows handling huge binary images, which are never read as a
+        whole into the Python heap.
+        The mapping is owned by the file object and its copies, and it is
+        closed by :meth:`discard_memory`.
+        Saving onto the mapped file replaces it, as per :meth:`BaseFile.save`.
+
+        :meth:`crop`, :meth:`copy`, :meth:`convert`, :meth:`view`,
+        :meth:`read`, and :meth:`update_records` do not copy the whole
+        mapping, while methods altering the memory content copy just the
+        blocks they edit.
+        Accessing :attr:`memory` copies the mapped blocks, so that the exposed
+        memory object can be edited directly.
+
+        Warnings:
+            The mapped file must not be modified while its file object is in
+            use.
+
+        Args:
+            in_path_or_stream (str or bytes IO):
+                Path of the file within the filesystem, or byte input stream.
+                If ``None``, ``sys.stdin.buffer`` is used.
+
+            args:
+                Forwarded to :meth:`BaseFile.load`.
+
+            records (bool):
+                Loads the file object in *records role* via :meth:`parse`.
+                Ignored if the file is memory mapped via `mmap`.
+
+            mmap (bool):
+                Maps the file into memory via :mod:`mmap`, referring to it
+                directly from :attr:`memory`.
+                Ignored if `path_or_stream` is a stream.
+
+            kwargs:
+                Forwarded to :meth:`BaseFile.load`.
+
+        Returns:
+            :class:`RawFile`: Loaded file object.
+
+        See Also:
+            :meth:`BaseFile.load`
+            :meth:`parse_memory`
+
+        Examples:
+            >>> import os, tempfile
+            >>> from hexrec import RawFile
+            >>> folder = tempfile.TemporaryDirectory()
+            >>> path = os.path.join(folder.name, 'data.bin')
+            >>> _ = RawFile.from_bytes(b'Hello, World!').save(path)
+            >>> file = RawFile.load(path, mmap=True)
+            >>> file.memory.to_blocks()
+            [(0, b'Hello, World!')]
+            >>> _ = file.crop(7, 12)
+            >>> bytes(file.view())
+            b'World'
+            >>> _ = file.discard_memory()  # closes the mapping
+            >>> folder.cleanup()
+        """
+
+        if mmap and in_path_or_stream is not None and not isinstance(in_path_or_stream, io.IOBase):
+            records = False
+            kwargs.setdefault('copy', False)
+
+        return super().load(in_path_or_stream, *args, records=records, mmap=mmap, **kwargs)
+
     @classmethod
     def parse(  # type: ignore kwargs order
         cls,
-        stream: IO,
+        stream: Union[AnyBytes, IO],
         ignore_errors: bool = False,
         maxdatalen: int = sys.maxsize,
         address: int = 0,
+        table: bool = False,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
     ) -> 'RawFile':
         r"""Parses records from a byte stream.
 
@@ -185,8 +399,8 @@ class RawFile(BaseFile):
             *format*, because it may be more specialized.
 
         Args:
-            stream (bytes IO):
-                Stream to serialize records onto.
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
 
             ignore_errors (bool):
                 Ignore :class:`Exception` raised by :meth:`RawRecord.parse`.
@@ -197,6 +411,15 @@ class RawFile(BaseFile):
             address (int):
                 Initial address.
 
+            table (bool):
+                Stores :attr:`records` into a compact
+                :class:`hexrec.base.RecordTable`, instead of a :class:`list`.
+                Its records are detached copies: edits must be stored back by
+                item assignment.
+
+            diagnostics (list):
+                Unused, as any byte stream is valid.
+
         Returns:
             :class:`RawFile`: *self*.
 
@@ -220,29 +443,117 @@ class RawFile(BaseFile):
         """
 
         del ignore_errors  # unused
+        del diagnostics  # unused
         maxdatalen = maxdatalen.__index__()
         if maxdatalen < 1:
             raise ValueError('invalid maximum data length')
-        if maxdatalen == sys.maxsize:
-            maxdatalen = -1
 
-        records = []
+        records = RecordTable(cls.Record) if table else []
         Record = cls.Record
 
-        chunk = b'...'
-        while chunk:
-            chunk = stream.read(maxdatalen)
-            if chunk:
-                record = Record.create_data(address, chunk)
-                record.coords = (0, address)
-                records.append(record)
-                size = len(chunk)
-                address += size
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            view = memoryview(stream)
+            step = min(maxdatalen, max(len(view), 1))
+            chunks = (bytes(view[offset:(offset + step)]) for offset in range(0, len(view), step))
+        else:
+            size = -1 if maxdatalen == sys.maxsize else maxdatalen  # read all if unbounded
+            chunks = iter(lambda: stream.read(size), b'')
+
+        for chunk in chunks:
+            record = Record.create_data(address, chunk)
+            record.coords = (0, address)
+            records.append(record)
+            size = len(chunk)
+            address += size
 
         file = cls.from_records(records)
         file._maxdatalen = maxdatalen
         return file
 
+    @classmethod
+    def parse_memory(  # type: ignore kwargs order
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        maxdatalen: int = sys.maxsize,
+        address: int = 0,
+        copy: bool = True,
+    ) -> 'RawFile':
+        r"""Parses a byte stream directly into memory.
+
+        The whole `stream` is written into :attr:`memory` at once, without
+        chopping it into :attr:`records`.
+
+        The resulting :attr:`memory` and *meta* are the same as per
+        :meth:`parse`.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse.
+
+            ignore_errors (bool):
+                Unused.
+
+            maxdatalen (int):
+                Maximum *data* record data size, as per :meth:`parse`.
+
+            address (int):
+                Initial address.
+
+            copy (bool):
+                Copies a byte buffer into :attr:`memory`.
+                If false, :attr:`memory` refers directly to the byte buffer,
+                which must not be altered while in use.
+                Read-only buffers and memory views are copied only when edited,
+                or when exposed via :attr:`memory`.
+                Ignored if `stream` is a stream.
+
+        Returns:
+            :class:`RawFile`: The created file object.
+
+        See Also:
+            :meth:`parse`
+            :meth:`load`
+
+        Examples:
+            >>> from hexrec import RawFile
+            >>> file = RawFile.parse_memory(b'Hello, World!', maxdatalen=5, address=1000)
+            >>> file.memory.to_blocks()
+            [(1000, b'Hello, World!')]
+            >>> file.get_meta()
+            {'maxdatalen': 5}
+
+            >>> buffer = bytearray(b'Hello, World!')
+            >>> file = RawFile.parse_memory(buffer, address=1000, copy=False)
+            >>> buffer[:5] = b'HELLO'
+            >>> file.memory.to_blocks()
+            [(1000, b'HELLO, World!')]
+        """
+
+        del ignore_errors  # unused
+        maxdatalen = maxdatalen.__index__()
+        if maxdatalen < 1:
+            raise ValueError('invalid maximum data length')
+
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            data = stream
+        else:
+            data = stream.read()
+            copy = True
+
+        if not copy:
+            if isinstance(data, memoryview):
+                data = data.toreadonly()  # not resizable, copied when edited
+            memory = Memory.from_bytes(data, offset=address, copy=False)
+        else:
+            memory = Memory()
+            if data:
+                memory.write(address, data)
+
+        file = cls.from_memory(memory)
+        file._maxdatalen = maxdatalen
+        return file
+
     def update_records(
         self,
         align: bool = False,
@@ -295,22 +606,32 @@ class RawFile(BaseFile):
         with memory.view():  # contiguity check
             pass
 
+        maxdatalen = self.maxdatalen
+
         records = []
         Record = self.Record
+        data_tag = Record.Tag.DATA
+        key = (align, maxdatalen)
+        reusable = self._get_reusable_records(key)
+        data_records = {}
         chunk_views = []
         try:
-            for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
+            for chunk_start, chunk_view in memory.chop(maxdatalen, align=align):
                 chunk_views.append(chunk_view)
-                data = bytes(chunk_view)
-                record = Record.create_data(chunk_start, data)
+                record = reusable.get(chunk_start)
+                if record is None or record.data != chunk_view:
+                    if chunk_start < 0:
+                        raise ValueError('address overflow')
+                    data = bytes(chunk_view)
+                    record = Record._create_trusted(data_tag, chunk_start, data)
+                data_records[chunk_start] = record
                 records.append(record)
 
         finally:
             for chunk_view in chunk_views:
                 chunk_view.release()
 
-        self.discard_records()
-        self._records = records
+        self._set_updated_records(records, data_records, key)
         return self
 
     def validate_records(
@@ -359,8 +680,8 @@ class RawFile(BaseFile):
 
         last_data_end = None
 
-        for record in self._records:
-            record.validate()
+        for record, verified in self._iter_verified_records(self._records):
+            record.validate(checksum=(not verified))
             address = record.address
             if last_data_end is None:
                 last_data_end = address
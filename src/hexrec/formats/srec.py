@@ -29,11 +29,18 @@ See Also:
     `<https://en.wikipedia.org/wiki/SREC_(file_format)>`_
 """
 
+import binascii
 import enum
 import re
+from typing import IO
 from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Mapping
+from typing import MutableMapping
 from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union  # NOTE: type | operator unsupported for Python < 3.10
@@ -43,10 +50,15 @@ from bytesparse import Memory
 
 from ..base import AnyBytes
 from ..base import BaseFile
+from ..base import BaseParser
 from ..base import BaseRecord
 from ..base import BaseTag
+from ..base import BatchWriter
 from ..base import ByteString
+from ..base import ChunkWriter
 from ..utils import hexlify
+from ..utils import hexlify_lines
+from ..utils import sum_chunks
 from ..utils import unhexlify
 
 try:
@@ -55,6 +67,12 @@ except ImportError:  # pragma: no cover
     Self = Any  # Python < 3.11
 __TYPING_HAS_SELF = Self is not Any
 
+_BATCH_TRANSLATION = bytes.maketrans(b'Ss', b'00')
+r"""Translation table turning ``S`` prefixes into ``0`` digits."""
+
+_CHECKSUM_TABLE = bytes(value ^ 0xFF for value in range(0x100))
+r"""Translation table from byte sums to *Motorola S-record* checksums."""
+
 
 if not __TYPING_HAS_SELF:  # pragma: no cover
     del Self
@@ -429,26 +447,28 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class SrecRecord(BaseRecord):
     r"""Motorola S-record record object."""
 
+    __slots__ = ()
+
     Tag: Type[SrecTag] = SrecTag  # type: ignore override
 
-    LINE1_REGEX = re.compile(
-        b'^(?P<before>\\s*)[Ss]'
-        b'(?P<tag>[0-9A-Fa-f])'
-        b'(?P<count>[0-9A-Fa-f]{2})'
+    BATCH_REGEX = re.compile(
+        b'(?:[Ss][0-9][0-9A-Fa-f]+\\r?\\n)*'
     )
-    r"""Line parser regex, part 1."""
-
-    LINE2_REGEX = [re.compile(
-        b'^(?P<address>[0-9A-Fa-f]{%d})' % (4 + (i * 2))
-    ) for i in range(3)]
-    r"""Line parser regex, part 2."""
+    r"""Batch parser regex, matching whole lines without any junk."""
 
-    LINE3_REGEX = re.compile(
-        b'^(?P<data>([0-9A-Fa-f]{2})*)'
-        b'(?P<checksum>[0-9A-Fa-f]{2})'
-        b'(?P<after>[^\\r\\n]*)\\r?\\n?$'
+    FIELDS_REGEX = re.compile(
+        b'^\\s*[Ss]'
+        b'(?P<tag>[0-9])'
+        b'(?P<fields>[0-9A-Fa-f]+)'
+        b'\\r?\\n?$'
     )
-    r"""Line parser regex, part 3."""
+    r"""Field parser regex, matching a line without junk after the checksum."""
+
+    HEX_DIGITS: bytes = b'0123456789ABCDEFabcdef'
+    r"""Hexadecimal digits, as accepted by the line parser."""
+
+    LINE_ENDS: Sequence[bytes] = (b'', b'\r', b'\n', b'\r\n', b'\n\n', b'\r\n\n')
+    r"""Line endings accepted by the line parser."""
 
     def compute_checksum(self) -> int:
 
@@ -462,6 +482,22 @@ class SrecRecord(BaseRecord):
         checksum = (checksum & 0xFF) ^ 0xFF
         return checksum
 
+    @classmethod
+    def compute_checksums(
+        cls,
+        records: Sequence[BaseRecord],
+    ) -> List[Union[int, None]]:
+
+        try:
+            sums = sum_chunks([record.data for record in records], [
+                ([record.count for record in records], 1),
+                ([record.address for record in records], 4),
+            ])
+        except (OverflowError, TypeError):  # unsupported by the batch layout
+            return super().compute_checksums(records)
+
+        return [(total & 0xFF) ^ 0xFF for total in sums]
+
     def compute_count(self) -> int:
 
         tag = _cast(SrecTag, self.tag)
@@ -653,6 +689,51 @@ class SrecRecord(BaseRecord):
         record = cls(tag, address=address)
         return record
 
+    def diagnose(
+        self,
+        checksum: bool = True,
+        count: bool = True,
+    ) -> Union[str, None]:
+
+        reason = super().diagnose(checksum=checksum, count=count)
+        if reason:
+            return reason
+
+        address = self.address
+
+        # if self.after and not self.after.isspace():
+        #     raise ValueError('junk after')
+
+        if self.before and not self.before.isspace():
+            return 'junk before'
+
+        if self.checksum is not None:
+            if not 0 <= self.checksum <= 0xFF:
+                return 'checksum overflow'
+
+        if self.count is not None:
+            if not 3 <= self.count <= 0xFF:
+                return 'count overflow'
+
+        Tag = _cast(SrecTag, self.Tag)
+        tag = _cast(SrecTag, self.tag)
+        if tag == Tag.RESERVED:
+            return 'reserved tag'
+
+        data_size = len(self.data)
+
+        if not Tag.HEADER <= tag <= Tag.DATA_32:
+            if data_size:
+                return 'unexpected data'
+
+        if data_size > tag.get_data_max():
+            return 'data size overflow'
+
+        if not 0 <= address <= tag.get_address_max():
+            return 'address overflow'
+
+        return None
+
     @classmethod
     def parse(
         cls,
@@ -660,44 +741,106 @@ class SrecRecord(BaseRecord):
         validate: bool = True,
     ) -> Self:  # type: ignore Self
 
-        Tag = cls.Tag
-        line = memoryview(line)
-
-        match = cls.LINE1_REGEX.match(line)
-        if not match:
-            raise ValueError('syntax error')
-        groups = match.groupdict()
-        before = groups['before']
-        tag = Tag(int(groups['tag'], 16))
-        count = int(groups['count'], 16)
-
-        addridx = tag.get_address_size() - 2
-        line = line[match.span()[1]:]
-        match = cls.LINE2_REGEX[addridx].match(line)
-        if not match:
-            raise ValueError('syntax error')
-        groups = match.groupdict()
-        address = int(groups['address'], 16)
-
-        line = line[match.span()[1]:]
-        match = cls.LINE3_REGEX.match(line)
-        if not match:
-            raise ValueError('syntax error')
-        groups = match.groupdict()
-        data = unhexlify(groups['data'])
-        checksum = int(groups['checksum'], 16)
-        after = groups['after']
-
-        record = cls(tag,
-                     address=address,
-                     data=data,
-                     count=count,
-                     checksum=checksum,
-                     before=before,
-                     after=after,
-                     validate=validate)
+        record, reason = cls.try_parse(line, validate=validate)
+        if reason:
+            raise ValueError(reason)
         return record
 
+    @classmethod
+    def parse_fields(
+        cls,
+        line: ByteString,
+    ) -> Union[Tuple[SrecTag, int, ByteString], None]:
+
+        match = cls.FIELDS_REGEX.match(line)
+        if match is None:
+            return None
+
+        tag = _cast(SrecTag, cls.Tag._value2member_map_[int(match.group(1))])
+        if tag == SrecTag.RESERVED:
+            return None
+
+        fields = match.group(2)
+        count = int(fields[:2], 16)
+        if count < 3 or len(fields) != (count + 1) << 1:
+            return None
+
+        raw = binascii.unhexlify(fields)
+        if sum(raw) & 0xFF != 0xFF:
+            return None
+
+        data_offset = tag.get_address_size() + 1
+        if count <= data_offset:
+            if count < data_offset:
+                return None
+        elif not tag.is_data() and not tag.is_header():
+            return None
+
+        return tag, int.from_bytes(raw[1:data_offset], byteorder='big'), raw[data_offset:-1]
+
+    @classmethod
+    def parse_fields_batch(
+        cls,
+        lines: Sequence[ByteString],
+    ) -> Union[List[Tuple[SrecTag, int, ByteString]], None]:
+        r"""Parses the fields of a batch of valid record lines.
+
+        Please refer to :meth:`BaseRecord.parse_fields_batch` for more details.
+
+        The syntax of the whole batch is checked at once by
+        :attr:`BATCH_REGEX`, then all the hexadecimal digits are decoded at
+        once, with each ``S`` prefix turned into a ``0`` digit, so that each
+        *tag* digit becomes a byte of its own.
+        Each line is then just checked against the *count* it states.
+
+        Args:
+            lines (list of bytes):
+                Lines to parse.
+
+        Returns:
+            list: *tag*, *address*, and *data* of each line, or ``None`` if
+            the batch must be parsed line by line instead.
+        """
+
+        buffer = b''.join(lines)
+        if not all(lines) or not cls.BATCH_REGEX.fullmatch(buffer):
+            return None
+        try:
+            raw = binascii.unhexlify(buffer.translate(_BATCH_TRANSLATION, b'\r\n'))
+        except binascii.Error:  # odd digits
+            return None
+
+        tags = cls.Tag._value2member_map_
+        parsed = []
+        append = parsed.append
+        offset = 0
+
+        for line in lines:
+            count = raw[offset + 1]
+            eol_size = len(line) - ((count << 1) + 4)
+            if eol_size != 1 and (eol_size != 2 or line[-2] != 0x0D):
+                return None
+
+            endex = offset + count + 2
+            if count < 3 or sum(raw[(offset + 1):endex]) & 0xFF != 0xFF:
+                return None
+
+            tag = _cast(SrecTag, tags[raw[offset]])
+            if tag == SrecTag.RESERVED:
+                return None
+
+            data_offset = offset + tag.get_address_size() + 2
+            if endex - 1 <= data_offset:
+                if endex - 1 < data_offset:
+                    return None
+            elif not tag.is_data() and not tag.is_header():
+                return None
+
+            append((tag, int.from_bytes(raw[(offset + 2):data_offset], byteorder='big'), raw[data_offset:(endex - 1)]))
+            offset = endex
+
+        return parsed
+
     def to_bytestr(
         self,
         end: AnyBytes = b'\r\n',
@@ -740,47 +883,147 @@ class SrecRecord(BaseRecord):
             'end': end,
         }
 
-    def validate(
-        self,
-        checksum: bool = True,
-        count: bool = True,
-    ) -> Self:  # type: ignore Self
+    @classmethod
+    def try_parse(
+        cls,
+        line: ByteString,
+        validate: bool = True,
+    ) -> Tuple[Union[Self, None], Union[str, None]]:  # type: ignore Self
+        r"""Parses a record from a line, without raising exceptions.
 
-        super().validate(checksum=checksum, count=count)
-        address = self.address
+        Instead of matching a chain of regular expressions, the line is
+        decoded in a single pass: the leading run of hexadecimal digits is
+        measured at once, then each field is sliced at its fixed offset, as
+        given by the address size of the tag.
+        Any well-formed line of the reserved tag is rejected as such, before
+        checking its *count* and *checksum*.
 
-        # if self.after and not self.after.isspace():
-        #     raise ValueError('junk after')
+        Args:
+            line (bytes):
+                Line to parse.
 
-        if self.before and not self.before.isspace():
-            raise ValueError('junk before')
+            validate (bool):
+                Perform validation checks.
 
-        if self.checksum is not None:
-            if not 0 <= self.checksum <= 0xFF:
-                raise ValueError('checksum overflow')
+        Returns:
+            (record, reason): The parsed record and ``None``, or ``None`` and
+            the reason why `line` is invalid.
 
-        if self.count is not None:
-            if not 3 <= self.count <= 0xFF:
-                raise ValueError('count overflow')
+        See Also:
+            :meth:`parse`
+            :meth:`diagnose`
 
-        Tag = _cast(SrecTag, self.Tag)
-        tag = _cast(SrecTag, self.tag)
-        if tag == Tag.RESERVED:
-            raise ValueError('reserved tag')
+        Examples:
+            >>> from hexrec.formats.srec import SrecRecord
+            >>> record, reason = SrecRecord.try_parse(b'S1061234616263D0\r\n')
+            >>> reason
+            'wrong checksum'
+            >>> record, reason = SrecRecord.try_parse(b'S10612346162638D\r\n')
+            >>> record.address, record.data, reason
+            (4660, b'abc', None)
+        """
 
-        data_size = len(self.data)
+        if not isinstance(line, bytes):
+            line = bytes(line)
 
-        if not Tag.HEADER <= tag <= Tag.DATA_32:
-            if data_size:
-                raise ValueError('unexpected data')
+        start = len(line) - len(line.lstrip())
+        if line[start:(start + 1)] not in (b'S', b's'):
+            return None, 'syntax error'
+        start += 1
 
-        if data_size > tag.get_data_max():
-            raise ValueError('data size overflow')
+        body = line[start:]
+        digits = len(body) - len(body.lstrip(cls.HEX_DIGITS))
+        if digits < 3:
+            return None, 'syntax error'
 
-        if not 0 <= address <= tag.get_address_max():
-            raise ValueError('address overflow')
+        Tag = cls.Tag
+        tag = int(body[0:1], 16)
+        tag = Tag._value2member_map_.get(tag, tag)
+        if not isinstance(tag, Tag):
+            return None, f'{tag!r} is not a valid {Tag.__qualname__}'
+
+        data_offset = 3 + (tag.get_address_size() * 2)
+        if digits < data_offset + 2:
+            return None, 'syntax error'
+        checksum_offset = data_offset + ((digits - data_offset) & ~1) - 2
+        address = int(body[3:data_offset], 16) if data_offset > 3 else 0  # reserved tag
+
+        after_offset = checksum_offset + 2
+        endex = body.find(b'\n', after_offset)
+        if endex < 0:
+            endex = len(body)
+        cr = body.find(b'\r', after_offset, endex)
+        if cr >= 0:
+            endex = cr
+        if body[endex:] not in cls.LINE_ENDS:
+            return None, 'syntax error'
+
+        if validate and tag == Tag.RESERVED:
+            return None, 'reserved tag'  # before any layout dependent checks
 
-        return self
+        record = cls(tag,
+                     address=address,
+                     data=unhexlify(body[data_offset:checksum_offset]),
+                     count=int(body[1:3], 16),
+                     checksum=int(body[checksum_offset:(checksum_offset + 2)], 16),
+                     before=line[:(start - 1)],
+                     after=body[after_offset:endex],
+                     validate=False)
+
+        if validate:
+            reason = record.diagnose()
+            if reason:
+                return None, reason
+
+        return record, None
+
+
+class SrecParser(BaseParser):
+    r"""Motorola S-record push parser.
+
+    It tracks the *header* and *start address* while parsing, as per
+    :meth:`SrecFile.apply_records`.
+    """
+
+    def __init__(
+        self,
+        file_type: Type[BaseFile],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+    ):
+
+        super().__init__(file_type,
+                         ignore_errors=ignore_errors,
+                         ignore_after_termination=ignore_after_termination)
+
+        self.header: Union[ByteString, None] = None
+        r"""Parsed header byte string."""
+
+        self.startaddr: int = 0
+        r"""Parsed start address."""
+
+    def apply_record(self, record: BaseRecord) -> None:
+
+        tag = _cast(SrecTag, record.tag)
+
+        if tag.is_data():
+            data = record.data
+            self.memory.write(record.address, data)
+            if self.maxdatalen < len(data):
+                self.maxdatalen = len(data)
+
+        elif tag.is_start():
+            self.startaddr = record.address
+
+        elif tag.is_header():
+            self.header = record.data
+
+    def get_meta(self) -> MutableMapping[str, Any]:
+
+        meta = super().get_meta()
+        meta['header'] = self.header
+        meta['startaddr'] = self.startaddr
+        return meta
 
 
 if not __TYPING_HAS_SELF:  # pragma: no cover
@@ -791,6 +1034,9 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class SrecFile(BaseFile):
     r"""Motorola S-record file object."""
 
+    CONTENT_REGEX = re.compile(b'\\s*[Ss][0-9][0-9A-Fa-f]{6}')
+    r"""Content signature regex, matching a leading record."""
+
     FILE_EXT: Sequence[str] = [
         # https://en.wikipedia.org/wiki/SREC_(file_format)
         '.s19', '.s28', '.s37', '.s',
@@ -804,6 +1050,8 @@ class SrecFile(BaseFile):
         'startaddr',
     ]
 
+    Parser: Type[SrecParser] = SrecParser  # type: ignore override
+
     Record: Type[SrecRecord] = SrecRecord  # type: ignore override
 
     def __init__(self):
@@ -813,131 +1061,71 @@ class SrecFile(BaseFile):
         self._header: Union[ByteString, None] = b''
         self._startaddr: int = 0
 
-    def apply_records(self) -> Self:  # type: ignore Self
-
-        if not self._records:
-            raise ValueError('records required')
-
-        memory = Memory()
-        startaddr = 0
-        header = None
-
-        for record in self._records:
-            tag = _cast(SrecTag, record.tag)
-
-            if tag.is_data():
-                memory.write(record.address, record.data)
-
-            elif tag.is_start():
-                startaddr = record.address
-
-            elif tag.is_header():
-                header = record.data
+    def _iter_data_lines(
+        self,
+        data_tag: SrecTag,
+        end: AnyBytes = b'\r\n',
+        align: bool = False,
+    ) -> Iterator[Tuple[bytes, int]]:
+        r"""Iterates over serialized data lines, straight from memory.
 
-        self.discard_memory()
-        self._memory = memory
-        self._startaddr = startaddr
-        self._header = header
-        return self
+        It generates the same *data* lines as :meth:`update_records` followed
+        by :meth:`SrecRecord.to_bytestr` for each record, without creating any
+        records.
+        Each window of :meth:`_iter_chunk_windows` is encoded at once via
+        :func:`hexrec.utils.hexlify_lines`, so that a generated item may
+        hold several lines.
 
-    @property
-    def header(self) -> Union[ByteString, None]:
-        r"""bytes: Header byte string.
+        Args:
+            data_tag (:class:`SrecTag`):
+                *Data* record tag to use.
 
-        This property sets the file *header* byte string; ``None`` to disable.
+            end (bytes):
+                End of record termination bytes.
 
-        This is usually taken into account by :meth:`update_records` while
-        splitting :attr:`memory` into :attr:`records`.
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
 
-        Setting a different value triggers :meth:`discard_records`.
+        Returns:
+            iterator of (bytes, int): Serialized lines, with their count.
 
         Raises:
-            ValueError: data size overflow.
-
-        See Also:
-            :meth:`update_records`
-            :meth:`discard_records`
+            ValueError: :attr:`memory` attribute not populated.
 
         Examples:
             >>> from hexrec import SrecFile
-            >>> file = SrecFile()
-            >>> file.header
-            b''
-            >>> _ = file.print()
-            S0030000FC
-            S5030000FC
-            S9030000FC
-            >>> file.header = b'HDR\0'
-            >>> _ = file.print()
-            S0070000484452001A
-            S5030000FC
-            S9030000FC
-            >>> file.header = None
-            >>> _ = file.print()
-            S5030000FC
-            S9030000FC
+            >>> from hexrec.formats.srec import SrecTag
+            >>> file = SrecFile.from_blocks([(0x1234, b'abc')], maxdatalen=2)
+            >>> list(file._iter_data_lines(SrecTag.DATA_16, end=b'\n'))
+            [(b'S10512346162F1\n', 1), (b'S10412366350\n', 1)]
         """
 
         if self._memory is None:
-            self.apply_records()
-        return self._header
+            raise ValueError('memory instance required')
 
-    @header.setter
-    def header(self, header: Union[ByteString, None]) -> None:
+        address_size = data_tag.get_address_size()
+        address_max = data_tag.get_address_max()
+        data_max = data_tag.get_data_max()
+        prefix = b'S%X' % (data_tag & 0xF)
 
-        if header is not None:
-            size = len(header)
-            if size > self.Record.Tag.HEADER.get_data_max():
+        for window_start, window_view in self._iter_chunk_windows(align=align):
+            window_size = len(window_view)
+            size = min(window_size, self.maxdatalen)
+            if size > data_max:
                 raise ValueError('data size overflow')
 
-        if header != self._header:
-            self.discard_records()
-        self._header = header
-
-    @property
-    def startaddr(self) -> int:
-        r"""Start address.
-
-        This property sets the *start address* of the serialized record file.
-
-        This is usually taken into account by :meth:`update_records` while
-        splitting :attr:`memory` into :attr:`records`.
-
-        Setting a different value triggers :meth:`discard_records`.
-
-        Examples:
-            >>> from hexrec import SrecFile
-            >>> file = SrecFile()
-            >>> file.startaddr
-            0
-            >>> _ = file.print()
-            S0030000FC
-            S5030000FC
-            S9030000FC
-            >>> file.startaddr = 0x87654321
-            >>> _ = file.print()
-            S0030000FC
-            S5030000FC
-            S70587654321AA
-        """
-
-        if self._memory is None:
-            self.apply_records()
-        return self._startaddr
-
-    @startaddr.setter
-    def startaddr(self, address: int = 0) -> None:
-
-        address = address.__index__()
-        if not 0 <= address <= 0xFFFFFFFF:
-            raise ValueError('invalid start address')
+            if window_start + window_size - size > address_max:
+                raise ValueError('address overflow')
 
-        if self._startaddr != address:
-            self.discard_records()
-        self._startaddr = address
+            lines = hexlify_lines(window_view, size, address=window_start, address_size=address_size,
+                                  head=bytes((address_size + size + 1,)), checksum_size=1,
+                                  checksum_table=_CHECKSUM_TABLE, prefix=prefix, suffix=end)
+            window_view.release()
+            yield lines, window_size // size
 
-    def update_records(
+    def _iter_memory_lines(
         self,
+        end: AnyBytes = b'\r\n',
         align: bool = False,
         header: bool = True,
         data: bool = False,
@@ -945,8 +1133,1047 @@ class SrecFile(BaseFile):
         start: bool = True,
         data_tag: Union[SrecTag, None] = None,
         count_tag: Union[SrecTag, None] = None,
-    ) -> Self:  # type: ignore Self
-        r"""Applies memory and meta to records.
+    ) -> Iterator[bytes]:
+        r"""Iterates over serialized lines, straight from memory.
+
+        It generates the same lines as :meth:`update_records` followed by
+        :meth:`SrecRecord.to_bytestr` for each record, without creating any
+        records.
+
+        Args:
+            end (bytes):
+                End of record termination bytes.
+
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+            header (bool):
+                Generates the *header* record if :attr:`header`.
+
+            data (bool):
+                Requires at least one *data* record be present, even if empty.
+
+            count (bool):
+                Generates the *count* record.
+
+            start (bool):
+                Generates the *start address* record.
+
+            data_tag (:class:`SrecTag`):
+                Specific *data* record tag to use.
+
+            count_tag (:class:`SrecTag`):
+                Specific *count* record tag to use.
+
+        Returns:
+            iterator of bytes: Serialized lines.
+
+        Raises:
+            ValueError: :attr:`memory` attribute not populated.
+
+        See Also:
+            :meth:`_iter_data_lines`
+            :meth:`_iter_trailer_lines`
+
+        Examples:
+            >>> from hexrec import SrecFile
+            >>> file = SrecFile.from_blocks([(0x1234, b'abc')])
+            >>> list(file._iter_memory_lines(end=b'\n'))
+            [b'S0030000FC\n', b'S10612346162638D\n', b'S5030001FB\n', b'S9030000FC\n']
+        """
+
+        data_tag = self._resolve_data_tag(data_tag)
+
+        if header and self._header is not None:
+            record = self.Record.create_header(self._header)
+            yield record.to_bytestr(end=end)
+
+        data_record_count = 0
+        for lines, line_count in self._iter_data_lines(data_tag, end=end, align=align):
+            yield lines
+            data_record_count += line_count
+
+        yield from self._iter_trailer_lines(data_record_count, data_tag, end=end,
+                                            data=data, count=count, start=start, count_tag=count_tag)
+
+    def _iter_stream_lines(
+        self,
+        windows: Iterable[Memory],
+        end: AnyBytes = b'\r\n',
+        align: bool = False,
+        header: bool = True,
+        data: bool = False,
+        count: bool = True,
+        start: bool = True,
+        data_tag: Union[SrecTag, None] = None,
+        count_tag: Union[SrecTag, None] = None,
+    ) -> Iterator[bytes]:
+        r"""Iterates over serialized lines of streamed memory windows.
+
+        It generates the same lines as :meth:`_iter_memory_lines`, as if
+        :attr:`memory` held just the data of all the `windows`.
+        Each window is encoded via :meth:`_iter_data_lines` as soon as it is
+        available, counting the *data* records for the trailer lines, which
+        follow the last window with the final *meta*.
+
+        As the whole address range is unknown in advance, an automatic
+        `data_tag` is resolved by the first window, then checked against the
+        last one.
+
+        Args:
+            windows (iterable of :class:`bytesparse.Memory`):
+                Memory windows, in address order.
+
+            end (bytes):
+                End of record termination bytes.
+
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+            header (bool):
+                Generates the *header* record if :attr:`header`.
+
+            data (bool):
+                Requires at least one *data* record be present, even if empty.
+
+            count (bool):
+                Generates the *count* record.
+
+            start (bool):
+                Generates the *start address* record.
+
+            data_tag (:class:`SrecTag`):
+                Specific *data* record tag to use.
+
+            count_tag (:class:`SrecTag`):
+                Specific *count* record tag to use.
+
+        Returns:
+            iterator of bytes: Serialized lines.
+
+        Raises:
+            ValueError: Automatic `data_tag` not fitting the last window.
+
+        See Also:
+            :func:`hexrec.base.convert_stream`
+            :meth:`_iter_data_lines`
+            :meth:`_iter_trailer_lines`
+
+        Examples:
+            >>> from hexrec import SrecFile
+            >>> from bytesparse import Memory
+            >>> windows = [Memory.from_bytes(b'abc', offset=0x1234),
+            ...            Memory.from_bytes(b'xyz', offset=0x1237)]
+            >>> file = SrecFile.from_memory(maxdatalen=3)
+            >>> list(file._iter_stream_lines(windows, end=b'\n'))  # doctest:+NORMALIZE_WHITESPACE
+            [b'S0030000FC\n', b'S10612346162638D\n', b'S106123778797A45\n',
+             b'S5030002FA\n', b'S9030000FC\n']
+        """
+
+        backup = self._memory
+        resolved_tag = None
+        data_record_count = 0
+        try:
+            for window in windows:
+                self._memory = window
+
+                if resolved_tag is None:
+                    resolved_tag = self._resolve_data_tag(data_tag)
+                    if header and self._header is not None:
+                        yield self.Record.create_header(self._header).to_bytestr(end=end)
+
+                for lines, line_count in self._iter_data_lines(resolved_tag, end=end, align=align):
+                    yield lines
+                    data_record_count += line_count
+
+            if resolved_tag is None:
+                self._memory = Memory()
+                resolved_tag = self._resolve_data_tag(data_tag)
+                if header and self._header is not None:
+                    yield self.Record.create_header(self._header).to_bytestr(end=end)
+
+            elif data_tag is None and self._resolve_data_tag() != resolved_tag:
+                raise ValueError('data tag changed')
+        finally:
+            self._memory = backup
+
+        yield from self._iter_trailer_lines(data_record_count, resolved_tag, end=end,
+                                            data=data, count=count, start=start, count_tag=count_tag)
+
+    def _iter_trailer_lines(
+        self,
+        data_record_count: int,
+        data_tag: SrecTag,
+        end: AnyBytes = b'\r\n',
+        data: bool = False,
+        count: bool = True,
+        start: bool = True,
+        count_tag: Union[SrecTag, None] = None,
+    ) -> Iterator[bytes]:
+        r"""Iterates over serialized trailer lines.
+
+        It generates the same lines following the *data* ones as
+        :meth:`update_records` followed by :meth:`SrecRecord.to_bytestr` for
+        each record.
+
+        Args:
+            data_record_count (int):
+                Number of *data* records.
+
+            data_tag (:class:`SrecTag`):
+                *Data* record tag, matched by the *start address* record tag.
+
+            end (bytes):
+                End of record termination bytes.
+
+            data (bool):
+                Requires at least one *data* record be present, even if empty.
+
+            count (bool):
+                Generates the *count* record.
+
+            start (bool):
+                Generates the *start address* record.
+
+            count_tag (:class:`SrecTag`):
+                Specific *count* record tag to use.
+
+        Returns:
+            iterator of bytes: Serialized lines.
+
+        Examples:
+            >>> from hexrec import SrecFile
+            >>> from hexrec.formats.srec import SrecTag
+            >>> file = SrecFile()
+            >>> list(file._iter_trailer_lines(3, SrecTag.DATA_16, end=b'\n'))
+            [b'S5030003F9\n', b'S9030000FC\n']
+        """
+
+        Record = self.Record
+        Tag = Record.Tag
+
+        if data and not data_record_count:
+            record = Record.create_data(0, b'', tag=data_tag)
+            yield record.to_bytestr(end=end)
+            data_record_count += 1
+
+        if count:
+            if count_tag is None:
+                count_tag = Tag.fit_count_tag(data_record_count)
+            record = Record.create_count(data_record_count, tag=count_tag)
+            yield record.to_bytestr(end=end)
+
+        start_tag = data_tag.get_tag_match()
+        address = self._startaddr if start else 0
+        record = Record.create_start(address, tag=start_tag)
+        yield record.to_bytestr(end=end)
+
+    @classmethod
+    def _merge_memory_shards(cls, shards: Iterable[tuple]) -> Self:  # type: ignore Self
+        r"""Merges parsed memory shards.
+
+        It merges the outcomes of :meth:`_parse_memory_shard`, in buffer
+        order, into a file object in *memory role*.
+        Merging stops at the shard holding the *start address* record.
+
+        Args:
+            shards (list of tuple):
+                Outcomes of :meth:`_parse_memory_shard`.
+
+        Returns:
+            :class:`SrecFile`: The created file object.
+
+        Raises:
+            ValueError: No valid records, as per :meth:`apply_records`.
+
+        See Also:
+            :meth:`_parse_memory_shard`
+        """
+
+        memory = None
+        header = None
+        startaddr = 0
+        maxdatalen = 0
+        parsed = 0
+
+        for shard_memory, shard_header, shard_startaddr, shard_maxdatalen, shard_parsed, terminated in shards:
+            if memory is None:
+                memory = shard_memory
+            else:
+                memory.write(0, shard_memory)
+
+            if shard_header is not None:
+                header = shard_header
+            if shard_startaddr is not None:
+                startaddr = shard_startaddr
+            if maxdatalen < shard_maxdatalen:
+                maxdatalen = shard_maxdatalen
+            parsed += shard_parsed
+            if terminated:
+                break
+
+        if not parsed:
+            raise ValueError('records required')
+
+        file = cls.from_memory(memory,
+                               header=header,
+                               maxdatalen=(maxdatalen or cls.DEFAULT_DATALEN),
+                               startaddr=startaddr)
+        return file
+
+    @classmethod
+    def _parse_memory_shard(
+        cls,
+        buffer: AnyBytes,
+        index: int = 0,
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> tuple:
+        r"""Parses a buffer shard into memory.
+
+        It decodes each line of the shard `buffer` via
+        :meth:`_iter_parsed_fields`, writing *data* straight into memory,
+        without creating any records.
+        Contiguous *data* records are joined into a single memory write, via
+        :class:`ChunkWriter`.
+
+        As each record holds its full address, a shard does not depend on the
+        previous ones.
+
+        Args:
+            buffer (bytes):
+                Byte buffer shard, starting at a line boundary.
+
+            index (int):
+                Shard index; zero for the first shard.
+
+            ignore_errors (bool):
+                Ignore invalid lines.
+
+            ignore_after_termination (bool):
+                Ignore anything after the *start address* record.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            tuple: Shard *memory*, last header (``None`` if not stated), start
+            address (``None`` if not stated), maximum data size, number of
+            valid records, and *start address* termination.
+
+        Raises:
+            ValueError: Invalid record.
+
+        See Also:
+            :meth:`_merge_memory_shards`
+            :meth:`_iter_parsed_fields`
+            :class:`ChunkWriter`
+        """
+
+        memory = Memory()
+        writer = ChunkWriter(memory)
+        startaddr = None
+        header = None
+        parsed = 0
+        terminated = False
+
+        for tag, address, data in cls._iter_parsed_fields(buffer, ignore_errors, ignore_after_termination,
+                                                          diagnostics):
+            tag = _cast(SrecTag, tag)
+            parsed += 1
+
+            if tag.is_data():
+                writer.write(address, data)
+
+            elif tag.is_header():
+                header = data
+
+            elif tag.is_start():
+                startaddr = address
+                terminated = ignore_after_termination
+
+        writer.flush()
+
+        return memory, header, startaddr, writer.maxdatalen, parsed, terminated
+
+    def _resolve_data_tag(self, data_tag: Union[SrecTag, None] = None) -> SrecTag:
+        r"""Resolves the data record tag.
+
+        Args:
+            data_tag (:class:`SrecTag`):
+                Specific *data* record tag to use.
+                If ``None``, the smallest one fitting the :attr:`memory`
+                addresses (or :attr:`startaddr` if empty).
+
+        Returns:
+            :class:`SrecTag`: *Data* record tag.
+
+        Raises:
+            ValueError: :attr:`memory` attribute not populated.
+            ValueError: invalid data tag.
+
+        Examples:
+            >>> from hexrec import SrecFile
+            >>> file = SrecFile.from_blocks([(0x12345, b'abc')])
+            >>> file._resolve_data_tag()
+            <SrecTag.DATA_24: 2>
+        """
+
+        memory = self._memory
+        if memory is None:
+            raise ValueError('memory instance required')
+
+        if data_tag is None:
+            address_max = max(0, memory.endin) if memory else self.startaddr
+            data_tag = self.Record.Tag.fit_data_tag(address_max)
+        elif not SrecTag.DATA_16 <= data_tag <= SrecTag.DATA_32:
+            raise ValueError('invalid data tag')
+        return data_tag
+
+    @classmethod
+    def _serialize_memory_shard(
+        cls,
+        memory: Memory,
+        index: int,
+        previous: Union[int, None],
+        meta: Mapping[str, Any],
+        data_tag: SrecTag,
+        end: AnyBytes = b'\r\n',
+        align: bool = False,
+    ) -> Tuple[bytes, int]:
+        r"""Serializes a memory shard.
+
+        It encodes the *data* lines of a memory shard via
+        :meth:`_iter_data_lines`.
+
+        Args:
+            memory (:class:`bytesparse.Memory`):
+                Memory shard.
+
+            index (int):
+                Shard index; zero for the first shard.
+
+            previous (int):
+                Start address of the last chunk preceding the shard, or
+                ``None`` for the first shard.
+
+            meta (dict):
+                File *meta*.
+
+            data_tag (:class:`SrecTag`):
+                *Data* record tag to use.
+
+            end (bytes):
+                End of record termination bytes.
+
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+        Returns:
+            (bytes, int): Serialized lines, with their count.
+
+        See Also:
+            :meth:`serialize_parallel`
+        """
+
+        file = cls.from_memory(memory, **meta)
+        chunks = []
+        data_record_count = 0
+        for lines, line_count in file._iter_data_lines(data_tag, end=end, align=align):
+            chunks.append(lines)
+            data_record_count += line_count
+        return b''.join(chunks), data_record_count
+
+    def apply_records(self) -> Self:  # type: ignore Self
+
+        if not self._records:
+            raise ValueError('records required')
+
+        memory = Memory()
+        startaddr = 0
+        header = None
+
+        for tag, address, data in self._iter_record_fields(self._records):
+            tag = _cast(SrecTag, tag)
+
+            if tag.is_data():
+                memory.write(address, data)
+
+            elif tag.is_start():
+                startaddr = address
+
+            elif tag.is_header():
+                header = data
+
+        self.discard_memory()
+        self._memory = memory
+        self._startaddr = startaddr
+        self._header = header
+        return self
+
+    @property
+    def header(self) -> Union[ByteString, None]:
+        r"""bytes: Header byte string.
+
+        This property sets the file *header* byte string; ``None`` to disable.
+
+        This is usually taken into account by :meth:`update_records` while
+        splitting :attr:`memory` into :attr:`records`.
+
+        Setting a different value triggers :meth:`discard_records`.
+
+        Raises:
+            ValueError: data size overflow.
+
+        See Also:
+            :meth:`update_records`
+            :meth:`discard_records`
+
+        Examples:
+            >>> from hexrec import SrecFile
+            >>> file = SrecFile()
+            >>> file.header
+            b''
+            >>> _ = file.print()
+            S0030000FC
+            S5030000FC
+            S9030000FC
+            >>> file.header = b'HDR\0'
+            >>> _ = file.print()
+            S0070000484452001A
+            S5030000FC
+            S9030000FC
+            >>> file.header = None
+            >>> _ = file.print()
+            S5030000FC
+            S9030000FC
+        """
+
+        if self._memory is None:
+            self.apply_records()
+        return self._header
+
+    @header.setter
+    def header(self, header: Union[ByteString, None]) -> None:
+
+        if header is not None:
+            size = len(header)
+            if size > self.Record.Tag.HEADER.get_data_max():
+                raise ValueError('data size overflow')
+
+        if header != self._header:
+            self.discard_records()
+        self._header = header
+
+    @classmethod
+    def parse_memory(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Parses a byte stream directly into memory.
+
+        It decodes each line via :meth:`SrecRecord.parse_fields`, writing
+        each record straight into :attr:`memory` and *meta*, without creating
+        any :attr:`records`.
+        Contiguous *data* records are joined into a single memory write.
+
+        The accepted syntax is the same as :meth:`parse`, as well as the
+        resulting :attr:`memory` and *meta*, and the reported errors.
+        The created file object is in *memory role*, so :attr:`records` are
+        generated from scratch by :meth:`update_records` upon request.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore invalid lines.
+
+            ignore_after_termination (bool):
+                Ignore anything after the *start address* record.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            :class:`SrecFile`: The created file object.
+
+        Raises:
+            ValueError: Invalid record.
+
+        See Also:
+            :meth:`parse`
+            :meth:`parse_parallel`
+            :meth:`SrecRecord.parse_fields`
+
+        Examples:
+            >>> from hexrec import SrecFile
+            >>> buffer = b'''
+            ...     S0030000FC
+            ...     S106DA7A6162637F
+            ...     S106DA7D78797A37
+            ...     S5030002FA
+            ...     S9030000FC
+            ... '''
+            >>> file = SrecFile.parse_memory(buffer)
+            >>> file.memory.to_blocks()
+            [(55930, b'abcxyz')]
+            >>> file.get_meta()
+            {'header': b'', 'maxdatalen': 3, 'startaddr': 0}
+        """
+
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            buffer = stream
+        else:
+            buffer = stream.read()
+
+        shard = cls._parse_memory_shard(buffer, 0, ignore_errors, ignore_after_termination, diagnostics)
+        file = cls._merge_memory_shards([shard])
+        return file
+
+    @classmethod
+    def parse_parallel(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        workers: Union[int, None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Parses a byte stream into memory, in parallel.
+
+        It splits the incoming `stream` into shards at line boundaries, each
+        one parsed by :meth:`_parse_memory_shard` within a separate worker
+        process.
+        The partial memories are then merged in order by
+        :meth:`_merge_memory_shards`.
+
+        The accepted syntax is the same as :meth:`parse_memory`, as well as
+        the resulting :attr:`memory` and *meta*.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore invalid lines.
+
+            ignore_after_termination (bool):
+                Ignore anything after the *start address* record.
+
+            workers (int):
+                Maximum number of worker processes.
+                If ``None``, as many as :func:`os.cpu_count`.
+
+        Returns:
+            :class:`SrecFile`: The created file object.
+
+        Raises:
+            ValueError: Invalid record.
+
+        See Also:
+            :meth:`parse_memory`
+            :attr:`SHARD_SIZE_MIN`
+
+        Examples:
+            >>> from hexrec import SrecFile
+            >>> buffer = b'''
+            ...     S0030000FC
+            ...     S106DA7A6162637F
+            ...     S106DA7D78797A37
+            ...     S5030002FA
+            ...     S9030000FC
+            ... '''
+            >>> file = SrecFile.parse_parallel(buffer, workers=4)
+            >>> file.memory.to_blocks()
+            [(55930, b'abcxyz')]
+            >>> file.get_meta()
+            {'header': b'', 'maxdatalen': 3, 'startaddr': 0}
+        """
+
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            buffer = stream
+        else:
+            buffer = stream.read()
+
+        shards = cls._map_buffer_shards(cls._parse_memory_shard, buffer, workers,
+                                        ignore_errors, ignore_after_termination)
+        file = cls._merge_memory_shards(shards)
+        return file
+
+    @classmethod
+    def parse_validated(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_after_termination: bool = True,
+        header_required: bool = False,
+        header_first: bool = True,
+        data_ordering: bool = False,
+        data_uniform: bool = True,
+        count_required: bool = False,
+        count_penultimate: bool = True,
+        start_last: bool = True,
+        start_within_data: bool = False,
+    ) -> Self:  # type: ignore Self
+        r"""Parses and validates a byte stream directly into memory.
+
+        It validates each record parsed from the `stream`, checks the record
+        sequence as per :meth:`validate_records`, and writes each record into
+        :attr:`memory` and *meta*, all within the same single pass.
+        The *header*, *data* count and tag, and *start address* are tracked
+        once for both the checks and the memory writes.
+        Contiguous *data* records are joined into a single memory write.
+
+        The resulting :attr:`memory` and *meta* are the same as per
+        :meth:`parse` followed by :meth:`validate_records` and
+        :meth:`apply_records`.
+        The first invalid record or sequence found along the `stream` raises
+        the exception.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_after_termination (bool):
+                Ignore anything after the *start address* record.
+
+            header_required (bool):
+                Requires the *header* record be present.
+
+            header_first (bool):
+                Requires the *header* record be the first of the sequence.
+
+            data_ordering (bool):
+                Checks that the *data* record sequence has monotonically
+                increasing addresses, without any overlapping.
+
+            data_uniform (bool):
+                Requires *data* records have the same tag.
+
+            count_required (bool):
+                Requires the *count* record be present.
+
+            count_penultimate (bool):
+                Requires the *start address* record be the penultimate one.
+
+            start_last (bool):
+                Requires the *start address* record be the last of the sequence.
+
+            start_within_data (bool):
+                Requires *start address* fall within data carried by some
+                *data* record.
+
+        Returns:
+            :class:`SrecFile`: The created file object.
+
+        Raises:
+            ValueError: Invalid record or record sequence.
+
+        See Also:
+            :meth:`parse`
+            :meth:`validate_records`
+            :meth:`apply_records`
+
+        Examples:
+            >>> from hexrec import SrecFile
+            >>> buffer = b'''
+            ...     S0030000FC
+            ...     S106DA7A6162637F
+            ...     S106DA7D78797A37
+            ...     S5030002FA
+            ...     S9030000FC
+            ... '''
+            >>> file = SrecFile.parse_validated(buffer, count_required=True)
+            >>> file.memory.to_blocks()
+            [(55930, b'abcxyz')]
+            >>> file.get_meta()
+            {'header': b'', 'maxdatalen': 3, 'startaddr': 0}
+            >>> SrecFile.parse_validated(buffer, start_within_data=True)
+            Traceback (most recent call last):
+                ...
+            ValueError: no data at start address
+        """
+
+        memory = Memory()
+        header = None
+        startaddr = 0
+        maxdatalen = 0
+        last_data_endex = 0
+        data_tag_sample = None
+        data_count = 0
+        header_index = None
+        count_index = None
+        start_record = None
+        chunk_start = 0
+        chunk_endex = 0
+        chunk = bytearray()
+        index = -1
+
+        records = cls._iter_parsed_records(stream, ignore_after_termination=ignore_after_termination)
+
+        for index, record in enumerate(records):
+            if start_last and start_record is not None:
+                raise ValueError('start record not last')
+
+            if count_penultimate and count_index is not None and count_index < index - 1:
+                raise ValueError('count record not penultimate')
+
+            tag = _cast(SrecTag, record.tag)
+
+            if tag.is_data():
+                data_count += 1
+
+                if data_uniform:
+                    if data_tag_sample is None:
+                        data_tag_sample = tag
+                    elif tag != data_tag_sample:
+                        raise ValueError('data record tags not uniform')
+
+                address = record.address
+                data = record.data
+                size = len(data)
+                if data_ordering:
+                    if address < last_data_endex:
+                        raise ValueError('unordered data record')
+                    last_data_endex = address + size
+
+                if address != chunk_endex:
+                    if chunk:
+                        memory.write(chunk_start, chunk)
+                    chunk_start = address
+                    chunk = bytearray()
+                chunk += data
+                chunk_endex = address + size
+                if maxdatalen < size:
+                    maxdatalen = size
+
+            elif tag.is_count():
+                if count_index is not None:
+                    raise ValueError('multiple count records')
+                count_index = index
+
+                if record.address != data_count:
+                    raise ValueError('wrong data record count')
+
+            elif tag.is_start():
+                if start_record is not None:
+                    raise ValueError('multiple start records')
+                start_record = record
+                startaddr = record.address
+
+            else:  # elif tag.is_header():
+                if header_first:
+                    if index != 0:
+                        raise ValueError('header record not first')
+                header_index = index
+                header = record.data
+
+        if count_penultimate and count_index is not None and count_index != index - 1:
+            raise ValueError('count record not penultimate')
+
+        if header_required:
+            if header_index is None:
+                raise ValueError('missing header record')
+
+        if count_required:
+            if count_index is None:
+                raise ValueError('missing count record')
+
+        if start_record is None:
+            raise ValueError('missing start record')
+
+        if chunk:
+            memory.write(chunk_start, chunk)
+
+        if start_within_data:
+            start_datum = memory.peek(startaddr)
+            if start_datum is None:
+                raise ValueError('no data at start address')
+
+        if data_uniform:
+            assert data_tag_sample is not None
+            if start_record.tag != data_tag_sample.get_tag_match():
+                raise ValueError('start record tag not uniform')
+
+        file = cls.from_memory(memory,
+                               header=header,
+                               maxdatalen=(maxdatalen or cls.DEFAULT_DATALEN),
+                               startaddr=startaddr)
+        return file
+
+    def serialize_parallel(
+        self,
+        stream: IO,
+        end: AnyBytes = b'\r\n',
+        align: bool = False,
+        header: bool = True,
+        data: bool = False,
+        count: bool = True,
+        start: bool = True,
+        data_tag: Union[SrecTag, None] = None,
+        count_tag: Union[SrecTag, None] = None,
+        workers: Union[int, None] = None,
+        buffer_size: Union[int, None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Serializes memory onto a byte stream, in parallel.
+
+        It splits the :attr:`memory` into shards at chunk boundaries, each one
+        encoded by :meth:`_serialize_memory_shard` within a separate worker
+        process.
+        The encoded shards are then written in order, between the *header*
+        record and the *count* and *start address* records, generated once.
+
+        The written bytes are the same as per :meth:`serialize`.
+
+        While in *records role*, it calls :meth:`serialize` instead.
+
+        Args:
+            stream (bytes IO):
+                Stream to serialize onto.
+
+            end (bytes):
+                End of record termination bytes.
+
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+                Ignored in *records role*.
+
+            header (bool):
+                Generates the *header* record if :attr:`header`.
+                Ignored in *records role*.
+
+            data (bool):
+                Requires at least one *data* record be present, even if empty.
+                Ignored in *records role*.
+
+            count (bool):
+                Generates the *count* record.
+                Ignored in *records role*.
+
+            start (bool):
+                Generates the *start address* record.
+                Ignored in *records role*.
+
+            data_tag (:class:`SrecTag`):
+                Specific *data* record tag to use.
+                Ignored in *records role*.
+
+            count_tag (:class:`SrecTag`):
+                Specific *count* record tag to use.
+                Ignored in *records role*.
+
+            workers (int):
+                Maximum number of worker processes.
+                If ``None``, as many as :func:`os.cpu_count`.
+
+            buffer_size (int):
+                Size of the :class:`BatchWriter` buffer, in bytes.
+                If zero, each shard is written straight onto `stream`.
+                If ``None``, :attr:`STREAM_CHUNK_SIZE` is used.
+
+        Returns:
+            :class:`SrecFile`: *self*.
+
+        Raises:
+            ValueError: Invalid address, data size, or tag.
+
+        See Also:
+            :meth:`serialize`
+            :meth:`_serialize_memory_shard`
+            :attr:`SHARD_SIZE_MIN`
+
+        Examples:
+            >>> from hexrec import SrecFile
+            >>> file = SrecFile.from_blocks([(0x1234, b'abc')], startaddr=0xCAFE)
+            >>> import io
+            >>> stream = io.BytesIO()
+            >>> _ = file.serialize_parallel(stream, end=b'\n', workers=4)
+            >>> stream.getvalue()
+            b'S0030000FC\nS10612346162638D\nS5030001FB\nS903CAFE34\n'
+        """
+
+        if self._records is not None:
+            return self.serialize(stream, end=end, buffer_size=buffer_size)
+
+        if buffer_size is None:
+            buffer_size = self.STREAM_CHUNK_SIZE
+
+        data_tag = self._resolve_data_tag(data_tag)
+        shards = self._map_memory_shards(self._serialize_memory_shard, workers, align,
+                                         self.get_meta(), data_tag, end, align)
+
+        with BatchWriter(stream, buffer_size) as writer:
+            if header and self._header is not None:
+                record = self.Record.create_header(self._header)
+                writer.write(record.to_bytestr(end=end))
+
+            data_record_count = 0
+            for lines, line_count in shards:
+                writer.write(lines)
+                data_record_count += line_count
+
+            writer.writelines(self._iter_trailer_lines(data_record_count, data_tag, end=end, data=data,
+                                                       count=count, start=start, count_tag=count_tag))
+        return self
+
+    @property
+    def startaddr(self) -> int:
+        r"""Start address.
+
+        This property sets the *start address* of the serialized record file.
+
+        This is usually taken into account by :meth:`update_records` while
+        splitting :attr:`memory` into :attr:`records`.
+
+        Setting a different value triggers :meth:`discard_records`.
+
+        Examples:
+            >>> from hexrec import SrecFile
+            >>> file = SrecFile()
+            >>> file.startaddr
+            0
+            >>> _ = file.print()
+            S0030000FC
+            S5030000FC
+            S9030000FC
+            >>> file.startaddr = 0x87654321
+            >>> _ = file.print()
+            S0030000FC
+            S5030000FC
+            S70587654321AA
+        """
+
+        if self._memory is None:
+            self.apply_records()
+        return self._startaddr
+
+    @startaddr.setter
+    def startaddr(self, address: int = 0) -> None:
+
+        address = address.__index__()
+        if not 0 <= address <= 0xFFFFFFFF:
+            raise ValueError('invalid start address')
+
+        if self._startaddr != address:
+            self.discard_records()
+        self._startaddr = address
+
+    def update_records(
+        self,
+        align: bool = False,
+        header: bool = True,
+        data: bool = False,
+        count: bool = True,
+        start: bool = True,
+        data_tag: Union[SrecTag, None] = None,
+        count_tag: Union[SrecTag, None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Applies memory and meta to records.
 
         This method processes the stored :attr:`memory` and *meta* information
         to generate the sequence of :attr:`records`.
@@ -1019,7 +2246,15 @@ class SrecFile(BaseFile):
         if data_tag is None:
             address_max = max(0, memory.endin) if memory else self.startaddr
             data_tag = Tag.fit_data_tag(address_max)
+        elif not Tag.DATA_16 <= data_tag <= Tag.DATA_32:
+            raise ValueError('invalid data tag')
+        address_max = data_tag.get_address_max()
+        data_max = data_tag.get_data_max()
+        key = (align, header, data, count, start, data_tag, count_tag, self.maxdatalen)
+        reusable = self._get_reusable_records(key)
+        data_records = {}
         chunk_views = []
+        created = []
         data_record_count = 0
         try:
             if header and self._header is not None:
@@ -1028,11 +2263,21 @@ class SrecFile(BaseFile):
 
             for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
                 chunk_views.append(chunk_view)
-                chunk_data = bytes(chunk_view)
-                record = Record.create_data(chunk_start, chunk_data, tag=data_tag)
+                record = reusable.get(chunk_start)
+                if record is None or record.data != chunk_view:
+                    if not 0 <= chunk_start <= address_max:
+                        raise ValueError('address overflow')
+                    if len(chunk_view) > data_max:
+                        raise ValueError('data size overflow')
+                    chunk_data = bytes(chunk_view)
+                    record = Record._create_trusted(data_tag, chunk_start, chunk_data)
+                    created.append(record.update_count())
+                data_records[chunk_start] = record
                 records.append(record)
                 data_record_count += 1
 
+            Record.update_checksums(created)
+
             if data and not data_record_count:
                 record = Record.create_data(0, b'', tag=data_tag)
                 records.append(record)
@@ -1054,8 +2299,7 @@ class SrecFile(BaseFile):
             for chunk_view in chunk_views:
                 chunk_view.release()
 
-        self.discard_records()
-        self._records = records
+        self._set_updated_records(records, data_records, key)
         return self
 
     def validate_records(
@@ -1127,8 +2371,8 @@ class SrecFile(BaseFile):
         data_tag_sample = None
         data_count = 0
 
-        for index, record in enumerate(records):
-            record.validate()
+        for index, (record, verified) in enumerate(self._iter_verified_records(records)):
+            record.validate(checksum=(not verified))
             tag = _cast(SrecTag, record.tag)
 
             if tag.is_data():
@@ -1186,7 +2430,7 @@ class SrecFile(BaseFile):
 
         if start_within_data:
             startaddr = start_record.address
-            start_datum = self.memory.peek(startaddr)
+            start_datum = self._get_memory().peek(startaddr)
             if start_datum is None:
                 raise ValueError('no data at start address')
 
@@ -33,15 +33,21 @@ import enum
 import re
 from typing import IO
 from typing import Any
+from typing import Iterator
+from typing import List
 from typing import Mapping
 from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union  # NOTE: type | operator unsupported for Python < 3.10
 from typing import cast as _cast
 
+from bytesparse import Memory
+
 from ..base import AnyBytes
 from ..base import BaseFile
+from ..base import BaseParser
 from ..base import BaseRecord
 from ..base import BaseTag
 from ..base import ByteString
@@ -126,6 +132,8 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class TiTxtRecord(BaseRecord):
     r"""Texas Instruments TI-TXT record object."""
 
+    __slots__ = ()
+
     Tag: Type[TiTxtTag] = TiTxtTag  # type: ignore override
 
     LINE_REGEX = re.compile(
@@ -229,6 +237,40 @@ class TiTxtRecord(BaseRecord):
         record = cls(cls.Tag.EOF)
         return record
 
+    def diagnose(
+        self,
+        checksum: bool = True,
+        count: bool = True,
+    ) -> Union[str, None]:
+
+        reason = super().diagnose(checksum=checksum, count=count)
+        if reason:
+            return reason
+
+        Tag = self.Tag
+        tag = self.tag
+
+        if self.after and not self.after.isspace():
+            return 'junk after'
+
+        if self.before and not self.before.isspace():
+            return 'junk before'
+
+        if count:
+            if self.count is None:
+                if tag == Tag.ADDRESS:
+                    return 'count required'
+            else:
+                addrstr = b'%X' % self.address
+                if self.count < len(addrstr):
+                    return 'count overflow'
+
+        if self.data:
+            if tag != Tag.DATA:
+                return 'unexpected data'
+
+        return None
+
     @classmethod
     def parse(  # type: ignore kwargs order
         cls,
@@ -268,40 +310,31 @@ class TiTxtRecord(BaseRecord):
             ValueError: syntax error
         """
 
-        match = cls.LINE_REGEX.match(line)
-        if not match:
-            raise ValueError('syntax error')
+        record, reason = cls.try_parse(line, address=address, validate=validate)
+        if reason:
+            raise ValueError(reason)
+        return record
 
-        coords = match.span()
-        groups = match.groupdict()
-        groups_address = groups['address']
-        groups_eof = groups['eof']
-        groups_data = groups['data'] or b''
+    @classmethod
+    def parse_fields(
+        cls,
+        line: ByteString,
+    ) -> Union[Tuple[TiTxtTag, int, ByteString], None]:
+
+        match = cls.LINE_REGEX.match(line)
+        if match is None:
+            return None
 
         Tag = cls.Tag
-        count = None
-        data = b''
+        groups_data = match.group('data')
+        if groups_data:
+            return Tag.DATA, 0, unhexlify(groups_data.translate(None, delete=b' \t'))
 
+        groups_address = match.group('address')
         if groups_address:
-            tag = Tag.ADDRESS
-            address = int(groups_address, 16)
-            count = len(groups_address)
+            return Tag.ADDRESS, int(groups_address, 16), b''
 
-        elif groups_eof:
-            tag = Tag.EOF
-
-        else:
-            tag = Tag.DATA
-            data = groups_data.translate(None, delete=b' \t')
-            data = unhexlify(data)
-
-        record = cls(tag,
-                     address=address,
-                     data=data,
-                     count=count,
-                     coords=coords,
-                     validate=validate)
-        return record
+        return Tag.EOF, 0, b''
 
     def to_bytestr(
         self,
@@ -387,36 +420,91 @@ class TiTxtRecord(BaseRecord):
             'end': end,
         }
 
-    def validate(
+    @classmethod
+    def try_parse(  # type: ignore kwargs order
+        cls,
+        line: ByteString,
+        address: int = 0,
+        validate: bool = True,
+    ) -> Tuple[Union[Self, None], Union[str, None]]:  # type: ignore Self
+
+        match = cls.LINE_REGEX.match(line)
+        if not match:
+            return None, 'syntax error'
+
+        coords = match.span()
+        groups = match.groupdict()
+        groups_address = groups['address']
+        groups_eof = groups['eof']
+        groups_data = groups['data'] or b''
+
+        Tag = cls.Tag
+        count = None
+        data = b''
+
+        if groups_address:
+            tag = Tag.ADDRESS
+            address = int(groups_address, 16)
+            count = len(groups_address)
+
+        elif groups_eof:
+            tag = Tag.EOF
+
+        else:
+            tag = Tag.DATA
+            data = groups_data.translate(None, delete=b' \t')
+            data = unhexlify(data)
+
+        record = cls(tag,
+                     address=address,
+                     data=data,
+                     count=count,
+                     coords=coords,
+                     validate=False)
+
+        if validate:
+            reason = record.diagnose(checksum=(count is not None), count=(count is not None))
+            if reason:
+                return None, reason
+
+        return record, None
+
+
+class TiTxtParser(BaseParser):
+    r"""Texas Instruments TI-TXT push parser.
+
+    It tracks the current address while parsing, assigning it to each parsed
+    *data* record, as per :meth:`TiTxtFile.parse`.
+    """
+
+    def __init__(
         self,
-        checksum: bool = True,
-        count: bool = True,
-    ) -> Self:  # type: ignore Self
+        file_type: Type[BaseFile],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+    ):
 
-        super().validate(checksum=checksum, count=count)
-        Tag = self.Tag
-        tag = self.tag
+        super().__init__(file_type,
+                         ignore_errors=ignore_errors,
+                         ignore_after_termination=ignore_after_termination)
 
-        if self.after and not self.after.isspace():
-            raise ValueError('junk after')
+        self.address: int = 0
+        r"""Current address."""
 
-        if self.before and not self.before.isspace():
-            raise ValueError('junk before')
+    def apply_record(self, record: BaseRecord) -> None:
 
-        if count:
-            if self.count is None:
-                if tag == Tag.ADDRESS:
-                    raise ValueError('count required')
-            else:
-                addrstr = b'%X' % self.address
-                if self.count < len(addrstr):
-                    raise ValueError('count overflow')
+        tag = _cast(TiTxtTag, record.tag)
 
-        if self.data:
-            if tag != Tag.DATA:
-                raise ValueError('unexpected data')
+        if tag.is_data():
+            data = record.data
+            record.address = self.address
+            self.memory.write(self.address, data)
+            self.address += len(data)
+            if self.maxdatalen < len(data):
+                self.maxdatalen = len(data)
 
-        return self
+        elif tag.is_address():
+            self.address = record.address
 
 
 if not __TYPING_HAS_SELF:  # pragma: no cover
@@ -427,32 +515,308 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class TiTxtFile(BaseFile):
     r"""Texas Instruments TI-TXT file object."""
 
+    CONTENT_REGEX = re.compile(
+        b'\\s*([0-9A-Fa-f]{2}([ \\t]+[0-9A-Fa-f]{2})*[ \\t]*\\r?\\n\\s*)*'
+        b'(@[0-9A-Fa-f]+\\s|q(\\s|\\Z))'
+    )
+    r"""Content signature regex, matching an address or end of file."""
+
     FILE_EXT: Sequence[str] = ['.txt']
 
+    Parser: Type[TiTxtParser] = TiTxtParser  # type: ignore override
+
     Record: Type[TiTxtRecord] = TiTxtRecord  # type: ignore override
 
+    def _iter_memory_lines(
+        self,
+        end: AnyBytes = b'\r\n',
+        align: bool = False,
+        addrlen: int = 4,
+    ) -> Iterator[bytes]:
+        r"""Iterates over serialized lines, straight from memory.
+
+        It generates the same lines as :meth:`update_records` followed by
+        :meth:`TiTxtRecord.to_bytestr` for each record.
+        *Data* lines are encoded straight from :attr:`memory`, without
+        creating any records.
+        All the lines of a window of :meth:`_iter_chunk_windows` are
+        hex-encoded at once, and generated as a single item.
+
+        Args:
+            end (bytes):
+                End of record termination bytes.
+
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+            addrlen (int):
+                Address length, in *nibbles* (4-bit units).
+
+        Returns:
+            iterator of bytes: Serialized lines.
+
+        Raises:
+            ValueError: :attr:`memory` attribute not populated.
+
+        Examples:
+            >>> from hexrec import TiTxtFile
+            >>> file = TiTxtFile.from_blocks([(0x1234, b'abc')])
+            >>> list(file._iter_memory_lines(end=b'\n'))
+            [b'@1234\n', b'61 62 63\n', b'q\n']
+        """
+
+        memory = self._memory
+        if memory is None:
+            raise ValueError('memory instance required')
+
+        addrlen = addrlen.__index__()
+        if addrlen < 1:
+            raise ValueError('invalid address length')
+
+        Record = self.Record
+        last_data_endex = 0
+
+        for window_start, window_view in self._iter_chunk_windows(align=align):
+            if window_start != last_data_endex:
+                record = Record.create_address(window_start, addrlen=addrlen)
+                yield record.to_bytestr(end=end)
+
+            window_size = len(window_view)
+            last_data_endex = window_start + window_size
+            line_size = min(window_size, self.maxdatalen) * 3
+            lines = bytearray(hexlify(window_view, b' '))
+            window_view.release()
+            lines.append(0x20)
+            lines[(line_size - 1)::line_size] = b'\n' * (len(lines) // line_size)
+            if end != b'\n':
+                lines = lines.replace(b'\n', end)
+            yield bytes(lines)
+
+        yield Record.create_eof().to_bytestr(end=end)
+
     @classmethod
-    def parse(  # type: ignore kwargs order
+    def _iter_parsed_fields(
         cls,
-        stream: IO,
+        stream: Union[AnyBytes, IO],
         ignore_errors: bool = False,
         ignore_after_termination: bool = True,
-    ) -> Self:  # type: ignore Self
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Iterator[Tuple[TiTxtTag, int, ByteString]]:
+        r"""Iterates over parsed record fields.
+
+        It executes :meth:`TiTxtRecord.parse_fields` for each line of the
+        incoming `stream`, yielding the *tag*, *address*, and *data* of each
+        line, without creating any record objects.
+
+        The address of each *data* line is assigned on the fly, as per
+        :meth:`_iter_parsed_records`.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore invalid lines.
+
+            ignore_after_termination (bool):
+                Ignore anything after the *End Of File* record.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            iterator: *tag*, *address*, and *data* of each valid line.
+
+        See Also:
+            :meth:`_iter_parsed_records`
+            :meth:`parse_memory`
+        """
 
-        file = super().parse(stream, ignore_errors=ignore_errors,
-                             ignore_after_termination=ignore_after_termination)
         last_data_endex = 0
 
-        for record in file.records:
-            tag = _cast(TiTxtTag, record.tag)
+        for tag, address, data in super()._iter_parsed_fields(stream, ignore_errors=ignore_errors,
+                                                              ignore_after_termination=ignore_after_termination,
+                                                              diagnostics=diagnostics):
+            tag = _cast(TiTxtTag, tag)
 
             if tag.is_data():
-                record.address = last_data_endex
-                last_data_endex += len(record.data)
+                address = last_data_endex
+                last_data_endex += len(data)
 
             elif tag.is_address():
+                last_data_endex = address
+
+            yield tag, address, data
+
+    @classmethod
+    def _iter_parsed_records(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Iterator[TiTxtRecord]:
+        r"""Iterates over parsed records.
+
+        It matches :attr:`TiTxtRecord.LINE_REGEX` against each line of the
+        incoming `stream`, yielding each record as soon as it is parsed.
+
+        *Data* lines, always valid once matched, are decoded on the spot into
+        record objects, without any further validation; any other lines are
+        parsed by :meth:`TiTxtRecord.try_parse`.
+
+        The address of each *data* record is assigned on the fly, following
+        the last *address* record and the *data* records after it.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore :class:`Exception` raised by :meth:`TiTxtRecord.parse`.
+
+            ignore_after_termination (bool):
+                Ignore anything after the *End Of File* record.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            iterator: Parsed records.
+
+        See Also:
+            :meth:`parse`
+            :meth:`parse_memory`
+        """
+
+        Record = cls.Record
+        create_data = Record._create_trusted
+        match_line = Record.LINE_REGEX.match
+        data_tag = Record.Tag.DATA
+        tolerant = ignore_errors or diagnostics is not None
+        last_data_endex = 0
+        row = 0
+
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            lines = cls._iter_buffer_lines(stream)
+        else:
+            lines = stream
+
+        for line in lines:
+            line = _cast(bytes, line)
+            row += 1
+            match = match_line(line)
+            groups_data = match and match.group('data')
+
+            if groups_data:
+                data = unhexlify(groups_data.translate(None, delete=b' \t'))
+                record = create_data(data_tag, last_data_endex, data, count=None, checksum=None, coords=(row, 0))
+                last_data_endex += len(data)
+                yield record
+                continue
+
+            if cls._is_line_empty(line):
+                continue
+
+            record, reason = Record.try_parse(line)
+            if reason:
+                if not tolerant:
+                    raise ValueError(reason)
+                if diagnostics is not None:
+                    diagnostics.append((row, 0, reason))
+                continue
+
+            record = _cast(TiTxtRecord, record)
+            record.coords = (row, 0)
+            tag = _cast(TiTxtTag, record.tag)
+            if tag.is_address():
                 last_data_endex = record.address
+            yield record
+
+            if ignore_after_termination and tag.is_file_termination():
+                break
+
+    @classmethod
+    def parse_memory(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Parses a byte stream directly into memory.
+
+        Each line is decoded by :meth:`TiTxtRecord.parse_fields`, then
+        written straight into :attr:`memory`, without creating any record
+        objects.
+        Consecutive *data* records are joined into a single memory write.
+
+        The accepted syntax is the same as :meth:`parse`, as well as the
+        resulting :attr:`memory` and *meta*, and the reported errors.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore :class:`Exception` raised by :meth:`TiTxtRecord.parse`.
+
+            ignore_after_termination (bool):
+                Ignore anything after the *End Of File* record.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            :class:`TiTxtFile`: The created file object.
+
+        See Also:
+            :meth:`parse`
+            :meth:`TiTxtRecord.parse_fields`
+
+        Examples:
+            >>> from hexrec import TiTxtFile
+            >>> buffer = b'''
+            ... @DA7A
+            ... 61 62 63
+            ... 78 79 7A
+            ... q
+            ... '''
+            >>> file = TiTxtFile.parse_memory(buffer)
+            >>> file.memory.to_blocks()
+            [(55930, b'abcxyz')]
+            >>> file.get_meta()
+            {'maxdatalen': 3}
+        """
+
+        memory = Memory()
+        maxdatalen = 0
+        chunk_start = 0
+        chunk = bytearray()
+
+        for tag, address, data in cls._iter_parsed_fields(stream, ignore_errors=ignore_errors,
+                                                          ignore_after_termination=ignore_after_termination,
+                                                          diagnostics=diagnostics):
+            tag = _cast(TiTxtTag, tag)
+
+            if tag.is_data():
+                chunk += data
+                if maxdatalen < len(data):
+                    maxdatalen = len(data)
+
+            elif tag.is_address():
+                if chunk:
+                    memory.write(chunk_start, chunk)
+                    chunk = bytearray()
+                chunk_start = address
+
+        if chunk:
+            memory.write(chunk_start, chunk)
 
+        file = cls.from_memory(memory, maxdatalen=(maxdatalen or cls.DEFAULT_DATALEN))
         return file
 
     def update_records(
@@ -517,18 +881,25 @@ class TiTxtFile(BaseFile):
 
         records = []
         Record = self.Record
+        data_tag = Record.Tag.DATA
         last_data_endex = 0
+        key = (align, addrlen, self.maxdatalen)
+        reusable = self._get_reusable_records(key)
+        data_records = {}
         chunk_views = []
         try:
             for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
                 chunk_views.append(chunk_view)
-                data = bytes(chunk_view)
 
                 if chunk_start != last_data_endex:
                     record = Record.create_address(chunk_start, addrlen=addrlen)
                     records.append(record)
 
-                record = Record.create_data(chunk_start, data)
+                record = reusable.get(chunk_start)
+                if record is None or record.data != chunk_view:
+                    data = bytes(chunk_view)
+                    record = Record._create_trusted(data_tag, chunk_start, data)
+                data_records[chunk_start] = record
                 records.append(record)
                 last_data_endex = chunk_start + len(chunk_view)
 
@@ -539,8 +910,7 @@ class TiTxtFile(BaseFile):
         record = Record.create_eof()
         records.append(record)
 
-        self.discard_records()
-        self._records = records
+        self._set_updated_records(records, data_records, key)
         return self
 
     def validate_records(
@@ -584,8 +954,8 @@ class TiTxtFile(BaseFile):
         last_data_endex = 0
         eof_record = None
 
-        for index, record in enumerate(records):
-            record.validate()
+        for index, (record, verified) in enumerate(self._iter_verified_records(records)):
+            record.validate(checksum=(not verified))
             tag = record.tag
 
             if tag == Tag.ADDRESS:
@@ -31,21 +31,32 @@ See Also:
 
 import enum
 import re
+import sys
+from array import array
+from typing import IO
 from typing import Any
+from typing import Iterator
+from typing import List
 from typing import Mapping
+from typing import MutableMapping
 from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
+from typing import Union  # NOTE: type | operator unsupported for Python < 3.10
 from typing import cast as _cast
 
 from bytesparse import Memory
 
 from ..base import AnyBytes
 from ..base import BaseFile
+from ..base import BaseParser
 from ..base import BaseRecord
 from ..base import BaseTag
 from ..base import ByteString
 from ..utils import hexlify
+from ..utils import sum_chunks
+from ..utils import sum_lines
 from ..utils import unhexlify
 
 try:
@@ -54,6 +65,12 @@ except ImportError:  # pragma: no cover
     Self = Any  # Python < 3.11
 __TYPING_HAS_SELF = Self is not Any
 
+_HEX_DIGIT_VALUES = bytes.maketrans(b'0123456789ABCDEFabcdef', bytes(range(16)) + bytes(range(10, 16)))
+r"""Translation table from hexadecimal digits to their values."""
+
+_NIBBLE_SUMS = bytes((value >> 4) + (value & 0xF) for value in range(0x100))
+r"""Translation table from byte values to the sums of their nibbles."""
+
 
 class XtekTag(BaseTag, enum.IntEnum):
     r"""Tektronix Extended tag."""
@@ -103,6 +120,10 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class XtekRecord(BaseRecord):
     r"""Tektronix Extended record object."""
 
+    __slots__ = [
+        'addrlen',
+    ]
+
     Tag: Type[XtekTag] = XtekTag  # type: ignore override
 
     EQUALITY_KEYS: Sequence[str] = list(BaseRecord.EQUALITY_KEYS) + ['addrlen']
@@ -126,6 +147,17 @@ class XtekRecord(BaseRecord):
     ) for i in range(1, 16)]
     r"""Line parser regex, part 2."""
 
+    FIELDS_REGEX = re.compile(
+        b'^[^%]*%'
+        b'(?P<count>[0-9A-Fa-f]{2})'
+        b'(?P<tag>[68])'
+        b'(?P<checksum>[0-9A-Fa-f]{2})'
+        b'(?P<addrlen>[1-9A-Fa-f])'
+        b'(?P<fields>[0-9A-Fa-f]*)'
+        b'\\r?\\n$'
+    )
+    r"""Field parser regex, matching a line without junk after the data."""
+
     def __init__(
         self,
         *super_init_args,
@@ -142,6 +174,18 @@ class XtekRecord(BaseRecord):
         self.addrlen = addrlen
         super().__init__(*super_init_args, validate=validate, **super_init_kwargs)
 
+    @classmethod
+    def _create_trusted(
+        cls,
+        tag: XtekTag,
+        address: int,
+        data: ByteString,
+        addrlen: int = 8,
+        **kwargs: Any,
+    ) -> Self:  # type: ignore Self
+
+        return super()._create_trusted(tag, address, data, addrlen=addrlen, **kwargs)
+
     @classmethod
     def compute_address_max(cls, addrlen: int) -> int:
         r"""Calculates the maximum address.
@@ -197,6 +241,23 @@ class XtekRecord(BaseRecord):
         checksum = (count_sum + tag + self.addrlen + address_sum + data_sum) & 0xFF
         return checksum
 
+    @classmethod
+    def compute_checksums(
+        cls,
+        records: Sequence[BaseRecord],
+    ) -> List[Union[int, None]]:
+
+        try:
+            sums = sum_chunks([record.data for record in records],
+                              [([record.address for record in records], 8)],
+                              table=_NIBBLE_SUMS)
+
+            return [(total + (count >> 4) + (count & 0xF) + record.addrlen + record.tag) & 0xFF
+                    for total, count, record in zip(sums, (record.count for record in records), records)]
+
+        except (OverflowError, TypeError):  # unsupported by the batch layout
+            return super().compute_checksums(records)
+
     def compute_count(self) -> int:
 
         count = 6 + self.addrlen + (len(self.data) * 2)
@@ -376,6 +437,48 @@ class XtekRecord(BaseRecord):
 
         return self.compute_data_max(self.addrlen)
 
+    def diagnose(
+        self,
+        checksum: bool = True,
+        count: bool = True,
+    ) -> Union[str, None]:
+
+        reason = super().diagnose(checksum=checksum, count=count)
+        if reason:
+            return reason
+
+        if self.after and not self.after.isspace():
+            return 'junk after is not whitespace'
+
+        if b'%' in self.before:
+            return 'junk before contains "%"'
+
+        if self.checksum is not None:
+            if not 0 <= self.checksum <= 0xFF:
+                return 'checksum overflow'
+
+        if self.count is not None:
+            if not 0 <= self.count <= 0xFF:
+                return 'count overflow'
+
+        addrlen = self.addrlen
+        if not 1 <= addrlen <= 15:
+            return 'invalid address length'
+
+        addrmax = self.compute_address_max(addrlen)
+        if not 0 <= self.address <= addrmax:
+            return 'address overflow'
+
+        datamax = (0xFA - addrlen) // 2
+        data_size = len(self.data)
+        if data_size > datamax:
+            return 'data size overflow'
+
+        if self.tag == XtekTag.EOF and data_size:
+            return 'unexpected data'
+
+        return None
+
     @classmethod
     def parse(
         cls,
@@ -383,36 +486,39 @@ class XtekRecord(BaseRecord):
         validate: bool = True,
     ) -> Self:  # type: ignore Self
 
-        line = memoryview(line)
-        match = cls.LINE1_REGEX.match(line)
-        if not match:
-            raise ValueError('syntax error')
-        groups = match.groupdict()
-        before = groups['before']
-        count = int(groups['count'], 16)
-        tag = cls.Tag(int(groups['tag'], 16))
-        checksum = int(groups['checksum'], 16)
-        addrlen = int(groups['addrlen'], 16)
+        record, reason = cls.try_parse(line, validate=validate)
+        if reason:
+            raise ValueError(reason)
+        return record
 
-        line = line[match.span()[1]:]
-        match = cls.LINE2_REGEX[addrlen - 1].match(line)
-        if not match:
-            raise ValueError('syntax error')
-        groups = match.groupdict()
-        address = int(groups['address'], 16)
-        data = unhexlify(groups['data'])
-        after = groups['after']
+    @classmethod
+    def parse_fields(
+        cls,
+        line: ByteString,
+    ) -> Union[Tuple[XtekTag, int, ByteString], None]:
 
-        record = cls(tag,
-                     address=address,
-                     data=data,
-                     count=count,
-                     checksum=checksum,
-                     before=before,
-                     after=after,
-                     addrlen=addrlen,
-                     validate=validate)
-        return record
+        match = cls.FIELDS_REGEX.match(line)
+        if match is None:
+            return None
+
+        count, tag, checksum, addrlen, fields = match.groups()
+        addrlen = int(addrlen, 16)
+        size = len(fields) - addrlen
+        if size < 0 or size & 1 or (size >> 1) > ((249 - addrlen) // 2):
+            return None
+
+        if int(count, 16) != 6 + addrlen + size:
+            return None
+
+        tag = int(tag)
+        if tag == XtekTag.EOF and size:
+            return None
+
+        total = sum(count.translate(_HEX_DIGIT_VALUES)) + tag + addrlen + sum(fields.translate(_HEX_DIGIT_VALUES))
+        if total & 0xFF != int(checksum, 16):
+            return None
+
+        return cls.Tag._value2member_map_[tag], int(fields[:addrlen], 16), unhexlify(fields[addrlen:])
 
     def to_bytestr(self, end: AnyBytes = b'\r\n') -> bytes:
 
@@ -447,45 +553,91 @@ class XtekRecord(BaseRecord):
             'end': end,
         }
 
-    def validate(
-        self,
-        checksum: bool = True,
-        count: bool = True,
-    ) -> Self:  # type: ignore Self
+    @classmethod
+    def try_parse(
+        cls,
+        line: ByteString,
+        validate: bool = True,
+    ) -> Tuple[Union[Self, None], Union[str, None]]:  # type: ignore Self
 
-        super().validate(checksum=checksum, count=count)
+        line = memoryview(line)
+        match = cls.LINE1_REGEX.match(line)
+        if not match:
+            return None, 'syntax error'
+        groups = match.groupdict()
+        before = groups['before']
+        count = int(groups['count'], 16)
+        tag = int(groups['tag'], 16)
+        tag = cls.Tag._value2member_map_.get(tag, tag)
+        if not isinstance(tag, cls.Tag):
+            return None, f'{tag!r} is not a valid {cls.Tag.__qualname__}'
+        checksum = int(groups['checksum'], 16)
+        addrlen = int(groups['addrlen'], 16)
 
-        if self.after and not self.after.isspace():
-            raise ValueError('junk after is not whitespace')
+        line = line[match.span()[1]:]
+        match = cls.LINE2_REGEX[addrlen - 1].match(line)
+        if not match:
+            return None, 'syntax error'
+        groups = match.groupdict()
+        address = int(groups['address'], 16)
+        data = unhexlify(groups['data'])
+        after = groups['after']
 
-        if b'%' in self.before:
-            raise ValueError('junk before contains "%"')
+        record = cls(tag,
+                     address=address,
+                     data=data,
+                     count=count,
+                     checksum=checksum,
+                     before=before,
+                     after=after,
+                     addrlen=addrlen,
+                     validate=False)
 
-        if self.checksum is not None:
-            if not 0 <= self.checksum <= 0xFF:
-                raise ValueError('checksum overflow')
+        if validate:
+            reason = record.diagnose()
+            if reason:
+                return None, reason
 
-        if self.count is not None:
-            if not 0 <= self.count <= 0xFF:
-                raise ValueError('count overflow')
+        return record, None
 
-        addrlen = self.addrlen
-        if not 1 <= addrlen <= 15:
-            raise ValueError('invalid address length')
 
-        addrmax = self.compute_address_max(addrlen)
-        if not 0 <= self.address <= addrmax:
-            raise ValueError('address overflow')
+class XtekParser(BaseParser):
+    r"""Tektronix Extended push parser.
 
-        datamax = (0xFA - addrlen) // 2
-        data_size = len(self.data)
-        if data_size > datamax:
-            raise ValueError('data size overflow')
+    It tracks the *start address* while parsing, as per
+    :meth:`XtekFile.apply_records`.
+    """
 
-        if self.tag == XtekTag.EOF and data_size:
-            raise ValueError('unexpected data')
+    def __init__(
+        self,
+        file_type: Type[BaseFile],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+    ):
 
-        return self
+        super().__init__(file_type,
+                         ignore_errors=ignore_errors,
+                         ignore_after_termination=ignore_after_termination)
+
+        self.startaddr: int = 0
+        r"""Parsed start address."""
+
+    def apply_record(self, record: BaseRecord) -> None:
+
+        if record.tag == XtekTag.DATA:
+            data = record.data
+            self.memory.write(record.address, data)
+            if self.maxdatalen < len(data):
+                self.maxdatalen = len(data)
+
+        else:  # elif tag == XtekTag.EOF:
+            self.startaddr = record.address
+
+    def get_meta(self) -> MutableMapping[str, Any]:
+
+        meta = super().get_meta()
+        meta['startaddr'] = self.startaddr
+        return meta
 
 
 if not __TYPING_HAS_SELF:  # pragma: no cover
@@ -496,6 +648,9 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class XtekFile(BaseFile):
     r"""Tektronix Extended file object."""
 
+    CONTENT_REGEX = re.compile(b'\\s*%[0-9A-Fa-f]{2}[68][0-9A-Fa-f]{2}[1-9A-Fa-f]')
+    r"""Content signature regex, matching a leading record."""
+
     FILE_EXT: Sequence[str] = ['.tek', '.xtek']
 
     META_KEYS: Sequence[str] = [
@@ -503,6 +658,8 @@ class XtekFile(BaseFile):
         'startaddr',
     ]
 
+    Parser: Type[XtekParser] = XtekParser  # type: ignore override
+
     Record: Type[XtekRecord] = XtekRecord  # type: ignore override
 
     def __init__(self):
@@ -511,6 +668,124 @@ class XtekFile(BaseFile):
 
         self._startaddr: int = 0
 
+    def _iter_memory_lines(
+        self,
+        end: AnyBytes = b'\r\n',
+        align: bool = False,
+        addrlen: int = 8,
+    ) -> Iterator[bytes]:
+        r"""Iterates over serialized lines, straight from memory.
+
+        It generates the same lines as :meth:`update_records` followed by
+        :meth:`XtekRecord.to_bytestr` for each record.
+        *Data* lines are encoded straight from :attr:`memory`, without
+        creating any records.
+        The text of all the lines of a window of :meth:`_iter_chunk_windows`
+        is laid out at once by column, with checksums computed via
+        :func:`hexrec.utils.sum_lines`, and generated as a single item.
+
+        Args:
+            end (bytes):
+                End of record termination bytes.
+
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+            addrlen (int):
+                Address length, in *nibbles* (4-bit units).
+
+        Returns:
+            iterator of bytes: Serialized lines.
+
+        Raises:
+            ValueError: :attr:`memory` attribute not populated.
+
+        Examples:
+            >>> from hexrec import XtekFile
+            >>> file = XtekFile.from_blocks([(0x1234, b'abc')])
+            >>> list(file._iter_memory_lines(end=b'\n'))
+            [b'%14635800001234616263\n', b'%0E81E800000000\n']
+        """
+
+        memory = self._memory
+        if memory is None:
+            raise ValueError('memory instance required')
+
+        addrlen = addrlen.__index__()
+        if not 1 <= addrlen <= 15:
+            raise ValueError('invalid address length')
+
+        Record = self.Record
+        address_max = Record.compute_address_max(addrlen)
+        data_max = Record.compute_data_max(addrlen)
+        line_base = 6 + addrlen
+
+        for window_start, window_view in self._iter_chunk_windows(align=align):
+            window_size = len(window_view)
+            size = min(window_size, self.maxdatalen)
+            if window_start + window_size - size > address_max:
+                raise ValueError('address overflow')
+
+            if size > data_max:
+                raise ValueError('data size overflow')
+
+            data = bytes(window_view)
+            window_view.release()
+            count = window_size // size
+            line_count = line_base + (size * 2)
+
+            addresses = array('Q', range(window_start, window_start + window_size, size))
+            if sys.byteorder == 'little':
+                addresses.byteswap()
+            address_bytes = addresses.tobytes()
+            address_digits = addresses.itemsize * 2
+
+            # Checksum of the nibbles of: count, type, length, address, data
+            checksum_base = (line_count >> 4) + (line_count & 0xF) + line_base
+            checksum_table = bytes((checksum_base + value) & 0xFF for value in range(0x100))
+            sums = (int.from_bytes(sum_lines(address_bytes.translate(_NIBBLE_SUMS), addresses.itemsize), 'big')
+                    + int.from_bytes(sum_lines(data.translate(_NIBBLE_SUMS), size), 'big'))
+            checksums = sums.to_bytes(count * 4, 'big')[3::4].translate(checksum_table)
+
+            # Lay out the line text column by column
+            line_size = 7 + addrlen + (size * 2) + len(end)
+            text = bytearray(count * line_size)
+            offset = 0
+
+            for value in b'%%%02X6' % line_count:
+                text[offset::line_size] = bytes((value,)) * count
+                offset += 1
+
+            checksum_str = hexlify(checksums)
+            for index in range(2):
+                text[offset::line_size] = checksum_str[index::2]
+                offset += 1
+
+            text[offset::line_size] = (b'%X' % addrlen) * count
+            offset += 1
+
+            address_str = hexlify(address_bytes)
+            for index in range(address_digits - addrlen, address_digits):
+                if index < address_digits - 8:  # 32-bit address text
+                    text[offset::line_size] = b'0' * count
+                else:
+                    text[offset::line_size] = address_str[index::address_digits]
+                offset += 1
+
+            data_str = hexlify(data)
+            for index in range(size * 2):
+                text[offset::line_size] = data_str[index::(size * 2)]
+                offset += 1
+
+            for value in end:
+                text[offset::line_size] = bytes((value,)) * count
+                offset += 1
+
+            yield bytes(text)
+
+        record = Record.create_eof(self.startaddr, addrlen=addrlen)
+        yield record.to_bytestr(end=end)
+
     def apply_records(self) -> Self:  # type: ignore Self
 
         if not self._records:
@@ -533,6 +808,87 @@ class XtekFile(BaseFile):
         self._startaddr = startaddr
         return self
 
+    @classmethod
+    def parse_memory(
+        cls,
+        stream: Union[AnyBytes, IO],
+        ignore_errors: bool = False,
+        ignore_after_termination: bool = True,
+        diagnostics: Union[List[Tuple[int, int, str]], None] = None,
+    ) -> Self:  # type: ignore Self
+        r"""Parses a byte stream directly into memory.
+
+        Each line is decoded by :meth:`XtekRecord.parse_fields`, then written
+        straight into :attr:`memory` and *meta*, without creating any record
+        objects.
+
+        The accepted syntax is the same as :meth:`parse`, as well as the
+        resulting :attr:`memory` and *meta*, and the reported errors.
+
+        Args:
+            stream (bytes IO or buffer):
+                Stream or byte buffer to parse records from.
+
+            ignore_errors (bool):
+                Ignore :class:`Exception` raised by :meth:`XtekRecord.parse`.
+
+            ignore_after_termination (bool):
+                Ignore anything after the *End Of File* record.
+
+            diagnostics (list):
+                If not ``None``, invalid lines are ignored, appending a
+                ``(row, column, reason)`` tuple for each of them.
+
+        Returns:
+            :class:`XtekFile`: The created file object.
+
+        Raises:
+            ValueError: Invalid record, or no valid records.
+
+        See Also:
+            :meth:`parse`
+            :meth:`XtekRecord.parse_fields`
+
+        Examples:
+            >>> from hexrec import XtekFile
+            >>> buffer = b'''
+            ... %1465380000DA7A616263
+            ... %1466E80000DA7D78797A
+            ... %0E85180000CAFE
+            ... '''
+            >>> file = XtekFile.parse_memory(buffer)
+            >>> file.memory.to_blocks()
+            [(55930, b'abcxyz')]
+            >>> file.get_meta()
+            {'maxdatalen': 3, 'startaddr': 51966}
+        """
+
+        memory = Memory()
+        startaddr = 0
+        maxdatalen = 0
+        parsed = False
+
+        for tag, address, data in cls._iter_parsed_fields(stream, ignore_errors=ignore_errors,
+                                                          ignore_after_termination=ignore_after_termination,
+                                                          diagnostics=diagnostics):
+            parsed = True
+
+            if tag == XtekTag.DATA:
+                memory.write(address, data)
+                if maxdatalen < len(data):
+                    maxdatalen = len(data)
+
+            else:  # elif tag == XtekTag.EOF:
+                startaddr = address
+
+        if not parsed:
+            raise ValueError('records required')
+
+        file = cls.from_memory(memory,
+                               maxdatalen=(maxdatalen or cls.DEFAULT_DATALEN),
+                               startaddr=startaddr)
+        return file
+
     @property
     def startaddr(self) -> int:
         r"""Start address.
@@ -632,14 +988,31 @@ class XtekFile(BaseFile):
 
         records = []
         Record = self.Record
+        data_tag = Record.Tag.DATA
+        address_max = Record.compute_address_max(addrlen)
+        data_max = Record.compute_data_max(addrlen)
+        key = (align, addrlen, self.maxdatalen)
+        reusable = self._get_reusable_records(key)
+        data_records = {}
         chunk_views = []
+        created = []
         try:
             for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
                 chunk_views.append(chunk_view)
-                data = bytes(chunk_view)
-                record = Record.create_data(chunk_start, data, addrlen=addrlen)
+                record = reusable.get(chunk_start)
+                if record is None or record.data != chunk_view:
+                    if not 0 <= chunk_start <= address_max:
+                        raise ValueError('address overflow')
+                    if len(chunk_view) > data_max:
+                        raise ValueError('data size overflow')
+                    data = bytes(chunk_view)
+                    record = Record._create_trusted(data_tag, chunk_start, data, addrlen=addrlen)
+                    created.append(record.update_count())
+                data_records[chunk_start] = record
                 records.append(record)
 
+            Record.update_checksums(created)
+
             record = Record.create_eof(self.startaddr, addrlen=addrlen)
             records.append(record)
 
@@ -647,8 +1020,7 @@ class XtekFile(BaseFile):
             for chunk_view in chunk_views:
                 chunk_view.release()
 
-        self.discard_records()
-        self._records = records
+        self._set_updated_records(records, data_records, key)
         return self
 
     def validate_records(
@@ -692,8 +1064,8 @@ class XtekFile(BaseFile):
         eof_record = None
         last_data_endex = 0
 
-        for index, record in enumerate(records):
-            record.validate()
+        for index, (record, verified) in enumerate(self._iter_verified_records(records)):
+            record.validate(checksum=(not verified))
             tag = _cast(XtekTag, record.tag)
 
             if data_ordering:
@@ -712,7 +1084,7 @@ class XtekFile(BaseFile):
             raise ValueError('missing end of file record')
 
         if start_within_data:
-            start_datum = self.memory.peek(eof_record.address)
+            start_datum = self._get_memory().peek(eof_record.address)
             if start_datum is None:
                 raise ValueError('no data at start address')
 
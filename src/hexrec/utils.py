@@ -27,11 +27,15 @@ r"""Generic utility functions."""
 
 import binascii
 import re
+import struct
 import sys
+from array import array
 from typing import Any
 from typing import Iterator
+from typing import List
 from typing import Mapping
 from typing import Sequence
+from typing import Tuple
 from typing import Union  # NOTE: type | operator unsupported for Python < 3.10
 from typing import cast as _cast
 
@@ -188,6 +192,142 @@ def hexlify(
     return hexstr
 
 
+def hexlify_lines(
+    data: AnyBytes,
+    width: int,
+    address: int = 0,
+    address_size: int = 0,
+    head: AnyBytes = b'',
+    tag: AnyBytes = b'',
+    checksum_size: int = 0,
+    checksum_table: Union[AnyBytes, None] = None,
+    prefix: AnyBytes = b'',
+    suffix: AnyBytes = b'',
+) -> bytes:
+    r"""Encodes hexadecimal record lines in batch.
+
+    It chops `data` into lines of `width` bytes, each one serialized as the
+    uppercase hexadecimal representation of the following binary fields:
+
+    #. `head` bytes;
+    #. big-endian line address, `address_size` bytes long;
+    #. `tag` bytes;
+    #. line data, `width` bytes long;
+    #. big-endian checksum, `checksum_size` bytes long.
+
+    Each line is enclosed within `prefix` and `suffix`.
+
+    The checksum is the sum of all the bytes of the previous fields of the
+    line, truncated to `checksum_size` bytes, and translated byte-wise via
+    `checksum_table` if not ``None`` (see :meth:`bytes.translate`).
+
+    All the lines are encoded at once: the binary fields are laid out by
+    column via slice assignments, the checksums are computed via
+    :func:`sum_lines`, and the whole binary buffer is hex-encoded with a
+    single call.
+
+    Args:
+        data (bytes):
+            Line data, as a multiple of `width` bytes.
+
+        width (int):
+            Line data size, in bytes.
+
+        address (int):
+            Address of the first line.
+            Each further line adds `width` to it.
+
+        address_size (int):
+            Size of the address field, in bytes, up to 8.
+
+        head (bytes):
+            Fields before the address, constant for each line.
+
+        tag (bytes):
+            Fields between the address and the data, constant for each line.
+
+        checksum_size (int):
+            Size of the checksum field, in bytes, up to 4.
+
+        checksum_table (bytes):
+            Optional translation table for the checksum bytes.
+
+        prefix (bytes):
+            Prefix of each line.
+
+        suffix (bytes):
+            Suffix of each line.
+
+    Returns:
+        bytes: Concatenated serialized lines.
+
+    Raises:
+        ValueError: Invalid width.
+
+    Examples:
+        >>> hexlify_lines(b'abcdef', 3, address=0x1234, address_size=2,
+        ...               head=b'\x03', checksum_size=1, prefix=b'<', suffix=b'>')
+        b'<0312346162636F><0312376465667B>'
+        >>> table = bytes((-i) & 0xFF for i in range(256))
+        >>> hexlify_lines(b'abc', 3, address=0x2345, address_size=2,
+        ...               head=b'\x03', tag=b'\x00', checksum_size=1,
+        ...               checksum_table=table, prefix=b':', suffix=b'\n')
+        b':032345006162636F\n'
+    """
+
+    data_size = len(data)
+    if width < 1 or data_size % width:
+        raise ValueError('invalid width')
+    if not data_size:
+        return b''
+
+    if not isinstance(data, bytes):
+        data = bytes(data)
+    count = data_size // width
+    line_size = len(head) + address_size + len(tag) + width + checksum_size
+    buffer = bytearray(count * line_size)
+    offset = 0
+
+    for value in head:
+        buffer[offset::line_size] = bytes((value,)) * count
+        offset += 1
+
+    if address_size:
+        addresses = array('Q', range(address, address + data_size, width))
+        if sys.byteorder == 'little':
+            addresses.byteswap()
+        addresses_bytes = addresses.tobytes()
+        item_size = addresses.itemsize
+
+        for index in range(item_size - address_size, item_size):
+            buffer[offset::line_size] = addresses_bytes[index::item_size]
+            offset += 1
+
+    for value in tag:
+        buffer[offset::line_size] = bytes((value,)) * count
+        offset += 1
+
+    for index in range(width):
+        buffer[offset::line_size] = data[index::width]
+        offset += 1
+
+    if checksum_size:
+        sums = sum_lines(buffer, line_size)
+
+        for index in range(4 - checksum_size, 4):
+            column = sums[index::4]
+            if checksum_table is not None:
+                column = column.translate(checksum_table)
+            buffer[offset::line_size] = column
+            offset += 1
+
+    hexstr = binascii.hexlify(buffer, b'\n', line_size).upper()
+    separator = suffix + prefix
+    if separator != b'\n':
+        hexstr = hexstr.replace(b'\n', separator)
+    return b''.join((prefix, hexstr, suffix))
+
+
 def parse_int(
     value: Union[str, Any],
 ) -> Union[int, None]:
@@ -258,6 +398,148 @@ def parse_int(
         return int(value)
 
 
+def sum_chunks(
+    chunks: Sequence[AnyBytes],
+    fields: Sequence[Tuple[Sequence[int], int]] = (),
+    table: Union[AnyBytes, None] = None,
+) -> List[int]:
+    r"""Sums the bytes of many chunks at once.
+
+    Each chunk is laid out as a line of a single binary buffer, preceded by
+    its `fields` and zero-padded up to the largest chunk size.
+    Each field is stored as a big-endian integer.
+
+    The line bytes are translated via `table` if not ``None`` (see
+    :meth:`bytes.translate`), and then summed by line via :func:`sum_lines`.
+
+    Args:
+        chunks (list of bytes):
+            Byte chunks to sum.
+
+        fields (list):
+            Sequence of ``(values, size)`` pairs.
+            Each pair is a column of integer `values`, one per chunk, between
+            zero and ``2**64 - 1``, truncated to `size` bytes, up to 8.
+
+        table (bytes):
+            Optional translation table for the line bytes.
+
+    Returns:
+        list of int: Line sums, one per chunk.
+
+    Raises:
+        ValueError: Invalid field.
+
+    See Also:
+        :func:`sum_lines`
+
+    Examples:
+        >>> sum_chunks([b'\x01\x02', b'\x03'])
+        [3, 3]
+        >>> sum_chunks([b'ab', b'c'], fields=[([0x1234, 0xFF00], 2)])
+        [265, 354]
+        >>> table = bytes((i >> 4) + (i & 0xF) for i in range(256))
+        >>> sum_chunks([b'\x12\x34'], table=table)
+        [10]
+    """
+
+    count = len(chunks)
+    sizes = list(map(len, chunks))
+    width = max(sizes, default=0)
+    line_size = width
+
+    for values, size in fields:
+        if not 0 <= size <= 8:
+            raise ValueError('invalid field size')
+        if len(values) != count:
+            raise ValueError('invalid field length')
+        line_size += size
+
+    if not count or not line_size:
+        return [0] * count
+
+    buffer = bytearray(count * line_size)
+    offset = 0
+
+    for values, size in fields:
+        if size:
+            column = array('Q', values)
+            if sys.byteorder == 'little':
+                column.byteswap()
+            column_bytes = column.tobytes()
+            item_size = column.itemsize
+
+            for index in range(item_size - size, item_size):
+                buffer[offset::line_size] = column_bytes[index::item_size]
+                offset += 1
+
+    if sizes.count(width) == count:
+        data = b''.join(chunks)
+    else:
+        data = b''.join([chunk if size == width else bytes(chunk) + bytes(width - size)
+                         for chunk, size in zip(chunks, sizes)])
+
+    for index in range(width):
+        buffer[offset::line_size] = data[index::width]
+        offset += 1
+
+    if table is not None:
+        buffer = buffer.translate(table)
+
+    sums = sum_lines(buffer, line_size)
+    return list(struct.unpack(f'>{count}L', sums))
+
+
+def sum_lines(
+    buffer: AnyBytes,
+    width: int,
+) -> bytes:
+    r"""Sums the bytes of each buffer line.
+
+    It splits `buffer` into lines of `width` bytes, the last one possibly
+    shorter, and sums the bytes of each line.
+
+    Instead of summing each line on its own, it sums the lines at once
+    column by column, with each line sum as a 32-bit lane of a single big
+    integer.
+
+    Args:
+        buffer (bytes):
+            Byte buffer to sum by line.
+
+        width (int):
+            Line size, in bytes, up to ``0x1010101``.
+
+    Returns:
+        bytes: Line sums, as 32-bit big-endian integers.
+
+    Raises:
+        ValueError: Invalid width.
+
+    Examples:
+        >>> sum_lines(b'\x01\x02\x03\x04\xFF', 2)
+        b'\x00\x00\x00\x03\x00\x00\x00\x07\x00\x00\x00\xff'
+    """
+
+    if not 1 <= width <= 0x1010101:
+        raise ValueError('invalid width')
+
+    size = len(buffer)
+    count = (size + width - 1) // width
+    padding = (count * width) - size
+    if padding or not isinstance(buffer, (bytes, bytearray)):
+        buffer = bytes(buffer) + bytes(padding)
+
+    lane = bytearray(count * 4)
+    total = 0
+
+    for offset in range(width):
+        lane[3::4] = buffer[offset::width]
+        total += int.from_bytes(lane, 'big')
+
+    return total.to_bytes(count * 4, 'big')
+
+
 def unhexlify(
     hexstr: Union[bytes, bytearray],
     delete: Union[bytes, bytearray, EllipsisType, None] = None,